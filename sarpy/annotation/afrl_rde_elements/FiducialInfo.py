@@ -68,10 +68,27 @@ class ImageLocationType(Serializable):
 
         if geo_location is None or geo_location.CenterPixel is None:
             return None
+        return cls.from_geolocations([geo_location, ], the_structure)[0]
+
+    @classmethod
+    def from_geolocations(cls, geo_locations, the_structure):
+        """
+        Construct from a collection of corresponding Geolocations using the sicd
+        projection model. All locations are projected in a single call.
+
+        Parameters
+        ----------
+        geo_locations : List[None|GeoLocationType]
+        the_structure : SICDType|SIDDType
+
+        Returns
+        -------
+        List[None|ImageLocationType]
+        """
 
         if not the_structure.can_project_coordinates():
             logger.warning(_no_projection_text)
-            return None
+            return [None for _ in geo_locations]
 
         if isinstance(the_structure, SICDType):
             image_shift = numpy.array(
@@ -79,12 +96,21 @@ class ImageLocationType(Serializable):
         else:
             image_shift = numpy.zeros((2, ), dtype='float64')
 
-        absolute_pixel_location, _, _ = the_structure.project_ground_to_image_geo(
-            geo_location.CenterPixel.get_array(dtype='float64'), ordering='latlong')
-        if numpy.any(numpy.isnan(absolute_pixel_location)):
-            return None
-
-        return ImageLocationType(CenterPixel=absolute_pixel_location - image_shift)
+        indices = [
+            index for index, entry in enumerate(geo_locations)
+            if entry is not None and entry.CenterPixel is not None]
+        out = [None for _ in geo_locations]
+        if len(indices) == 0:
+            return out
+
+        points = numpy.array(
+            [geo_locations[index].CenterPixel.get_array(dtype='float64') for index in indices], dtype='float64')
+        absolute_pixel_locations, _, _ = the_structure.project_ground_to_image_geo(points, ordering='latlong')
+        absolute_pixel_locations = numpy.reshape(absolute_pixel_locations, (-1, 2))
+        for index, pixel in zip(indices, absolute_pixel_locations):
+            if not numpy.any(numpy.isnan(pixel)):
+                out[index] = ImageLocationType(CenterPixel=pixel - image_shift)
+        return out
 
 
 class GeoLocationType(Serializable):
@@ -301,7 +327,7 @@ class TheFiducialType(Serializable):
         self.ProjectionPerturbation = ProjectionPerturbation
         super(TheFiducialType, self).__init__(**kwargs)
 
-    def set_image_location_from_sicd(self, sicd, populate_in_periphery=False):
+    def set_image_location_from_sicd(self, sicd, populate_in_periphery=False, image_location=None):
         """
         Set the image location information with respect to the given SICD.
 
@@ -309,6 +335,10 @@ class TheFiducialType(Serializable):
         ----------
         sicd : SICDType
         populate_in_periphery : bool
+        image_location : None|ImageLocationType
+            The image location already projected from the geographical location,
+            as by :meth:`ImageLocationType.from_geolocations`. If not provided,
+            this will be projected here.
 
         Returns
         -------
@@ -334,7 +364,8 @@ class TheFiducialType(Serializable):
             logger.warning(_no_projection_text)
             return -1
 
-        image_location = ImageLocationType.from_geolocation(self.GeoLocation, sicd)
+        if image_location is None:
+            image_location = ImageLocationType.from_geolocation(self.GeoLocation, sicd)
         # check bounding information
         rows = sicd.ImageData.NumRows
         cols = sicd.ImageData.NumCols
@@ -452,8 +483,19 @@ class FiducialInfoType(Serializable):
             Include the objects which are out of range (with no image location information)?
         """
 
+        # project the locations of all the fiducials at once
+        pending = [
+            the_fid for the_fid in self.Fiducials
+            if the_fid.ImageLocation is None and the_fid.SlantPlane is None and the_fid.GeoLocation is not None]
+        image_locations = {}
+        if len(pending) > 0 and sicd.can_project_coordinates():
+            projected = ImageLocationType.from_geolocations([the_fid.GeoLocation for the_fid in pending], sicd)
+            image_locations = {id(the_fid): entry for the_fid, entry in zip(pending, projected)}
+
         def update_fiducial(temp_fid, in_image_count):
-            status = temp_fid.set_image_location_from_sicd(sicd, populate_in_periphery=populate_in_periphery)
+            status = temp_fid.set_image_location_from_sicd(
+                sicd, populate_in_periphery=populate_in_periphery,
+                image_location=image_locations.get(id(temp_fid), None))
             use_fid = False
             if status == 0:
                 raise ValueError('Fiducial already has image details set')
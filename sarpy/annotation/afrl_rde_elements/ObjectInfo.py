@@ -302,33 +302,72 @@ class ImageLocationType(Serializable):
 
         if geo_location is None:
             return None
+        return cls.from_geolocations([geo_location, ], the_structure)[0]
+
+    @classmethod
+    def from_geolocations(cls, geo_locations, the_structure):
+        """
+        Construct the image locations from a collection of geographical locations
+        via projection using the SICD model. All points of all locations are
+        projected in a single call.
+
+        Parameters
+        ----------
+        geo_locations : List[None|GeoLocationType]
+        the_structure : SICDType|SIDDType
+
+        Returns
+        -------
+        List[None|ImageLocationType]
+            The entries are None where projection fails, the value otherwise
+        """
 
         if not the_structure.can_project_coordinates():
             logger.warning(_no_projection_text)
-            return None
+            return [None for _ in geo_locations]
 
         # make sure this is defined, for the sake of efficiency
         the_structure.define_coa_projection(override=False)
 
-        kwargs = {}
-
         if isinstance(the_structure, SICDType):
             image_shift = numpy.array(
                 [the_structure.ImageData.FirstRow, the_structure.ImageData.FirstCol], dtype='float64')
         else:
             image_shift = numpy.zeros((2, ), dtype='float64')
 
-        for attribute in cls._fields:
-            value = getattr(geo_location, attribute)
-            if value is not None:
-                absolute_pixel_location, _, _ = the_structure.project_ground_to_image_geo(
-                    value.get_array(dtype='float64'), ordering='latlong')
-                if numpy.any(numpy.isnan(absolute_pixel_location)):
-                    return None
-
-                kwargs[attribute] = absolute_pixel_location - image_shift
-        out = ImageLocationType(**kwargs)
-        out.infer_center_pixel()
+        # gather all points, as (location index, attribute) references
+        references = []
+        points = []
+        for index, geo_location in enumerate(geo_locations):
+            if geo_location is None:
+                continue
+            for attribute in cls._fields:
+                value = getattr(geo_location, attribute)
+                if value is not None:
+                    references.append((index, attribute))
+                    points.append(value.get_array(dtype='float64'))
+
+        kwargs = [None if entry is None else {} for entry in geo_locations]
+        if len(points) > 0:
+            absolute_pixel_locations, _, _ = the_structure.project_ground_to_image_geo(
+                numpy.array(points, dtype='float64'), ordering='latlong')
+            absolute_pixel_locations = numpy.reshape(absolute_pixel_locations, (-1, 2))
+            for (index, attribute), pixel in zip(references, absolute_pixel_locations):
+                if kwargs[index] is None:
+                    continue
+                if numpy.any(numpy.isnan(pixel)):
+                    kwargs[index] = None
+                else:
+                    kwargs[index][attribute] = pixel - image_shift
+
+        out = []
+        for entry in kwargs:
+            if entry is None:
+                out.append(None)
+            else:
+                image_location = ImageLocationType(**entry)
+                image_location.infer_center_pixel()
+                out.append(image_location)
         return out
 
     def infer_center_pixel(self):
@@ -512,15 +551,22 @@ class GeoLocationType(Serializable):
         else:
             image_shift = numpy.zeros((2, ), dtype='float64')
 
-        kwargs = {}
+        attributes = []
+        coords = []
         for attribute in cls._fields:
             value = getattr(image_location, attribute)
             if value is not None:
-                coords = value.get_array(dtype='float64') + image_shift
-                geo_coords = the_structure.project_image_to_ground_geo(
-                    coords, ordering='latlong', projection_type=projection_type, **proj_kwargs)
+                attributes.append(attribute)
+                coords.append(value.get_array(dtype='float64') + image_shift)
 
-                kwargs[attribute] = geo_coords
+        kwargs = {}
+        if len(coords) > 0:
+            geo_coords = the_structure.project_image_to_ground_geo(
+                numpy.array(coords, dtype='float64'), ordering='latlong',
+                projection_type=projection_type, **proj_kwargs)
+            geo_coords = numpy.reshape(geo_coords, (-1, 3))
+            for attribute, value in zip(attributes, geo_coords):
+                kwargs[attribute] = value
         out = GeoLocationType(**kwargs)
         out.infer_center_pixel()
         return out
@@ -879,7 +925,7 @@ class TheObjectType(Serializable):
         else:
             return 3  # it should be considered out of range
 
-    def set_image_location_from_sicd(self, sicd, populate_in_periphery=False):
+    def set_image_location_from_sicd(self, sicd, populate_in_periphery=False, image_location=None):
         """
         Set the image location information with respect to the given SICD,
         assuming that the physical coordinates are populated.
@@ -888,6 +934,10 @@ class TheObjectType(Serializable):
         ----------
         sicd : SICDType
         populate_in_periphery : bool
+        image_location : None|ImageLocationType
+            The image location already projected from the geographical location,
+            as by :meth:`ImageLocationType.from_geolocations`. If not provided,
+            this will be projected here.
 
         Returns
         -------
@@ -914,7 +964,8 @@ class TheObjectType(Serializable):
             return -1
 
         # gets the prospective image location
-        image_location = ImageLocationType.from_geolocation(self.GeoLocation, sicd)
+        if image_location is None:
+            image_location = ImageLocationType.from_geolocation(self.GeoLocation, sicd)
         if image_location is None:
             return -1
 
@@ -1261,9 +1312,20 @@ class ObjectInfoType(Serializable):
         minimum_pad : None|int|float
         """
 
+        # project the locations of all the objects at once
+        pending = [
+            the_object for the_object in self.Objects
+            if the_object.ImageLocation is None and the_object.GeoLocation is not None]
+        image_locations = {}
+        if len(pending) > 0 and sicd.can_project_coordinates():
+            projected = ImageLocationType.from_geolocations(
+                [the_object.GeoLocation for the_object in pending], sicd)
+            image_locations = {id(the_object): entry for the_object, entry in zip(pending, projected)}
+
         def update_object(temp_object, in_image_count):
             status = temp_object.set_image_location_from_sicd(
-                sicd, populate_in_periphery=populate_in_periphery)
+                sicd, populate_in_periphery=populate_in_periphery,
+                image_location=image_locations.get(id(temp_object), None))
             use_object = False
             if status == 0:
                 raise ValueError('Object already has image details set')
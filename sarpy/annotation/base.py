@@ -7,12 +7,15 @@ __author__ = "Thomas McCullough"
 
 import logging
 import os
+import re
 from uuid import uuid4
 from typing import Optional, Dict, List, Any, Union
 import json
 
 from collections import OrderedDict
 
+import numpy
+
 from sarpy.geometry.geometry_elements import Jsonable, FeatureCollection, Feature, \
     GeometryCollection, GeometryObject, Geometry, basic_assemble_from_collection
 
@@ -644,6 +647,7 @@ class AnnotationCollection(FeatureCollection):
 
     @features.setter
     def features(self, features):
+        self._spatial_index = None
         if features is None:
             self._features = None
             self._feature_dict = None
@@ -669,12 +673,7 @@ class AnnotationCollection(FeatureCollection):
         if not isinstance(feature, AnnotationFeature):
             raise TypeError('This requires an AnnotationFeature instance, got {}'.format(type(feature)))
 
-        if self._features is None:
-            self._feature_dict = {feature.uid: 0}
-            self._features = [feature, ]
-        else:
-            self._feature_dict[feature.uid] = len(self._features)
-            self._features.append(feature)
+        self._append_feature(feature)
 
     def __getitem__(self, item):
         # type: (Any) -> Union[AnnotationFeature, List[AnnotationFeature]]
@@ -687,6 +686,377 @@ class AnnotationCollection(FeatureCollection):
         return self._features[item]
 
 
+##########
+# streaming json and binary sidecar helpers
+
+class _JSONStreamScanner(object):
+    """
+    A minimal incremental scanner over a json text file, which permits stepping
+    into objects and arrays, and decoding individual values, without reading
+    the entire file into memory.
+    """
+
+    __slots__ = ('_file', '_buffer', '_position', '_eof', '_chunk_size')
+    _decoder = json.JSONDecoder()
+    _whitespace = ' \t\n\r'
+
+    def __init__(self, file_object, chunk_size=1048576):
+        self._file = file_object
+        self._buffer = ''
+        self._position = 0
+        self._eof = False
+        self._chunk_size = int(chunk_size)
+
+    def _read_more(self):
+        # discard the consumed portion, and grow the read size with the buffer
+        # so that decoding a very large value requires few attempts
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        data = self._file.read(max(self._chunk_size, len(self._buffer)))
+        if len(data) == 0:
+            self._eof = True
+        self._buffer += data
+
+    def peek(self):
+        """
+        Gets the next non-whitespace character, without consuming it.
+
+        Returns
+        -------
+        str
+            This will be the empty string at the end of the file.
+        """
+
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in self._whitespace:
+                self._position += 1
+            if self._position < len(self._buffer) or self._eof:
+                return self._buffer[self._position:self._position+1]
+            self._read_more()
+
+    def expect(self, characters):
+        """
+        Consume the next non-whitespace character, which must be one of the
+        given characters.
+
+        Parameters
+        ----------
+        characters : str
+
+        Returns
+        -------
+        str
+        """
+
+        value = self.peek()
+        if value == '' or value not in characters:
+            raise ValueError(
+                'Got unexpected character `{}` in json stream, expected one of `{}`'.format(value, characters))
+        self._position += 1
+        return value
+
+    def decode(self):
+        """
+        Decode and consume the next json value.
+
+        Returns
+        -------
+        Any
+        """
+
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # a number at the end of the buffer may be truncated
+                if end < len(self._buffer) or self._eof:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read_more()
+
+    def iterate_object(self):
+        """
+        Step through the next json object, yielding each key. The caller is
+        responsible for consuming the associated value before continuing.
+
+        Yields
+        ------
+        str
+        """
+
+        self.expect('{')
+        if self.peek() == '}':
+            self.expect('}')
+            return
+        while True:
+            key = self.decode()
+            self.expect(':')
+            yield key
+            if self.expect(',}') == '}':
+                return
+
+    def iterate_array(self):
+        """
+        Step through the next json array, yielding the index of each element.
+        The caller is responsible for consuming each element before continuing.
+
+        Yields
+        ------
+        int
+        """
+
+        self.expect('[')
+        if self.peek() == ']':
+            self.expect(']')
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.expect(',]') == ']':
+                return
+
+
+def _iterate_feature_dicts(file_name, header):
+    """
+    Iterate over the annotation feature dictionaries in a serialized file
+    annotation collection, without loading the whole file. The other top level
+    elements encountered are populated in `header`.
+
+    Parameters
+    ----------
+    file_name : str
+    header : dict
+
+    Yields
+    ------
+    dict
+    """
+
+    with open(file_name, 'r') as fi:
+        scanner = _JSONStreamScanner(fi)
+        for key in scanner.iterate_object():
+            if key != 'annotations' or scanner.peek() != '{':
+                header[key] = scanner.decode()
+                continue
+            for sub_key in scanner.iterate_object():
+                if sub_key == 'features' and scanner.peek() == '[':
+                    for _ in scanner.iterate_array():
+                        yield scanner.decode()
+                else:
+                    scanner.decode()
+
+
+def _read_file_header(file_name):
+    """
+    Reads the top level elements of a serialized file annotation collection,
+    stopping at the first annotation feature.
+
+    Parameters
+    ----------
+    file_name : str
+
+    Returns
+    -------
+    header : dict
+    features_state : str
+        One of `'absent'`, `'null'`, or `'array'`, describing the annotation
+        features element.
+    """
+
+    header = OrderedDict()
+    with open(file_name, 'r') as fi:
+        scanner = _JSONStreamScanner(fi)
+        for key in scanner.iterate_object():
+            if key != 'annotations':
+                header[key] = scanner.decode()
+                continue
+            if scanner.peek() != '{':
+                raise ValueError('Got unexpected annotations element in file {}'.format(file_name))
+            for sub_key in scanner.iterate_object():
+                if sub_key != 'features':
+                    scanner.decode()
+                elif scanner.peek() == '[':
+                    return header, 'array'
+                elif scanner.decode() is None:
+                    return header, 'null'
+                else:
+                    raise ValueError('Got unexpected features element in file {}'.format(file_name))
+    return header, 'absent'
+
+
+def _indented_json(value, depth):
+    """
+    Serialize to json in the same format as `json.dump(..., indent=1)`, for
+    inclusion at the given nesting depth.
+
+    Parameters
+    ----------
+    value : Any
+    depth : int
+
+    Returns
+    -------
+    str
+    """
+
+    return json.dumps(value, indent=1).replace('\n', '\n' + ' '*depth)
+
+
+def _append_feature_dicts(file_name, feature_dicts, collection_type):
+    """
+    Append the features to the serialized file annotation collection, by
+    rewriting only the closing portion of the file.
+
+    Parameters
+    ----------
+    file_name : str
+    feature_dicts : List[dict]
+    collection_type : str
+        The type of the annotation collection, used if annotations are absent.
+    """
+
+    if len(feature_dicts) == 0:
+        return
+
+    _, features_state = _read_file_header(file_name)
+    items = ',\n   '.join(_indented_json(entry, 3) for entry in feature_dicts)
+
+    with open(file_name, 'rb+') as fi:
+        fi.seek(0, os.SEEK_END)
+        start = max(0, fi.tell() - 4096)
+        fi.seek(start)
+        tail = fi.read()
+
+        closing = '\n  ]\n }\n}'
+        if features_state == 'absent':
+            match = re.search(rb'\s*}\s*\Z', tail)
+            cut = None if match is None else match.start()
+            insert = ',\n "annotations": {\n  "type": ' + json.dumps(collection_type) + \
+                     ',\n  "features": [\n   ' + items + closing
+        elif features_state == 'null':
+            match = re.search(rb'null\s*}\s*}\s*\Z', tail)
+            cut = None if match is None else match.start()
+            insert = '[\n   ' + items + closing
+        else:
+            match = re.search(rb'\]\s*}\s*}\s*\Z', tail)
+            cut = None if match is None else len(tail[:match.start()].rstrip())
+            if match is not None and tail[:cut].endswith(b'['):
+                insert = '\n   ' + items + closing
+            else:
+                insert = ',\n   ' + items + closing
+        if cut is None:
+            raise ValueError(
+                'Unable to append to file {}, since it has unexpected json structure'.format(file_name))
+        fi.seek(start + cut)
+        fi.truncate()
+        fi.write(insert.encode('utf-8'))
+
+
+# the number of list levels above the coordinate arrays for each geometry type
+_coordinate_depth = {
+    'Point': 0, 'MultiPoint': 0, 'LineString': 0, 'MultiLineString': 1,
+    'Polygon': 1, 'MultiPolygon': 2}
+
+
+def _strip_coordinates(geometry, arrays):
+    """
+    Replace the coordinates of a geometry dictionary with integer references
+    into the list of coordinate arrays, to which they are appended.
+
+    Parameters
+    ----------
+    geometry : None|dict
+    arrays : List[numpy.ndarray]
+
+    Returns
+    -------
+    None|dict
+    """
+
+    def strip(value, depth):
+        if depth == 0:
+            arrays.append(numpy.asarray(value, dtype='float64'))
+            return len(arrays) - 1
+        return [strip(entry, depth-1) for entry in value]
+
+    if geometry is None:
+        return None
+    out = OrderedDict(geometry)
+    if out.get('type', None) == 'GeometryCollection':
+        if out.get('geometries', None) is not None:
+            out['geometries'] = [_strip_coordinates(entry, arrays) for entry in out['geometries']]
+    elif out.get('coordinates', None) is not None:
+        out['coordinates'] = strip(out['coordinates'], _coordinate_depth[out['type']])
+    return out
+
+
+def _restore_coordinates(geometry, arrays):
+    """
+    The inverse of :func:`_strip_coordinates`.
+
+    Parameters
+    ----------
+    geometry : None|dict
+    arrays : List[numpy.ndarray]
+
+    Returns
+    -------
+    None|dict
+    """
+
+    def restore(value, depth):
+        if depth == 0:
+            return arrays[value]
+        return [restore(entry, depth-1) for entry in value]
+
+    if geometry is None:
+        return None
+    if geometry.get('type', None) == 'GeometryCollection':
+        if geometry.get('geometries', None) is not None:
+            geometry['geometries'] = [_restore_coordinates(entry, arrays) for entry in geometry['geometries']]
+    elif geometry.get('coordinates', None) is not None:
+        geometry['coordinates'] = restore(geometry['coordinates'], _coordinate_depth[geometry['type']])
+    return geometry
+
+
+def _geometry_dict_intersects(geometry, bbox):
+    """
+    Does the bounding box of the geometry dictionary intersect the given
+    bounding box? This avoids constructing the geometry object.
+
+    Parameters
+    ----------
+    geometry : None|dict
+    bbox : numpy.ndarray|List[float]
+
+    Returns
+    -------
+    bool
+    """
+
+    arrays = []
+    _strip_coordinates(geometry, arrays)
+    arrays = [entry for entry in arrays if entry.size > 0]
+    if len(arrays) == 0:
+        return False
+    coords = numpy.vstack([numpy.reshape(entry[..., :2], (-1, 2)) for entry in arrays])
+    mins = coords.min(axis=0)
+    maxs = coords.max(axis=0)
+    return mins[0] <= bbox[2] and maxs[0] >= bbox[0] and mins[1] <= bbox[3] and maxs[1] >= bbox[1]
+
+
+def _json_to_array(value):
+    return numpy.frombuffer(json.dumps(value).encode('utf-8'), dtype='uint8')
+
+
+def _array_to_json(value):
+    return json.loads(value.tobytes().decode('utf-8'))
+
+
 class FileAnnotationCollection(Jsonable):
     """
     An collection of annotation elements associated with a given single image element file.
@@ -695,6 +1065,8 @@ class FileAnnotationCollection(Jsonable):
     __slots__ = (
          '_version', '_image_file_name', '_image_id', '_core_name', '_annotations')
     _type = 'FileAnnotationCollection'
+    _feature_type = AnnotationFeature
+    _collection_type = AnnotationCollection
 
     def __init__(self, version=None, annotations=None, image_file_name=None, image_id=None, core_name=None):
         if version is None:
@@ -865,7 +1237,19 @@ class FileAnnotationCollection(Jsonable):
             image_id=the_dict.get('image_id', None),
             core_name=the_dict.get('core_name', None))
 
-    def to_dict(self, parent_dict=None):
+    def _header_dict(self, parent_dict=None):
+        """
+        Populate the dictionary representation of everything except the annotations.
+
+        Parameters
+        ----------
+        parent_dict : None|dict
+
+        Returns
+        -------
+        dict
+        """
+
         if parent_dict is None:
             parent_dict = OrderedDict()
         parent_dict['type'] = self.type
@@ -876,6 +1260,10 @@ class FileAnnotationCollection(Jsonable):
             parent_dict['image_id'] = self.image_id
         if self.core_name is not None:
             parent_dict['core_name'] = self.core_name
+        return parent_dict
+
+    def to_dict(self, parent_dict=None):
+        parent_dict = self._header_dict(parent_dict)
         if self.annotations is not None:
             parent_dict['annotations'] = self.annotations.to_dict()
         return parent_dict
@@ -883,3 +1271,295 @@ class FileAnnotationCollection(Jsonable):
     def to_file(self, file_name):
         with open(file_name, 'w') as fi:
             json.dump(self.to_dict(), fi, indent=1)
+
+    @classmethod
+    def iterate_features(cls, file_name, bbox=None, filter_function=None):
+        """
+        Iterate over the annotations in a (json) file, as written by :meth:`to_file`,
+        without loading the whole file. Each annotation is only constructed
+        if it passes the given filters.
+
+        Parameters
+        ----------
+        file_name : str
+        bbox : None|numpy.ndarray|List[float]
+            If provided, only annotations whose geometry bounding box intersects
+            this bounding box, of the form `[min coord 0, min coord 1, max coord 0, max coord 1]`,
+            will be yielded.
+        filter_function : None|callable
+            If provided, this will be called on the dictionary representation of
+            each annotation, and only annotations for which it returns `True`
+            will be yielded.
+
+        Yields
+        ------
+        AnnotationFeature
+        """
+
+        header = {}
+        type_checked = False
+        for the_dict in _iterate_feature_dicts(file_name, header):
+            if not type_checked:
+                if header.get('type', 'NONE') != cls._type:
+                    raise ValueError('{} cannot be constructed from file {}'.format(cls.__name__, file_name))
+                type_checked = True
+            if filter_function is not None and not filter_function(the_dict):
+                continue
+            if bbox is not None and not _geometry_dict_intersects(the_dict.get('geometry', None), bbox):
+                continue
+            yield cls._feature_type.from_dict(the_dict)
+
+    @classmethod
+    def _from_file_header(cls, file_name):
+        """
+        Define from the top level elements of a (json) file, without reading
+        the annotations.
+
+        Parameters
+        ----------
+        file_name : str
+
+        Returns
+        -------
+        FileAnnotationCollection
+        """
+
+        header, _ = _read_file_header(file_name)
+        header.pop('annotations', None)
+        return cls.from_dict(header)
+
+    @classmethod
+    def _validate_appended_annotations(cls, file_name, annotations):
+        """
+        Validate the annotations to be appended to the given file.
+
+        Parameters
+        ----------
+        file_name : str
+        annotations : List[AnnotationFeature]
+        """
+
+        for annotation in annotations:
+            if not isinstance(annotation, cls._feature_type):
+                raise TypeError(
+                    'This requires an {} instance. Got {}'.format(cls._feature_type.__name__, type(annotation)))
+
+    @classmethod
+    def append_to_file(cls, file_name, annotations):
+        """
+        Append annotations to an existing (json) file, as written by :meth:`to_file`,
+        without reading or rewriting the whole file. Note that the uniqueness
+        of the annotation identifiers is not checked.
+
+        Parameters
+        ----------
+        file_name : str
+        annotations : AnnotationFeature|dict|List[AnnotationFeature|dict]
+        """
+
+        if not isinstance(annotations, (list, tuple)):
+            annotations = [annotations, ]
+        annotations = [
+            cls._feature_type.from_dict(entry) if isinstance(entry, dict) else entry for entry in annotations]
+        cls._validate_appended_annotations(file_name, annotations)
+        _append_feature_dicts(
+            file_name, [entry.to_dict() for entry in annotations], cls._collection_type._type)
+
+    def to_sidecar(self, file_name):
+        """
+        Write to a compact binary (numpy `.npz` format) file, which permits much
+        faster reloading using :meth:`from_sidecar`. The coordinates of all
+        geometries are stored in a single columnar array, along with the feature
+        bounding boxes, while the uids, properties and geometry structures are
+        stored as json.
+
+        Parameters
+        ----------
+        file_name : str
+        """
+
+        header = self._header_dict()
+        annotations = self.annotations
+        features = [] if annotations is None or annotations.features is None else annotations.features
+        uids = []
+        properties = []
+        geometries = []
+        arrays = []
+        array_offsets = [0, ]
+        bboxes = numpy.full((len(features), 4), numpy.nan, dtype='float64')
+        for index, feature in enumerate(features):
+            the_dict = feature.to_dict()
+            uids.append(the_dict['id'])
+            properties.append(the_dict.get('properties', None))
+            geometries.append(_strip_coordinates(the_dict.get('geometry', None), arrays))
+            if len(arrays) > array_offsets[-1]:
+                coords = numpy.vstack([numpy.reshape(entry[..., :2], (-1, 2)) for entry in arrays[array_offsets[-1]:]])
+                bboxes[index, :2] = numpy.min(coords, axis=0)
+                bboxes[index, 2:] = numpy.max(coords, axis=0)
+            array_offsets.append(len(arrays))
+
+        coordinate_offsets = numpy.cumsum([0, ] + [entry.size for entry in arrays], dtype='int64')
+        coordinates = numpy.concatenate([entry.ravel() for entry in arrays]) if len(arrays) > 0 else \
+            numpy.zeros((0, ), dtype='float64')
+        with open(file_name, 'wb') as fi:
+            numpy.savez(
+                fi,
+                header=_json_to_array(header),
+                uids=_json_to_array(uids),
+                properties=_json_to_array(properties),
+                geometries=_json_to_array(geometries),
+                bboxes=bboxes,
+                array_offsets=numpy.array(array_offsets, dtype='int64'),
+                coordinates=coordinates,
+                coordinate_offsets=coordinate_offsets,
+                coordinate_ndim=numpy.array([entry.ndim for entry in arrays], dtype='int8'),
+                coordinate_dim=numpy.array([entry.shape[-1] for entry in arrays], dtype='int8'))
+
+    @classmethod
+    def from_sidecar(cls, file_name, bbox=None):
+        """
+        Read from a binary file written by :meth:`to_sidecar`.
+
+        Parameters
+        ----------
+        file_name : str
+        bbox : None|numpy.ndarray|List[float]
+            If provided, only annotations whose geometry bounding box intersects
+            this bounding box, of the form `[min coord 0, min coord 1, max coord 0, max coord 1]`,
+            will be loaded.
+
+        Returns
+        -------
+        FileAnnotationCollection
+        """
+
+        with numpy.load(file_name, allow_pickle=False) as data:
+            header = _array_to_json(data['header'])
+            if header.get('type', 'NONE') != cls._type:
+                raise ValueError('{} cannot be constructed from file {}'.format(cls.__name__, file_name))
+            uids = _array_to_json(data['uids'])
+            properties = _array_to_json(data['properties'])
+            geometries = _array_to_json(data['geometries'])
+            bboxes = data['bboxes']
+            array_offsets = data['array_offsets']
+            coordinates = data['coordinates']
+            coordinate_offsets = data['coordinate_offsets']
+            coordinate_ndim = data['coordinate_ndim']
+            coordinate_dim = data['coordinate_dim']
+
+        if bbox is None:
+            indices = numpy.arange(len(uids))
+        else:
+            bbox = numpy.asarray(bbox, dtype='float64')
+            indices = numpy.nonzero(
+                (bboxes[:, 0] <= bbox[2]) & (bboxes[:, 2] >= bbox[0]) &
+                (bboxes[:, 1] <= bbox[3]) & (bboxes[:, 3] >= bbox[1]))[0]
+
+        features = []
+        for index in indices:
+            arrays = {}
+            for array_index in range(array_offsets[index], array_offsets[index+1]):
+                coords = coordinates[coordinate_offsets[array_index]:coordinate_offsets[array_index+1]]
+                if coordinate_ndim[array_index] == 2:
+                    coords = numpy.reshape(coords, (-1, coordinate_dim[array_index]))
+                arrays[array_index] = coords
+            features.append(cls._feature_type(
+                uid=uids[index],
+                geometry=_restore_coordinates(geometries[index], arrays),
+                properties=properties[index]))
+
+        out = cls.from_dict(header)
+        out.annotations = cls._collection_type(features=features)
+        return out
+
+
+def _validate_projection_structure(structure):
+    """
+    Verify that the structure permits projection, and make sure that the
+    COA projection is defined, so it is not redefined for each call.
+
+    Parameters
+    ----------
+    structure : SICDType|SIDDType
+    """
+
+    if not structure.can_project_coordinates():
+        raise ValueError('The provided structure does not permit projection of coordinates')
+    structure.define_coa_projection(override=False)
+
+
+def project_collection_to_ground(collection, structure, ordering='latlong', projection_type='HAE', **proj_kwargs):
+    """
+    Project a collection with geometries in image (row, column) coordinates to
+    a new collection with geometries in geographic coordinates. All vertices of
+    all features are projected in a single vectorized call.
+
+    Parameters
+    ----------
+    collection : FeatureCollection
+        For example, an AnnotationCollection.
+    structure : SICDType|SIDDType
+        The structure providing the projection.
+    ordering : str
+        One of `'latlong'` or `'longlat'`, for the output coordinates.
+    projection_type : str
+        The projection type selector, one of `['PLANE', 'HAE', 'DEM']`. Using `'DEM'`
+        requires configuration for the DEM pathway described in
+        :func:`sarpy.geometry.point_projection.image_to_ground_dem`.
+    proj_kwargs
+        The keyword arguments for the :func:`SICDType.project_image_to_ground_geo` method.
+
+    Returns
+    -------
+    FeatureCollection
+        Of the same type as the input collection.
+    """
+
+    _validate_projection_structure(structure)
+
+    def proj_method(coords):
+        return structure.project_image_to_ground_geo(
+            coords[:, :2], ordering=ordering, projection_type=projection_type, **proj_kwargs)
+
+    return collection.apply_projection(proj_method)
+
+
+def project_collection_to_image(collection, structure, ordering='latlong', hae=None, **proj_kwargs):
+    """
+    Project a collection with geometries in geographic coordinates to a new
+    collection with geometries in image (row, column) coordinates. All vertices
+    of all features are projected in a single vectorized call.
+
+    Parameters
+    ----------
+    collection : FeatureCollection
+        For example, an AnnotationCollection.
+    structure : SICDType|SIDDType
+        The structure providing the projection.
+    ordering : str
+        One of `'latlong'` or `'longlat'`, for the input coordinates.
+    hae : None|float
+        The height above the ellipsoid to use for any two-dimensional coordinates.
+        This is required if any coordinates do not include height.
+    proj_kwargs
+        The keyword arguments for the :func:`SICDType.project_ground_to_image_geo` method.
+
+    Returns
+    -------
+    FeatureCollection
+        Of the same type as the input collection.
+    """
+
+    _validate_projection_structure(structure)
+
+    def proj_method(coords):
+        if coords.shape[1] == 2:
+            if hae is None:
+                raise ValueError(
+                    'Geometry coordinates do not include height, so hae must be provided')
+            coords = numpy.hstack((coords, numpy.full((coords.shape[0], 1), hae, dtype='float64')))
+        image_coords, _, _ = structure.project_ground_to_image_geo(
+            coords[:, :3], ordering=ordering, **proj_kwargs)
+        return image_coords
+
+    return collection.apply_projection(proj_method)
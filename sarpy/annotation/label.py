@@ -1163,6 +1163,7 @@ class LabelCollection(AnnotationCollection):
 
     @features.setter
     def features(self, features):
+        self._spatial_index = None
         if features is None:
             self._features = None
             self._feature_dict = None
@@ -1190,12 +1191,7 @@ class LabelCollection(AnnotationCollection):
         if not isinstance(feature, LabelFeature):
             raise TypeError('This requires an LabelFeature instance, got {}'.format(type(feature)))
 
-        if self._features is None:
-            self._feature_dict = {feature.uid: 0}
-            self._features = [feature, ]
-        else:
-            self._feature_dict[feature.uid] = len(self._features)
-            self._features.append(feature)
+        self._append_feature(feature)
 
     def __getitem__(self, item):
         # type: (Any) -> Union[LabelFeature, List[LabelFeature]]
@@ -1219,6 +1215,8 @@ class FileLabelCollection(FileAnnotationCollection):
     __slots__ = (
         '_version', '_label_schema', '_image_file_name', '_image_id', '_core_name', '_annotations')
     _type = 'FileLabelCollection'
+    _feature_type = LabelFeature
+    _collection_type = LabelCollection
 
     def __init__(self, label_schema, version=None, annotations=None,
                  image_file_name=None, image_id=None, core_name=None):
@@ -1364,6 +1362,14 @@ class FileLabelCollection(FileAnnotationCollection):
             raise ValueError('Some annotation does not follow the schema.')
         return valid
 
+    @classmethod
+    def _validate_appended_annotations(cls, file_name, annotations):
+        super(FileLabelCollection, cls)._validate_appended_annotations(file_name, annotations)
+        checker = cls._from_file_header(file_name)
+        for annotation in annotations:
+            if not checker.is_annotation_valid(annotation):
+                raise ValueError('LabelFeature does not follow the schema.')
+
     @classmethod
     def from_file(cls, file_name):
         """
@@ -1413,7 +1419,7 @@ class FileLabelCollection(FileAnnotationCollection):
             image_id=the_dict.get('image_id', None),
             core_name=the_dict.get('core_name', None))
 
-    def to_dict(self, parent_dict=None):
+    def _header_dict(self, parent_dict=None):
         if parent_dict is None:
             parent_dict = OrderedDict()
         parent_dict['type'] = self.type
@@ -1425,6 +1431,4 @@ class FileLabelCollection(FileAnnotationCollection):
             parent_dict['image_id'] = self.image_id
         if self.core_name is not None:
             parent_dict['core_name'] = self.core_name
-        if self.annotations is not None:
-            parent_dict['annotations'] = self.annotations.to_dict()
         return parent_dict
@@ -205,18 +205,16 @@ def create_rcs_value_collection_for_reader(reader, polygon):
                 x_array = get_im_physical_coords(row_array, sicd.Grid, sicd.ImageData, 'Row')
                 col_array = numpy.arange(col_bounds[0], col_bounds[1], 1, dtype=numpy.int32)
                 y_array = get_im_physical_coords(col_array, sicd.Grid, sicd.ImageData, 'Col')
-                yarr, xarr = numpy.meshgrid(y_array, x_array)
-                xarr = xarr[mask]
-                yarr = yarr[mask]
 
-                noise_power = numpy.exp(numpy.log(10)*0.1*noise_poly(xarr, yarr)) if has_noise else None
+                noise_power = numpy.exp(numpy.log(10)*0.1*noise_poly.evaluate_grid(x_array, y_array)[mask]) \
+                    if has_noise else None
                 if has_noise:
                     # add the noise statistics for the pixel power
                     calculate_statistics(noise_power, current_stat_entries['PixelPower']['noise'])
 
                 for units_name, rcs_poly_name in DEFAULT_NAME_MAPPING.items():
                     the_poly = getattr(sicd.Radiometric, rcs_poly_name)
-                    sf_data = the_poly(xarr, yarr)
+                    sf_data = the_poly.evaluate_grid(x_array, y_array)[mask]
                     calculate_statistics(sf_data*data, current_stat_entries[units_name]['value'])
                     if has_noise:
                         calculate_statistics(sf_data*noise_power, current_stat_entries[units_name]['noise'])
@@ -600,6 +598,7 @@ class RCSCollection(AnnotationCollection):
 
     @features.setter
     def features(self, features):
+        self._spatial_index = None
         if features is None:
             self._features = None
             self._feature_dict = None
@@ -626,12 +625,7 @@ class RCSCollection(AnnotationCollection):
         if not isinstance(feature, RCSFeature):
             raise TypeError('This requires an RCSFeature instance, got {}'.format(type(feature)))
 
-        if self._features is None:
-            self._feature_dict = {feature.uid: 0}
-            self._features = [feature, ]
-        else:
-            self._feature_dict[feature.uid] = len(self._features)
-            self._features.append(feature)
+        self._append_feature(feature)
 
     def __getitem__(self, item):
         # type: (Any) -> Union[RCSFeature, List[RCSFeature]]
@@ -652,6 +646,8 @@ class FileRCSCollection(FileAnnotationCollection):
     An collection of RCS statistics elements.
     """
     _type = 'FileRCSCollection'
+    _feature_type = RCSFeature
+    _collection_type = RCSCollection
 
     def __init__(self, version=None, annotations=None, image_file_name=None,
                  image_id=None, core_name=None):
@@ -11,13 +11,19 @@ __author__ = "Nathan Bombaci, Valkyrie"
 import collections
 import contextlib
 import linecache
+import logging
 import re
 import sys
 import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 
 def _exception_stack():
     """
@@ -57,17 +63,33 @@ class ConsistencyChecker(object):
 
     This class can be used to perform and log comparisons. Each comparison
     can be logged as either an ``'Error'`` or a ``'Warning'``.
+
+    Checks may be run concurrently in worker threads, so the active check
+    is tracked per thread. Check methods should not modify shared state.
     """
 
     def __init__(self):
         self._all_check_results = collections.OrderedDict()
-        self._active_check = None
+        self._check_times = collections.OrderedDict()
+        self._local = threading.local()
 
         names = [name for name in dir(self) if name.startswith('check_')]
         attrs = [getattr(self, name) for name in sorted(names)]
         self.funcs = [attr for attr in attrs if hasattr(attr, '__call__')]
 
-    def check(self, func_name=None, *, allow_prefix=False, ignore_patterns=None):
+    @property
+    def _active_check(self):
+        """
+        None|Dict: The results of the check running in the current thread.
+        """
+
+        return getattr(self._local, 'active_check', None)
+
+    @_active_check.setter
+    def _active_check(self, value):
+        self._local.active_check = value
+
+    def check(self, func_name=None, *, allow_prefix=False, ignore_patterns=None, max_workers=None):
         """
         Run checks.
 
@@ -82,6 +104,10 @@ class ConsistencyChecker(object):
             If ``False``, runs tests with names equal to any `func_name`
         ignore_patterns: list-like of str
             Skips tests if zero or more characters at the beginning of their name match the regular expression patterns
+        max_workers: None|int
+            The number of worker threads used to run independent checks
+            concurrently. If omitted, the checks are run sequentially.
+            The results are recorded in the same order in either case.
         """
         # run specified test(s) or all of them
         if func_name is None:
@@ -111,17 +137,36 @@ class ConsistencyChecker(object):
         for pattern in (ignore_patterns or []):
             funcs = [func for func in funcs if not re.match(pattern, func.__name__)]
 
-        for func in funcs:
-            self._run_check(func)
+        if max_workers is not None and int(max_workers) < 1:
+            raise ValueError('max_workers must be a positive integer, got {}'.format(max_workers))
+
+        start = time.perf_counter()
+        if max_workers is None or int(max_workers) == 1 or len(funcs) < 2:
+            results = [self._run_check(func) for func in funcs]
+        else:
+            with ThreadPoolExecutor(max_workers=int(max_workers)) as executor:
+                results = list(executor.map(self._run_check, funcs))
+
+        for func, (result, elapsed) in zip(funcs, results):
+            self._all_check_results[func.__name__] = result
+            self._check_times[func.__name__] = elapsed
+        logger.info('Ran {} checks in {:.3f} seconds'.format(len(funcs), time.perf_counter() - start))
 
     def _run_check(self, func):
         """
-        Runs a single 'check_' method and store the results.
+        Runs a single 'check_' method and returns the results.
 
         Parameters
         ----------
         func: Callable
             Run the supplied function
+
+        Returns
+        -------
+        result : Dict
+            The check results.
+        elapsed : float
+            The time taken by the check, in seconds.
         """
 
         self._active_check = {
@@ -130,6 +175,7 @@ class ConsistencyChecker(object):
             'passed': True}
 
         # func() will populate self._active_check
+        start = time.perf_counter()
         try:
             func()
         except Exception as e:
@@ -140,9 +186,12 @@ class ConsistencyChecker(object):
                                                                              line=frame['line']))
             message.append(str(e))
             self._add_item_to_current('Error', False, '\n'.join(message), details="Exception Raised")
+        elapsed = time.perf_counter() - start
+        logger.debug('Check {} took {:.3f} seconds'.format(func.__name__, elapsed))
 
-        self._all_check_results[func.__name__] = self._active_check
+        result = self._active_check
         self._active_check = None
+        return result, elapsed
 
     def _add_item_to_current(self, severity, passed, message, details=''):
         """
@@ -264,6 +313,32 @@ class ConsistencyChecker(object):
                 details = stack[1]['line']
             self._add_item_to_current('No-Op', True, self._format_assertion(e), details=details)
 
+    def timings(self):
+        """
+        Returns the time taken by each check which has been run.
+
+        Returns
+        -------
+        Dict
+            Dictionary of check name to elapsed time in seconds
+        """
+
+        return collections.OrderedDict(self._check_times)
+
+    def print_timings(self, count=None):
+        """
+        Print the check timings to stdout, slowest first.
+
+        Parameters
+        ----------
+        count : None|int
+            Print only the `count` slowest checks
+        """
+
+        ordered = sorted(self._check_times.items(), key=lambda item: item[1], reverse=True)
+        for name, elapsed in ordered[:count]:
+            print("{:10.3f}s  {}".format(elapsed, name))
+
     def all(self):
         """
         Returns all results.
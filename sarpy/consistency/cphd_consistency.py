@@ -17,19 +17,19 @@ import itertools
 import numbers
 import os
 import re
+import threading
 from typing import List
 
 import numpy as np
 import numpy.polynomial.polynomial as npp
 import scipy.constants
 
-from sarpy.geometry import geocoords
-
 import sarpy.consistency.consistency as con
 import sarpy.consistency.parsers as parsers
 import sarpy.io.phase_history.cphd1_elements.CPHD
 import sarpy.io.phase_history.cphd1_elements.utils as cphd1_utils
 from sarpy.io.phase_history import cphd_schema
+from sarpy.io.phase_history.pvp_geometry import PVPGeometry
 
 logger = logging.getLogger(__name__)
 
@@ -210,13 +210,21 @@ class CphdConsistency(con.ConsistencyChecker):
         Path to CPHD XML Schema. If None, tries to find a version-specific schema
     check_signal_data: bool
         Should the signal array be checked for invalid values
+    signal_chunk_bytes: int
+        The approximate number of signal array bytes examined at a time when
+        checking the signal data
     """
 
-    def __init__(self, cphdroot, pvps, header, filename, schema=None, check_signal_data=False):
+    def __init__(self, cphdroot, pvps, header, filename, schema=None, check_signal_data=False,
+                 signal_chunk_bytes=64*2**20):
         super(CphdConsistency, self).__init__()
         self.xml_with_ns = etree.fromstring(etree.tostring(cphdroot))  # handle element or tree -> element
         self.xml = strip_namespace(self.xml_with_ns)
         self.pvps = pvps
+        self.signal_chunk_bytes = int(signal_chunk_bytes)
+        # values derived from the PVPs which are shared between checks
+        self._derived_cache = {}
+        self._derived_lock = threading.RLock()
         self.filename = filename
         self.header = header
         self.version = self._version_lookup()
@@ -247,7 +255,7 @@ class CphdConsistency(con.ConsistencyChecker):
                 self.funcs[index:index+1] = subfuncs
 
     @classmethod
-    def from_file(cls, filename, schema=None, check_signal_data=False):
+    def from_file(cls, filename, schema=None, check_signal_data=False, signal_chunk_bytes=64*2**20):
         """
         Create a CphdConsistency object from a CPHD file.
 
@@ -259,6 +267,8 @@ class CphdConsistency(con.ConsistencyChecker):
             Path to CPHD XML Schema. If None, tries to find a version-specific schema
         check_signal_data : bool
             Should the signal array be checked for invalid values
+        signal_chunk_bytes : int
+            The approximate number of signal array bytes examined at a time
 
         Returns
         -------
@@ -294,7 +304,8 @@ class CphdConsistency(con.ConsistencyChecker):
                                              count=int(channel_node.findtext('./NumVectors')),
                                              offset=int(channel_node.findtext('./PVPArrayByteOffset')))
                 pvps[channel_id] = channel_pvps
-        return cls(cphdroot, pvps, header, filename, schema=schema, check_signal_data=check_signal_data)
+        return cls(cphdroot, pvps, header, filename, schema=schema, check_signal_data=check_signal_data,
+                   signal_chunk_bytes=signal_chunk_bytes)
 
     def _version_lookup(self):
         """
@@ -316,6 +327,40 @@ class CphdConsistency(con.ConsistencyChecker):
         assert channel_id in self.pvps
         return self.pvps[channel_id]
 
+    def _get_derived(self, key, function):
+        """
+        Returns the value derived from the PVPs by `function`, which is computed
+        once and shared between checks (which may be running concurrently).
+        """
+        with self._derived_lock:
+            if key not in self._derived_cache:
+                self._derived_cache[key] = function()
+            return self._derived_cache[key]
+
+    def _get_all_pvps(self):
+        """
+        Returns the PVPs for all channels concatenated, or raises an AssertionError.
+        """
+        assert self.pvps is not None
+        return self._get_derived('all_pvps', lambda: np.concatenate(list(self.pvps.values())))
+
+    def _get_refgeom_parameters(self):
+        """
+        Returns the expected reference geometry parameters.
+        """
+        def compute():
+            ref_id = self.xml.findtext('./Channel/RefChId')
+            return calc_refgeom_parameters(self.xml, self.pvps, geometry=self._get_pvp_geometry(ref_id))
+
+        return self._get_derived('refgeom', compute)
+
+    def _get_pvp_geometry(self, channel_id):
+        """
+        Returns the :class:`PVPGeometry` for the channel keyed by `channel_id`, or raises an AssertionError.
+        """
+        pvp = self._get_channel_pvps(channel_id)
+        return self._get_derived(('pvp_geometry', channel_id), lambda: PVPGeometry(pvp))
+
     def check_file_type_header(self):
         """
         Version in File Type Header matches the version in the XML.
@@ -651,7 +696,7 @@ class CphdConsistency(con.ConsistencyChecker):
 
         with self.precondition():
             assert self.pvps is not None
-            pvp = np.concatenate(list(self.pvps.values()))
+            pvp = self._get_all_pvps()
             fx1_tol = con.Approx(np.nanmean(pvp['FX1']))
             fx2_tol = con.Approx(np.nanmean(pvp['FX2']))
             fx1_min_max = np.array([pvp['FX1'].min(), pvp['FX1'].max()])
@@ -682,7 +727,7 @@ class CphdConsistency(con.ConsistencyChecker):
 
         with self.precondition():
             assert self.pvps is not None
-            pvp = np.concatenate(list(self.pvps.values()))
+            pvp = self._get_all_pvps()
             toa1_tol = con.Approx(np.nanmean(pvp['TOA1']), atol=1e-11)
             toa2_tol = con.Approx(np.nanmean(pvp['TOA2']), atol=1e-11)
             toa1_min_max = np.array([pvp['TOA1'].min(), pvp['TOA1'].max()])
@@ -713,7 +758,7 @@ class CphdConsistency(con.ConsistencyChecker):
 
         with self.precondition():
             assert self.pvps is not None
-            pvp = np.concatenate(list(self.pvps.values()))
+            pvp = self._get_all_pvps()
             with self.precondition():
                 assert parsers.parse_bool(self.xml.find('./Channel/SRPFixedCPHD'))
                 with self.need("SRPPos is fixed"):
@@ -892,15 +937,9 @@ class CphdConsistency(con.ConsistencyChecker):
         aFDOP PVP is consistent with other PVPs.
         """
 
-        def calc_rdot(pos, vel, srp):
-            return (vel * unit(pos - srp)).sum(axis=-1)
-
         with self.precondition():
             pvp = self._get_channel_pvps(channel_id)
-            rdot_xmt_srp = calc_rdot(pvp['TxPos'], pvp['TxVel'], pvp['SRPPos'])
-            rdot_rcv_srp = calc_rdot(pvp['RcvPos'], pvp['RcvVel'], pvp['SRPPos'])
-            rdot_avg_srp = 0.5 * (rdot_xmt_srp + rdot_rcv_srp)
-            afdop_expected = rdot_avg_srp * (-2 / scipy.constants.speed_of_light)
+            afdop_expected = self._get_pvp_geometry(channel_id).afdop
             mask = np.logical_and(np.isfinite(afdop_expected), np.isfinite(pvp['aFDOP']))
             assert mask.any()
             assert np.count_nonzero(pvp['aFDOP'])  # CPHD advises these "may be set equal to zero for all vectors"
@@ -1200,11 +1239,16 @@ class CphdConsistency(con.ConsistencyChecker):
                 assert self.check_signal_data
                 assert self.filename is not None
                 assert format_string == 'CF8'
+                signal = np.memmap(self.filename, signal_dtype.newbyteorder('B'), mode='r',
+                                   offset=signal_file_offset, shape=(num_vectors, num_samples), order='C')
+                chunk_vectors = max(1, self.signal_chunk_bytes // max(1, num_samples * signal_dtype.itemsize))
                 with self.need("All signal samples are finite and not NaN"):
-                    assert np.all(np.isfinite(np.memmap(self.filename, signal_dtype.newbyteorder('B'), mode='r',
-                                                        offset=signal_file_offset,
-                                                        shape=(num_vectors, num_samples),
-                                                        order='C')))
+                    # examine the signal array in bounded pieces, stopping at the first bad vector
+                    for start in range(0, num_vectors, chunk_vectors):
+                        finite = np.isfinite(signal[start:start + chunk_vectors]).all(axis=1)
+                        bad_vectors = start + np.nonzero(~finite)[0]
+                        assert bad_vectors.size == 0, f"Vector {bad_vectors[0]} has a non-finite signal sample"
+                del signal
 
     @per_channel
     def check_channel_normal_signal_pvp(self, channel_id, channel_node):
@@ -1421,7 +1465,7 @@ class CphdConsistency(con.ConsistencyChecker):
 
         with self.precondition():
             assert self.pvps is not None
-            refgeom = calc_refgeom_parameters(self.xml, self.pvps).refgeom
+            refgeom = self._get_refgeom_parameters().refgeom
             self._check_refgeom_parameters(self.xml.find('./ReferenceGeometry'), refgeom)
 
     def check_refgeom_monostatic(self):
@@ -1436,7 +1480,7 @@ class CphdConsistency(con.ConsistencyChecker):
                 assert refgeom_mono is not None
 
             assert self.pvps is not None
-            monostat = calc_refgeom_parameters(self.xml, self.pvps).monostat
+            monostat = self._get_refgeom_parameters().monostat
             self._check_refgeom_parameters(refgeom_mono, monostat)
 
     def check_refgeom_bistatic(self):
@@ -1451,7 +1495,7 @@ class CphdConsistency(con.ConsistencyChecker):
                 assert refgeom_bistat is not None
 
             assert self.pvps is not None
-            bistat = calc_refgeom_parameters(self.xml, self.pvps).bistat
+            bistat = self._get_refgeom_parameters().bistat
             self._check_refgeom_parameters(refgeom_bistat, bistat)
 
     def check_unconnected_ids(self):
@@ -1556,14 +1600,23 @@ def unit(vec, axis=-1):
     return vec / np.linalg.norm(vec, axis=axis, keepdims=True)
 
 
-def calc_refgeom_parameters(xml, pvps):
+def calc_refgeom_parameters(xml, pvps, geometry=None):
     """
     Calculate expected reference geometry parameters given CPHD XML and PVPs (CPHD1.0.1, Sec 6.5)
+
+    The per vector quantities are taken from `geometry`, the :class:`PVPGeometry`
+    for the reference channel, if provided. Otherwise, they are computed for the
+    reference vector alone.
     """
     # 6.5.1 - Reference Vector Parameters
     ref_id = xml.findtext('./Channel/RefChId')
     ref_chan_parameters = get_by_id(xml, './Channel/Parameters/', ref_id)
     v_ch_ref = int(ref_chan_parameters.findtext('RefVectorIndex'))
+    if geometry is None:
+        geometry = PVPGeometry(pvps[ref_id][v_ch_ref:v_ch_ref + 1])
+        v_geom = 0
+    else:
+        v_geom = v_ch_ref
 
     ref_vector = pvps[ref_id][v_ch_ref]
     txc = ref_vector['TxTime']
@@ -1581,9 +1634,6 @@ def calc_refgeom_parameters(xml, pvps):
     xy2dwell = parsers.parse_poly2d(get_by_id(xml, './Dwell/DwellTime', ref_dwell_id).find('./DwellTimePoly'))
 
     # (1) See also Section 6.2
-    srp_llh = geocoords.ecf_to_geodetic(srp, 'latlong')
-    srp_lat, srp_lon = np.deg2rad(srp_llh[:2])
-
     ref_surface = xml.find('./SceneCoordinates/ReferenceSurface/Planar')
     if ref_surface is None:  # TODO: Add HAE
         raise NotImplementedError("Non-Planar reference surfaces (e.g. HAE) are currently not supported.")
@@ -1593,27 +1643,18 @@ def calc_refgeom_parameters(xml, pvps):
     iarp = parsers.parse_xyz(xml.find('./SceneCoordinates/IARP/ECF'))
     srp_iac = np.dot([iax, iay, unit(np.cross(iax, iay))], srp - iarp)
 
-    # (2)
-    srp_dec = np.linalg.norm(srp)
-    uec_srp = srp / srp_dec
-
-    # (3)
-    ueast = np.array((-np.sin(srp_lon),
-                      np.cos(srp_lon),
-                      0))
-    unor = np.array((-np.sin(srp_lat) * np.cos(srp_lon),
-                     -np.sin(srp_lat) * np.sin(srp_lon),
-                     np.cos(srp_lat)))
-    uup = np.array((np.cos(srp_lat) * np.cos(srp_lon),
-                    np.cos(srp_lat) * np.sin(srp_lon),
-                    np.sin(srp_lat)))
+    # (2), (3)
+    srp_enu = geometry.srp_enu
+    ueast = srp_enu['east'][v_geom]
+    unor = srp_enu['north'][v_geom]
+    uup = srp_enu['up'][v_geom]
 
     # (4)
-    r_xmt_srp = np.linalg.norm(xmt - srp)
-    r_rcv_srp = np.linalg.norm(rcv - srp)
+    r_xmt_srp = geometry.range_xmt_srp[v_geom]
+    r_rcv_srp = geometry.range_rcv_srp[v_geom]
 
     # (5)
-    t_ref = txc + r_xmt_srp / (r_xmt_srp + r_rcv_srp) * (trc_srp - txc)
+    t_ref = geometry.reference_time[v_geom]
 
     # (6)
     t_cod_srp = npp.polyval2d(*srp_iac[:2], c=xy2cod)
@@ -1626,86 +1667,24 @@ def calc_refgeom_parameters(xml, pvps):
                'SRPCODTime': t_cod_srp,
                'SRPDwellTime': t_dwell_srp}
 
-    def calc_apc_parameters(position, velocity):
-        """Calculate APC parameters given a position and velocity.
-
-        Use arp/varp variable substitution for similarity with CPHD v1.0.1 Section 6.5.2
-
-        """
-        # (1)
-        arp = position
-        varp = velocity
-
-        # (2)
-        r_arp_srp = np.linalg.norm(arp - srp)
-        uarp = (arp - srp) / r_arp_srp
-        rdot_arp_srp = np.dot(uarp, varp)
-
-        # (3)
-        arp_dec = np.linalg.norm(arp)
-        uec_arp = arp / arp_dec
-
-        # (4)
-        ea_arp = np.arccos(np.dot(uec_arp, uec_srp))
-        rg_arp_srp = srp_dec * ea_arp
-
-        # (5)
-        varp_m = np.linalg.norm(varp)
-        uvarp = varp / varp_m
-        left = np.cross(uec_arp, uvarp)
-
-        # (6)
-        look = +1 if np.dot(left, uarp) < 0 else -1
-        side_of_track = 'L' if look == +1 else 'R'
-
-        # (7)
-        dca = np.arccos(-rdot_arp_srp / varp_m)
-
-        # (8)
-        ugpz = uup
-        gpy = np.cross(uup, uarp)
-        ugpy = unit(gpy)
-        ugpx = np.cross(ugpy, ugpz)
-
-        # (9)
-        graz = np.arccos(np.dot(uarp, ugpx))
-        # incidence angle in (15)
-
-        # (10)
-        gpx_n = np.dot(ugpx, unor)
-        gpx_e = np.dot(ugpx, ueast)
-        azim = np.arctan2(gpx_e, gpx_n)
-
-        # (11)
-        uspn = unit(look * np.cross(uarp, uvarp))
-
-        # (12)
-        twst = -np.arcsin(np.dot(uspn, ugpy))
-
-        # (13)
-        slope = np.arccos(np.dot(ugpz, uspn))
-
-        # (14)
-        lodir_n = np.dot(-uspn, unor)
-        lodir_e = np.dot(-uspn, ueast)
-        lo_ang = np.arctan2(lodir_e, lodir_n)
-
-        # (15)
-        return {'ARPPos': arp,
-                'ARPVel': varp,
-                'SideOfTrack': side_of_track,
-                'SlantRange': r_arp_srp,
-                'GroundRange': rg_arp_srp,
-                'DopplerConeAngle': np.rad2deg(dca),
-                'GrazeAngle': np.rad2deg(graz),
-                'IncidenceAngle': 90 - np.rad2deg(graz),
-                'AzimuthAngle': np.rad2deg(azim) % 360,
-                'TwistAngle': np.rad2deg(twst),
-                'SlopeAngle': np.rad2deg(slope),
-                'LayoverAngle': np.rad2deg(lo_ang) % 360}
-
-    def calc_apc_parameters_bi(platform, time, position, velocity):
-        apc_params = calc_apc_parameters(position, velocity)
+    def calc_apc_parameters(platform):
+        """Extract the APC parameters for the reference vector (CPHD v1.0.1 Section 6.5.2)"""
+        apc_params = geometry.apc_parameters(platform)
+        return {'ARPPos': apc_params['Pos'][v_geom],
+                'ARPVel': apc_params['Vel'][v_geom],
+                'SideOfTrack': str(apc_params['SideOfTrack'][v_geom]),
+                'SlantRange': apc_params['SlantRange'][v_geom],
+                'GroundRange': apc_params['GroundRange'][v_geom],
+                'DopplerConeAngle': apc_params['DopplerConeAngle'][v_geom],
+                'GrazeAngle': apc_params['GrazeAngle'][v_geom],
+                'IncidenceAngle': apc_params['IncidenceAngle'][v_geom],
+                'AzimuthAngle': apc_params['AzimuthAngle'][v_geom],
+                'TwistAngle': apc_params['TwistAngle'][v_geom],
+                'SlopeAngle': apc_params['SlopeAngle'][v_geom],
+                'LayoverAngle': apc_params['LayoverAngle'][v_geom]}
+
+    def calc_apc_parameters_bi(platform, time, velocity):
+        apc_params = calc_apc_parameters(platform)
         apc_params['Time'] = time
         apc_params['Pos'] = apc_params.pop('ARPPos')
         apc_params['Vel'] = apc_params.pop('ARPVel')
@@ -1725,7 +1704,7 @@ def calc_refgeom_parameters(xml, pvps):
         return {'{platform}Platform/{k}'.format(platform=platform, k=k): v for k, v in apc_params.items()}
 
     def calc_refgeom_mono():
-        return calc_apc_parameters((xmt + rcv) / 2, (vxmt + vrcv) / 2)
+        return calc_apc_parameters('ARP')
 
     def calc_refgeom_bi():
         # 6.5.3 Reference Geometry: Collect Type = BISTATIC
@@ -1822,9 +1801,9 @@ def calc_refgeom_parameters(xml, pvps):
             'LayoverAngle': np.rad2deg(bistat_lo_ang) % 360
         }
         # (18)
-        refgeom_bi.update(calc_apc_parameters_bi('Tx', txc, xmt, vxmt))
+        refgeom_bi.update(calc_apc_parameters_bi('Tx', txc, vxmt))
         # (19)
-        refgeom_bi.update(calc_apc_parameters_bi('Rcv', trc_srp, rcv, vrcv))
+        refgeom_bi.update(calc_apc_parameters_bi('Rcv', trc_srp, vrcv))
         return refgeom_bi
 
     mono = calc_refgeom_mono()
@@ -1945,6 +1924,9 @@ def main(args=None):
     parser.add_argument('--ignore', action='append', metavar='PATTERN',
                         help=("Skip any check matching PATTERN at the beginning of its name. Can be specified more than"
                               " once."))
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Run independent checks concurrently using this many threads")
+    parser.add_argument('--timing', action='store_true', help="Display the time taken by each check")
     config = parser.parse_args(args)
 
     # Some questionable abuse of the pytest internals
@@ -1964,12 +1946,14 @@ def main(args=None):
     exec(co, ns)
 
     cphd_con = ns['CphdConsistency'].from_file(config.cphd_or_xml, config.schema, config.signal_data)
-    cphd_con.check(ignore_patterns=config.ignore)
+    cphd_con.check(ignore_patterns=config.ignore, max_workers=config.workers)
     failures = cphd_con.failures()
     cphd_con.print_result(fail_detail=config.verbose >= 1,
                           include_passed_asserts=config.verbose >= 2,
                           include_passed_checks=config.verbose >= 3,
                           skip_detail=config.verbose >= 4)
+    if config.timing:
+        cphd_con.print_timings()
 
     return bool(failures)
 
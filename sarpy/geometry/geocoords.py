@@ -2,6 +2,8 @@
 Provides coordinate transforms for WGS-84 and ECF coordinate systems
 """
 
+import math
+
 import numpy
 
 __classification__ = "UNCLASSIFIED"
@@ -35,16 +37,132 @@ def _validate(arr):
     return arr, orig_shape
 
 
-def ecf_to_geodetic(ecf, ordering='latlong'):
+def _ordering_indices(ordering):
+    """
+    Gets the (longitude, latitude) column indices for the given ordering.
+
+    Parameters
+    ----------
+    ordering : str
+
+    Returns
+    -------
+    (int, int)
+    """
+
+    return (0, 1) if ordering.lower() == 'longlat' else (1, 0)
+
+
+def _prepare_output(out, arr, orig_shape, dtype):
+    """
+    Validate or construct the output array for a conversion, and get its
+    two-dimensional view. The input is copied, if it shares memory with the
+    provided output array.
+
+    Parameters
+    ----------
+    out : None|numpy.ndarray
+    arr : numpy.ndarray
+        The two-dimensional input array.
+    orig_shape : tuple
+        The shape of the input array.
+    dtype : str|numpy.dtype
+        The output data type, only used if `out` is not provided.
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+        The output array, its two-dimensional view, and the (possibly copied)
+        input array.
+    """
+
+    if out is None:
+        dtype = numpy.dtype(dtype)
+        if dtype not in (numpy.float32, numpy.float64):
+            raise ValueError('dtype must be one of float32 or float64, got {}'.format(dtype))
+        out = numpy.empty(orig_shape, dtype=dtype)
+        return out, numpy.reshape(out, (-1, 3)), arr
+
+    if not isinstance(out, numpy.ndarray) or out.shape != orig_shape:
+        raise ValueError(
+            'out must be a numpy array of shape {}, got {}'.format(
+                orig_shape, getattr(out, 'shape', type(out))))
+    if out.dtype not in (numpy.float32, numpy.float64):
+        raise ValueError('out must have dtype float32 or float64, got {}'.format(out.dtype))
+    out_view = numpy.reshape(out, (-1, 3))
+    if not numpy.may_share_memory(out_view, out):
+        raise ValueError('out must be reshapeable to (-1, 3) without copying')
+    if numpy.may_share_memory(arr, out):
+        arr = numpy.array(arr, dtype='float64')
+    return out, out_view, arr
+
+
+def _ecf_to_geodetic_point(x, y, z):
+    """
+    Converts a single ECF point to WGS-84 coordinates, using the same method as
+    :func:`ecf_to_geodetic` in scalar arithmetic, which avoids the numpy call
+    overhead for the frequent case of a single reference point.
+
+    Parameters
+    ----------
+    x : float
+    y : float
+    z : float
+
+    Returns
+    -------
+    (float, float, float)
+        The latitude, longitude, and hae.
+    """
+
+    r2 = x*x + y*y
+    z2 = z*z
+    if _A2*r2 + _B2*z2 <= (_A2 - _B2)*(_A2 - _B2):
+        return numpy.nan, numpy.nan, numpy.nan
+
+    p = r2/_A2
+    q = _OME2*z2/_A2
+    s = (p + q - _E4)/6.0
+    p = 0.25*_E4*p*q/(s*s*s)
+    t = (1.0 + p + math.sqrt(p*(2.0 + p)))**(1.0/3.0)
+    u = s*(1.0 + t + 1.0/t)
+    v = math.sqrt(u*u + _E4*q)
+    w = 0.5*_E2*(u + v - q)/v
+    k = math.sqrt(u + v + w*w) - w
+    d = k*math.sqrt(r2)/(k + _E2)
+    dz = math.sqrt(d*d + z2)
+    return (
+        math.degrees(2.0*math.atan2(z, d + dz)),
+        math.degrees(math.atan2(y, x)),
+        (k + _E2 - 1.0)*dz/k)
+
+
+def ecf_to_geodetic(ecf, ordering='latlong', out=None, dtype='float64'):
     """
     Converts ECF (Earth Centered Fixed) coordinates to WGS-84 coordinates.
 
+    This uses the closed form (i.e. non-iterative) method of Vermeille,
+    "An analytical method to transform geocentric into geodetic coordinates",
+    J. Geodesy (2011) 85:105-117, which is accurate to well under a millimeter
+    for any point outside the evolute of the ellipsoid. Points within roughly
+    43 km of the center of the earth, where the solution is not unique, yield
+    `NaN`.
+
+    The calculation is always performed in float64 using a fixed set of work
+    arrays, and only the result is stored in the requested precision.
+
     Parameters
     ----------
     ecf : numpy.ndarray|list|tuple
     ordering : str
         If 'longlat', then the return will be `[longitude, latitude, hae]`.
         Otherwise, the return will be `[latitude, longitude, hae]`.
+    out : None|numpy.ndarray
+        If provided, the result is written into this array, which must be of
+        the same shape as `ecf` and of float32 or float64 dtype.
+    dtype : str|numpy.dtype
+        The output data type, one of float32 or float64. Ignored if `out`
+        is provided.
 
     Returns
     -------
@@ -53,55 +171,138 @@ def ecf_to_geodetic(ecf, ordering='latlong'):
     """
 
     ecf, orig_shape = _validate(ecf)
+    out, llh, ecf = _prepare_output(out, ecf, orig_shape, dtype)
+    lon_index, lat_index = _ordering_indices(ordering)
+    if ecf.shape[0] == 1:
+        lat_value, lon_value, hae_value = _ecf_to_geodetic_point(*ecf[0].tolist())
+        llh[0, lat_index] = lat_value
+        llh[0, lon_index] = lon_value
+        llh[0, 2] = hae_value
+        return out
 
     x = ecf[:, 0]
     y = ecf[:, 1]
     z = ecf[:, 2]
+    lon = llh[:, lon_index]
+    lat = llh[:, lat_index]
+    hae = llh[:, 2]
+
+    r2, z2, p, q, s, t = numpy.empty((6, ecf.shape[0]), dtype='float64')
+    numpy.multiply(x, x, out=r2)
+    r2 += numpy.multiply(y, y, out=p)
+    numpy.multiply(z, z, out=z2)
+
+    # Check for invalid solution, i.e. (A*r)^2 + (B*z)^2 <= (A^2 - B^2)^2
+    numpy.multiply(r2, _A2, out=p)
+    p += numpy.multiply(z2, _B2, out=q)
+    valid = (p > (_A2 - _B2)*(_A2 - _B2))
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        # p = r^2/a^2, q = (1 - e^2)*z^2/a^2, s = (p + q - e^4)/6
+        numpy.multiply(r2, 1.0/_A2, out=p)
+        numpy.multiply(z2, _OME2/_A2, out=q)
+        numpy.add(p, q, out=s)
+        s -= _E4
+        s *= 1.0/6.0
+        # p <- e^4*p*q/(4*s^3)
+        p *= q
+        p *= 0.25*_E4
+        p /= numpy.power(s, 3, out=t)
+        # t = cbrt(1 + p + sqrt(p*(2 + p)))
+        numpy.add(p, 2.0, out=t)
+        t *= p
+        numpy.sqrt(t, out=t)
+        t += p
+        t += 1.0
+        numpy.cbrt(t, out=t)
+        # p <- u = s*(1 + t + 1/t)
+        numpy.divide(1.0, t, out=p)
+        p += t
+        p += 1.0
+        p *= s
+        # s <- v = sqrt(u^2 + e^4*q)
+        numpy.multiply(p, p, out=s)
+        s += numpy.multiply(q, _E4, out=t)
+        numpy.sqrt(s, out=s)
+        # t <- w = e^2*(u + v - q)/(2*v)
+        numpy.add(p, s, out=t)
+        t -= q
+        t *= 0.5*_E2
+        t /= s
+        # q <- k = sqrt(u + v + w^2) - w
+        numpy.multiply(t, t, out=q)
+        q += p
+        q += s
+        numpy.sqrt(q, out=q)
+        q -= t
+        # p <- D = k*r/(k + e^2)
+        numpy.sqrt(r2, out=p)
+        p *= q
+        p /= numpy.add(q, _E2, out=s)
+        # s <- sqrt(D^2 + z^2)
+        numpy.multiply(p, p, out=s)
+        s += z2
+        numpy.sqrt(s, out=s)
+        # latitude = 2*arctan2(z, D + sqrt(D^2 + z^2))
+        p += s
+        numpy.arctan2(z, p, out=t)
+        numpy.multiply(t, 360.0/numpy.pi, out=lat)
+        # hae = (k + e^2 - 1)*sqrt(D^2 + z^2)/k
+        numpy.add(q, _E2 - 1.0, out=t)
+        t *= s
+        numpy.divide(t, q, out=hae)
+    # longitude
+    numpy.arctan2(y, x, out=t)
+    numpy.multiply(t, 180.0/numpy.pi, out=lon)
+
+    if not valid.all():
+        llh[~valid, :] = numpy.nan
+    return out
+
+
+def _geodetic_to_ecf_point(lat, lon, hae):
+    """
+    Converts a single WGS-84 point to ECF coordinates in scalar arithmetic.
 
-    llh = numpy.full(ecf.shape, numpy.nan, dtype=numpy.float64)
-
-    r = numpy.sqrt((x * x) + (y * y))
-
-    # Check for invalid solution
-    valid = ((_A*r)*(_A*r) + (_B*z)*(_B*z) > (_A2 - _B2)*(_A2 - _B2))
-
-    # calculate intermediates
-    F = 54.0*_B2*z*z  # not the WGS 84 flattening parameter
-    G = r*r + _OME2*z*z - _E2*(_A2 - _B2)
-    C = _E4*F*r*r/(G*G*G)
-    S = (1.0 + C + numpy.sqrt(C*C + 2*C))**(1./3)
-    P = F/(3.0*(G*(S + 1.0/S + 1.0))**2)
-    Q = numpy.sqrt(1.0 + 2.0*_E4*P)
-    R0 = -P*_E2*r/(1.0 + Q) + numpy.sqrt(numpy.abs(0.5*_A2*(1.0 + 1/Q) - P*_OME2*z*z/(Q*(1.0 + Q)) - 0.5*P*r*r))
-    T = r - _E2*R0
-    U = numpy.sqrt(T*T + z*z)
-    V = numpy.sqrt(T*T + _OME2*z*z)
-    z0 = _B2*z/(_A*V)
-
-    # account for ordering
-    if ordering.lower() == 'longlat':
-        inds = [0, 1, 2]
-    else:
-        inds = [1, 0, 2]
-    # calculate longitude
-    llh[valid, inds[0]] = numpy.rad2deg(numpy.arctan2(y[valid], x[valid]))
-    # calculate latitude
-    llh[valid, inds[1]] = numpy.rad2deg(numpy.arctan2(z[valid] + _EB2*z0[valid], r[valid]))
-    # calculate altitude
-    llh[valid, inds[2]] = U[valid]*(1.0 - _B2/(_A*V[valid]))
-    return numpy.reshape(llh, orig_shape)
+    Parameters
+    ----------
+    lat : float
+    lon : float
+    hae : float
+
+    Returns
+    -------
+    (float, float, float)
+    """
+
+    lat, lon = math.radians(lat), math.radians(lon)
+    sin_lat, cos_lat = math.sin(lat), math.cos(lat)
+    r = _A/math.sqrt(1.0 - _E2*sin_lat*sin_lat)
+    return (
+        (r + hae)*cos_lat*math.cos(lon),
+        (r + hae)*cos_lat*math.sin(lon),
+        (_OME2*r + hae)*sin_lat)
 
 
-def geodetic_to_ecf(llh, ordering='latlong'):
+def geodetic_to_ecf(llh, ordering='latlong', out=None, dtype='float64'):
     """
     Converts WGS-84 coordinates to ECF (Earth Centered Fixed).
 
+    The calculation is always performed in float64 using a fixed set of work
+    arrays, and only the result is stored in the requested precision.
+
     Parameters
     ----------
     llh : numpy.ndarray|list|tuple
     ordering : str
         If 'longlat', then the input is `[longitude, latitude, hae]`.
         Otherwise, the input is `[latitude, longitude, hae]`.
+    out : None|numpy.ndarray
+        If provided, the result is written into this array, which must be of
+        the same shape as `llh` and of float32 or float64 dtype.
+    dtype : str|numpy.dtype
+        The output data type, one of float32 or float64. Ignored if `out`
+        is provided.
 
     Returns
     -------
@@ -110,25 +311,41 @@ def geodetic_to_ecf(llh, ordering='latlong'):
     """
 
     llh, orig_shape = _validate(llh)
-
-    # account for ordering
-    if ordering.lower() == 'longlat':
-        inds = [0, 1, 2]
-    else:
-        inds = [1, 0, 2]
-    lon = llh[:, inds[0]]
-    lat = llh[:, inds[1]]
-    alt = llh[:, inds[2]]
-
-    out = numpy.full(llh.shape, numpy.nan, dtype=numpy.float64)
-    # calculate distance to surface of ellipsoid
-    r = _A / numpy.sqrt(1.0 - _E2*numpy.sin(numpy.deg2rad(lat)) * numpy.sin(numpy.deg2rad(lat)))
+    out, ecf, llh = _prepare_output(out, llh, orig_shape, dtype)
+    lon_index, lat_index = _ordering_indices(ordering)
+    if llh.shape[0] == 1:
+        ecf[0, :] = _geodetic_to_ecf_point(
+            float(llh[0, lat_index]), float(llh[0, lon_index]), float(llh[0, 2]))
+        return out
+
+    lon = llh[:, lon_index]
+    lat = llh[:, lat_index]
+    alt = llh[:, 2]
+
+    angle, sin_lat, cos_lat, r, work = numpy.empty((5, llh.shape[0]), dtype='float64')
+    numpy.deg2rad(lat, out=angle)
+    numpy.sin(angle, out=sin_lat)
+    numpy.cos(angle, out=cos_lat)
+    numpy.deg2rad(lon, out=angle)
+
+    # calculate distance to surface of ellipsoid, r = a/sqrt(1 - e^2*sin(lat)^2)
+    numpy.multiply(sin_lat, sin_lat, out=r)
+    r *= -_E2
+    r += 1.0
+    numpy.sqrt(r, out=r)
+    numpy.divide(_A, r, out=r)
 
     # calculate coordinates
-    out[:, 0] = (r + alt)*numpy.cos(numpy.deg2rad(lat))*numpy.cos(numpy.deg2rad(lon))
-    out[:, 1] = (r + alt)*numpy.cos(numpy.deg2rad(lat))*numpy.sin(numpy.deg2rad(lon))
-    out[:, 2] = (r + alt - _E2*r)*numpy.sin(numpy.deg2rad(lat))
-    return numpy.reshape(out, orig_shape)
+    numpy.multiply(r, _OME2, out=work)
+    work += alt
+    numpy.multiply(work, sin_lat, out=ecf[:, 2])
+    r += alt
+    r *= cos_lat
+    numpy.cos(angle, out=work)
+    numpy.multiply(work, r, out=ecf[:, 0])
+    numpy.sin(angle, out=work)
+    numpy.multiply(work, r, out=ecf[:, 1])
+    return out
 
 
 def wgs_84_norm(ecf):
@@ -151,6 +368,37 @@ def wgs_84_norm(ecf):
     return numpy.reshape(out, orig_shape)
 
 
+def _validate_origin(orp_coord, coords, orig_shape):
+    """
+    Validate the origin reference point(s) for a local coordinate conversion.
+
+    Parameters
+    ----------
+    orp_coord : numpy.ndarray|list|tuple
+        Either a single point of shape `(3, )`, or one point per coordinate,
+        of the same shape as the coordinates.
+    coords : numpy.ndarray
+        The two-dimensional coordinates array.
+    orig_shape : tuple
+        The shape of the coordinates array.
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(3, )` or `(N, 3)`.
+    """
+
+    if not isinstance(orp_coord, numpy.ndarray):
+        orp_coord = numpy.array(orp_coord, dtype='float64')
+    if orp_coord.ndim == 1 and orp_coord.size == 3:
+        return orp_coord
+    if orp_coord.shape == orig_shape and orp_coord.ndim > 1:
+        return numpy.reshape(orp_coord, coords.shape)
+    raise ValueError(
+        'orp_coord must be a one-dimensional array of length 3, or of the same '
+        'shape as the coordinates {}. Got shape {}.'.format(orig_shape, orp_coord.shape))
+
+
 def _ecf_to_ned_matrix(orp_coord):
     """
     Get the rotation matrix for converting ECF to NED coordinate system
@@ -162,112 +410,168 @@ def _ecf_to_ned_matrix(orp_coord):
     Parameters
     ----------
     orp_coord : numpy.ndarray
-        The origin reference point. This is assumed given in ECF coordinates.
+        The origin reference point, or an array of shape `(N, 3)` of origin
+        reference points. This is assumed given in ECF coordinates.
 
     Returns
     -------
     numpy.ndarray
+        Of shape `(3, 3)`, or `(N, 3, 3)` for an array of origin reference points.
     """
 
-    if not isinstance(orp_coord, numpy.ndarray) or orp_coord.ndim != 1 or orp_coord.size != 3:
-        raise ValueError('orp_coord must be a one-dimensional array of length 3.')
-    llh = ecf_to_geodetic(orp_coord)
+    if not isinstance(orp_coord, numpy.ndarray) or orp_coord.shape[-1:] != (3, ) or orp_coord.ndim > 2:
+        raise ValueError('orp_coord must be a one-dimensional array of length 3, or of shape (N, 3).')
+    if orp_coord.ndim == 1:
+        lat, lon, _ = _ecf_to_geodetic_point(*orp_coord.tolist())
+        lat, lon = math.radians(lat), math.radians(lon)
+        sin_lat, cos_lat = math.sin(lat), math.cos(lat)
+        sin_lon, cos_lon = math.sin(lon), math.cos(lon)
+        zero = 0.0
+    else:
+        llh = ecf_to_geodetic(orp_coord)
+        lat = numpy.deg2rad(llh[:, 0])
+        lon = numpy.deg2rad(llh[:, 1])
+        sin_lat, cos_lat = numpy.sin(lat), numpy.cos(lat)
+        sin_lon, cos_lon = numpy.sin(lon), numpy.cos(lon)
+        zero = numpy.zeros_like(lat)
+
+    # the columns are the north, east, and down unit vectors
+    matrix = numpy.array([
+        [-sin_lat*cos_lon, -sin_lon, -cos_lat*cos_lon],
+        [-sin_lat*sin_lon, cos_lon, -cos_lat*sin_lon],
+        [cos_lat, zero, -sin_lat]], dtype='float64')
+    if matrix.ndim == 3:
+        matrix = numpy.moveaxis(matrix, -1, 0)
+    return matrix
 
-    angle2 = numpy.deg2rad(-90 - llh[0])
-    angle1 = numpy.deg2rad(llh[1])
 
-    matrix1 = numpy.array([[numpy.cos(angle1), -numpy.sin(angle1), 0],
-                           [numpy.sin(angle1), numpy.cos(angle1), 0],
-                           [0, 0, 1]], dtype='float64')
-    matrix2 = numpy.array([[numpy.cos(angle2), 0, numpy.sin(angle2)],
-                           [0, 1, 0],
-                           [-numpy.sin(angle2), 0, numpy.cos(angle2)]], dtype='float64')
-    return matrix1.dot(matrix2)
+def _ecf_to_enu_matrix(orp_coord):
+    """
+    Get the rotation matrix for converting from ECF to ENU.
 
+    Note: The array orientation convention indicates array multiplication on the
+    RIGHT, so this is the transpose of the transform matrix for left multiplication.
 
-def ecf_to_ned(ecf_coords, orp_coord, absolute_coords=True):
+    Parameters
+    ----------
+    orp_coord : numpy.ndarray
+        The origin reference point, or an array of shape `(N, 3)` of origin
+        reference points. This is assumed given in ECF coordinates.
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(3, 3)`, or `(N, 3, 3)` for an array of origin reference points.
     """
-    Convert from ECF to North-East-Down (NED) coordinates.
+
+    matrix = _ecf_to_ned_matrix(orp_coord)[..., [1, 0, 2]]
+    matrix[..., 2] *= -1
+    return matrix
+
+
+def _local_transform(coords, orp_coord, matrix_function, absolute_coords, to_local, out, dtype):
+    """
+    Perform the conversion between ECF and a local coordinate system.
 
     Parameters
     ----------
-    ecf_coords : numpy.ndarray
-    orp_coord : numpy.ndarray
+    coords : numpy.ndarray|list|tuple
+    orp_coord : numpy.ndarray|list|tuple
+    matrix_function : callable
+        One of :func:`_ecf_to_ned_matrix` or :func:`_ecf_to_enu_matrix`.
     absolute_coords : bool
-        Are these absolute (i.e. position) coordinates? The alternative is relative
-        coordinates like velocity, acceleration, or unit vector values.
+    to_local : bool
+        Convert from ECF to local coordinates? Otherwise, from local to ECF.
+    out : None|numpy.ndarray
+    dtype : str|numpy.dtype
 
     Returns
     -------
     numpy.ndarray
     """
 
-    if not isinstance(orp_coord, numpy.ndarray):
-        orp_coord = numpy.array(orp_coord, dtype='float64')
-    transform = _ecf_to_ned_matrix(orp_coord)
-    # NB: orp_coord is guaranteed to be shape (3, )
-    ecf_coords, o_shape = _validate(ecf_coords)
-    if absolute_coords:
-        out = (ecf_coords - orp_coord).dot(transform)
+    coords, o_shape = _validate(coords)
+    orp_coord = _validate_origin(orp_coord, coords, o_shape)
+    transform = matrix_function(orp_coord)
+    if not to_local:
+        transform = numpy.swapaxes(transform, -1, -2)  # transpose = inverse here
+    out, out_view, coords = _prepare_output(out, coords, o_shape, dtype)
+
+    # accumulate in float64, and round to the output precision only at the end
+    result = out_view if out_view.dtype == numpy.float64 else numpy.empty(coords.shape, dtype='float64')
+    if to_local and absolute_coords:
+        coords = coords - orp_coord
+    if transform.ndim == 2:
+        numpy.matmul(coords, transform, out=result)
     else:
-        out = ecf_coords.dot(transform)
-    return numpy.reshape(out, o_shape)
+        numpy.matmul(coords[:, numpy.newaxis, :], transform, out=result[:, numpy.newaxis, :])
+    if absolute_coords and not to_local:
+        result += orp_coord
+    if result is not out_view:
+        out_view[:] = result
+    return out
 
 
-def ned_to_ecf(ned_coords, orp_coord, absolute_coords=True):
+def ecf_to_ned(ecf_coords, orp_coord, absolute_coords=True, out=None, dtype='float64'):
     """
-    Convert from North-East-Down (NED) to ECF coordinates.
+    Convert from ECF to North-East-Down (NED) coordinates.
 
     Parameters
     ----------
-    ned_coords : numpy.ndarray
-        The NED coordinates.
+    ecf_coords : numpy.ndarray
     orp_coord : numpy.ndarray
-        The Origin Reference Point in ECF coordinates.
+        The Origin Reference Point in ECF coordinates. This may be a single
+        point, or one point per coordinate (i.e. of the same shape as `ecf_coords`).
     absolute_coords : bool
         Are these absolute (i.e. position) coordinates? The alternative is relative
         coordinates like velocity, acceleration, or unit vector values.
+    out : None|numpy.ndarray
+        If provided, the result is written into this array, which must be of
+        the same shape as `ecf_coords` and of float32 or float64 dtype.
+    dtype : str|numpy.dtype
+        The output data type, one of float32 or float64. Ignored if `out`
+        is provided.
 
     Returns
     -------
     numpy.ndarray
     """
 
-    if not isinstance(orp_coord, numpy.ndarray):
-        orp_coord = numpy.array(orp_coord, dtype='float64')
-    transform = _ecf_to_ned_matrix(orp_coord).transpose()  # transpose = inverse here
-    # NB: orp_coord is guaranteed to be shape (3, )
-    ned_coords, o_shape = _validate(ned_coords)
+    return _local_transform(
+        ecf_coords, orp_coord, _ecf_to_ned_matrix, absolute_coords, True, out, dtype)
 
-    out = ned_coords.dot(transform)
-    if absolute_coords:
-        out += orp_coord
-    return numpy.reshape(out, o_shape)
 
-
-def _ecf_to_enu_matrix(orp_coord):
+def ned_to_ecf(ned_coords, orp_coord, absolute_coords=True, out=None, dtype='float64'):
     """
-    Get the rotation matrix for converting from ECF to ENU.
-
-    Note: The array orientation convention indicates array multiplication on the
-    RIGHT, so this is the transpose of the transform matrix for left multiplication.
+    Convert from North-East-Down (NED) to ECF coordinates.
 
     Parameters
     ----------
+    ned_coords : numpy.ndarray
+        The NED coordinates.
     orp_coord : numpy.ndarray
-        The origin reference point. This is assumed given in ECF coordinates.
+        The Origin Reference Point in ECF coordinates. This may be a single
+        point, or one point per coordinate (i.e. of the same shape as `ned_coords`).
+    absolute_coords : bool
+        Are these absolute (i.e. position) coordinates? The alternative is relative
+        coordinates like velocity, acceleration, or unit vector values.
+    out : None|numpy.ndarray
+        If provided, the result is written into this array, which must be of
+        the same shape as `ned_coords` and of float32 or float64 dtype.
+    dtype : str|numpy.dtype
+        The output data type, one of float32 or float64. Ignored if `out`
+        is provided.
 
     Returns
     -------
     numpy.ndarray
     """
 
-    ned_matrix = _ecf_to_ned_matrix(orp_coord)
-    ned_to_enu = numpy.array([[0, 1, 0], [1, 0, 0], [0, 0, -1]], dtype='float64')
-    return ned_matrix.dot(ned_to_enu)
+    return _local_transform(
+        ned_coords, orp_coord, _ecf_to_ned_matrix, absolute_coords, False, out, dtype)
 
 
-def ecf_to_enu(ecf_coords, orp_coord, absolute_coords=True):
+def ecf_to_enu(ecf_coords, orp_coord, absolute_coords=True, out=None, dtype='float64'):
     """
     Convert from ECF to East-North-Up (ENU) coordinates.
 
@@ -275,28 +579,28 @@ def ecf_to_enu(ecf_coords, orp_coord, absolute_coords=True):
     ----------
     ecf_coords : numpy.ndarray
     orp_coord : numpy.ndarray
+        The Origin Reference Point in ECF coordinates. This may be a single
+        point, or one point per coordinate (i.e. of the same shape as `ecf_coords`).
     absolute_coords : bool
         Are these absolute (i.e. position) coordinates? The alternative is relative
         coordinates like velocity, acceleration, or unit vector values.
+    out : None|numpy.ndarray
+        If provided, the result is written into this array, which must be of
+        the same shape as `ecf_coords` and of float32 or float64 dtype.
+    dtype : str|numpy.dtype
+        The output data type, one of float32 or float64. Ignored if `out`
+        is provided.
 
     Returns
     -------
     numpy.ndarray
     """
 
-    if not isinstance(orp_coord, numpy.ndarray):
-        orp_coord = numpy.array(orp_coord, dtype='float64')
-    transform = _ecf_to_enu_matrix(orp_coord)
-    # NB: orp_coord is guaranteed to be shape (3, )
-    ecf_coords, o_shape = _validate(ecf_coords)
-    if absolute_coords:
-        out = (ecf_coords - orp_coord).dot(transform)
-    else:
-        out = ecf_coords.dot(transform)
-    return numpy.reshape(out, o_shape)
+    return _local_transform(
+        ecf_coords, orp_coord, _ecf_to_enu_matrix, absolute_coords, True, out, dtype)
 
 
-def enu_to_ecf(enu_coords, orp_coord, absolute_coords=True):
+def enu_to_ecf(enu_coords, orp_coord, absolute_coords=True, out=None, dtype='float64'):
     """
     Convert from East-North-UP (ENU) to ECF coordinates.
 
@@ -305,23 +609,22 @@ def enu_to_ecf(enu_coords, orp_coord, absolute_coords=True):
     enu_coords : numpy.ndarray
         The ENU coordinates.
     orp_coord : numpy.ndarray
-        The Origin Reference Point in ECF coordinates.
+        The Origin Reference Point in ECF coordinates. This may be a single
+        point, or one point per coordinate (i.e. of the same shape as `enu_coords`).
     absolute_coords : bool
         Are these absolute (i.e. position) coordinates? The alternative is relative
         coordinates like velocity, acceleration, or unit vector values.
+    out : None|numpy.ndarray
+        If provided, the result is written into this array, which must be of
+        the same shape as `enu_coords` and of float32 or float64 dtype.
+    dtype : str|numpy.dtype
+        The output data type, one of float32 or float64. Ignored if `out`
+        is provided.
 
     Returns
     -------
     numpy.ndarray
     """
 
-    if not isinstance(orp_coord, numpy.ndarray):
-        orp_coord = numpy.array(orp_coord, dtype='float64')
-    transform = _ecf_to_enu_matrix(orp_coord).transpose()  # transpose = inverse here
-    # NB: orp_coord is guaranteed to be shape (3, )
-    enu_coords, o_shape = _validate(enu_coords)
-
-    out = enu_coords.dot(transform)
-    if absolute_coords:
-        out += orp_coord
-    return numpy.reshape(out, o_shape)
+    return _local_transform(
+        enu_coords, orp_coord, _ecf_to_enu_matrix, absolute_coords, False, out, dtype)
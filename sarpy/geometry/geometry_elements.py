@@ -14,6 +14,8 @@ import logging
 
 import numpy
 
+from sarpy.geometry.spatial_index import PackedRTree
+
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +43,8 @@ def _compress_identical(coords):
     if coords.shape[0] < 2:
         return coords
 
-    include = numpy.zeros((coords.shape[0], ), dtype='bool')
-    include[-1] = True
-
-    for i, (first, last) in enumerate(zip(coords[:-1, :], coords[1:, :])):
-        if not (first[0] == last[0] and first[1] == last[1]):
-            include[i] = True
+    include = numpy.ones((coords.shape[0], ), dtype='bool')
+    include[:-1] = (coords[:-1, 0] != coords[1:, 0]) | (coords[:-1, 1] != coords[1:, 1])
     return coords[include, :]
 
 
@@ -79,6 +77,203 @@ def _validate_grid_contain_arguments(grid_x, grid_y):
     return grid_x, grid_y
 
 
+def _expand_ranges(start, end):
+    """
+    Helper function which expands the half-open ranges `[start, end)` into the
+    concatenated collection of indices, and the index of the range for each.
+
+    Parameters
+    ----------
+    start : numpy.ndarray
+    end : numpy.ndarray
+
+    Returns
+    -------
+    (numpy.ndarray, numpy.ndarray)
+        The indices and the range index for each.
+    """
+
+    counts = numpy.maximum(end - start, 0)
+    range_index = numpy.repeat(numpy.arange(counts.size), counts)
+    offsets = numpy.cumsum(counts) - counts
+    indices = numpy.arange(range_index.size) - offsets[range_index] + start[range_index]
+    return indices, range_index
+
+
+def _scanline_fill(coordinates, grid_x, grid_y, fill_rule='nonzero'):
+    """
+    Scanline rasterization of the closed ring defined by `coordinates` onto the
+    grid defined by `grid_x` and `grid_y`. Each `grid_x` value defines a scan
+    line, and the spans of `grid_y` interior to the ring along each scan line
+    are determined from the sorted edge crossings. Points on the boundary are
+    considered to be contained.
+
+    This is linear in the number of edge crossings plus the number of grid points.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        The closed ring coordinates of shape `(N, 2+)`, with first and last equal.
+    grid_x : numpy.ndarray
+        Monotonically increasing.
+    grid_y : numpy.ndarray
+        Monotonically increasing.
+    fill_rule : str
+        One of `'nonzero'` or `'evenodd'`, for determining the interior of
+        a self-intersecting ring.
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean mask of shape `(grid_x.size, grid_y.size)`.
+    """
+
+    if fill_rule not in ['nonzero', 'evenodd']:
+        raise ValueError('fill_rule must be one of `nonzero` or `evenodd`, got `{}`'.format(fill_rule))
+
+    x0 = coordinates[:-1, 0]
+    y0 = coordinates[:-1, 1]
+    x1 = coordinates[1:, 0]
+    y1 = coordinates[1:, 1]
+    x_min = numpy.minimum(x0, x1)
+    x_max = numpy.maximum(x0, x1)
+
+    span_lines = []
+    span_starts = []
+    span_ends = []
+
+    def add_spans(lines, first, last):
+        # the grid_y indices in [first, last]
+        start = numpy.searchsorted(grid_y, first, side='left')
+        end = numpy.searchsorted(grid_y, last, side='right')
+        keep = (start < end)
+        span_lines.append(lines[keep])
+        span_starts.append(start[keep])
+        span_ends.append(end[keep])
+
+    def crossings(edges, side):
+        # the crossings of the scan lines with the given (non-vertical) edges
+        start = numpy.searchsorted(grid_x, x_min[edges], side='left')
+        end = numpy.searchsorted(grid_x, x_max[edges], side=side)
+        lines, range_index = _expand_ranges(start, end)
+        edges = edges[range_index]
+        y_value = y0[edges] + (grid_x[lines] - x0[edges])*(y1[edges] - y0[edges])/(x1[edges] - x0[edges])
+        return lines, edges, y_value
+
+    sloped = numpy.nonzero(x0 != x1)[0]
+    if sloped.size > 0:
+        # the interior spans, using the half-open rule for the edge x-extent
+        #   so that a vertex shared by two edges is counted once
+        lines, edges, y_value = crossings(sloped, 'left')
+        winding = numpy.where(x1[edges] > x0[edges], 1, -1)
+        order = numpy.lexsort((y_value, lines))
+        lines = lines[order]
+        y_value = y_value[order]
+        if fill_rule == 'nonzero':
+            interior = (numpy.cumsum(winding[order]) != 0)
+        else:
+            # there are an even number of crossings on each scan line
+            interior = (numpy.arange(lines.size) % 2 == 0)
+        interior = interior[:-1] & (lines[:-1] == lines[1:])
+        add_spans(lines[:-1][interior], y_value[:-1][interior], y_value[1:][interior])
+
+        # the boundary points along the sloped edges, including the end points
+        lines, edges, y_value = crossings(sloped, 'right')
+        add_spans(lines, y_value, y_value)
+
+    vertical = numpy.nonzero(x0 == x1)[0]
+    if vertical.size > 0:
+        # the boundary points along the edges lying on a scan line
+        start = numpy.searchsorted(grid_x, x0[vertical], side='left')
+        on_line = (start < grid_x.size)
+        on_line[on_line] = (grid_x[start[on_line]] == x0[vertical[on_line]])
+        vertical = vertical[on_line]
+        add_spans(
+            start[on_line], numpy.minimum(y0[vertical], y1[vertical]), numpy.maximum(y0[vertical], y1[vertical]))
+
+    span_lines = numpy.concatenate(span_lines)
+    changes = numpy.zeros((grid_x.size, grid_y.size + 1), dtype=numpy.int32)
+    numpy.add.at(changes, (span_lines, numpy.concatenate(span_starts)), 1)
+    numpy.add.at(changes, (span_lines, numpy.concatenate(span_ends)), -1)
+    return numpy.cumsum(changes[:, :-1], axis=1) > 0
+
+
+def _subsample_grid(grid, subsamples):
+    """
+    Helper function which constructs the subsample grid, with `subsamples`
+    evenly spaced points in each cell. The cell for each grid point extends
+    halfway to its neighbors.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+    subsamples : int
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    if grid.size == 1:
+        edges = numpy.array([grid[0] - 0.5, grid[0] + 0.5])
+    else:
+        mid = 0.5*(grid[1:] + grid[:-1])
+        edges = numpy.hstack((2*grid[0] - mid[0], mid, 2*grid[-1] - mid[-1]))
+    fractions = (numpy.arange(subsamples) + 0.5)/subsamples
+    return (edges[:-1, numpy.newaxis] + fractions*(edges[1:] - edges[:-1])[:, numpy.newaxis]).ravel()
+
+
+def _grid_coverage(geometry, grid_x, grid_y, subsamples, fill_rule):
+    """
+    Helper function which determines the fraction of each grid cell covered
+    by the given polygonal geometry, by supersampling its grid containment.
+
+    Parameters
+    ----------
+    geometry : LinearRing|Polygon|MultiPolygon
+    grid_x : numpy.ndarray
+    grid_y : numpy.ndarray
+    subsamples : int
+    fill_rule : str
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    grid_x, grid_y = _validate_grid_contain_arguments(grid_x, grid_y)
+    subsamples = int(subsamples)
+    if subsamples < 1:
+        raise ValueError('subsamples must be a positive integer, got {}'.format(subsamples))
+
+    mask = geometry.grid_contained(
+        _subsample_grid(grid_x, subsamples), _subsample_grid(grid_y, subsamples), fill_rule=fill_rule)
+    return numpy.mean(
+        numpy.reshape(mask, (grid_x.size, subsamples, grid_y.size, subsamples)), axis=(1, 3))
+
+
+def _get_feature_box(feature):
+    """
+    Gets the two-dimensional bounding box of the feature geometry, which is
+    all `NaN` for a feature without geometry.
+
+    Parameters
+    ----------
+    feature : Feature
+
+    Returns
+    -------
+    List[float]
+        Of the form `[min coord 0, min coord 1, max coord 0, max coord 1]`.
+    """
+
+    bbox = None if feature.geometry is None else feature.geometry.get_bbox()
+    if bbox is None or len(bbox) < 4:
+        return [numpy.nan, numpy.nan, numpy.nan, numpy.nan]
+    half = int(len(bbox)/2)
+    return [bbox[0], bbox[1], bbox[half], bbox[half+1]]
+
+
 def _get_kml_coordinate_string(coordinates, transform):
     # type: (numpy.ndarray, Union[None, Callable]) -> str
     def identity(x):
@@ -450,12 +645,13 @@ class FeatureCollection(Jsonable):
     extended to coherently handle specific Feature extension.
     """
 
-    __slots__ = ('_features', '_feature_dict')
+    __slots__ = ('_features', '_feature_dict', '_spatial_index')
     _type = 'FeatureCollection'
 
     def __init__(self, features=None):
         self._features = None
         self._feature_dict = None
+        self._spatial_index = None
         if features is not None:
             self.features = features
 
@@ -490,6 +686,7 @@ class FeatureCollection(Jsonable):
         else:
             del self._features[item]
         self._rebuild_feature_dict()
+        self._spatial_index = None
 
     @property
     def features(self):
@@ -505,6 +702,7 @@ class FeatureCollection(Jsonable):
 
     @features.setter
     def features(self, features):
+        self._spatial_index = None
         if features is None:
             self._features = None
             self._feature_dict = None
@@ -576,12 +774,139 @@ class FeatureCollection(Jsonable):
         if not isinstance(feature, Feature):
             raise TypeError('This requires a Feature instance, got {}'.format(type(feature)))
 
+        self._append_feature(feature)
+
+    def _append_feature(self, feature):
+        """
+        Appends the (validated) feature, and updates the spatial index if it
+        has been constructed.
+
+        Parameters
+        ----------
+        feature : Feature
+        """
+
         if self._features is None:
             self._feature_dict = {feature.uid: 0}
             self._features = [feature, ]
         else:
             self._feature_dict[feature.uid] = len(self._features)
             self._features.append(feature)
+        if self._spatial_index is not None:
+            self._spatial_index.insert(_get_feature_box(feature))
+
+    @property
+    def spatial_index(self):
+        """
+        The packed R-tree spatial index of the feature bounding boxes, which
+        is constructed on first use. The index is in the coordinates of the
+        feature geometries (e.g. image pixel or longitude/latitude), using the
+        first two coordinates. Features without geometry are never matched.
+
+        Note that modifying the geometry of a feature in place is not tracked,
+        so :meth:`reset_spatial_index` should be called after doing so.
+
+        Returns
+        -------
+        PackedRTree
+        """
+
+        if self._spatial_index is None:
+            features = [] if self._features is None else self._features
+            boxes = numpy.array([_get_feature_box(entry) for entry in features], dtype='float64')
+            self._spatial_index = PackedRTree(boxes)
+        return self._spatial_index
+
+    def reset_spatial_index(self):
+        """
+        Discard the spatial index, so that it will be rebuilt on next use.
+        """
+
+        self._spatial_index = None
+
+    def query_bbox(self, bbox):
+        """
+        Gets the features whose bounding box intersects the given bounding box.
+
+        Parameters
+        ----------
+        bbox : numpy.ndarray|list|tuple
+            Of the form `[min coord 0, min coord 1, max coord 0, max coord 1]`,
+            in the coordinates of the feature geometries.
+
+        Returns
+        -------
+        List[Feature]
+        """
+
+        return [self._features[index] for index in self.spatial_index.query_bbox(bbox)]
+
+    def query_point(self, point):
+        """
+        Gets the features whose bounding box contains the given point.
+
+        Parameters
+        ----------
+        point : numpy.ndarray|list|tuple
+            In the coordinates of the feature geometries.
+
+        Returns
+        -------
+        List[Feature]
+        """
+
+        return [self._features[index] for index in self.spatial_index.query_point(point)]
+
+    def nearest(self, point, k=1):
+        """
+        Gets the `k` features whose bounding boxes are nearest the given point,
+        in order of increasing distance.
+
+        Parameters
+        ----------
+        point : numpy.ndarray|list|tuple
+            In the coordinates of the feature geometries.
+        k : int
+
+        Returns
+        -------
+        List[Feature]
+        """
+
+        indices, _ = self.spatial_index.nearest(point, k=k)
+        return [self._features[index] for index in indices]
+
+    def apply_projection(self, proj_method):
+        """
+        Gets a new collection, with new features sharing the uids and copies of
+        the properties of the current features, after applying a transform
+        method to all feature geometries. This uses
+        :func:`apply_projection_batched`, so `proj_method` is applied to all
+        vertices of all features at once.
+
+        Parameters
+        ----------
+        proj_method : callable
+
+        Returns
+        -------
+        FeatureCollection
+        """
+
+        the_type = self.__class__
+        if self._features is None:
+            return the_type()
+
+        geometries = apply_projection_batched([entry.geometry for entry in self._features], proj_method)
+        features = []
+        for entry, geometry in zip(self._features, geometries):
+            properties = entry.properties
+            if isinstance(properties, Jsonable):
+                properties = properties.copy()
+            elif properties is not None:
+                properties = copy.deepcopy(properties)
+            features.append(entry.__class__(uid=entry.uid, geometry=geometry, properties=properties))
+        return the_type(features=features)
 
     def export_to_kml(self, file_name, coord_transform=None, **params):
         """
@@ -1616,19 +1941,35 @@ class LinearRing(LineString):
         self._coordinates = coordinates
         # construct bounding box
         self._bounding_box = numpy.empty((2, 2), dtype=coordinates.dtype)
-        self._bounding_box[0, :] = (numpy.min(coordinates[:, 0]), numpy.max(coordinates[:, 0]))
-        self._bounding_box[1, :] = (numpy.min(coordinates[:, 1]), numpy.max(coordinates[:, 1]))
+        self._bounding_box[:, 0] = coordinates[:, :2].min(axis=0)
+        self._bounding_box[:, 1] = coordinates[:, :2].max(axis=0)
         # construct diffs
         self._diffs = coordinates[1:, :] - coordinates[:-1, :]
-        self._segmentation = {
-            'x': self._construct_segmentation(coordinates[:, 0], coordinates[:, 1]),
-            'y': self._construct_segmentation(coordinates[:, 1], coordinates[:, 0])}
+        # the segmentation is only required for point containment, so is
+        # constructed on first use
+        self._segmentation = None
         signed_area = self.get_area()
         if signed_area >= 0:
             self._orientation = 1
         else:
             self._orientation = -1
 
+    def _get_segmentation(self):
+        """
+        Gets the segmentation used for point containment, constructing it if
+        necessary.
+
+        Returns
+        -------
+        dict
+        """
+
+        if self._segmentation is None:
+            self._segmentation = {
+                'x': self._construct_segmentation(self._coordinates[:, 0], self._coordinates[:, 1]),
+                'y': self._construct_segmentation(self._coordinates[:, 1], self._coordinates[:, 0])}
+        return self._segmentation
+
     @staticmethod
     def _construct_segmentation(coords, o_coords):
         # helper method
@@ -1732,11 +2073,12 @@ class LinearRing(LineString):
             return t_first_ind, t_last_ind
 
         # let's determine first/last x & y segments and which is better (fewer)
-        x_first_ind, x_last_ind = segment(x, self._segmentation['x'])
+        segmentation = self._get_segmentation()
+        x_first_ind, x_last_ind = segment(x, segmentation['x'])
         if x_first_ind is None:
             return None, None, 'x'
 
-        y_first_ind, y_last_ind = segment(y, self._segmentation['y'])
+        y_first_ind, y_last_ind = segment(y, segmentation['y'])
         if y_first_ind is None:
             return None, None, 'y'
 
@@ -1812,12 +2154,13 @@ class LinearRing(LineString):
         if ind_beg is None:
             return out  # it missed the whole bounding box
 
+        segmentation = self._get_segmentation()
         for index in range(ind_beg, ind_end):
             if direction == 'x':
-                seg = self._segmentation['x'][index]
+                seg = segmentation['x'][index]
                 mask = ((x >= seg['min']) & (x <= seg['max']) & (y >= seg['min_value']) & (y <= seg['max_value']))
             else:
-                seg = self._segmentation['y'][index]
+                seg = segmentation['y'][index]
                 mask = ((y >= seg['min']) & (y <= seg['max']) & (x >= seg['min_value']) & (x <= seg['max_value']))
             if numpy.any(mask):
                 out[mask] = self._contained_do_segment(x[mask], y[mask], seg, direction)
@@ -1879,15 +2222,22 @@ class LinearRing(LineString):
         else:
             return numpy.reshape(in_poly, o_shape)
 
-    def grid_contained(self, grid_x, grid_y):
+    def grid_contained(self, grid_x, grid_y, fill_rule='nonzero'):
         """
         Determines inclusion of a coordinate grid inside the polygon. The coordinate
         grid is defined by the two one-dimensional coordinate arrays `grid_x` and `grid_y`.
 
+        This uses scanline rasterization, so the cost is linear in the number
+        of edge crossings plus the number of grid points. Points on the boundary
+        are considered to be contained.
+
         Parameters
         ----------
         grid_x : numpy.ndarray
         grid_y : numpy.ndarray
+        fill_rule : str
+            One of `'nonzero'` or `'evenodd'`, which only matters for a
+            self-intersecting linear ring.
 
         Returns
         -------
@@ -1898,36 +2248,32 @@ class LinearRing(LineString):
 
         grid_x, grid_y = _validate_grid_contain_arguments(grid_x, grid_y)
 
-        out = numpy.zeros((grid_x.size, grid_y.size), dtype='bool')
-        if self._coordinates.shape[0] < 4:
+        if self._coordinates is None or self._coordinates.shape[0] < 4:
             # this is a degenerate linear ring with no interior
-            return out
+            return numpy.zeros((grid_x.size, grid_y.size), dtype='bool')
+        return _scanline_fill(self._coordinates, grid_x, grid_y, fill_rule=fill_rule)
 
-        first_ind, last_ind, direction = self._contained_segment_data(grid_x, grid_y)
-        if first_ind is None:
-            return out  # it missed the whole bounding box
+    def grid_coverage(self, grid_x, grid_y, subsamples=4, fill_rule='nonzero'):
+        """
+        Determines the (anti-aliased) fraction of each grid cell covered by the
+        polygon. The cell for each grid point extends halfway to its neighbors.
 
-        first_ind, last_ind, direction = self._contained_segment_data(grid_x, grid_y)
-        x_inds = numpy.arange(grid_x.size)
-        y_inds = numpy.arange(grid_y.size)
-        for index in range(first_ind, last_ind):
-            if direction == 'x':
-                seg = self._segmentation['x'][index]
-                start_x = x_inds[grid_x >= seg['min']].min()
-                end_x = x_inds[grid_x <= seg['max']].max() + 1
-                start_y = y_inds[grid_y >= seg['min_value']].min() if grid_y[-1] >= seg['min_value'] else None
-                end_y = y_inds[grid_y <= seg['max_value']].max() + 1 if start_y is not None else None
-            else:
-                seg = self._segmentation['y'][index]
-                start_x = x_inds[grid_x >= seg['min_value']].min() if grid_x[-1] >= seg['min_value'] else None
-                end_x = x_inds[grid_x <= seg['max_value']].max() + 1 if start_x is not None else None
-                start_y = y_inds[grid_y >= seg['min']].min()
-                end_y = y_inds[grid_y <= seg['max']].max() + 1
-
-            if start_x is not None and end_x is not None and start_y is not None and end_y is not None:
-                y_temp, x_temp = numpy.meshgrid(grid_y[start_y:end_y], grid_x[start_x:end_x], indexing='xy')
-                out[start_x:end_x, start_y:end_y] = self._contained_do_segment(x_temp, y_temp, seg, direction)
-        return out
+        Parameters
+        ----------
+        grid_x : numpy.ndarray
+        grid_y : numpy.ndarray
+        subsamples : int
+            The number of subsamples per cell along each dimension.
+        fill_rule : str
+            One of `'nonzero'` or `'evenodd'`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The coverage fractions, of shape `(grid_x.size, grid_y.size)`.
+        """
+
+        return _grid_coverage(self, grid_x, grid_y, subsamples, fill_rule)
 
     def apply_projection(self, proj_method):
         # type: (callable) -> LinearRing
@@ -2191,7 +2537,7 @@ class Polygon(GeometryObject):
         else:
             return numpy.reshape(in_poly, o_shape)
 
-    def grid_contained(self, grid_x, grid_y):
+    def grid_contained(self, grid_x, grid_y, fill_rule='nonzero'):
         """
         Determines inclusion of a coordinate grid inside the polygon. The coordinate
         grid is defined by the two one-dimensional coordinate arrays `grid_x` and `grid_y`.
@@ -2200,6 +2546,9 @@ class Polygon(GeometryObject):
         ----------
         grid_x : numpy.ndarray
         grid_y : numpy.ndarray
+        fill_rule : str
+            One of `'nonzero'` or `'evenodd'`, which only matters for a
+            self-intersecting linear ring.
 
         Returns
         -------
@@ -2213,12 +2562,34 @@ class Polygon(GeometryObject):
         if self._outer_ring is None:
             return numpy.zeros((grid_x.size, grid_y.size), dtype='bool')
 
-        in_poly = self._outer_ring.grid_contained(grid_x, grid_y)
+        in_poly = self._outer_ring.grid_contained(grid_x, grid_y, fill_rule=fill_rule)
         if self._inner_rings is not None:
             for ir in self._inner_rings:
-                in_poly &= ~ir.grid_contained(grid_x, grid_y)
+                in_poly &= ~ir.grid_contained(grid_x, grid_y, fill_rule=fill_rule)
         return in_poly
 
+    def grid_coverage(self, grid_x, grid_y, subsamples=4, fill_rule='nonzero'):
+        """
+        Determines the (anti-aliased) fraction of each grid cell covered by the
+        polygon. The cell for each grid point extends halfway to its neighbors.
+
+        Parameters
+        ----------
+        grid_x : numpy.ndarray
+        grid_y : numpy.ndarray
+        subsamples : int
+            The number of subsamples per cell along each dimension.
+        fill_rule : str
+            One of `'nonzero'` or `'evenodd'`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The coverage fractions, of shape `(grid_x.size, grid_y.size)`.
+        """
+
+        return _grid_coverage(self, grid_x, grid_y, subsamples, fill_rule)
+
     def add_to_kml(self, doc, parent, coord_transform):
         if self._outer_ring is None:
             return
@@ -2395,7 +2766,7 @@ class MultiPolygon(GeometryObject):
             in_poly |= entry.contain_coordinates(pts_x, pts_y, block_size=block_size)
         return in_poly
 
-    def grid_contained(self, grid_x, grid_y):
+    def grid_contained(self, grid_x, grid_y, fill_rule='nonzero'):
         """
         Determines inclusion of a coordinate grid inside the polygon. The coordinate
         grid is defined by the two one-dimensional coordinate arrays `grid_x` and `grid_y`.
@@ -2404,6 +2775,9 @@ class MultiPolygon(GeometryObject):
         ----------
         grid_x : numpy.ndarray
         grid_y : numpy.ndarray
+        fill_rule : str
+            One of `'nonzero'` or `'evenodd'`, which only matters for a
+            self-intersecting linear ring.
 
         Returns
         -------
@@ -2417,11 +2791,33 @@ class MultiPolygon(GeometryObject):
         if self._polygons is None or len(self._polygons) == 0:
             return numpy.zeros((grid_x.size, grid_y.size), dtype='bool')
 
-        in_poly = self._polygons[0].grid_contained(grid_x, grid_y)
+        in_poly = self._polygons[0].grid_contained(grid_x, grid_y, fill_rule=fill_rule)
         for entry in self._polygons[1:]:
-            in_poly |= entry.grid_contained(grid_x, grid_y)
+            in_poly |= entry.grid_contained(grid_x, grid_y, fill_rule=fill_rule)
         return in_poly
 
+    def grid_coverage(self, grid_x, grid_y, subsamples=4, fill_rule='nonzero'):
+        """
+        Determines the (anti-aliased) fraction of each grid cell covered by the
+        polygons. The cell for each grid point extends halfway to its neighbors.
+
+        Parameters
+        ----------
+        grid_x : numpy.ndarray
+        grid_y : numpy.ndarray
+        subsamples : int
+            The number of subsamples per cell along each dimension.
+        fill_rule : str
+            One of `'nonzero'` or `'evenodd'`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The coverage fractions, of shape `(grid_x.size, grid_y.size)`.
+        """
+
+        return _grid_coverage(self, grid_x, grid_y, subsamples, fill_rule)
+
     def add_to_kml(self, doc, parent, coord_transform):
         if self._polygons is None:
             return
@@ -2506,3 +2902,158 @@ def basic_assemble_from_collection(*args):
         pass
 
     return GeometryCollection.assemble_from_collection(*args)
+
+
+def _gather_coordinate_arrays(geometry, arrays):
+    """
+    Helper function which appends the coordinate arrays of the geometry to the
+    given list, in the same order in which `apply_projection` visits them,
+    without constructing any new geometry objects.
+
+    Parameters
+    ----------
+    geometry : Geometry
+    arrays : List[numpy.ndarray]
+    """
+
+    def collect(coords):
+        if coords is not None:
+            arrays.append(numpy.asarray(coords, dtype='float64'))
+        return coords
+
+    if isinstance(geometry, GeometryCollection):
+        if geometry.geometries is not None:
+            for entry in geometry.geometries:
+                _gather_coordinate_arrays(entry, arrays)
+    elif isinstance(geometry, (Point, LineString)):
+        collect(geometry.coordinates)
+    elif isinstance(geometry, MultiPoint):
+        for entry in geometry.points:
+            collect(entry.coordinates)
+    elif isinstance(geometry, MultiLineString):
+        for entry in geometry.lines:
+            collect(entry.coordinates)
+    elif isinstance(geometry, Polygon):
+        _gather_coordinate_arrays(geometry.outer_ring, arrays)
+        if geometry.inner_rings is not None:
+            for entry in geometry.inner_rings:
+                collect(entry.coordinates)
+    elif isinstance(geometry, MultiPolygon):
+        for entry in geometry.polygons:
+            _gather_coordinate_arrays(entry, arrays)
+    else:
+        geometry.apply_projection(collect)
+
+
+def apply_projection_batched(geometries, proj_method):
+    """
+    Apply the projection method to all the given geometries, by gathering every
+    vertex of every geometry into a single array, applying `proj_method` once
+    (per distinct coordinate dimension), and scattering the results into new
+    geometry objects. This is equivalent to, but much more efficient than,
+    `[geometry.apply_projection(proj_method) for geometry in geometries]`
+    for methods with significant per call overhead, like the iterative SICD
+    image to ground projection.
+
+    Parameters
+    ----------
+    geometries : List[None|Geometry]
+    proj_method : callable
+        This will be called on a two-dimensional array of shape `(N, dim)`,
+        and must return a two-dimensional array with `N` rows.
+
+    Returns
+    -------
+    List[None|Geometry]
+        The projected geometries, with `None` entries preserved.
+    """
+
+    arrays = []
+    for geometry in geometries:
+        if geometry is not None:
+            _gather_coordinate_arrays(geometry, arrays)
+
+    # group by coordinate dimension, so that each group is projected at once
+    groups = OrderedDict()
+    for index, coords in enumerate(arrays):
+        groups.setdefault(coords.shape[-1], []).append(index)
+
+    projected = [None for _ in arrays]
+    for dim, indices in groups.items():
+        stacked = numpy.vstack([numpy.reshape(arrays[index], (-1, dim)) for index in indices])
+        result = numpy.asarray(proj_method(stacked))
+        if result.shape[0] != stacked.shape[0]:
+            raise ValueError(
+                'proj_method returned shape {} for input of shape {}'.format(result.shape, stacked.shape))
+        result = numpy.reshape(result, (stacked.shape[0], -1))
+        start = 0
+        for index in indices:
+            if arrays[index].ndim == 1:
+                projected[index] = result[start]
+                start += 1
+            else:
+                count = arrays[index].shape[0]
+                projected[index] = result[start:start+count]
+                start += count
+
+    results = iter(projected)
+
+    def scatter(coords):
+        return None if coords is None else next(results)
+
+    return [None if geometry is None else geometry.apply_projection(scatter) for geometry in geometries]
+
+
+def rasterize_labels(geometries, shape, labels=None, offset=None, fill_rule='nonzero'):
+    """
+    Rasterize a collection of polygonal geometries into a label image. Pixel
+    `(i, j)` corresponds to coordinates `(offset[0] + i, offset[1] + j)`, and
+    each geometry is only rasterized over the window of its bounding box.
+    Where geometries overlap, later geometries take precedence.
+
+    Parameters
+    ----------
+    geometries : List[LinearRing|Polygon|MultiPolygon]
+    shape : Tuple[int, int]
+        The shape of the label image.
+    labels : None|numpy.ndarray|List[int]
+        The label values, which default to `1, ..., len(geometries)`.
+    offset : None|Tuple[float, float]
+        The coordinates of pixel `(0, 0)`, which default to `(0, 0)`.
+    fill_rule : str
+        One of `'nonzero'` or `'evenodd'`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The label image, with background value 0.
+    """
+
+    shape = (int(shape[0]), int(shape[1]))
+    if offset is None:
+        offset = (0, 0)
+    if labels is None:
+        labels = numpy.arange(1, len(geometries) + 1, dtype='int32')
+    else:
+        labels = numpy.asarray(labels)
+        if labels.shape != (len(geometries), ):
+            raise ValueError(
+                'labels must have shape ({},), got {}'.format(len(geometries), labels.shape))
+
+    out = numpy.zeros(shape, dtype=labels.dtype)
+    for geometry, label in zip(geometries, labels):
+        bounding_box = geometry.get_bbox()
+        if bounding_box is None or len(bounding_box) != 4:
+            continue
+        row_min = max(0, int(numpy.ceil(bounding_box[0] - offset[0])))
+        row_max = min(int(numpy.floor(bounding_box[2] - offset[0])) + 1, shape[0])
+        col_min = max(0, int(numpy.ceil(bounding_box[1] - offset[1])))
+        col_max = min(int(numpy.floor(bounding_box[3] - offset[1])) + 1, shape[1])
+        if row_min >= row_max or col_min >= col_max:
+            continue
+        mask = geometry.grid_contained(
+            numpy.arange(row_min, row_max) + offset[0],
+            numpy.arange(col_min, col_max) + offset[1],
+            fill_rule=fill_rule)
+        out[row_min:row_max, col_min:col_max][mask] = label
+    return out
@@ -0,0 +1,371 @@
+"""
+A packed (bulk loaded, array backed) R-tree spatial index on two-dimensional
+bounding boxes, constructed using the Sort-Tile-Recursive (STR) method.
+
+The index is agnostic to the coordinate system, so it applies equally to
+image pixel coordinates or longitude/latitude coordinates, provided the queries
+are given in the same coordinates as the indexed bounding boxes.
+"""
+
+__classification__ = "UNCLASSIFIED"
+
+import heapq
+
+import numpy
+
+
+def _validate_boxes(boxes):
+    """
+    Validate and reshape bounding box array.
+
+    Parameters
+    ----------
+    boxes : numpy.ndarray|list|tuple
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(N, 4)` and dtype float64.
+    """
+
+    boxes = numpy.array(boxes, dtype='float64')
+    if boxes.ndim == 1 and boxes.size == 4:
+        boxes = numpy.reshape(boxes, (1, 4))
+    elif boxes.size == 0:
+        boxes = numpy.reshape(boxes, (0, 4))
+    if boxes.ndim != 2 or boxes.shape[1] != 4:
+        raise ValueError(
+            'boxes must have shape (N, 4) of the form [min 0, min 1, max 0, max 1], '
+            'got shape {}'.format(boxes.shape))
+    return boxes
+
+
+def _str_order(boxes, node_size):
+    """
+    Gets the Sort-Tile-Recursive ordering of the given bounding boxes. The
+    boxes are sorted into vertical slices by center in the first coordinate,
+    and each slice is then sorted by center in the second coordinate.
+
+    Parameters
+    ----------
+    boxes : numpy.ndarray
+    node_size : int
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    count = boxes.shape[0]
+    if count <= node_size:
+        return numpy.arange(count)
+
+    center_0 = boxes[:, 0] + boxes[:, 2]
+    center_1 = boxes[:, 1] + boxes[:, 3]
+    node_count = int(numpy.ceil(count/float(node_size)))
+    slice_count = int(numpy.ceil(numpy.sqrt(node_count)))
+    slice_size = node_size*int(numpy.ceil(node_count/float(slice_count)))
+
+    by_first = numpy.argsort(center_0, kind='stable')
+    slice_number = numpy.empty((count, ), dtype='int64')
+    slice_number[by_first] = numpy.arange(count)//slice_size
+    return numpy.lexsort((center_1, slice_number))
+
+
+def _group_bounds(boxes, node_size):
+    """
+    Gets the bounding box of each consecutive group of `node_size` boxes.
+
+    Parameters
+    ----------
+    boxes : numpy.ndarray
+    node_size : int
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    starts = numpy.arange(0, boxes.shape[0], node_size)
+    return numpy.hstack((
+        numpy.minimum.reduceat(boxes[:, :2], starts, axis=0),
+        numpy.maximum.reduceat(boxes[:, 2:], starts, axis=0)))
+
+
+def _expand_children(nodes, starts, ends):
+    """
+    Gets the concatenated child index ranges of the given nodes.
+
+    Parameters
+    ----------
+    nodes : numpy.ndarray
+    starts : numpy.ndarray
+    ends : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    start = starts[nodes]
+    counts = ends[nodes] - start
+    total = int(numpy.sum(counts))
+    if total == 0:
+        return numpy.zeros((0, ), dtype='int64')
+    offsets = numpy.cumsum(counts) - counts
+    return numpy.repeat(start - offsets, counts) + numpy.arange(total)
+
+
+def _box_distance(boxes, point):
+    """
+    Gets the Euclidean distance from the point to each bounding box, which is
+    0 for a point inside the box.
+
+    Parameters
+    ----------
+    boxes : numpy.ndarray
+    point : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    delta_0 = numpy.maximum(numpy.maximum(boxes[:, 0] - point[0], point[0] - boxes[:, 2]), 0)
+    delta_1 = numpy.maximum(numpy.maximum(boxes[:, 1] - point[1], point[1] - boxes[:, 3]), 0)
+    return numpy.hypot(delta_0, delta_1)
+
+
+class PackedRTree(object):
+    """
+    A static, bulk loaded R-tree on two-dimensional bounding boxes, stored in
+    flat arrays level by level. Items are identified by their integer index in
+    the order provided, and boxes are of the form
+    `[min coord 0, min coord 1, max coord 0, max coord 1]`. Boxes with any
+    `NaN` entry (i.e. empty geometry) are never returned by any query.
+
+    Items added after construction via :meth:`insert` are held in a pending
+    buffer which is searched directly, and the tree is repacked once the
+    buffer grows large relative to the packed tree.
+    """
+
+    __slots__ = (
+        '_node_size', '_boxes', '_count', '_items', '_levels',
+        '_pending_boxes', '_pending_items')
+
+    def __init__(self, boxes=None, node_size=16):
+        """
+
+        Parameters
+        ----------
+        boxes : None|numpy.ndarray|list
+            Of shape `(N, 4)`.
+        node_size : int
+            The maximum number of children of each node.
+        """
+
+        node_size = int(node_size)
+        if node_size < 2:
+            raise ValueError('node_size must be at least 2, got {}'.format(node_size))
+        self._node_size = node_size
+        self._boxes = _validate_boxes([] if boxes is None else boxes)
+        self._count = self._boxes.shape[0]
+        self._items = None
+        self._levels = []
+        self._pending_boxes = []
+        self._pending_items = []
+        self._pack()
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def node_size(self):
+        """
+        int: The maximum number of children of each node.
+        """
+
+        return self._node_size
+
+    @property
+    def boxes(self):
+        """
+        numpy.ndarray: The bounding boxes of all items, in item order.
+        """
+
+        if len(self._pending_boxes) > 0:
+            return numpy.vstack([self._boxes, ] + self._pending_boxes)
+        return self._boxes
+
+    def _pack(self):
+        """
+        (Re)build the packed tree from all current bounding boxes.
+        """
+
+        if len(self._pending_boxes) > 0:
+            self._boxes = numpy.vstack([self._boxes, ] + self._pending_boxes)
+        self._pending_boxes = []
+        self._pending_items = []
+
+        valid = numpy.nonzero(~numpy.any(numpy.isnan(self._boxes), axis=1))[0]
+        boxes = self._boxes[valid, :]
+        order = _str_order(boxes, self._node_size)
+        self._items = valid[order]
+        boxes = boxes[order, :]
+
+        # each level entry is (bounding boxes, child starts, child ends), where
+        # the children of level 0 nodes are positions in the items array, and
+        # the children of other nodes are positions in the previous level
+        self._levels = []
+        while True:
+            group_starts = numpy.arange(0, boxes.shape[0], self._node_size)
+            group_ends = numpy.minimum(group_starts + self._node_size, boxes.shape[0])
+            if boxes.shape[0] > 0:
+                boxes = _group_bounds(boxes, self._node_size)
+            self._levels.append((boxes, group_starts, group_ends))
+            if boxes.shape[0] <= 1:
+                break
+            order = _str_order(boxes, self._node_size)
+            boxes = boxes[order, :]
+            self._levels[-1] = (boxes, group_starts[order], group_ends[order])
+
+    def insert(self, box):
+        """
+        Add a new item, which is assigned the next integer index.
+
+        Parameters
+        ----------
+        box : numpy.ndarray|list|tuple
+            Of the form `[min coord 0, min coord 1, max coord 0, max coord 1]`.
+
+        Returns
+        -------
+        int
+            The index of the new item.
+        """
+
+        box = _validate_boxes(box)
+        if box.shape[0] != 1:
+            raise ValueError('insert requires a single bounding box, got shape {}'.format(box.shape))
+        index = self._count
+        self._count += 1
+        self._pending_boxes.append(box)
+        self._pending_items.append(index)
+        if len(self._pending_items) > max(self._node_size**2, self._boxes.shape[0]//4):
+            self._pack()
+        return index
+
+    def _pending_array(self):
+        if len(self._pending_boxes) == 0:
+            return None, None
+        return numpy.vstack(self._pending_boxes), numpy.array(self._pending_items, dtype='int64')
+
+    def query_bbox(self, bbox):
+        """
+        Gets the indices of the items whose bounding boxes intersect the given
+        bounding box, where the boundary is included.
+
+        Parameters
+        ----------
+        bbox : numpy.ndarray|list|tuple
+            Of the form `[min coord 0, min coord 1, max coord 0, max coord 1]`.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted item indices.
+        """
+
+        bbox = _validate_boxes(bbox)[0]
+
+        def intersects(the_boxes):
+            return (the_boxes[:, 0] <= bbox[2]) & (the_boxes[:, 2] >= bbox[0]) & \
+                   (the_boxes[:, 1] <= bbox[3]) & (the_boxes[:, 3] >= bbox[1])
+
+        candidates = numpy.arange(self._levels[-1][0].shape[0])
+        for boxes, starts, ends in reversed(self._levels):
+            candidates = candidates[intersects(boxes[candidates, :])]
+            candidates = _expand_children(candidates, starts, ends)
+        item_boxes = self._boxes[self._items[candidates], :]
+        found = self._items[candidates[intersects(item_boxes)]]
+
+        pending_boxes, pending_items = self._pending_array()
+        if pending_boxes is not None:
+            found = numpy.hstack((found, pending_items[intersects(pending_boxes)]))
+        return numpy.sort(found)
+
+    def query_point(self, point):
+        """
+        Gets the indices of the items whose bounding boxes contain the given
+        point, where the boundary is included.
+
+        Parameters
+        ----------
+        point : numpy.ndarray|list|tuple
+            Only the first two coordinates are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            The sorted item indices.
+        """
+
+        point = numpy.asarray(point, dtype='float64')
+        return self.query_bbox([point[0], point[1], point[0], point[1]])
+
+    def nearest(self, point, k=1):
+        """
+        Gets the indices of the `k` items whose bounding boxes are nearest to
+        the given point, using a best-first traversal. The distance to a box
+        containing the point is 0.
+
+        Parameters
+        ----------
+        point : numpy.ndarray|list|tuple
+            Only the first two coordinates are used.
+        k : int
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            The item indices and the corresponding bounding box distances, in
+            order of increasing distance.
+        """
+
+        k = int(k)
+        point = numpy.asarray(point, dtype='float64')[:2]
+        found_items = []
+        found_distances = []
+        if k < 1:
+            return numpy.array(found_items, dtype='int64'), numpy.array(found_distances, dtype='float64')
+
+        # heap entries are (distance, item flag, level or item index, node index)
+        heap = []
+        pending_boxes, pending_items = self._pending_array()
+        if pending_boxes is not None:
+            for dist, item in zip(_box_distance(pending_boxes, point), pending_items):
+                if not numpy.isnan(dist):
+                    heap.append((float(dist), 0, int(item), -1))
+        top = len(self._levels) - 1
+        top_boxes = self._levels[top][0]
+        for node, dist in enumerate(_box_distance(top_boxes, point)):
+            heap.append((float(dist), 1, top, node))
+        heapq.heapify(heap)
+
+        while heap and len(found_items) < k:
+            dist, is_node, level_or_item, node = heapq.heappop(heap)
+            if not is_node:
+                found_items.append(level_or_item)
+                found_distances.append(dist)
+                continue
+            _, starts, ends = self._levels[level_or_item]
+            children = numpy.arange(starts[node], ends[node])
+            if level_or_item == 0:
+                items = self._items[children]
+                for item, child_dist in zip(items, _box_distance(self._boxes[items, :], point)):
+                    heapq.heappush(heap, (float(child_dist), 0, int(item), -1))
+            else:
+                child_boxes = self._levels[level_or_item - 1][0]
+                for child, child_dist in zip(children, _box_distance(child_boxes[children, :], point)):
+                    heapq.heappush(heap, (float(child_dist), 1, level_or_item - 1, int(child)))
+        return numpy.array(found_items, dtype='int64'), numpy.array(found_distances, dtype='float64')
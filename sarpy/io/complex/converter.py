@@ -12,14 +12,12 @@ from typing import Union, List, Tuple, Callable, BinaryIO
 
 import numpy
 
-from sarpy.geometry.geocoords import ecf_to_geodetic
-from sarpy.geometry.point_projection import image_to_ground_dem
 from sarpy.io.complex.base import SICDTypeReader
 from sarpy.io.complex.sicd import SICDWriter
 from sarpy.io.complex.sio import SIOWriter
-from sarpy.io.DEM.geotiff1deg import GeoTIFF1DegInterpolator
 from sarpy.io.general.base import SarpyIOError
-from sarpy.io.general.base import check_for_openers
+from sarpy.io.general.base import check_for_plugin_openers, \
+    OpenerManifestEntry, get_candidate_openers
 from sarpy.io.general.nitf import NITFReader
 from sarpy.io.general.utils import is_file_like
 
@@ -29,12 +27,52 @@ logger = logging.getLogger(__name__)
 # Module variables
 _writer_types = {'SICD': SICDWriter, 'SIO': SIOWriter}
 _openers = []
+_plugin_openers = []
 _parsed_openers = False
+_manifest = (
+    OpenerManifestEntry(
+        'sarpy.io.complex.sicd',
+        magic=(b'NITF', b'NSIF'),
+        extensions=('.nitf', '.ntf', '.nsf')),
+    OpenerManifestEntry(
+        'sarpy.io.complex.sio',
+        magic=(b'\xff\x01\x7f\xfe', b'\xfe\x7f\x01\xff', b'\xff\x02\x7f\xfd', b'\xfd\x7f\x02\xff'),
+        extensions=('.sio', )),
+    OpenerManifestEntry('sarpy.io.complex.gff', magic=(b'GSATIMG', ), extensions=('.gff', )),
+    OpenerManifestEntry(
+        'sarpy.io.complex.capella',
+        magic=(b'II*\x00', b'MM\x00*', b'II+\x00', b'MM\x00+'),
+        extensions=('.tif', '.tiff'),
+        priority=10),
+    OpenerManifestEntry(
+        'sarpy.io.complex.csk',
+        magic=(b'\x89HDF\r\n\x1a\n', ),
+        extensions=('.h5', '.hdf5', '.he5'),
+        priority=10),
+    OpenerManifestEntry(
+        'sarpy.io.complex.iceye',
+        magic=(b'\x89HDF\r\n\x1a\n', ),
+        extensions=('.h5', '.hdf5', '.he5'),
+        priority=10),
+    OpenerManifestEntry(
+        'sarpy.io.complex.nisar',
+        magic=(b'\x89HDF\r\n\x1a\n', ),
+        extensions=('.h5', '.hdf5', '.he5'),
+        priority=10),
+    OpenerManifestEntry('sarpy.io.complex.palsar2', priority=20),
+    OpenerManifestEntry('sarpy.io.complex.radarsat', extensions=('.xml', ), priority=20),
+    OpenerManifestEntry('sarpy.io.complex.sentinel', extensions=('.safe', ), priority=20),
+    OpenerManifestEntry('sarpy.io.complex.tsx', extensions=('.xml', ), priority=20),
+)
+"""
+The openers provided in `sarpy.io.complex`, which are only imported when attempted.
+"""
 
 
 def register_opener(open_func: Callable) -> None:
     """
-    Provide a new opener.
+    Provide a new opener. Registered openers are attempted before the openers
+    provided in sarpy, so this may be used to override a provided reader.
 
     Parameters
     ----------
@@ -56,7 +94,9 @@ def register_opener(open_func: Callable) -> None:
 
 def parse_openers() -> None:
     """
-    Automatically find the viable openers (i.e. :func:`is_a`) in the various modules.
+    Find the openers provided by plug-ins, which are attempted after the
+    openers provided in sarpy. The openers provided in sarpy are declared in
+    the module manifest instead, and are only imported when attempted.
     """
 
     global _parsed_openers
@@ -64,7 +104,7 @@ def parse_openers() -> None:
         return
     _parsed_openers = True
 
-    check_for_openers('sarpy.io.complex', register_opener)
+    check_for_plugin_openers('sarpy.io.complex', _plugin_openers.append)
 
 
 def _define_final_attempt_openers() -> List[Callable]:
@@ -102,7 +142,7 @@ def open_complex(file_name: Union[str, BinaryIO]) -> SICDTypeReader:
     # parse openers, if not already done
     parse_openers()
     # see if we can find a reader though trial and error
-    for opener in _openers:
+    for opener in get_candidate_openers(file_name, _manifest, _openers, _plugin_openers):
         reader = opener(file_name)
         if reader is not None:
             return reader
@@ -380,6 +420,10 @@ def conversion_utility(
     sizes = reader.get_data_size_as_tuple()
 
     if dem_filename_pattern is not None:
+        from sarpy.geometry.geocoords import ecf_to_geodetic
+        from sarpy.geometry.point_projection import image_to_ground_dem
+        from sarpy.io.DEM.geotiff1deg import GeoTIFF1DegInterpolator
+
         # Update the SICD metadata base on a projection of the SCP to a DEM.
         if dem_type.upper().startswith('GEOTIFF'):
             ref_surface = dem_type.upper().split(':')[-1] if ':' in dem_type else 'EGM2008'
@@ -720,7 +720,8 @@ class SentinelDetails(object):
             scps = get_scps(len(burst_list))
 
             for j, burst in enumerate(burst_list):
-                t_sicd = out_sicd.copy()
+                # the common structure is otherwise unused, so share any unmodified subtrees
+                t_sicd = out_sicd.copy(copy_on_write=True)
                 # set preliminary geodata (required for projection)
                 t_sicd.GeoData = GeoDataType(SCP=SCPType(ECF=scps[j, :]))  # EarthModel & LLH are implicitly set
 
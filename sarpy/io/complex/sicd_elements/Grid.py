@@ -11,16 +11,15 @@ from typing import Union, Optional, Dict, Tuple
 
 import numpy
 from numpy.linalg import norm
-from scipy.constants import speed_of_light
 
-from sarpy.processing.sicd.windows import general_hamming, taylor, kaiser, find_half_power, \
+from sarpy.processing.sicd.windows import get_window, find_half_power, \
     get_hamming_broadening_factor
 from sarpy.io.xml.base import Serializable, ParametersCollection, find_first_child
 from sarpy.io.xml.descriptors import StringDescriptor, StringEnumDescriptor, \
     FloatDescriptor, FloatArrayDescriptor, IntegerEnumDescriptor, \
     SerializableDescriptor, UnitVectorDescriptor, ParametersDescriptor
 
-from .base import DEFAULT_STRICT, FLOAT_FORMAT
+from .base import DEFAULT_STRICT, FLOAT_FORMAT, speed_of_light
 from .blocks import XYZType, Poly2DType
 from .utils import _get_center_frequency
 
@@ -268,9 +267,9 @@ class DirParamType(Serializable):
                 coef = float(self.WgtType.get_parameter_value(None, 0.54))  # just get first parameter - name?
             except ValueError:
                 coef = 0.54
-            value = general_hamming(weight_size, coef, sym=True)
+            value = get_window('GENERAL_HAMMING', weight_size, parameters={'ALPHA': coef})
         elif window_name == 'HANNING':
-            value = general_hamming(weight_size, 0.5, sym=True)
+            value = get_window('HANNING', weight_size)
         elif window_name == 'KAISER':
             beta = 14.0  # suggested default in literature/documentation
             try:
@@ -278,13 +277,14 @@ class DirParamType(Serializable):
                 beta = float(self.WgtType.get_parameter_value(None, beta))  # just get first parameter - name?
             except ValueError:
                 pass
-            value = kaiser(weight_size, beta, sym=True)
+            value = get_window('KAISER', weight_size, parameters={'BETA': beta})
         elif window_name == 'TAYLOR':
             # noinspection PyTypeChecker
             sidelobes = int(self.WgtType.get_parameter_value('NBAR', 4))  # apparently the matlab argument name
             # noinspection PyTypeChecker
             max_sidelobe_level = float(self.WgtType.get_parameter_value('SLL', -30))  # same
-            value = taylor(weight_size, nbar=sidelobes, sll=max_sidelobe_level, norm=True, sym=True)
+            value = get_window(
+                'TAYLOR', weight_size, parameters={'NBAR': sidelobes, 'SLL': max_sidelobe_level})
         elif window_name == 'UNIFORM':
             value = numpy.ones((32, ), dtype='float64')
 
@@ -7,7 +7,6 @@ __author__ = "Thomas McCullough"
 
 
 import logging
-from copy import deepcopy
 import re
 from collections import OrderedDict
 from typing import Optional, Dict, Union, Tuple
@@ -71,6 +70,7 @@ class SICDType(Serializable):
         'CollectionInfo', 'ImageData', 'GeoData', 'Grid', 'Timeline', 'Position',
         'RadarCollection', 'ImageFormation', 'SCPCOA')
     _choice = ({'required': False, 'collection': ('RgAzComp', 'PFA', 'RMA')}, )
+    _copy_reset = ('_coa_projection', )
     # descriptors
     CollectionInfo = SerializableDescriptor(
         'CollectionInfo', CollectionInfoType, _required, strict=False,
@@ -960,18 +960,21 @@ class SICDType(Serializable):
             ('DESSHSD', spec_date),
             ('DESSHTN', spec_ns)])
 
-    def copy(self):
+    def copy(self, copy_on_write=False):
         """
-        Provides a deep copy.
+        Provides a deep copy, including the NITF details.
+
+        Parameters
+        ----------
+        copy_on_write : bool
+            Share the child structures until first accessed? See :meth:`Serializable.copy`.
 
         Returns
         -------
         SICDType
         """
 
-        out = super(SICDType, self).copy()
-        out._NITF = deepcopy(self._NITF)
-        return out
+        return super(SICDType, self).copy(copy_on_write=copy_on_write)
 
     def to_xml_bytes(self, urn=None, tag='SICD', check_validity=False, strict=DEFAULT_STRICT):
         if urn is None:
@@ -18,6 +18,11 @@ from sarpy.io.xml.descriptors import BasicDescriptor
 logger = logging.getLogger(__name__)
 DEFAULT_STRICT = False
 FLOAT_FORMAT = '0.17G'
+speed_of_light = 299792458.0
+"""
+The speed of light in vacuum in meters per second, as :data:`scipy.constants.speed_of_light`.
+Defined here, since importing :mod:`scipy.constants` is slow.
+"""
 
 
 class SerializableCPArrayDescriptor(BasicDescriptor):
@@ -866,6 +866,108 @@ class RowColArrayElement(RowColType):
 ###############
 # Polynomial Types
 
+_GRID_BLOCK_ELEMENTS = 2**16
+
+
+def _validate_grid_vector(array: Union[float, int, numpy.ndarray], name: str) -> numpy.ndarray:
+    array = numpy.atleast_1d(numpy.asarray(array, dtype='float64'))
+    if array.ndim != 1:
+        raise ValueError('{} must be a scalar or one-dimensional, got shape {}'.format(name, array.shape))
+    return array
+
+
+def poly2d_grid(
+        x: Union[float, int, numpy.ndarray],
+        y: Union[float, int, numpy.ndarray],
+        coefs: numpy.ndarray,
+        out: Optional[numpy.ndarray] = None,
+        dtype: Union[str, numpy.dtype] = 'float64',
+        block_size: Optional[int] = None) -> numpy.ndarray:
+    """
+    Evaluate a two-dimensional polynomial on the Cartesian product of `x` and `y`,
+    in the fashion of :func:`polygrid2d` of `numpy.polynomial.polynomial`, so that
+    `out[i, j] = P(x[i], y[j])`.
+
+    The polynomial is first reduced to one-dimensional polynomials along the
+    dimension of higher order, and then a Horner scheme along the dimension of lower
+    order is applied in place over blocks of rows. No mesh of coordinates is
+    constructed, and no temporary beyond a single block is allocated.
+
+    Parameters
+    ----------
+    x : float|int|numpy.ndarray
+        The one-dimensional first coordinate values.
+    y : float|int|numpy.ndarray
+        The one-dimensional second coordinate values.
+    coefs : numpy.ndarray
+        The two-dimensional coefficient array.
+    out : None|numpy.ndarray
+        The optional output array of shape `(x.size, y.size)` and the given `dtype`,
+        into which the result will be written.
+    dtype : str|numpy.dtype
+        The output data type, one of `'float64'` or `'float32'`. The float32 mode
+        performs the (full grid) Horner steps in single precision, which is faster
+        and uses half the memory, at the expense of precision.
+    block_size : None|int
+        The number of rows evaluated at a time. If not provided, this is chosen so
+        that each block has roughly 65536 elements.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    dtype = numpy.dtype(dtype)
+    if dtype.name not in ['float64', 'float32']:
+        raise ValueError('dtype must be one of float64 or float32, got {}'.format(dtype))
+    coefs = numpy.asarray(coefs, dtype='float64')
+    if coefs.ndim != 2:
+        raise ValueError('coefs must be two-dimensional, got shape {}'.format(coefs.shape))
+    x = _validate_grid_vector(x, 'x')
+    y = _validate_grid_vector(y, 'y')
+
+    shape = (x.size, y.size)
+    if out is None:
+        out = numpy.empty(shape, dtype=dtype)
+    elif not isinstance(out, numpy.ndarray) or out.shape != shape or out.dtype != dtype:
+        raise ValueError(
+            'out must be a numpy array of shape {} and dtype {}'.format(shape, dtype.name))
+    if out.size == 0:
+        return out
+
+    if block_size is None:
+        block_size = max(1, _GRID_BLOCK_ELEMENTS//y.size)
+    else:
+        block_size = int(block_size)
+        if block_size < 1:
+            raise ValueError('block_size must be a positive integer, got {}'.format(block_size))
+
+    # Horner along the axis of lower order, over the full grid
+    horner_on_rows = (coefs.shape[0] <= coefs.shape[1])
+    if horner_on_rows:
+        # reduced[k, j] = sum_l coefs[k, l]*y[j]**l
+        reduced = numpy.polynomial.polynomial.polyval(y, coefs.T).astype(dtype, copy=False)
+        horner_values = x.astype(dtype, copy=False)
+    else:
+        # reduced[k, i] = sum_l coefs[l, k]*x[i]**l
+        reduced = numpy.polynomial.polynomial.polyval(x, coefs).astype(dtype, copy=False)
+        horner_values = y.astype(dtype, copy=False)[numpy.newaxis, :]
+
+    for start in range(0, x.size, block_size):
+        end = min(start + block_size, x.size)
+        block = out[start:end, :]
+        if horner_on_rows:
+            terms = reduced[:, numpy.newaxis, :]
+            multiplier = horner_values[start:end, numpy.newaxis]
+        else:
+            terms = reduced[:, start:end, numpy.newaxis]
+            multiplier = horner_values
+        block[:] = terms[-1]
+        for k in range(reduced.shape[0]-2, -1, -1):
+            block *= multiplier
+            block += terms[k]
+    return out
+
 
 class Poly1DType(Serializable, Arrayable):
     """
@@ -1213,6 +1315,43 @@ class Poly2DType(Serializable, Arrayable):
 
         return numpy.polynomial.polynomial.polyval2d(x, y, self._coefs)
 
+    def evaluate_grid(
+            self,
+            x: Union[float, int, numpy.ndarray],
+            y: Union[float, int, numpy.ndarray],
+            out: Optional[numpy.ndarray] = None,
+            dtype: Union[str, numpy.dtype] = 'float64',
+            block_size: Optional[int] = None) -> numpy.ndarray:
+        """
+        Evaluate the polynomial on the grid defined by the one-dimensional arrays
+        `x` and `y`, so that the result has shape `(x.size, y.size)`. This is the
+        analog of :func:`polygrid2d` of `numpy.polynomial.polynomial`, but no
+        coordinate mesh is constructed, and the output may be preallocated.
+
+        Parameters
+        ----------
+        x : float|int|numpy.ndarray
+            The first coordinate values, for example row coordinates.
+        y : float|int|numpy.ndarray
+            The second coordinate values, for example column coordinates.
+        out : None|numpy.ndarray
+            Optional output array of shape `(x.size, y.size)`.
+        dtype : str|numpy.dtype
+            The output data type, one of `'float64'` or `'float32'`.
+        block_size : None|int
+            The number of rows evaluated at a time.
+
+        Returns
+        -------
+        numpy.ndarray
+
+        See Also
+        --------
+        poly2d_grid
+        """
+
+        return poly2d_grid(x, y, self._coefs, out=out, dtype=dtype, block_size=block_size)
+
     @property
     def order1(self) -> int:
         """
@@ -1515,6 +1654,52 @@ class XYZPolyType(Serializable, Arrayable):
             out = numpy.hstack((x, y, z))
             return numpy.reshape(out, o_shape + (3, ))
 
+    def evaluate(
+            self,
+            t: Union[float, int, numpy.ndarray],
+            out: Optional[numpy.ndarray] = None,
+            dtype: Union[str, numpy.dtype] = 'float64') -> numpy.ndarray:
+        """
+        Evaluate the polynomial at points `t`, writing each of the `X,Y,Z`
+        components directly into the output array using a Horner scheme. This is
+        intended for large `t`, for example the coa times over an image grid given by
+        :meth:`Poly2DType.evaluate_grid`.
+
+        Parameters
+        ----------
+        t : float|int|numpy.ndarray
+            The point(s) at which to evaluate.
+        out : None|numpy.ndarray
+            Optional output array of shape `t.shape + (3, )` and the given `dtype`.
+        dtype : str|numpy.dtype
+            The output data type, one of `'float64'` or `'float32'`.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        dtype = numpy.dtype(dtype)
+        if dtype.name not in ['float64', 'float32']:
+            raise ValueError('dtype must be one of float64 or float32, got {}'.format(dtype))
+        t = numpy.asarray(t)
+        shape = t.shape + (3, )
+        if out is None:
+            out = numpy.empty(shape, dtype=dtype)
+        elif not isinstance(out, numpy.ndarray) or out.shape != shape or out.dtype != dtype:
+            raise ValueError(
+                'out must be a numpy array of shape {} and dtype {}'.format(shape, dtype.name))
+
+        t = t.astype(dtype, copy=False)
+        for i, poly in enumerate([self.X, self.Y, self.Z]):
+            coefs = poly.Coefs
+            component = out[..., i]
+            component[...] = coefs[-1]
+            for coef in coefs[-2::-1]:
+                component *= t
+                component += coef
+        return out
+
     def get_array(self, dtype='object') -> numpy.ndarray:
         """Gets an array representation of the class instance.
 
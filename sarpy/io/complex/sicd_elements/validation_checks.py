@@ -9,9 +9,9 @@ __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
 
 import numpy
-from scipy.constants import speed_of_light
 from sarpy.geometry import geocoords
 from sarpy.geometry.geometry_elements import LinearRing
+from sarpy.io.complex.sicd_elements.base import speed_of_light
 
 
 ##############
@@ -10,7 +10,7 @@ __author__ = "Thomas McCullough"
 
 import os
 import logging
-from typing import Union, List, Tuple, Sequence, Optional, Callable
+from typing import Union, List, Tuple, Sequence, Optional, Callable, BinaryIO
 from importlib import import_module
 import pkgutil
 
@@ -21,6 +21,7 @@ from sarpy.compliance import SarpyError
 from sarpy.io.general.format_function import FormatFunction
 from sarpy.io.general.data_segment import DataSegment, extract_string_from_subscript, \
     NumpyArraySegment
+from sarpy.io.general.utils import is_file_like
 
 logger = logging.getLogger(__name__)
 
@@ -37,11 +38,33 @@ class SarpyIOError(SarpyError):
 ############
 # module walking to register openers
 
+def check_for_plugin_openers(start_package: str, register_method: Callable) -> None:
+    """
+    Registers the openers (i.e. the :meth:`is_a` methods) provided by plug-ins,
+    via the entry points group named `start_package`.
+
+    Parameters
+    ----------
+    start_package : str
+    register_method : Callable
+    """
+
+    for entry in sarpy._extensions.entry_points(group=start_package):
+        sub_module = entry.load()
+        if hasattr(sub_module, 'is_a'):
+            logger.info(f"Extending {start_package} with {sub_module.__name__}")
+            register_method(sub_module.is_a)
+
+
 def check_for_openers(start_package: str, register_method: Callable) -> None:
     """
     Walks the package, and registers the discovered openers. That is, the modules
     with an :meth:`is_a` method.
 
+    Note that this imports every module in the package. The converters instead
+    use a static :class:`OpenerManifestEntry` collection, so that only the
+    modules which are candidates for a given file are imported.
+
     Parameters
     ----------
     start_package : str
@@ -58,11 +81,175 @@ def check_for_openers(start_package: str, register_method: Callable) -> None:
         if hasattr(sub_module, 'is_a'):
             register_method(sub_module.is_a)
 
-    for entry in sarpy._extensions.entry_points(group=start_package):
-        sub_module = entry.load()
-        if hasattr(sub_module, 'is_a'):
-            logger.info(f"Extending {start_package} with {sub_module.__name__}")
-            register_method(sub_module.is_a)
+    check_for_plugin_openers(start_package, register_method)
+
+
+class OpenerManifestEntry(object):
+    """
+    The declaration of a module providing an opener (i.e. an :meth:`is_a` method),
+    which permits determining whether the module is a candidate for a given file
+    without importing it.
+    """
+
+    __slots__ = ('_module_name', '_magic', '_extensions', '_priority')
+
+    def __init__(
+            self,
+            module_name: str,
+            magic: Sequence[bytes] = (),
+            extensions: Sequence[str] = (),
+            priority: int = 0):
+        """
+
+        Parameters
+        ----------
+        module_name : str
+            The fully qualified name of the module providing the `is_a` method.
+        magic : Sequence[bytes]
+            The possible leading bytes of a file of this type.
+        extensions : Sequence[str]
+            The (lower case) file extensions for this type, including the leading `.`.
+        priority : int
+            The candidates are attempted in increasing priority order, with ties
+            attempted in manifest order.
+        """
+
+        self._module_name = module_name
+        self._magic = tuple(magic)
+        self._extensions = tuple(entry.lower() for entry in extensions)
+        self._priority = int(priority)
+
+    @property
+    def module_name(self) -> str:
+        """
+        str: The fully qualified name of the module providing the `is_a` method.
+        """
+
+        return self._module_name
+
+    @property
+    def magic(self) -> Tuple[bytes, ...]:
+        """
+        Tuple[bytes, ...]: The possible leading bytes of a file of this type.
+        """
+
+        return self._magic
+
+    @property
+    def extensions(self) -> Tuple[str, ...]:
+        """
+        Tuple[str, ...]: The file extensions for this type.
+        """
+
+        return self._extensions
+
+    @property
+    def priority(self) -> int:
+        """
+        int: The attempt priority, lower values are attempted first.
+        """
+
+        return self._priority
+
+    def matches(self, header: Optional[bytes], extension: Optional[str]) -> bool:
+        """
+        Is a file with the given leading bytes or extension a candidate for this opener?
+
+        Parameters
+        ----------
+        header : None|bytes
+        extension : None|str
+
+        Returns
+        -------
+        bool
+        """
+
+        if header is not None and any(header.startswith(entry) for entry in self._magic):
+            return True
+        return extension is not None and extension in self._extensions
+
+    def get_opener(self) -> Optional[Callable]:
+        """
+        Import the module, and get its `is_a` method.
+
+        Returns
+        -------
+        None|Callable
+        """
+
+        return getattr(import_module(self._module_name), 'is_a', None)
+
+
+def _fetch_file_header(file_name: Union[str, BinaryIO], size: int) -> Optional[bytes]:
+    """
+    Fetch (up to) the first `size` bytes of the file, or `None` if the input
+    is not a file.
+    """
+
+    if is_file_like(file_name):
+        current_location = file_name.tell()
+        file_name.seek(0, os.SEEK_SET)
+        header = file_name.read(size)
+        file_name.seek(current_location, os.SEEK_SET)
+        return header if isinstance(header, bytes) else None
+    elif isinstance(file_name, str) and os.path.isfile(file_name):
+        with open(file_name, 'rb') as fi:
+            return fi.read(size)
+    return None
+
+
+def get_candidate_openers(
+        file_name: Union[str, BinaryIO],
+        manifest: Sequence[OpenerManifestEntry],
+        registered: Sequence[Callable] = (),
+        plugins: Sequence[Callable] = ()):
+    """
+    Yields the openers to attempt for the given file. The explicitly registered
+    openers are yielded first, so that registration can override a provided
+    reader. These are followed by the manifest entries whose magic bytes or file
+    extension match the file, then the remaining manifest entries, and finally
+    the plug-in openers. The module for a manifest entry is only imported when
+    its opener is yielded.
+
+    Parameters
+    ----------
+    file_name : str|BinaryIO
+    manifest : Sequence[OpenerManifestEntry]
+    registered : Sequence[Callable]
+        The explicitly registered openers.
+    plugins : Sequence[Callable]
+        The openers provided by plug-ins.
+
+    Yields
+    ------
+    Callable
+    """
+
+    attempted = set()
+    for opener in registered:
+        if opener not in attempted:
+            attempted.add(opener)
+            yield opener
+
+    magic_size = max((len(entry) for manifest_entry in manifest for entry in manifest_entry.magic), default=0)
+    header = _fetch_file_header(file_name, magic_size) if magic_size > 0 else None
+    extension = os.path.splitext(file_name)[1].lower() if isinstance(file_name, str) else None
+
+    ordered = sorted(manifest, key=lambda manifest_entry: manifest_entry.priority)
+    candidates = [entry for entry in ordered if entry.matches(header, extension)]
+    candidates.extend(entry for entry in ordered if not entry.matches(header, extension))
+
+    for manifest_entry in candidates:
+        opener = manifest_entry.get_opener()
+        if opener is None or opener in attempted:
+            continue
+        attempted.add(opener)
+        yield opener
+    for opener in plugins:
+        if opener not in attempted:
+            attempted.add(opener)
+            yield opener
 
 
 #############
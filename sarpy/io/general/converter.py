@@ -5,7 +5,8 @@ opened by the sicd, sidd, cphd, or crsd reader collections.
 
 import os
 from typing import Callable
-from sarpy.io.general.base import SarpyIOError, BaseReader, check_for_openers
+from sarpy.io.general.base import SarpyIOError, BaseReader, check_for_plugin_openers, \
+    OpenerManifestEntry, get_candidate_openers
 
 __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
@@ -14,12 +15,27 @@ __author__ = "Thomas McCullough"
 ###########
 # Module variables
 _openers = []
+_plugin_openers = []
 _parsed_openers = False
+_manifest = (
+    OpenerManifestEntry(
+        'sarpy.io.general.nitf',
+        magic=(b'NITF', b'NSIF'),
+        extensions=('.nitf', '.ntf', '.nsf')),
+    OpenerManifestEntry(
+        'sarpy.io.general.tiff',
+        magic=(b'II*\x00', b'MM\x00*', b'II+\x00', b'MM\x00+'),
+        extensions=('.tif', '.tiff')),
+)
+"""
+The openers provided in `sarpy.io.general`, which are only imported when attempted.
+"""
 
 
 def register_opener(open_func: Callable) -> None:
     """
-    Provide a new opener.
+    Provide a new opener. Registered openers are attempted before the openers
+    provided in sarpy, so this may be used to override a provided reader.
 
     Parameters
     ----------
@@ -41,7 +57,9 @@ def register_opener(open_func: Callable) -> None:
 
 def parse_openers() -> None:
     """
-    Automatically find the viable openers (i.e. :func:`is_a`) in the various modules.
+    Find the openers provided by plug-ins, which are attempted after the
+    openers provided in sarpy. The openers provided in sarpy are declared in
+    the module manifest instead, and are only imported when attempted.
 
     Returns
     -------
@@ -53,7 +71,7 @@ def parse_openers() -> None:
         return
     _parsed_openers = True
 
-    check_for_openers('sarpy.io.general', register_opener)
+    check_for_plugin_openers('sarpy.io.general', _plugin_openers.append)
 
 
 def open_general(file_name: str) -> BaseReader:
@@ -78,7 +96,7 @@ def open_general(file_name: str) -> BaseReader:
     # parse openers, if not already done
     parse_openers()
     # see if we can find a reader though trial and error
-    for opener in _openers:
+    for opener in get_candidate_openers(file_name, _manifest, _openers, _plugin_openers):
         reader = opener(file_name)
         if reader is not None:
             return reader
@@ -18,13 +18,7 @@ import numpy
 from sarpy.io.general.format_function import FormatFunction, IdentityFunction
 from sarpy.io.general.slice_parsing import verify_subscript, get_slice_result_size, \
     get_subscript_result_size
-from sarpy.io.general.utils import h5py, is_file_like
-
-if h5py is not None:
-    from h5py import File as h5pyFile, Dataset as h5pyDataset
-else:
-    h5pyFile = None
-    h5pyDataset = None
+from sarpy.io.general.utils import get_h5py, is_file_like
 
 logger = logging.getLogger(__name__)
 
@@ -2189,8 +2183,8 @@ class HDF5DatasetSegment(DataSegment):
 
     def __init__(
             self,
-            file_object: Union[str, h5pyFile],
-            data_set: Union[str, h5pyDataset],
+            file_object: Union[str, 'h5py.File'],
+            data_set: Union[str, 'h5py.Dataset'],
             formatted_dtype: Optional[Union[str, numpy.dtype]] = None,
             formatted_shape: Optional[Tuple[int, ...]] = None,
             reverse_axes: Optional[Union[int, Sequence[int]]] = None,
@@ -2219,7 +2213,7 @@ class HDF5DatasetSegment(DataSegment):
         self._file_object = None
         self._data_set = None
 
-        if h5py is None:
+        if get_h5py() is None:
             raise ValueError(
                 'h5py was not successfully imported, and no hdf5 file can be read')
 
@@ -2260,10 +2254,11 @@ class HDF5DatasetSegment(DataSegment):
         self._close_file = bool(value)
 
     @property
-    def file_object(self) -> h5pyFile:
+    def file_object(self) -> 'h5py.File':
         return self._file_object
 
     def _set_file_object(self, value) -> None:
+        h5py = get_h5py()
         if isinstance(value, str):
             value = h5py.File(value, mode='r')
         if not isinstance(value, h5py.File):
@@ -2271,13 +2266,13 @@ class HDF5DatasetSegment(DataSegment):
         self._file_object = value
 
     @property
-    def data_set(self) -> h5pyDataset:
+    def data_set(self) -> 'h5py.Dataset':
         return self._data_set
 
     def _set_data_set(self, value) -> None:
         if isinstance(value, str):
             value = self.file_object[value]
-        if not isinstance(value, h5py.Dataset):
+        if not isinstance(value, get_h5py().Dataset):
             raise ValueError('Requires a dataset path or h5py.Dataset object')
         self._data_set = value
 
@@ -14,6 +14,7 @@ import os
 from typing import Union, List, Tuple, BinaryIO, Sequence, Optional
 from tempfile import mkstemp
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import struct
 from io import BytesIO
 
@@ -49,16 +50,6 @@ try:
 except ImportError:
     pyproj = None
 
-try:
-    # noinspection PyPackageRequirements
-    from PIL import Image as PIL_Image
-    PIL_Image.MAX_IMAGE_PIXELS = None  # get rid of decompression bomb checking
-    from PIL import ImageFile
-    ImageFile.LOAD_TRUNCATED_IMAGES = True
-except ImportError:
-    PIL_Image = None
-    ImageFile = None
-
 import platform
 system_os = platform.system()
 if system_os == 'Linux':
@@ -69,6 +60,33 @@ if system_os == 'Linux':
 
 logger = logging.getLogger(__name__)
 
+_PIL_Image = False  # sentinel for not yet attempted
+
+
+def _get_pil_image():
+    """
+    Gets the PIL Image module, which is only required for compressed image
+    segments, so it is imported on first use.
+
+    Returns
+    -------
+    None|module
+        `None` if PIL is not successfully imported.
+    """
+
+    global _PIL_Image
+    if _PIL_Image is False:
+        try:
+            # noinspection PyPackageRequirements
+            from PIL import Image, ImageFile
+            Image.MAX_IMAGE_PIXELS = None  # get rid of decompression bomb checking
+            ImageFile.LOAD_TRUNCATED_IMAGES = True
+            _PIL_Image = Image
+        except ImportError:
+            _PIL_Image = None
+    return _PIL_Image
+
+
 _unhandled_version_text = 'Unhandled NITF version `{}`'
 
 
@@ -143,8 +161,8 @@ def find_jpeg_delimiters(the_bytes: bytes) -> List[Tuple[int, int]]:
         end_block = the_bytes.find(end_pattern, next_location)
         if end_block == -1:
             raise ValueError('The new jpeg block {} does not contain the jpeg end delimiter'.format(len(out)))
+        out.append((next_location, end_block + 2))
         next_location = end_block + 2
-        out.append((0, next_location))
     return out
 
 
@@ -1408,7 +1426,7 @@ class NITFReader(BaseReader):
             out = False
 
         if img_header.is_compressed:
-            if PIL_Image is None:
+            if _get_pil_image() is None:
                 logger.error(
                     'Image segment at index {} has IC value {},\n\t'
                     'and PIL cannot be imported.\n\t'
@@ -1597,7 +1615,7 @@ class NITFReader(BaseReader):
             raise ValueError(
                 'Requires IMODE = `B` and IC = `C8`, got `{}` and `{}` at image segment index {}'.format(
                     image_header.IMODE, image_header.IC, image_segment_index))
-        if PIL_Image is None:
+        if _get_pil_image() is None:
             raise ValueError('Image segment {} is compressed, which requires PIL'.format(image_segment_index))
 
         # get bytes offset to this image segment (relative to start of file)
@@ -1617,7 +1635,7 @@ class NITFReader(BaseReader):
             path_name, dtype=raw_dtype, mode='w+', offset=0,
             shape=_get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2))
         # noinspection PyUnresolvedReferences
-        img = PIL_Image.open(BytesIO(the_bytes))
+        img = _get_pil_image().open(BytesIO(the_bytes))
         data = numpy.asarray(img)
         mem_map[:] = data[:image_header.NROWS, :image_header.NCOLS]
         mem_map.flush()  # write all the data to the file
@@ -1655,7 +1673,7 @@ class NITFReader(BaseReader):
             raise ValueError(
                 'Requires IMODE = `B` and IC = `M8`, got `{}` and `{}` at image segment index {}'.format(
                     image_header.IMODE, image_header.IC, image_segment_index))
-        if PIL_Image is None:
+        if _get_pil_image() is None:
             raise ValueError('Image segment {} is compressed, which requires PIL'.format(image_segment_index))
 
         # get mask definition details
@@ -1695,7 +1713,7 @@ class NITFReader(BaseReader):
             start_bytes = mask_offset  # TODO: verify that we don't need to account for mask definition length
             end_bytes = len(the_bytes) if mask_index == len(mask_offsets)-1 else mask_offsets[mask_index + 1]
             # noinspection PyUnresolvedReferences
-            img = PIL_Image.open(BytesIO(the_bytes[start_bytes:end_bytes]))
+            img = _get_pil_image().open(BytesIO(the_bytes[start_bytes:end_bytes]))
             # handle block padding situation
             row_start, row_end = block_bound[0], min(block_bound[1], image_header.NROWS)
             col_start, col_end = block_bound[2], min(block_bound[3], image_header.NCOLS)
@@ -1740,7 +1758,7 @@ class NITFReader(BaseReader):
                 'Requires IMODE in `(B, P)` and IC in `(C3, C5, M3, M5)`,\n\t'
                 'got `{}` and `{}` at image segment index {}'.format(
                     image_header.IMODE, image_header.IC, image_segment_index))
-        if PIL_Image is None:
+        if _get_pil_image() is None:
             raise ValueError('Image segment {} is compressed, which requires PIL'.format(image_segment_index))
 
         # get bytes offset to this image segment (relative to start of file)
@@ -1778,7 +1796,7 @@ class NITFReader(BaseReader):
                     'than populated blocks ({}) in masked image segment {}'.format(
                         len(jpeg_delimiters), len(anticipated_jpeg_indices), image_segment_index))
             for jpeg_delim, mask_index in zip(jpeg_delimiters, anticipated_jpeg_indices):
-                if anticipated_jpeg_indices[mask_index] != jpeg_delim[0]:
+                if mask_offsets[mask_index] != jpeg_delim[0]:
                     raise ValueError(
                         'Populated mask offsets ({})\n\t'
                         'do not agree with discovered jpeg offsets ({})\n\t'
@@ -1807,7 +1825,7 @@ class NITFReader(BaseReader):
             jpeg_delim = jpeg_delimiters[next_jpeg_block]
             # noinspection PyUnresolvedReferences
             the_image_bytes = the_bytes[jpeg_delim[0]:jpeg_delim[1]]
-            img = PIL_Image.open(BytesIO(the_image_bytes))
+            img = _get_pil_image().open(BytesIO(the_image_bytes))
             # handle block padding situation
             row_start, row_end = block_bound[0], min(block_bound[1], image_header.NROWS)
             col_start, col_end = block_bound[2], min(block_bound[3], image_header.NCOLS)
@@ -2007,7 +2025,7 @@ class NITFReader(BaseReader):
                 'Requires IMODE = `S` and IC in `(C3, C5, M3, M5)`,\n\t'
                 'got `{}` and `{}` at image segment index {}'.format(
                     image_header.IMODE, image_header.IC, image_segment_index))
-        if PIL_Image is None:
+        if _get_pil_image() is None:
             raise ValueError('Image segment {} is compressed, which requires PIL'.format(image_segment_index))
 
         # get bytes offset to this image segment (relative to start of file)
@@ -2077,7 +2095,7 @@ class NITFReader(BaseReader):
                     continue  # just skip it, it's masked out
                 jpeg_delim = jpeg_delimiters[next_jpeg_block]
                 # noinspection PyUnresolvedReferences
-                img = PIL_Image.open(BytesIO(the_bytes[jpeg_delim[0]:jpeg_delim[1]]))
+                img = _get_pil_image().open(BytesIO(the_bytes[jpeg_delim[0]:jpeg_delim[1]]))
                 # handle block padding situation
                 row_start, row_end = block_bound[0], min(block_bound[1], image_header.NROWS)
                 col_start, col_end = block_bound[2], min(block_bound[3], image_header.NCOLS)
@@ -2237,7 +2255,7 @@ class NITFReader(BaseReader):
             return self._handle_jpeg(image_segment_index, apply_format)
         elif image_header.IC == 'C8':
             return self._handle_jpeg2k_no_mask(image_segment_index, apply_format)
-        elif image_header.IC == 'C8':
+        elif image_header.IC == 'M8':
             return self._handle_jpeg2k_with_mask(image_segment_index, apply_format)
         else:
             raise ValueError('Got unhandled IC `{}`'.format(image_header.IC))
@@ -2541,6 +2559,66 @@ def _flatten_bytes(value: Union[bytes, Sequence]) -> bytes:
         raise TypeError('input must be a bytes object, or a sequence with bytes objects as leaves')
 
 
+def _encode_jpeg(data: numpy.ndarray, quality: int) -> bytes:
+    """
+    Encode a single block as a baseline jpeg codestream, for `IC` of `C3` or `M3`.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Of dtype uint8, and shape `(rows, columns)` or `(rows, columns, 3)`.
+    quality : int
+
+    Returns
+    -------
+    bytes
+    """
+
+    out = BytesIO()
+    _get_pil_image().fromarray(numpy.ascontiguousarray(data)).save(out, format='JPEG', quality=quality)
+    return out.getvalue()
+
+
+def _encode_jpeg2000(
+        data: numpy.ndarray,
+        ratio: Optional[float],
+        tile_size: Optional[Tuple[int, int]]) -> bytes:
+    """
+    Encode an image as a jpeg 2000 codestream, for `IC` of `C8`.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Of dtype uint8 or uint16, and shape `(rows, columns)`, or of dtype
+        uint8 and shape `(rows, columns, 3)`.
+    ratio : None|float
+        The compression ratio. If `None`, the reversible (lossless) transform
+        is used.
+    tile_size : None|Tuple[int, int]
+        The `(columns, rows)` tile size.
+
+    Returns
+    -------
+    bytes
+    """
+
+    data = numpy.ascontiguousarray(data)
+    if data.dtype.name == 'uint16':
+        image = _get_pil_image().frombuffer('I;16', (data.shape[1], data.shape[0]), data.astype('<u2'), 'raw', 'I;16', 0, 1)
+    else:
+        image = _get_pil_image().fromarray(data)
+    kwargs = {'no_jp2': True, 'tile_size': tile_size}
+    if ratio is None:
+        kwargs['irreversible'] = False
+    else:
+        kwargs['irreversible'] = True
+        kwargs['quality_mode'] = 'rates'
+        kwargs['quality_layers'] = [float(ratio)]
+    out = BytesIO()
+    image.save(out, format='JPEG2000', **kwargs)
+    return out.getvalue()
+
+
 class SubheaderManager(object):
     """
     Simple manager object for a NITF subheader, and it's associated information
@@ -2810,6 +2888,9 @@ class ImageSubheaderManager(SubheaderManager):
         if self.subheader_written:
             return
 
+        if self.subheader.is_compressed and self.item_bytes is None:
+            return  # the compression rate and mask are populated along with the compressed bytes
+
         SubheaderManager.write_subheader(self, file_object)
         if self.subheader.mask_subheader is not None:
             file_object.write(self.subheader.mask_subheader.to_bytes())
@@ -3509,19 +3590,41 @@ class NITFWritingDetails(object):
 
 
 #############
-# An array based (for only uncompressed images) nitf 2.1 writer
+# An array based nitf 2.1 writer
 
 class NITFWriter(BaseWriter):
+    """
+    An array based NITF 2.1 writer.
+
+    Image segments with `IC` of `NC` or `NM` are written directly. Image segments
+    with `IC` of `C3` or `M3` (blocked jpeg) or `C8` (jpeg 2000) require PIL,
+    and force in-memory writing. Such an image segment is accumulated in memory,
+    and encoded once it has been fully written (or on a forced flush). The blocks,
+    and distinct image segments, are encoded concurrently in worker threads, and
+    written in order. For `M3`, any block which consists entirely of zeros, or
+    which is excluded in a provided mask subheader, is omitted and recorded in
+    the block mask.
+    """
+
     __slots__ = (
         '_file_object', '_file_name', '_in_memory',
-        '_nitf_writing_details', '_image_segment_data_segments', '_close_after')
+        '_nitf_writing_details', '_image_segment_data_segments', '_close_after',
+        '_max_workers', '_jpeg_quality', '_jpeg2000_ratio')
+
+    supported_compressions = ('NC', 'NM', 'C3', 'M3', 'C8')
+    """
+    The supported IC values for writing.
+    """
 
     def __init__(
             self,
             file_object: Union[str, BinaryIO],
             writing_details: NITFWritingDetails,
             check_existence: bool = True,
-            in_memory: bool = None):
+            in_memory: bool = None,
+            max_workers: Optional[int] = None,
+            jpeg_quality: int = 90,
+            jpeg2000_ratio: Optional[float] = None):
         """
 
         Parameters
@@ -3531,7 +3634,16 @@ class NITFWriter(BaseWriter):
         check_existence : bool
             Should we check if the given file already exists?
         in_memory : bool
-            If True force in-memory writing, if False force file writing.
+            If True force in-memory writing, if False force file writing. Compressed
+            image segments require in-memory writing.
+        max_workers : None|int
+            The maximum number of worker threads for encoding compressed image
+            segments. The default is determined by :class:`ThreadPoolExecutor`.
+        jpeg_quality : int
+            The jpeg quality, in the range `[1, 95]`, for `IC` of `C3` or `M3`.
+        jpeg2000_ratio : None|float
+            The jpeg 2000 compression ratio for `IC` of `C8`. If `None`, the
+            compression is lossless.
 
         Raises
         ------
@@ -3543,6 +3655,21 @@ class NITFWriter(BaseWriter):
         self._image_segment_data_segments = []  # type: List[DataSegment]
         self._close_after = False
 
+        if max_workers is not None:
+            max_workers = int(max_workers)
+            if max_workers < 1:
+                raise ValueError('max_workers must be a positive integer, got {}'.format(max_workers))
+        self._max_workers = max_workers
+        jpeg_quality = int(jpeg_quality)
+        if not (1 <= jpeg_quality <= 95):
+            raise ValueError('jpeg_quality must be in the range [1, 95], got {}'.format(jpeg_quality))
+        self._jpeg_quality = jpeg_quality
+        if jpeg2000_ratio is not None:
+            jpeg2000_ratio = float(jpeg2000_ratio)
+            if jpeg2000_ratio <= 1:
+                raise ValueError('jpeg2000_ratio must be greater than 1, got {}'.format(jpeg2000_ratio))
+        self._jpeg2000_ratio = jpeg2000_ratio
+
         if isinstance(file_object, str):
             if check_existence and os.path.exists(file_object):
                 raise SarpyIOError(
@@ -3567,9 +3694,13 @@ class NITFWriter(BaseWriter):
 
         self.nitf_writing_details = writing_details
 
-        if not self.nitf_writing_details.verify_images_have_no_compression():
-            raise ValueError(
-                'Some image segments indicate compression in the image managers of the nitf_writing_details')
+        uncompressed = self.nitf_writing_details.verify_images_have_no_compression()
+        if not uncompressed:
+            if in_memory is False:
+                raise ValueError(
+                    'Some image segments indicate compression in the image managers of the nitf_writing_details,\n\t'
+                    'and this requires in-memory writing')
+            self._in_memory = True
 
         # set the image offset
         self.nitf_writing_details.set_first_image_offset()
@@ -3579,7 +3710,8 @@ class NITFWriter(BaseWriter):
 
         data_segments = self.get_data_segments()
 
-        self.nitf_writing_details.set_all_sizes(require=True)  # NB: while no compression supported...
+        # NB: compressed image sizes are determined on encoding
+        self.nitf_writing_details.set_all_sizes(require=uncompressed)
         if not self._in_memory:
             self.nitf_writing_details.write_all_populated_items(self._file_object)
         BaseWriter.__init__(self, data_segments)
@@ -3671,21 +3803,57 @@ class NITFWriter(BaseWriter):
                 'Image segment at index {} has bits per pixel per band {},\n\t'
                 'only 8, 16, 32, 64 are supported.'.format(index, img_header.NBPP))
 
+        if img_header.IC not in self.supported_compressions:
+            raise ValueError(
+                'Image segment at index {} has unsupported IC value {}.'.format(
+                    index, img_header.IC))
+
         if img_header.is_compressed:
-            if PIL_Image is None:
+            if _get_pil_image() is None:
                 raise ValueError(
-                    'Image segment at index {} has unsupported IC value {}.'.format(
+                    'Image segment at index {} has IC value {}, which requires PIL'.format(
                         index, img_header.IC))
+            bands = len(img_header.Bands)
+            if img_header.PVTYPE != 'INT' or bands not in (1, 3):
+                raise ValueError(
+                    'Image segment at index {} has IC value {}, which requires PVTYPE `INT`\n\t'
+                    'and 1 or 3 bands, got `{}` and {}'.format(index, img_header.IC, img_header.PVTYPE, bands))
+            if img_header.IC in ['C3', 'M3']:
+                if img_header.NBPP != 8 or img_header.IMODE not in ['B', 'P']:
+                    raise ValueError(
+                        'Image segment at index {} has IC value {}, which requires NBPP 8\n\t'
+                        'and IMODE in `(B, P)`, got {} and `{}`'.format(
+                            index, img_header.IC, img_header.NBPP, img_header.IMODE))
+                row_block_size = img_header.NROWS if img_header.NPPBV == 0 else img_header.NPPBV
+                column_block_size = img_header.NCOLS if img_header.NPPBH == 0 else img_header.NPPBH
+                if max(row_block_size, column_block_size) > 65500:
+                    raise ValueError(
+                        'Image segment at index {} has IC value {}, and block size {}\n\t'
+                        'exceeding the jpeg limit'.format(
+                            index, img_header.IC, (row_block_size, column_block_size)))
+            else:
+                # noinspection PyPackageRequirements
+                from PIL import features as PIL_features
+                if not PIL_features.check('jpg_2000'):
+                    raise ValueError(
+                        'Image segment at index {} has IC value {},\n\t'
+                        'which requires PIL with OpenJPEG support'.format(index, img_header.IC))
+                if img_header.IMODE != 'B' or img_header.NBPP not in (8, 16) or \
+                        (bands == 3 and img_header.NBPP != 8):
+                    raise ValueError(
+                        'Image segment at index {} has IC value {}, which requires IMODE `B`\n\t'
+                        'and NBPP 8 (or 16 for a single band), got `{}` and {}'.format(
+                            index, img_header.IC, img_header.IMODE, img_header.NBPP))
 
         if img_header.IMODE not in ['B', 'P', 'R']:
             raise ValueError('Got unsupported IMODE `{}`'.format(img_header.IMODE))
 
         if img_header.mask_subheader is None:
-            if img_header.IC != 'NC':
-                raise ValueError('Mask subheader not defined, but IC is not `NC`')
+            if img_header.IC not in ['NC', 'C3', 'C8']:
+                raise ValueError('Mask subheader not defined, but IC is `{}`'.format(img_header.IC))
         else:
-            if img_header.IC != 'NM':
-                raise ValueError('Mask subheader is defined, but IC is not `NM`')
+            if img_header.IC not in ['NM', 'M3']:
+                raise ValueError('Mask subheader is defined, but IC is `{}`'.format(img_header.IC))
 
     def _verify_image_segments(self) -> None:
         for index, entry in enumerate(self.image_managers):
@@ -3694,6 +3862,12 @@ class NITFWriter(BaseWriter):
                     'The item_bytes is populated for image segment {}.\n\t'
                     'This is incompatible with array-type image writing'.format(index))
             subhead = entry.subheader
+            if subhead.IC == 'M3' and subhead.mask_subheader is None:
+                # the block mask records are populated on encoding
+                blocks = subhead.NBPR*subhead.NBPC
+                subhead.mask_subheader = MaskSubheader(
+                    band_depth=1, blocks=blocks, IMDATOFF=10 + 4*blocks,
+                    BMRLNTH=4, TMRLNTH=0, TPXCDLNTH=0, BMR=numpy.zeros((1, blocks), dtype='uint32'))
             self._check_image_segment_for_compliance(index, subhead)
 
     def _construct_block_bounds(self, image_segment_index: int) -> List[Tuple[int, int, int, int]]:
@@ -3962,6 +4136,39 @@ class NITFWriter(BaseWriter):
             transpose_axes=transpose_axes, format_function=format_function,
             close_children=True)
 
+    def _handle_compression(self, image_segment_index: int, apply_format: bool) -> DataSegment:
+        # NB: the image size is determined when the image segment is encoded
+
+        image_header = self.get_image_header(image_segment_index)
+        if image_header.IMODE not in ['B', 'P'] or image_header.IC not in ['C3', 'M3', 'C8']:
+            raise ValueError(
+                'Requires IMODE in `(B, P)` and IC in `(C3, M3, C8)`,\n\t'
+                'got `{}` and `{}` at image segment index {}'.format(
+                    image_header.IMODE, image_header.IC, image_segment_index))
+        if not self._in_memory:
+            raise ValueError(
+                'Image segment {} is compressed, which requires in-memory writing'.format(image_segment_index))
+
+        raw_bands = len(image_header.Bands)
+        raw_dtype, formatted_dtype, formatted_bands, complex_order, lut = self._get_dtypes(image_segment_index)
+        # the compression scheme abstracts away the IMODE, so bands are in the final dimension
+        raw_shape = _get_shape(image_header.NROWS, image_header.NCOLS, raw_bands, band_dimension=2)
+
+        if apply_format:
+            format_function = self.get_format_function(
+                raw_dtype, complex_order, lut, 2,
+                image_segment_index=image_segment_index)
+            formatted_shape = _get_shape(image_header.NROWS, image_header.NCOLS, formatted_bands, band_dimension=2)
+        else:
+            format_function = None
+            formatted_dtype = raw_dtype
+            formatted_shape = raw_shape
+
+        underlying_array = numpy.full(raw_shape, 0, dtype=raw_dtype)
+        return NumpyArraySegment(
+            underlying_array, formatted_dtype, formatted_shape,
+            format_function=format_function, mode='w')
+
     def _create_data_segment_from_imode_b(self, image_segment_index: int, apply_format: bool) -> DataSegment:
         image_header = self.get_image_header(image_segment_index)
         if image_header.IMODE != 'B':
@@ -3970,6 +4177,8 @@ class NITFWriter(BaseWriter):
                     image_header.IMODE, image_segment_index))
         if image_header.IC in ['NC', 'NM']:
             return self._handle_no_compression(image_segment_index, apply_format)
+        elif image_header.IC in ['C3', 'M3', 'C8']:
+            return self._handle_compression(image_segment_index, apply_format)
         else:
             raise ValueError('Got unhandled IC `{}`'.format(image_header.IC))
 
@@ -3982,6 +4191,8 @@ class NITFWriter(BaseWriter):
 
         if image_header.IC in ['NC', 'NM']:
             return self._handle_no_compression(image_segment_index, apply_format)
+        elif image_header.IC in ['C3', 'M3']:
+            return self._handle_compression(image_segment_index, apply_format)
         else:
             raise ValueError('Got unhandled IC `{}`'.format(image_header.IC))
 
@@ -4125,12 +4336,108 @@ class NITFWriter(BaseWriter):
             out.append(self.create_data_segment_for_collection_element(index))
         return out
 
+    def _get_encoding_tasks(self, image_segment_index: int) -> Tuple[list, list]:
+        """
+        Gets the encoding tasks for the given compressed image segment.
+
+        Parameters
+        ----------
+        image_segment_index : int
+
+        Returns
+        -------
+        tasks : list
+            The list of `(function, args)` encoding tasks, in order.
+        block_indices : list
+            The block index for each task, or `None` for the entire image segment.
+        """
+
+        image_header = self.get_image_header(image_segment_index)
+        data = self._image_segment_data_segments[image_segment_index].underlying_array
+
+        if image_header.IC == 'C8':
+            tile_size = None
+            if image_header.NBPR*image_header.NBPC > 1:
+                tile_size = (image_header.NPPBH, image_header.NPPBV)
+            return [(_encode_jpeg2000, (data, self._jpeg2000_ratio, tile_size))], [None]
+
+        excluded = None
+        if image_header.mask_subheader is not None and image_header.mask_subheader.BMR is not None:
+            excluded = numpy.reshape(image_header.mask_subheader.BMR, (-1, )) == 0xFFFFFFFF
+
+        tasks = []
+        block_indices = []
+        for block_index, block_definition in enumerate(self._construct_block_bounds(image_segment_index)):
+            if excluded is not None and excluded[block_index]:
+                continue
+            row_start, row_end = block_definition[0], min(block_definition[1], image_header.NROWS)
+            col_start, col_end = block_definition[2], min(block_definition[3], image_header.NCOLS)
+            block_data = data[row_start:row_end, col_start:col_end]
+            if image_header.IC == 'M3' and not numpy.any(block_data):
+                continue  # omitted, and recorded in the block mask
+            block_shape = (block_definition[1] - block_definition[0], block_definition[3] - block_definition[2])
+            if block_data.shape[:2] != block_shape:
+                # NB: all blocks are the same size, and the pad pixels are zero
+                padded = numpy.zeros(block_shape + block_data.shape[2:], dtype=block_data.dtype)
+                padded[:row_end - row_start, :col_end - col_start] = block_data
+                block_data = padded
+            tasks.append((_encode_jpeg, (block_data, self._jpeg_quality)))
+            block_indices.append(block_index)
+        return tasks, block_indices
+
+    def _encode_image_segments(self, image_segment_indices: Sequence[int]) -> None:
+        """
+        Encode the given compressed image segments, and populate the image
+        manager item bytes, compression rate, and any block mask. The encoding
+        of all blocks is performed concurrently.
+
+        Parameters
+        ----------
+        image_segment_indices : Sequence[int]
+        """
+
+        all_tasks = []
+        all_block_indices = []
+        for index in image_segment_indices:
+            tasks, block_indices = self._get_encoding_tasks(index)
+            all_tasks.append(tasks)
+            all_block_indices.append(block_indices)
+
+        flat_tasks = [task for tasks in all_tasks for task in tasks]
+        if len(flat_tasks) < 2 or self._max_workers == 1:
+            encoded = [function(*args) for function, args in flat_tasks]
+        else:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                encoded = list(executor.map(lambda task: task[0](*task[1]), flat_tasks))
+
+        position = 0
+        for index, tasks, block_indices in zip(image_segment_indices, all_tasks, all_block_indices):
+            the_bytes = encoded[position:position + len(tasks)]
+            position += len(tasks)
+
+            image_header = self.get_image_header(index)
+            if image_header.IC == 'M3':
+                offsets = numpy.full((image_header.NBPR*image_header.NBPC, ), 0xFFFFFFFF, dtype='uint32')
+                offsets[block_indices] = numpy.cumsum([0, ] + [len(entry) for entry in the_bytes[:-1]])
+                image_header.mask_subheader.BMR = numpy.reshape(offsets, (1, -1))
+            if image_header.COMRAT is None or image_header.COMRAT.strip() == '':
+                if image_header.IC == 'C8':
+                    # bits per pixel per band, in tenths
+                    rate = sum(len(entry) for entry in the_bytes)*8*10/(
+                        image_header.NROWS*image_header.NCOLS*len(image_header.Bands))
+                    image_header.COMRAT = '{0:s}{1:03d}'.format(
+                        'N' if self._jpeg2000_ratio is None else 'V', min(999, int(round(rate))))
+                else:
+                    image_header.COMRAT = '00.0'  # the quantization tables are embedded
+            self.image_managers[index].item_bytes = the_bytes
+
     def flush(self, force: bool = False) -> None:
         self._validate_closed()
         BaseWriter.flush(self, force=force)
         try:
             if self._in_memory:
                 if self._image_segment_data_segments is not None:
+                    to_encode = []
                     for index, entry in enumerate(self._image_segment_data_segments):
                         manager = self.nitf_writing_details.image_managers[index]
                         if manager.item_written:
@@ -4138,10 +4445,16 @@ class NITFWriter(BaseWriter):
                         if manager.item_bytes is not None:
                             continue
                         if force or entry.check_fully_written(warn=force):
-                            manager.item_bytes = entry.get_raw_bytes(warn=False)
+                            if manager.subheader.is_compressed:
+                                to_encode.append(index)
+                            else:
+                                manager.item_bytes = entry.get_raw_bytes(warn=False)
+                    if len(to_encode) > 0:
+                        self._encode_image_segments(to_encode)
 
             check = self.nitf_writing_details.verify_all_offsets(require=False)
             if check:
+                self.nitf_writing_details.set_all_sizes(require=True)
                 self.nitf_writing_details.write_header(self._file_object, overwrite=True)
             self.nitf_writing_details.write_all_populated_items(self._file_object)
         except AttributeError:
@@ -1107,17 +1107,10 @@ class TREList(NITFElement):
             tres = []
             loc = start
             while loc < len(value):
-                anticipated_length = int(value[loc+6:loc+11]) + 11
-                tre = TRE.from_bytes(value, loc)
-                parsed_length = tre.get_bytes_length()
-                if parsed_length != anticipated_length:
-                    logger.error(
-                        'The given length for TRE {} instance is {}, but the constructed length is {}. '
-                        'This is the result of a malformed TRE object definition. '
-                        'If possible, this should be reported to the sarpy team for review/repair.'.format(
-                            tre.TAG, anticipated_length, parsed_length))
-                loc += anticipated_length
-                tres.append(tre)
+                # the TRE extent is given by its length field, and a malformed
+                # TREExtension body is reported when it is (lazily) parsed
+                tres.append(TRE.from_bytes(value, loc))
+                loc += int(value[loc+6:loc+11]) + 11
             fields['tres'] = tres
             return len(value)
         return super(TREList, cls)._parse_attribute(fields, attribute, value, start)
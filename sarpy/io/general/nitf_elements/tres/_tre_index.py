@@ -0,0 +1,119 @@
+"""
+Static index of the TRE id to the module which defines it, for the TRE
+definitions provided in this package.
+
+This is generated by :func:`sarpy.io.general.nitf_elements.tres.registration.build_tre_index`,
+and should be regenerated whenever a TRE definition is added or moved.
+"""
+
+__classification__ = "UNCLASSIFIED"
+
+TRE_MODULE_INDEX = {
+    'ACCHZB': 'sarpy.io.general.nitf_elements.tres.unclass.ACCHZB',
+    'ACCPOB': 'sarpy.io.general.nitf_elements.tres.unclass.ACCPOB',
+    'ACCVTB': 'sarpy.io.general.nitf_elements.tres.unclass.ACCVTB',
+    'ACFTA': 'sarpy.io.general.nitf_elements.tres.unclass.ACFTA',
+    'ACFTA_132': 'sarpy.io.general.nitf_elements.tres.unclass.ACFTA',
+    'ACFTA_154': 'sarpy.io.general.nitf_elements.tres.unclass.ACFTA',
+    'ACFTA_199': 'sarpy.io.general.nitf_elements.tres.unclass.ACFTA',
+    'ACFTB': 'sarpy.io.general.nitf_elements.tres.unclass.ACFTB',
+    'AIMIDA': 'sarpy.io.general.nitf_elements.tres.unclass.AIMIDA',
+    'AIMIDA_69': 'sarpy.io.general.nitf_elements.tres.unclass.AIMIDA',
+    'AIMIDA_73': 'sarpy.io.general.nitf_elements.tres.unclass.AIMIDA',
+    'AIMIDA_89': 'sarpy.io.general.nitf_elements.tres.unclass.AIMIDA',
+    'AIMIDB': 'sarpy.io.general.nitf_elements.tres.unclass.AIMIDB',
+    'AIPBCA': 'sarpy.io.general.nitf_elements.tres.unclass.AIPBCA',
+    'ASTORA': 'sarpy.io.general.nitf_elements.tres.unclass.ASTORA',
+    'BANDSA': 'sarpy.io.general.nitf_elements.tres.unclass.BANDSA',
+    'BANDSB': 'sarpy.io.general.nitf_elements.tres.unclass.BANDSB',
+    'BCKGDA': 'sarpy.io.general.nitf_elements.tres.unclass.BCKGDA',
+    'BLOCKA': 'sarpy.io.general.nitf_elements.tres.unclass.BLOCKA',
+    'BNDPLB': 'sarpy.io.general.nitf_elements.tres.unclass.BNDPLB',
+    'CCINFA': 'sarpy.io.general.nitf_elements.tres.unclass.CCINFA',
+    'CLCTNA': 'sarpy.io.general.nitf_elements.tres.unclass.CLCTNA',
+    'CLCTNB': 'sarpy.io.general.nitf_elements.tres.unclass.CLCTNB',
+    'CMETAA': 'sarpy.io.general.nitf_elements.tres.unclass.CMETAA',
+    'CSCCGA': 'sarpy.io.general.nitf_elements.tres.unclass.CSCCGA',
+    'CSCRNA': 'sarpy.io.general.nitf_elements.tres.unclass.CSCRNA',
+    'CSDIDA': 'sarpy.io.general.nitf_elements.tres.unclass.CSDIDA',
+    'CSEPHA': 'sarpy.io.general.nitf_elements.tres.unclass.CSEPHA',
+    'CSEXRA': 'sarpy.io.general.nitf_elements.tres.unclass.CSEXRA',
+    'CSPROA': 'sarpy.io.general.nitf_elements.tres.unclass.CSPROA',
+    'CSSFAA': 'sarpy.io.general.nitf_elements.tres.unclass.CSSFAA',
+    'CSSHPA': 'sarpy.io.general.nitf_elements.tres.unclass.CSSHPA',
+    'ENGRDA': 'sarpy.io.general.nitf_elements.tres.unclass.ENGRDA',
+    'EXOPTA': 'sarpy.io.general.nitf_elements.tres.unclass.EXOPTA',
+    'EXPLTA': 'sarpy.io.general.nitf_elements.tres.unclass.EXPLTA',
+    'EXPLTA_101': 'sarpy.io.general.nitf_elements.tres.unclass.EXPLTA',
+    'EXPLTA_87': 'sarpy.io.general.nitf_elements.tres.unclass.EXPLTA',
+    'EXPLTB': 'sarpy.io.general.nitf_elements.tres.unclass.EXPLTB',
+    'GEOLOB': 'sarpy.io.general.nitf_elements.tres.unclass.GEOLOB',
+    'GEOPSB': 'sarpy.io.general.nitf_elements.tres.unclass.GEOPSB',
+    'GRDPSB': 'sarpy.io.general.nitf_elements.tres.unclass.GRDPSB',
+    'HISTOA': 'sarpy.io.general.nitf_elements.tres.unclass.HISTOA',
+    'ICHIPB': 'sarpy.io.general.nitf_elements.tres.unclass.ICHIPB',
+    'IMASDA': 'sarpy.io.general.nitf_elements.tres.unclass.IMASDA',
+    'IMGDTA': 'sarpy.io.general.nitf_elements.tres.unclass.IMGDTA',
+    'IMRFCA': 'sarpy.io.general.nitf_elements.tres.unclass.IMRFCA',
+    'IOMAPA': 'sarpy.io.general.nitf_elements.tres.unclass.IOMAPA',
+    'IOMAPA_16': 'sarpy.io.general.nitf_elements.tres.unclass.IOMAPA',
+    'IOMAPA_6': 'sarpy.io.general.nitf_elements.tres.unclass.IOMAPA',
+    'IOMAPA_8202': 'sarpy.io.general.nitf_elements.tres.unclass.IOMAPA',
+    'IOMAPA_91': 'sarpy.io.general.nitf_elements.tres.unclass.IOMAPA',
+    'J2KLRA': 'sarpy.io.general.nitf_elements.tres.unclass.J2KLRA',
+    'MAPLOB': 'sarpy.io.general.nitf_elements.tres.unclass.MAPLOB',
+    'MATESA': 'sarpy.io.general.nitf_elements.tres.unclass.MATESA',
+    'MENSRA': 'sarpy.io.general.nitf_elements.tres.unclass.MENSRA',
+    'MENSRA_155': 'sarpy.io.general.nitf_elements.tres.unclass.MENSRA',
+    'MENSRA_174': 'sarpy.io.general.nitf_elements.tres.unclass.MENSRA',
+    'MENSRA_185': 'sarpy.io.general.nitf_elements.tres.unclass.MENSRA',
+    'MENSRB': 'sarpy.io.general.nitf_elements.tres.unclass.MENSRB',
+    'MPDSRA': 'sarpy.io.general.nitf_elements.tres.unclass.MPDSRA',
+    'MSTGTA': 'sarpy.io.general.nitf_elements.tres.unclass.MSTGTA',
+    'MTIRPA': 'sarpy.io.general.nitf_elements.tres.unclass.MTIRPA',
+    'MTIRPB': 'sarpy.io.general.nitf_elements.tres.unclass.MTIRPB',
+    'NBLOCA': 'sarpy.io.general.nitf_elements.tres.unclass.NBLOCA',
+    'OBJCTA': 'sarpy.io.general.nitf_elements.tres.unclass.OBJCTA',
+    'OFFSET': 'sarpy.io.general.nitf_elements.tres.unclass.OFFSET',
+    'PATCHA': 'sarpy.io.general.nitf_elements.tres.unclass.PATCHA',
+    'PATCHA_115': 'sarpy.io.general.nitf_elements.tres.unclass.PATCHA',
+    'PATCHA_74': 'sarpy.io.general.nitf_elements.tres.unclass.PATCHA',
+    'PATCHB': 'sarpy.io.general.nitf_elements.tres.unclass.PATCHB',
+    'PIAEQA': 'sarpy.io.general.nitf_elements.tres.unclass.PIAEQA',
+    'PIAEVA': 'sarpy.io.general.nitf_elements.tres.unclass.PIAEVA',
+    'PIAIMB': 'sarpy.io.general.nitf_elements.tres.unclass.PIAIMB',
+    'PIAIMC': 'sarpy.io.general.nitf_elements.tres.unclass.PIAIMC',
+    'PIAPEA': 'sarpy.io.general.nitf_elements.tres.unclass.PIAPEA',
+    'PIAPEB': 'sarpy.io.general.nitf_elements.tres.unclass.PIAPEB',
+    'PIAPRC': 'sarpy.io.general.nitf_elements.tres.unclass.PIAPRC',
+    'PIAPRD': 'sarpy.io.general.nitf_elements.tres.unclass.PIAPRD',
+    'PIATGA': 'sarpy.io.general.nitf_elements.tres.unclass.PIATGA',
+    'PIATGB': 'sarpy.io.general.nitf_elements.tres.unclass.PIATGB',
+    'PIXQLA': 'sarpy.io.general.nitf_elements.tres.unclass.PIXQLA',
+    'PLTFMA': 'sarpy.io.general.nitf_elements.tres.unclass.PLTFMA',
+    'PRJPSB': 'sarpy.io.general.nitf_elements.tres.unclass.PRJPSB',
+    'REGPTB': 'sarpy.io.general.nitf_elements.tres.unclass.REGPTB',
+    'RPC00A': 'sarpy.io.general.nitf_elements.tres.unclass.RPC00A',
+    'RPC00B': 'sarpy.io.general.nitf_elements.tres.unclass.RPC00B',
+    'RPFDES': 'sarpy.io.general.nitf_elements.tres.unclass.RPFDES',
+    'RPFHDR': 'sarpy.io.general.nitf_elements.tres.unclass.RPFHDR',
+    'RPFIMG': 'sarpy.io.general.nitf_elements.tres.unclass.RPFIMG',
+    'RSMAPA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMAPA',
+    'RSMDCA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMDCA',
+    'RSMECA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMECA',
+    'RSMGGA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMGGA',
+    'RSMGIA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMGIA',
+    'RSMIDA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMIDA',
+    'RSMPCA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMPCA',
+    'RSMPIA': 'sarpy.io.general.nitf_elements.tres.unclass.RSMPIA',
+    'SECTGA': 'sarpy.io.general.nitf_elements.tres.unclass.SECTGA',
+    'SENSRA': 'sarpy.io.general.nitf_elements.tres.unclass.SENSRA',
+    'SENSRB': 'sarpy.io.general.nitf_elements.tres.unclass.SENSRB',
+    'SNSPSB': 'sarpy.io.general.nitf_elements.tres.unclass.SNSPSB',
+    'SNSRA': 'sarpy.io.general.nitf_elements.tres.unclass.SNSRA',
+    'SOURCB': 'sarpy.io.general.nitf_elements.tres.unclass.SOURCB',
+    'STDIDC': 'sarpy.io.general.nitf_elements.tres.unclass.STDIDC',
+    'STREOB': 'sarpy.io.general.nitf_elements.tres.unclass.STREOB',
+    'TRGTA': 'sarpy.io.general.nitf_elements.tres.unclass.TRGTA',
+    'USE00A': 'sarpy.io.general.nitf_elements.tres.unclass.USE00A',
+}
@@ -1,5 +1,10 @@
 """
-Module for maintaining the TRE registry
+Module for maintaining the TRE registry.
+
+The TRE definitions shipped with sarpy are located using the static index in
+:mod:`sarpy.io.general.nitf_elements.tres._tre_index`, so that only the modules
+for the TREs actually encountered get imported. That index should be
+regenerated using :func:`build_tre_index` whenever a TRE definition is added.
 """
 
 __classification__ = "UNCLASSIFIED"
@@ -13,6 +18,7 @@ import inspect
 
 import sarpy._extensions
 from sarpy.compliance import bytes_to_string
+from sarpy.io.general.nitf_elements.tres._tre_index import TRE_MODULE_INDEX
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,7 @@ logger = logging.getLogger(__name__)
 # module variables
 _TRE_Registry = {}
 _parsed_package = False
+_loaded_plugins = False
 _default_tre_packages = 'sarpy.io.general.nitf_elements.tres'
 
 
@@ -67,10 +74,55 @@ def register_tre(tre_type, tre_id=None, replace=False):
     _TRE_Registry[tre_id] = tre_type
 
 
+def _evaluate_module(the_module):
+    """
+    Register all the TREExtension subclasses found in the given module.
+
+    Parameters
+    ----------
+    the_module
+    """
+
+    from sarpy.io.general.nitf_elements.tres.tre_elements import TREExtension
+
+    for element_name, element_type in inspect.getmembers(the_module, inspect.isclass):
+        if issubclass(element_type, TREExtension) and element_type != TREExtension \
+                and _TRE_Registry.get(element_name, None) is not element_type:
+            register_tre(element_type, tre_id=element_name, replace=False)
+
+
+def _import_indexed_tre(tre_id):
+    """
+    Import and register the module providing the given TRE, according to
+    the static index of default TRE definitions.
+
+    Parameters
+    ----------
+    tre_id : str
+
+    Returns
+    -------
+    bool
+        Is the TRE in the index?
+    """
+
+    if tre_id in _TRE_Registry:
+        return True
+    module_name = TRE_MODULE_INDEX.get(tre_id, None)
+    if module_name is None:
+        return False
+    _evaluate_module(import_module(module_name))
+    return True
+
+
 def find_tre(tre_id):
     """
     Try to find a TRE with given id in our registry. Return `None` if not found.
 
+    Only the module defining the given TRE is imported, on first request. The
+    plug-in TREs are only loaded when a TRE id is not among the default
+    definitions.
+
     Parameters
     ----------
     tre_id : str|bytes
@@ -80,15 +132,58 @@ def find_tre(tre_id):
     sarpy.io.general.nitf_elements.base.TRE|None
     """
 
-    if not _parsed_package:
-        parse_package()
-        load_plugin_tres()
-
     if isinstance(tre_id, bytes):
         tre_id = bytes_to_string(tre_id)
     if not isinstance(tre_id, str):
         raise TypeError('tre_id must be of type string. Got {}'.format(tre_id))
-    return _TRE_Registry.get(tre_id.strip(), None)
+    tre_id = tre_id.strip()
+
+    the_type = _TRE_Registry.get(tre_id, None)
+    if the_type is not None:
+        return the_type
+
+    if _import_indexed_tre(tre_id):
+        the_type = _TRE_Registry.get(tre_id, None)
+    if the_type is None and not _loaded_plugins:
+        load_plugin_tres()
+        the_type = _TRE_Registry.get(tre_id, None)
+    return the_type
+
+
+def build_tre_index(packages=None):
+    """
+    Walk the packages contained in `packages`, and construct the map of TRE id
+    to the name of the module in which it is defined. This is used to generate
+    the static index in :mod:`sarpy.io.general.nitf_elements.tres._tre_index`.
+
+    Parameters
+    ----------
+    packages : None|str|List[str]
+        Defaults to the sarpy TRE package.
+
+    Returns
+    -------
+    Dict[str, str]
+    """
+
+    from sarpy.io.general.nitf_elements.tres.tre_elements import TREExtension
+
+    if packages is None:
+        packages = _default_tre_packages
+    if isinstance(packages, str):
+        packages = [packages, ]
+
+    the_index = {}
+    for start_package in packages:
+        module = import_module(start_package)
+        for details in pkgutil.walk_packages(module.__path__, start_package + '.'):
+            _, module_name, is_pkg = details
+            sub_module = import_module(module_name)
+            for element_name, element_type in inspect.getmembers(sub_module, inspect.isclass):
+                if issubclass(element_type, TREExtension) and element_type != TREExtension \
+                        and element_name not in the_index:
+                    the_index[element_name] = element_type.__module__
+    return dict(sorted(the_index.items()))
 
 
 def parse_package(packages=None):
@@ -100,13 +195,6 @@ def parse_package(packages=None):
     None
     """
 
-    def evaluate(the_module):
-        for element_name, element_type in inspect.getmembers(the_module, inspect.isclass):
-            if issubclass(element_type, TREExtension) and element_type != TREExtension:
-                register_tre(element_type, tre_id=element_name, replace=False)
-
-    from sarpy.io.general.nitf_elements.tres.tre_elements import TREExtension
-
     if packages is None:
         global _parsed_package
         if _parsed_package:
@@ -123,19 +211,25 @@ def parse_package(packages=None):
 
     for start_package in packages:
         module = import_module(start_package)
-        evaluate(module)
+        _evaluate_module(module)
         for details in pkgutil.walk_packages(module.__path__, start_package + '.'):
             _, module_name, is_pkg = details
             sub_module = import_module(module_name)
-            evaluate(sub_module)
+            _evaluate_module(sub_module)
 
     logger.info('We now have {} registered TREs'.format(len(_TRE_Registry)))
 
 
 def load_plugin_tres():
     """Load TREs provided by plug-ins"""
+
+    global _loaded_plugins
+    _loaded_plugins = True
+
     logger.info('Loading plug-in TREs')
     for entry in sarpy._extensions.entry_points(group='sarpy.io.general.nitf_elements.tre_extension'):
+        # the default definition takes precedence, so ensure it is registered first
+        _import_indexed_tre(entry.name)
         tre_class = entry.load()
         logger.info("Loading TRE: {entry.name} from {entry.module}")
         register_tre(tre_class, tre_id=entry.name, replace=False)
@@ -283,9 +283,12 @@ class TRELoop(TREElement):
 class TREExtension(TRE):
     """
     Extend this object to provide concrete TRE implementations.
+
+    When constructed from bytes, the raw bytes are retained and the fields are
+    only parsed on first access of :attr:`DATA`.
     """
 
-    __slots__ = ('_data', )
+    __slots__ = ('_data', '_raw')
     _tag_value = None
     _data_type = None
 
@@ -297,6 +300,7 @@ class TREExtension(TRE):
         if len(self._tag_value) > 6:
             raise ValueError('Tag value must have 6 or fewer characters.')
         self._data = None
+        self._raw = None
         self.DATA = value
 
     @property
@@ -304,7 +308,9 @@ class TREExtension(TRE):
         return self._tag_value
 
     @property
-    def DATA(self):  # type: () -> _data_type
+    def DATA(self):  # type: () -> Union[_data_type, bytes]
+        if self._data is None and self._raw is not None:
+            self._parse_raw()
         return self._data
 
     @DATA.setter
@@ -312,15 +318,50 @@ class TREExtension(TRE):
         # type: (Union[bytes, _data_type]) -> None
         if isinstance(value, self._data_type):
             self._data = value
+            self._raw = None
         elif isinstance(value, bytes):
-            self._data = self._data_type(value)
+            self._data = None
+            self._raw = value
         else:
             raise TypeError(
                 'data must be of {} type or a bytes array. '
                 'Got {}'.format(self._data_type, type(value)))
 
+    @property
+    def is_parsed(self):
+        """
+        bool: Have the fields been parsed from the raw bytes?
+        """
+
+        return self._raw is None
+
+    def _parse_raw(self):
+        """
+        Parse the fields from the retained raw bytes. If parsing fails, the
+        data is left as the raw bytes, as for an unknown TRE.
+        """
+
+        try:
+            data = self._data_type(self._raw)
+        except Exception as e:
+            logger.error(
+                "Returning unparsed tre data, because we failed parsing tre {} as "
+                "type {} with exception\n\t{}".format(self.TAG, self._data_type.__name__, e))
+            self._data = self._raw
+            return
+        if data.get_bytes_length() != len(self._raw):
+            logger.error(
+                'The given length for TRE {} instance is {}, but the constructed length is {}. '
+                'This is the result of a malformed TRE object definition. '
+                'If possible, this should be reported to the sarpy team for review/repair.'.format(
+                    self.TAG, len(self._raw), data.get_bytes_length()))
+        self._data = data
+        self._raw = None
+
     @property
     def EL(self):
+        if self._raw is not None:
+            return len(self._raw)
         if self._data is None:
             return 0
         return self._data.get_bytes_length()
@@ -333,7 +374,8 @@ class TREExtension(TRE):
         return 11 + self.EL
 
     def to_bytes(self):
-        return ('{0:6s}{1:05d}'.format(self.TAG, self.EL)).encode('utf-8') + self._data.to_bytes()
+        body = self._raw if self._raw is not None else self._data.to_bytes()
+        return ('{0:6s}{1:05d}'.format(self.TAG, self.EL)).encode('utf-8') + body
 
     @classmethod
     def from_bytes(cls, value, start):
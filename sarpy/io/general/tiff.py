@@ -1,5 +1,6 @@
 """
-Module providing api consistent with other file types for reading tiff files.
+Module providing api consistent with other file types for reading tiff files,
+and for writing tiled GeoTIFF files.
 """
 
 __classification__ = "UNCLASSIFIED"
@@ -13,10 +14,12 @@ __author__ = ("Thomas McCullough", "Daniel Haverporth")
 
 import logging
 import os
+import struct
+import zlib
 
 import numpy
 import re
-from typing import Union, Tuple, Dict, BinaryIO, Sequence
+from typing import Union, Tuple, Dict, BinaryIO, Sequence, Optional, List
 
 from sarpy.io.general.base import BaseReader, SarpyIOError
 from sarpy.io.general.format_function import ComplexFormatFunction
@@ -544,6 +547,453 @@ class TiffReader(BaseReader):
     def file_name(self):
         return self.tiff_details.file_name
 
+########
+# tiled (cloud optimized) GeoTIFF writing
+
+_TIFF_WRITE_TYPES = {
+    3: ('H', 2),  # SHORT
+    4: ('I', 4),  # LONG
+    12: ('d', 8),  # DOUBLE
+    16: ('Q', 8),  # LONG8
+}
+_SAMPLE_FORMAT_CODES = {'u': 1, 'i': 2, 'f': 3}
+
+
+def _downsample_by_two(data: numpy.ndarray) -> numpy.ndarray:
+    """
+    Downsample the given array by a factor of two along the first two dimensions,
+    by averaging (with rounding, for integer types). An odd edge is replicated.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    pad = [(0, data.shape[0] % 2), (0, data.shape[1] % 2)] + [(0, 0)]*(data.ndim - 2)
+    if any(entry[1] > 0 for entry in pad):
+        data = numpy.pad(data, pad, mode='edge')
+    shape = (data.shape[0]//2, 2, data.shape[1]//2, 2) + data.shape[2:]
+    if data.dtype.kind == 'f':
+        return data.reshape(shape).mean(axis=(1, 3), dtype='float64').astype(data.dtype)
+    total = data.reshape(shape).sum(axis=(1, 3), dtype='int64')
+    return ((total + 2)//4).astype(data.dtype)
+
+
+class _TiffLevel(object):
+    """
+    The tiling state for a single resolution level of a :class:`GeoTiffWriter`.
+    """
+
+    __slots__ = (
+        'index', 'rows', 'cols', 'tile_size', 'tiles_down', 'tiles_across',
+        'offsets', 'byte_counts', 'written', 'pending', 'next_level')
+
+    def __init__(self, index: int, rows: int, cols: int, tile_size: int):
+        self.index = index
+        self.rows = rows
+        self.cols = cols
+        self.tile_size = tile_size
+        self.tiles_down = int(numpy.ceil(rows/tile_size))
+        self.tiles_across = int(numpy.ceil(cols/tile_size))
+        count = self.tiles_down*self.tiles_across
+        self.offsets = numpy.zeros((count, ), dtype='uint64')
+        self.byte_counts = numpy.zeros((count, ), dtype='uint64')
+        self.written = numpy.zeros((count, ), dtype='bool')
+        self.pending = {}  # tile index -> [tile array, pixel count]
+        self.next_level = None  # type: Optional[_TiffLevel]
+
+    def tile_valid_shape(self, tile_index: int) -> Tuple[int, int]:
+        tile_row, tile_col = divmod(tile_index, self.tiles_across)
+        return (
+            min(self.tile_size, self.rows - tile_row*self.tile_size),
+            min(self.tile_size, self.cols - tile_col*self.tile_size))
+
+
+class GeoTiffWriter(object):
+    """
+    Writer for a tiled, and optionally deflate compressed, GeoTIFF file with
+    internal overviews, following the cloud optimized GeoTIFF layout.
+
+    All image file directories are located at the beginning of the file, so a
+    range reader can determine the location of any tile from the leading bytes.
+    Image data may be provided in arbitrary blocks (for example, the output of
+    :class:`sarpy.processing.ortho_rectify.OrthorectificationIterator`), and
+    each tile is encoded and written once it is complete, with the tiles of the
+    overview levels accumulated from the completed tiles of the preceding level.
+    Only the incomplete tiles are held in memory.
+
+    The georeferencing is defined by an affine transform of GDAL convention,
+    and an EPSG code.
+    """
+
+    __slots__ = (
+        '_file_name', '_file_object', '_rows', '_cols', '_bands', '_dtype',
+        '_tile_size', '_compression', '_compression_level', '_bigtiff',
+        '_geo_transform', '_epsg', '_levels', '_data_start', '_position', '_closed')
+
+    def __init__(
+            self,
+            file_name: str,
+            shape: Tuple[int, int],
+            dtype: Union[str, numpy.dtype] = 'uint8',
+            bands: int = 1,
+            tile_size: int = 512,
+            compression: Optional[str] = 'deflate',
+            compression_level: int = 6,
+            overview_levels: Optional[int] = None,
+            geo_transform: Optional[Sequence[float]] = None,
+            epsg: int = 4326,
+            bigtiff: Optional[bool] = None,
+            check_existence: bool = True):
+        """
+
+        Parameters
+        ----------
+        file_name : str
+        shape : Tuple[int, int]
+            The `(rows, columns)` image size.
+        dtype : str|numpy.dtype
+            The pixel data type.
+        bands : int
+            The number of bands, `3` is interpreted as RGB.
+        tile_size : int
+            The tile size in pixels, which must be a multiple of 16.
+        compression : None|str
+            One of `None` or `'deflate'`.
+        compression_level : int
+            The deflate compression level.
+        overview_levels : None|int
+            The number of overview levels, each of half the size of the preceding
+            level. By default, overviews are added until the image fits in a
+            single tile.
+        geo_transform : None|Sequence[float]
+            The affine transform `(x0, dx/dcol, dx/drow, y0, dy/dcol, dy/drow)`
+            from the `(column, row)` coordinates of the upper left corner of a
+            pixel to the model coordinates `(x, y)`, so `(longitude, latitude)`
+            for a geographic coordinate system. If not provided, no GeoTIFF tags
+            are written.
+        epsg : int
+            The EPSG code of the geographic (`4326`) or projected coordinate
+            system of `geo_transform`.
+        bigtiff : None|bool
+            Write a BigTIFF? By default, this is determined from the uncompressed
+            data size.
+        check_existence : bool
+            Should we check if the given file already exists?
+
+        Raises
+        ------
+        SarpyIOError
+            If the given `file_name` already exists
+        """
+
+        self._closed = True
+        if check_existence and os.path.exists(file_name):
+            raise SarpyIOError(
+                'Given file {} already exists, and a new GeoTIFF file cannot be created here.'.format(file_name))
+
+        rows, cols = int(shape[0]), int(shape[1])
+        if rows < 1 or cols < 1:
+            raise ValueError('shape must be positive, got {}'.format(shape))
+        self._rows = rows
+        self._cols = cols
+        self._bands = int(bands)
+        if self._bands < 1:
+            raise ValueError('bands must be positive, got {}'.format(bands))
+        self._dtype = numpy.dtype(dtype).newbyteorder('<')
+        if self._dtype.kind not in _SAMPLE_FORMAT_CODES:
+            raise ValueError('Unsupported dtype {}'.format(dtype))
+        self._tile_size = int(tile_size)
+        if self._tile_size < 16 or self._tile_size % 16 != 0:
+            raise ValueError('tile_size must be a positive multiple of 16, got {}'.format(tile_size))
+        if compression not in (None, 'deflate'):
+            raise ValueError('compression must be one of None or `deflate`, got `{}`'.format(compression))
+        self._compression = compression
+        self._compression_level = int(compression_level)
+        if geo_transform is not None:
+            geo_transform = tuple(float(entry) for entry in geo_transform)
+            if len(geo_transform) != 6:
+                raise ValueError('geo_transform must have 6 elements, got {}'.format(len(geo_transform)))
+        self._geo_transform = geo_transform
+        self._epsg = int(epsg)
+
+        # define the resolution levels
+        self._levels = [_TiffLevel(0, rows, cols, self._tile_size)]
+        while (overview_levels is None and max(rows, cols) > self._tile_size) or \
+                (overview_levels is not None and len(self._levels) <= overview_levels):
+            rows, cols = (rows + 1)//2, (cols + 1)//2
+            level = _TiffLevel(len(self._levels), rows, cols, self._tile_size)
+            self._levels[-1].next_level = level
+            self._levels.append(level)
+            if rows == 1 and cols == 1:
+                break
+
+        if bigtiff is None:
+            tile_bytes = self._tile_size*self._tile_size*self._bands*self._dtype.itemsize
+            total_tiles = sum(level.offsets.size for level in self._levels)
+            bigtiff = total_tiles*(tile_bytes + 1024) + 2**20 >= 2**32
+        self._bigtiff = bool(bigtiff)
+
+        # the directories are placed first, with placeholder offsets of fixed size
+        position = 16 if self._bigtiff else 8
+        for level in self._levels:
+            position += len(self._get_ifd_bytes(level, position, 0))
+        self._data_start = position
+        self._position = position
+
+        self._file_object = open(file_name, 'wb')
+        self._file_name = file_name
+        self._closed = False
+
+    @property
+    def file_name(self) -> str:
+        """
+        str: The file name.
+        """
+
+        return self._file_name
+
+    @property
+    def bigtiff(self) -> bool:
+        """
+        bool: Is this a BigTIFF?
+        """
+
+        return self._bigtiff
+
+    @property
+    def overview_count(self) -> int:
+        """
+        int: The number of overview levels.
+        """
+
+        return len(self._levels) - 1
+
+    def _get_tags(self, level: _TiffLevel) -> List[Tuple[int, int, list]]:
+        """
+        Gets the `(tag, type, values)` entries for the given level.
+        """
+
+        offset_type = 16 if self._bigtiff else 4
+        tags = [
+            (256, 4, [level.cols]),
+            (257, 4, [level.rows]),
+            (258, 3, [self._dtype.itemsize*8]*self._bands),
+            (259, 3, [1 if self._compression is None else 8]),
+            (262, 3, [2 if self._bands == 3 else 1]),
+            (277, 3, [self._bands]),
+            (284, 3, [1]),
+            (322, 3 if self._tile_size < 65536 else 4, [self._tile_size]),
+            (323, 3 if self._tile_size < 65536 else 4, [self._tile_size]),
+            (324, offset_type, level.offsets.tolist()),
+            (325, offset_type, level.byte_counts.tolist()),
+            (339, 3, [_SAMPLE_FORMAT_CODES[self._dtype.kind]]*self._bands),
+        ]
+        if level.index > 0:
+            tags.append((254, 4, [1]))  # reduced resolution version
+        if level.index == 0 and self._geo_transform is not None:
+            x0, x_col, x_row, y0, y_col, y_row = self._geo_transform
+            tags.append(
+                (34264, 12, [x_col, x_row, 0, x0, y_col, y_row, 0, y0, 0, 0, 0, 0, 0, 0, 0, 1]))
+            if self._epsg == 4326:
+                model_type, crs_key = 2, 2048  # geographic, GeographicTypeGeoKey
+            else:
+                model_type, crs_key = 1, 3072  # projected, ProjectedCSTypeGeoKey
+            tags.append(
+                (34735, 3, [1, 1, 0, 3, 1024, 0, 1, model_type, 1025, 0, 1, 1, crs_key, 0, 1, self._epsg]))
+        return sorted(tags, key=lambda entry: entry[0])
+
+    def _get_ifd_bytes(self, level: _TiffLevel, position: int, next_position: int) -> bytes:
+        """
+        Gets the image file directory bytes for the given level, located at the
+        given position, including the values which do not fit in the directory
+        entries, which immediately follow the directory.
+        """
+
+        tags = self._get_tags(level)
+        if self._bigtiff:
+            count_format, entry_format, value_size = '<Q', '<HHQ', 8
+        else:
+            count_format, entry_format, value_size = '<H', '<HHI', 4
+        directory_size = struct.calcsize(count_format) + len(tags)*(struct.calcsize(entry_format) + value_size) + \
+            value_size
+        external_position = position + directory_size
+
+        entries = []
+        external = []
+        for tag, tiff_type, values in tags:
+            code, size = _TIFF_WRITE_TYPES[tiff_type]
+            value_bytes = struct.pack('<{}{}'.format(len(values), code), *values)
+            if len(value_bytes) <= value_size:
+                value_bytes = value_bytes + b'\x00'*(value_size - len(value_bytes))
+            else:
+                if external_position % 2 == 1:
+                    external.append(b'\x00')
+                    external_position += 1
+                external.append(value_bytes)
+                value_bytes = struct.pack('<Q' if self._bigtiff else '<I', external_position)
+                external_position += len(external[-1])
+            entries.append(struct.pack(entry_format, tag, tiff_type, len(values)) + value_bytes)
+        if external_position % 2 == 1:
+            external.append(b'\x00')
+        return struct.pack(count_format, len(tags)) + b''.join(entries) + \
+            struct.pack('<Q' if self._bigtiff else '<I', next_position) + b''.join(external)
+
+    def _write_tile(self, level: _TiffLevel, tile_index: int, tile: numpy.ndarray) -> None:
+        the_bytes = numpy.ascontiguousarray(tile, dtype=self._dtype).tobytes()
+        if self._compression == 'deflate':
+            the_bytes = zlib.compress(the_bytes, self._compression_level)
+        self._file_object.seek(self._position, os.SEEK_SET)
+        self._file_object.write(the_bytes)
+        level.offsets[tile_index] = self._position
+        level.byte_counts[tile_index] = len(the_bytes)
+        level.written[tile_index] = True
+        self._position += len(the_bytes)
+
+        if level.next_level is not None:
+            tile_row, tile_col = divmod(tile_index, level.tiles_across)
+            valid_rows, valid_cols = level.tile_valid_shape(tile_index)
+            self._add_data(
+                level.next_level, _downsample_by_two(tile[:valid_rows, :valid_cols]),
+                tile_row*self._tile_size//2, tile_col*self._tile_size//2)
+
+    def _add_data(self, level: _TiffLevel, data: numpy.ndarray, row_start: int, col_start: int) -> None:
+        row_end = row_start + data.shape[0]
+        col_end = col_start + data.shape[1]
+        tile_shape = (self._tile_size, self._tile_size) + ((self._bands, ) if self._bands > 1 else ())
+        for tile_row in range(row_start//self._tile_size, (row_end - 1)//self._tile_size + 1):
+            tile_row_start = tile_row*self._tile_size
+            r0, r1 = max(row_start, tile_row_start), min(row_end, tile_row_start + self._tile_size)
+            for tile_col in range(col_start//self._tile_size, (col_end - 1)//self._tile_size + 1):
+                tile_col_start = tile_col*self._tile_size
+                c0, c1 = max(col_start, tile_col_start), min(col_end, tile_col_start + self._tile_size)
+                tile_index = tile_row*level.tiles_across + tile_col
+                if level.written[tile_index]:
+                    logger.error(
+                        'Tile {} of level {} has already been written, and the data is ignored'.format(
+                            tile_index, level.index))
+                    continue
+                entry = level.pending.get(tile_index, None)
+                if entry is None:
+                    entry = [numpy.zeros(tile_shape, dtype=self._dtype), 0]
+                    level.pending[tile_index] = entry
+                entry[0][r0 - tile_row_start:r1 - tile_row_start, c0 - tile_col_start:c1 - tile_col_start] = \
+                    data[r0 - row_start:r1 - row_start, c0 - col_start:c1 - col_start]
+                entry[1] += (r1 - r0)*(c1 - c0)
+                valid_rows, valid_cols = level.tile_valid_shape(tile_index)
+                if entry[1] >= valid_rows*valid_cols:
+                    del level.pending[tile_index]
+                    self._write_tile(level, tile_index, entry[0])
+
+    def write_chip(self, data: numpy.ndarray, start_indices: Union[None, int, Tuple[int, int]] = None) -> None:
+        """
+        Write the given block of data.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Of shape `(rows, columns)`, or `(rows, columns, bands)`.
+        start_indices : None|int|Tuple[int, int]
+            The `(row, column)` location of the first pixel of `data`.
+        """
+
+        if self._closed:
+            raise ValueError('The writer is closed')
+        if start_indices is None:
+            start_indices = (0, 0)
+        elif isinstance(start_indices, int):
+            start_indices = (start_indices, 0)
+        row_start, col_start = int(start_indices[0]), int(start_indices[1])
+
+        data = numpy.asarray(data)
+        expected_ndim = 2 if self._bands == 1 else 3
+        if data.ndim != expected_ndim or (self._bands > 1 and data.shape[2] != self._bands):
+            raise ValueError(
+                'data must have shape (rows, columns{}), got {}'.format(
+                    '' if self._bands == 1 else ', {}'.format(self._bands), data.shape))
+        if row_start < 0 or col_start < 0 or row_start + data.shape[0] > self._rows or \
+                col_start + data.shape[1] > self._cols:
+            raise ValueError(
+                'data of shape {} at {} does not fit in the image of shape {}'.format(
+                    data.shape, (row_start, col_start), (self._rows, self._cols)))
+        if data.size == 0:
+            return
+        self._add_data(self._levels[0], data.astype(self._dtype, copy=False), row_start, col_start)
+
+    def __call__(
+            self,
+            data: numpy.ndarray,
+            start_indices: Union[None, int, Tuple[int, int]] = None,
+            index: int = 0) -> None:
+        """
+        Write the given block of data, consistent with the sarpy writer call signature.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+        start_indices : None|int|Tuple[int, int]
+        index : int
+            Must be `0`.
+        """
+
+        if index != 0:
+            raise ValueError('A GeoTIFF contains a single image, got index {}'.format(index))
+        self.write_chip(data, start_indices=start_indices)
+
+    def close(self) -> None:
+        """
+        Write any incomplete tiles, and the image file directories, and close the file.
+        """
+
+        if self._closed:
+            return
+
+        try:
+            for level in self._levels:
+                if level.index == 0 and not numpy.all(level.written):
+                    logger.error(
+                        'GeoTIFF file {} has {} tiles which were not fully written,\n\t'
+                        'and these will be zero filled'.format(self._file_name, numpy.count_nonzero(~level.written)))
+                for tile_index in numpy.nonzero(~level.written)[0]:
+                    entry = level.pending.pop(int(tile_index), None)
+                    tile = numpy.zeros(
+                        (self._tile_size, self._tile_size) + ((self._bands, ) if self._bands > 1 else ()),
+                        dtype=self._dtype) if entry is None else entry[0]
+                    self._write_tile(level, int(tile_index), tile)
+
+            header = b'II' + (struct.pack('<HHHQ', 43, 8, 0, 16) if self._bigtiff else struct.pack('<HI', 42, 8))
+            directories = []
+            position = len(header)
+            for i, level in enumerate(self._levels):
+                ifd_size = len(self._get_ifd_bytes(level, position, 0))
+                next_position = 0 if i == len(self._levels) - 1 else position + ifd_size
+                directories.append(self._get_ifd_bytes(level, position, next_position))
+                position += ifd_size
+            if position != self._data_start:
+                raise ValueError('The image file directory size changed')
+            self._file_object.seek(0, os.SEEK_SET)
+            self._file_object.write(header + b''.join(directories))
+        finally:
+            self._closed = True
+            self._file_object.close()
+
+    def __enter__(self) -> 'GeoTiffWriter':
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        if exception_type is not None:
+            logger.error(
+                'The {} file writer generated an exception during processing'.format(self.__class__.__name__))
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
 ########
 # base expected functionality for a module with an implemented Reader
 
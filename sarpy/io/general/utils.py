@@ -16,10 +16,58 @@ import mmap
 
 import numpy
 
-try:
-    import h5py
-except ImportError:
-    h5py = None
+
+_h5py = False  # sentinel for not yet attempted
+
+
+def get_h5py():
+    """
+    Gets the h5py module, which is imported on first use since it is slow to
+    import and is only required for reading hdf5 files.
+
+    Returns
+    -------
+    None|module
+        `None` if h5py is not successfully imported.
+    """
+
+    global _h5py
+    if _h5py is False:
+        try:
+            import h5py as _h5py
+        except ImportError:
+            _h5py = None
+    return _h5py
+
+
+def __getattr__(name):
+    # preserves the module attribute `h5py`, without importing it at module import
+    if name == 'h5py':
+        return get_h5py()
+    raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+
+def get_worker_count(max_workers: Optional[int]) -> int:
+    """
+    Gets the number of worker threads for a `max_workers` argument. `None`
+    means the :class:`concurrent.futures.ThreadPoolExecutor` default, that is
+    `min(32, cpu count + 4)`, and `1` means serial processing.
+
+    Parameters
+    ----------
+    max_workers : None|int
+
+    Returns
+    -------
+    int
+    """
+
+    if max_workers is None:
+        return min(32, (os.cpu_count() or 1) + 4)
+    max_workers = int(max_workers)
+    if max_workers < 1:
+        raise ValueError('max_workers must be a positive integer, got {}'.format(max_workers))
+    return max_workers
 
 
 ###########
@@ -196,7 +244,7 @@ def is_hdf5(file_name: Union[str, BinaryIO]) -> bool:
         return False
 
     out = (header == b'\x89HDF')
-    if out and h5py is None:
+    if out and get_h5py() is None:
         warnings.warn('The h5py library was not successfully imported, and no hdf5 files can be read')
     return out
 
@@ -6,7 +6,9 @@ __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
 
 
-from typing import Union, Tuple, Sequence, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Tuple, Sequence, Dict, Optional, Callable, Iterator
 
 import numpy
 
@@ -14,6 +16,192 @@ from sarpy.io.general.base import BaseReader
 from sarpy.io.general.data_segment import DataSegment
 from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType as CPHDType1_0
 from sarpy.io.phase_history.cphd0_3_elements.CPHD import CPHDType as CPHDType0_3
+from sarpy.io.phase_history.pvp_geometry import PVPGeometry
+
+
+VectorPredicate = Callable[[numpy.ndarray], numpy.ndarray]
+
+
+def signal_normal(pvp: numpy.ndarray) -> numpy.ndarray:
+    """
+    A vector predicate selecting the vectors with normal signal, i.e. `SIGNAL == 1`.
+    All vectors are selected if the `SIGNAL` parameter is not present.
+
+    Parameters
+    ----------
+    pvp : numpy.ndarray
+        The structured per vector parameter array.
+
+    Returns
+    -------
+    numpy.ndarray
+        The boolean selection mask.
+    """
+
+    if pvp.dtype.fields is not None and 'SIGNAL' in pvp.dtype.fields:
+        return numpy.reshape(pvp['SIGNAL'], (pvp.shape[0], )) == 1
+    return numpy.ones((pvp.shape[0], ), dtype='bool')
+
+
+def time_window(
+        start: Optional[float] = None,
+        stop: Optional[float] = None,
+        variable: str = 'TxTime') -> VectorPredicate:
+    """
+    Gets a vector predicate selecting the vectors for which the given time
+    parameter lies in the half open interval `[start, stop)`.
+
+    Parameters
+    ----------
+    start : None|float
+    stop : None|float
+    variable : str
+        The name of the time parameter, for example `'TxTime'` or `'RcvStart'`.
+
+    Returns
+    -------
+    Callable
+    """
+
+    def predicate(pvp: numpy.ndarray) -> numpy.ndarray:
+        times = pvp[variable]
+        mask = numpy.ones(times.shape, dtype='bool')
+        if start is not None:
+            mask &= (times >= start)
+        if stop is not None:
+            mask &= (times < stop)
+        return mask
+
+    return predicate
+
+
+class VectorIterator(object):
+    """
+    Iterates over the vectors of a given channel in vector order, yielding
+    `(vector_indices, pvp_array, signal_array)` for batches of vectors, where
+    `vector_indices` are the indices of the vectors in the channel.
+
+    The memory footprint is bounded by the batch size. While the caller
+    processes one batch, the next batch is read on a background thread. If a
+    vector predicate is provided, only the selected vectors are yielded, and no
+    signal data is read for a batch with no selected vectors.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from sarpy.io.phase_history.base import signal_normal
+
+        for indices, pvp, signal in reader.iterate_vectors(0, batch_size=512, predicate=signal_normal):
+            ...
+    """
+
+    __slots__ = (
+        '_reader', '_index', '_batch_size', '_predicate', '_vector_range', '_raw', '_prefetch')
+
+    def __init__(
+            self,
+            reader: BaseReader,
+            index: Union[int, str] = 0,
+            batch_size: int = 1024,
+            predicate: Optional[VectorPredicate] = None,
+            vector_range: Optional[Tuple[int, int]] = None,
+            raw: bool = False,
+            prefetch: bool = True):
+        """
+
+        Parameters
+        ----------
+        reader : BaseReader
+            The CPHD or CRSD reader.
+        index : int|str
+            The channel index or identifier.
+        batch_size : int
+            The number of vectors considered in each batch.
+        predicate : None|Callable
+            A function of the structured pvp array for a batch, which returns
+            a boolean array indicating which vectors are to be yielded.
+        vector_range : None|Tuple[int, int]
+            The `(start, stop)` range of vectors to iterate over, defaults to all.
+        raw : bool
+            Yield the raw signal data, rather than formatted data?
+        prefetch : bool
+            Read the next batch on a background thread?
+        """
+
+        self._reader = reader
+        # noinspection PyProtectedMember
+        self._index = reader._validate_index(index)
+        self._batch_size = int(batch_size)
+        if self._batch_size < 1:
+            raise ValueError('batch_size must be a positive integer, got {}'.format(batch_size))
+        if predicate is not None and not callable(predicate):
+            raise TypeError('predicate must be callable, got type {}'.format(type(predicate)))
+        self._predicate = predicate
+        num_vectors = reader.get_data_size_as_tuple()[self._index][0]
+        if vector_range is None:
+            vector_range = (0, num_vectors)
+        start, stop = int(vector_range[0]), int(vector_range[1])
+        if not (0 <= start <= stop <= num_vectors):
+            raise ValueError(
+                'vector_range {} must satisfy 0 <= start <= stop <= {}'.format(vector_range, num_vectors))
+        self._vector_range = (start, stop)
+        self._raw = bool(raw)
+        self._prefetch = bool(prefetch)
+
+    @property
+    def batch_ranges(self) -> Sequence[Tuple[int, int]]:
+        """
+        Sequence[Tuple[int, int]]: The `(start, stop)` vector range for each batch.
+        """
+
+        start, stop = self._vector_range
+        return [(entry, min(entry + self._batch_size, stop)) for entry in range(start, stop, self._batch_size)]
+
+    def _read_batch(self, start: int, stop: int) -> Optional[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+        pvp = self._reader.read_pvp_array(self._index, the_range=(start, stop, 1))
+        indices = numpy.arange(start, stop)
+        if self._predicate is not None:
+            mask = numpy.asarray(self._predicate(pvp), dtype='bool')
+            if mask.shape != (stop - start, ):
+                raise ValueError(
+                    'The predicate returned shape {}, expected {}'.format(mask.shape, (stop - start, )))
+            if not numpy.any(mask):
+                return None
+            selected = numpy.nonzero(mask)[0]
+            indices, pvp = indices[selected], pvp[selected]
+            # read only the span of selected vectors
+            start, stop = start + int(selected[0]), start + int(selected[-1]) + 1
+            mask = mask[selected[0]:selected[-1] + 1]
+        else:
+            mask = None
+        signal = self._reader(slice(start, stop), None, index=self._index, raw=self._raw, squeeze=False)
+        if mask is not None and not numpy.all(mask):
+            signal = signal[mask]
+        return indices, pvp, signal
+
+    def __iter__(self) -> Iterator[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]:
+        batch_ranges = self.batch_ranges
+        if not self._prefetch:
+            for start, stop in batch_ranges:
+                batch = self._read_batch(start, stop)
+                if batch is not None:
+                    yield batch
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for start, stop in batch_ranges:
+                future = executor.submit(self._read_batch, start, stop)
+                if pending is not None:
+                    batch = pending.result()
+                    if batch is not None:
+                        yield batch
+                pending = future
+            if pending is not None:
+                batch = pending.result()
+                if batch is not None:
+                    yield batch
 
 
 class CPHDTypeReader(BaseReader):
@@ -50,6 +238,8 @@ class CPHDTypeReader(BaseReader):
         else:
             raise TypeError(
                 'The cphd_meta must be of type CPHDType, got `{}`'.format(type(cphd_meta)))
+        self._pvp_geometry = {}  # type: Dict[int, PVPGeometry]
+        self._pvp_geometry_lock = threading.Lock()
 
         BaseReader.__init__(
             self, data_segment, reader_type='CPHD', close_segments=close_segments, delete_files=delete_files)
@@ -62,6 +252,67 @@ class CPHDTypeReader(BaseReader):
 
         return self._cphd_meta
 
+    def iterate_vectors(
+            self,
+            index: Union[int, str] = 0,
+            batch_size: int = 1024,
+            predicate: Optional[VectorPredicate] = None,
+            vector_range: Optional[Tuple[int, int]] = None,
+            raw: bool = False,
+            prefetch: bool = True) -> VectorIterator:
+        """
+        Gets an iterator over batches of `(vector_indices, pvp_array, signal_array)`
+        for the given channel, in vector order.
+
+        Parameters
+        ----------
+        index : int|str
+            The channel index or identifier.
+        batch_size : int
+            The number of vectors considered in each batch.
+        predicate : None|Callable
+            A function of the structured pvp array for a batch, which returns
+            a boolean array indicating which vectors are to be yielded. See
+            :func:`signal_normal` and :func:`time_window`.
+        vector_range : None|Tuple[int, int]
+            The `(start, stop)` range of vectors to iterate over, defaults to all.
+        raw : bool
+            Yield the raw signal data, rather than formatted data?
+        prefetch : bool
+            Read the next batch on a background thread?
+
+        Returns
+        -------
+        VectorIterator
+        """
+
+        return VectorIterator(
+            self, index=index, batch_size=batch_size, predicate=predicate,
+            vector_range=vector_range, raw=raw, prefetch=prefetch)
+
+    def get_pvp_geometry(self, index: Union[int, str]) -> PVPGeometry:
+        """
+        Gets the geometry parameters derived from the PVP array of the given
+        channel. This is constructed on first request, and cached on the reader,
+        and its derived quantities are computed lazily and cached in turn.
+
+        Parameters
+        ----------
+        index : int|str
+            The channel index or identifier.
+
+        Returns
+        -------
+        PVPGeometry
+        """
+
+        # noinspection PyUnresolvedReferences
+        int_index = self._validate_index(index)
+        with self._pvp_geometry_lock:
+            if int_index not in self._pvp_geometry:
+                self._pvp_geometry[int_index] = PVPGeometry(self.read_pvp_array(int_index))
+            return self._pvp_geometry[int_index]
+
     def read_support_array(
             self,
             index: Union[int, str],
@@ -186,3 +437,8 @@ class CPHDTypeReader(BaseReader):
         """
 
         raise NotImplementedError
+
+    def close(self) -> None:
+        BaseReader.close(self)
+        if hasattr(self, '_pvp_geometry'):
+            self._pvp_geometry.clear()
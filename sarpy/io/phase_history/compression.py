@@ -0,0 +1,660 @@
+"""
+Compressed signal array support for CPHD files.
+
+The CPHD standard permits compressed signal arrays, identified by
+`Data.SignalCompressionID`, but does not define the compression scheme. This
+module defines a registry of simple byte codecs and a chunked layout which
+permits decoding only the vectors required for a given read.
+
+A compressed signal array following this convention is identified by
+a `SignalCompressionID` of the form :code:`SARPY_CHUNKED_<CODEC>`, and the
+corresponding `CompressedSignalSize` bytes are organized (all big-endian) as
+
+* a 32 byte header: the magic bytes `SPYCHNK1`, the number of vectors,
+  the number of vectors per chunk, and the number of chunks (each `uint64`),
+* the chunk index: `num_chunks + 1` byte offsets (`uint64`) relative to the
+  start of the channel signal array, where the final entry is the total size,
+* the chunk payloads. Each chunk is the encoded raw (i.e. file storage format)
+  signal data for a contiguous collection of vectors.
+
+Additional codecs can be registered directly using :func:`register_signal_codec`,
+or provided by a plug-in package using the `sarpy.io.phase_history.signal_codec`
+entry point group, where the entry point name is the codec name and the loaded
+object is a :class:`SignalCodec` instance.
+"""
+
+__classification__ = "UNCLASSIFIED"
+
+import logging
+import lzma
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Tuple, Sequence, Optional, Callable, List
+
+import numpy
+
+import sarpy._extensions
+from sarpy.io.general.data_segment import DataSegment
+from sarpy.io.general.format_function import FormatFunction
+from sarpy.io.general.slice_parsing import get_subscript_result_size
+from sarpy.io.general.utils import get_worker_count
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_ID_PREFIX = 'SARPY_CHUNKED_'
+_CHUNK_MAGIC = b'SPYCHNK1'
+_HEADER_FORMAT = '>8sQQQ'
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+_ENTRY_POINT_GROUP = 'sarpy.io.phase_history.signal_codec'
+
+
+class SignalCodec(object):
+    """
+    A byte level compression codec for use in compressed signal arrays.
+
+    Both the `compress` and `decompress` functions are called from worker
+    threads, so the codec should be thread-safe and ideally release the GIL.
+    """
+
+    __slots__ = ('_name', '_compress', '_decompress')
+
+    def __init__(
+            self,
+            name: str,
+            compress: Callable[[bytes, Optional[int]], bytes],
+            decompress: Callable[[bytes], bytes]):
+        """
+
+        Parameters
+        ----------
+        name : str
+            The codec name, which will be normalized to upper case.
+        compress : Callable
+            Function of signature `compress(data, level)`, where `level` may be
+            `None` to indicate the codec default.
+        decompress : Callable
+            Function of signature `decompress(data)`.
+        """
+
+        if not isinstance(name, str) or name.strip() == '':
+            raise ValueError('codec name must be a non-empty string, got `{}`'.format(name))
+        self._name = name.strip().upper()
+        self._compress = compress
+        self._decompress = decompress
+
+    @property
+    def name(self) -> str:
+        """
+        str: The codec name.
+        """
+
+        return self._name
+
+    @property
+    def compression_id(self) -> str:
+        """
+        str: The `Data.SignalCompressionID` value for this codec.
+        """
+
+        return COMPRESSION_ID_PREFIX + self._name
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        """
+        Compress the given bytes.
+
+        Parameters
+        ----------
+        data : bytes
+        level : None|int
+            The compression level, `None` for the codec default.
+
+        Returns
+        -------
+        bytes
+        """
+
+        return self._compress(data, level)
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompress the given bytes.
+
+        Parameters
+        ----------
+        data : bytes
+
+        Returns
+        -------
+        bytes
+        """
+
+        return self._decompress(data)
+
+    def __repr__(self):
+        return '{}({})'.format(self.__class__.__name__, self._name)
+
+
+def _zlib_compress(data: bytes, level: Optional[int]) -> bytes:
+    return zlib.compress(data, -1 if level is None else level)
+
+
+def _lzma_compress(data: bytes, level: Optional[int]) -> bytes:
+    return lzma.compress(data, preset=level)
+
+
+_SIGNAL_CODECS = OrderedDict()  # type: OrderedDict[str, SignalCodec]
+_SIGNAL_CODEC_LOCK = threading.Lock()
+_PLUGINS_LOADED = False
+
+
+def register_signal_codec(codec: SignalCodec, replace: bool = False) -> None:
+    """
+    Register a signal codec.
+
+    Parameters
+    ----------
+    codec : SignalCodec
+    replace : bool
+        Replace an existing codec of the same name? Otherwise, a duplicate
+        name is logged and ignored.
+
+    Returns
+    -------
+    None
+    """
+
+    if not isinstance(codec, SignalCodec):
+        raise TypeError('codec must be a SignalCodec instance, got type `{}`'.format(type(codec)))
+
+    with _SIGNAL_CODEC_LOCK:
+        if codec.name in _SIGNAL_CODECS and not replace:
+            logger.warning(
+                'A signal codec named `{}` is already registered,\n\t'
+                'and will not be replaced'.format(codec.name))
+            return
+        _SIGNAL_CODECS[codec.name] = codec
+
+
+def _load_plugin_codecs() -> None:
+    global _PLUGINS_LOADED
+    if _PLUGINS_LOADED:
+        return
+    _PLUGINS_LOADED = True
+    for entry in sarpy._extensions.entry_points(group=_ENTRY_POINT_GROUP):
+        codec = entry.load()
+        logger.info('Loading signal codec {} from {}'.format(entry.name, entry.module))
+        if not isinstance(codec, SignalCodec) or codec.name != entry.name.strip().upper():
+            logger.error(
+                'Entry point `{}` does not provide a SignalCodec named `{}`, skipping'.format(
+                    entry.name, entry.name))
+            continue
+        register_signal_codec(codec)
+
+
+def available_signal_codecs() -> List[str]:
+    """
+    Gets the names of the registered signal codecs, including those provided
+    by plug-in packages.
+
+    Returns
+    -------
+    List[str]
+    """
+
+    _load_plugin_codecs()
+    return list(_SIGNAL_CODECS.keys())
+
+
+def get_signal_codec(codec: Union[str, SignalCodec]) -> SignalCodec:
+    """
+    Gets the registered signal codec.
+
+    Parameters
+    ----------
+    codec : str|SignalCodec
+        The codec name, the `SignalCompressionID`, or the codec itself.
+
+    Returns
+    -------
+    SignalCodec
+
+    Raises
+    ------
+    KeyError
+        If no such codec is registered.
+    """
+
+    if isinstance(codec, SignalCodec):
+        return codec
+    if not isinstance(codec, str):
+        raise TypeError('codec must be a string or SignalCodec, got type `{}`'.format(type(codec)))
+
+    name = codec.strip().upper()
+    if name.startswith(COMPRESSION_ID_PREFIX):
+        name = name[len(COMPRESSION_ID_PREFIX):]
+    if name not in _SIGNAL_CODECS:
+        _load_plugin_codecs()
+    if name not in _SIGNAL_CODECS:
+        raise KeyError(
+            'No signal codec `{}` registered, the available codecs are {}'.format(
+                name, available_signal_codecs()))
+    return _SIGNAL_CODECS[name]
+
+
+def parse_compression_id(compression_id: Optional[str]) -> Optional[SignalCodec]:
+    """
+    Gets the codec for the given `SignalCompressionID`, if it follows the
+    chunked convention defined here and the codec is registered.
+
+    Parameters
+    ----------
+    compression_id : None|str
+
+    Returns
+    -------
+    None|SignalCodec
+    """
+
+    if compression_id is None or not compression_id.strip().upper().startswith(COMPRESSION_ID_PREFIX):
+        return None
+    try:
+        return get_signal_codec(compression_id)
+    except KeyError:
+        logger.warning(
+            'SignalCompressionID `{}` follows the chunked convention,\n\t'
+            'but no corresponding codec is registered'.format(compression_id))
+        return None
+
+
+register_signal_codec(SignalCodec('ZLIB', _zlib_compress, zlib.decompress))
+register_signal_codec(SignalCodec('LZMA', _lzma_compress, lzma.decompress))
+
+
+#########
+# chunked layout
+
+class ChunkIndex(object):
+    """
+    The chunk index for a compressed signal array.
+    """
+
+    __slots__ = ('_num_vectors', '_vectors_per_chunk', '_offsets')
+
+    def __init__(self, num_vectors: int, vectors_per_chunk: int, offsets: numpy.ndarray):
+        """
+
+        Parameters
+        ----------
+        num_vectors : int
+        vectors_per_chunk : int
+        offsets : numpy.ndarray
+            The `num_chunks + 1` byte offsets of the chunks, relative to the
+            start of the channel signal array.
+        """
+
+        self._num_vectors = int(num_vectors)
+        self._vectors_per_chunk = int(vectors_per_chunk)
+        self._offsets = numpy.asarray(offsets, dtype='int64')
+        if self._vectors_per_chunk < 1:
+            raise ValueError('vectors_per_chunk must be positive, got {}'.format(vectors_per_chunk))
+        expected_chunks = -(-self._num_vectors // self._vectors_per_chunk)
+        if self._offsets.ndim != 1 or self._offsets.size != expected_chunks + 1:
+            raise ValueError(
+                'Expected {} chunk offsets for {} vectors in chunks of {}, got shape {}'.format(
+                    expected_chunks + 1, num_vectors, vectors_per_chunk, self._offsets.shape))
+        if numpy.any(numpy.diff(self._offsets) < 0) or \
+                (self._offsets.size > 0 and self._offsets[0] < self.header_size):
+            raise ValueError('The chunk offsets are not consistent')
+
+    @property
+    def num_vectors(self) -> int:
+        """
+        int: The number of vectors.
+        """
+
+        return self._num_vectors
+
+    @property
+    def vectors_per_chunk(self) -> int:
+        """
+        int: The number of vectors in each chunk, except possibly the last.
+        """
+
+        return self._vectors_per_chunk
+
+    @property
+    def num_chunks(self) -> int:
+        """
+        int: The number of chunks.
+        """
+
+        return self._offsets.size - 1
+
+    @property
+    def offsets(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The chunk byte offsets.
+        """
+
+        return self._offsets
+
+    @property
+    def header_size(self) -> int:
+        """
+        int: The size of the header and chunk index in bytes.
+        """
+
+        return _HEADER_SIZE + 8*self._offsets.size
+
+    @property
+    def total_size(self) -> int:
+        """
+        int: The total size of the compressed signal array in bytes.
+        """
+
+        return int(self._offsets[-1])
+
+    def get_vector_range(self, chunk: int) -> Tuple[int, int]:
+        """
+        Gets the range of vectors contained in the given chunk.
+
+        Parameters
+        ----------
+        chunk : int
+
+        Returns
+        -------
+        Tuple[int, int]
+        """
+
+        start = chunk*self._vectors_per_chunk
+        return start, min(start + self._vectors_per_chunk, self._num_vectors)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the header and chunk index.
+
+        Returns
+        -------
+        bytes
+        """
+
+        return struct.pack(
+            _HEADER_FORMAT, _CHUNK_MAGIC, self._num_vectors, self._vectors_per_chunk, self.num_chunks) + \
+            self._offsets.astype('>u8').tobytes()
+
+    @classmethod
+    def from_bytes(cls, header: bytes, read_index: Callable[[int], bytes]) -> 'ChunkIndex':
+        """
+        Parse the header and chunk index.
+
+        Parameters
+        ----------
+        header : bytes
+            The first 32 bytes of the compressed signal array.
+        read_index : Callable
+            Function which returns the given number of bytes immediately
+            following the header.
+
+        Returns
+        -------
+        ChunkIndex
+        """
+
+        if len(header) < _HEADER_SIZE:
+            raise ValueError('The compressed signal array header requires {} bytes'.format(_HEADER_SIZE))
+        magic, num_vectors, vectors_per_chunk, num_chunks = struct.unpack(_HEADER_FORMAT, header[:_HEADER_SIZE])
+        if magic != _CHUNK_MAGIC:
+            raise ValueError('The compressed signal array does not begin with the expected magic bytes')
+        offsets = numpy.frombuffer(read_index(8*(num_chunks + 1)), dtype='>u8')
+        return cls(num_vectors, vectors_per_chunk, offsets)
+
+
+def compress_signal_arrays(
+        raw_arrays: Sequence[numpy.ndarray],
+        codec: Union[str, SignalCodec] = 'ZLIB',
+        vectors_per_chunk: int = 256,
+        level: Optional[int] = None,
+        max_workers: Optional[int] = None) -> List[bytes]:
+    """
+    Compress a collection of raw signal arrays into the chunked layout. The
+    chunks of all arrays are encoded by a shared pool of worker threads.
+
+    Parameters
+    ----------
+    raw_arrays : Sequence[numpy.ndarray]
+        The raw signal arrays, each of shape `(num_vectors, num_samples, 2)` and
+        of the file storage data type (big-endian).
+    codec : str|SignalCodec
+    vectors_per_chunk : int
+        The number of vectors in each compressed chunk, which is the granularity
+        for random access.
+    level : None|int
+        The codec compression level, `None` for the codec default.
+    max_workers : None|int
+        The maximum number of worker threads. `None` uses the
+        :class:`concurrent.futures.ThreadPoolExecutor` default, and `1` gives
+        serial compression.
+
+    Returns
+    -------
+    List[bytes]
+        The compressed signal array bytes for each array.
+    """
+
+    codec = get_signal_codec(codec)
+    vectors_per_chunk = int(vectors_per_chunk)
+    if vectors_per_chunk < 1:
+        raise ValueError('vectors_per_chunk must be positive, got {}'.format(vectors_per_chunk))
+    for array in raw_arrays:
+        if array.ndim != 3 or array.shape[2] != 2:
+            raise ValueError(
+                'Each raw signal array must have shape (num_vectors, num_samples, 2), got {}'.format(array.shape))
+
+    def encode(array, start):
+        return codec.compress(numpy.ascontiguousarray(array[start:start+vectors_per_chunk]).tobytes(), level)
+
+    worker_count = get_worker_count(max_workers)
+    starts = [range(0, array.shape[0], vectors_per_chunk) for array in raw_arrays]
+    if worker_count == 1:
+        encoded = [[encode(array, start) for start in the_starts] for array, the_starts in zip(raw_arrays, starts)]
+    else:
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                [executor.submit(encode, array, start) for start in the_starts]
+                for array, the_starts in zip(raw_arrays, starts)]
+            encoded = [[future.result() for future in the_futures] for the_futures in futures]
+
+    out = []
+    for array, chunks in zip(raw_arrays, encoded):
+        sizes = numpy.array([len(chunk) for chunk in chunks], dtype='int64')
+        offsets = numpy.zeros((sizes.size + 1, ), dtype='int64')
+        offsets[1:] = numpy.cumsum(sizes)
+        offsets += _HEADER_SIZE + 8*offsets.size
+        index = ChunkIndex(array.shape[0], vectors_per_chunk, offsets)
+        out.append(index.to_bytes() + b''.join(chunks))
+    logger.info(
+        'Compressed {} signal arrays using codec {} to {} bytes'.format(
+            len(raw_arrays), codec.name, sum(len(entry) for entry in out)))
+    return out
+
+
+class CompressedSignalSegment(DataSegment):
+    """
+    Read only data segment which decodes a signal array stored in the chunked
+    compressed layout. The raw data is of shape `(num_vectors, num_samples, 2)`,
+    and only the chunks containing the requested vectors are decoded. The most
+    recently decoded chunks are retained in a small cache.
+    """
+
+    __slots__ = (
+        '_parent', '_codec', '_chunk_index', '_cache', '_cache_size', '_lock', '_close_parent')
+
+    def __init__(
+            self,
+            parent: DataSegment,
+            codec: Union[str, SignalCodec],
+            raw_dtype: Union[str, numpy.dtype],
+            num_samples: int,
+            formatted_dtype: Union[str, numpy.dtype],
+            format_function: Optional[FormatFunction] = None,
+            cache_size: int = 4,
+            close_parent: bool = True):
+        """
+
+        Parameters
+        ----------
+        parent : DataSegment
+            The one-dimensional byte data segment for the compressed signal array.
+        codec : str|SignalCodec
+        raw_dtype : str|numpy.dtype
+            The (uncompressed) signal array storage data type.
+        num_samples : int
+        formatted_dtype : str|numpy.dtype
+        format_function : None|FormatFunction
+        cache_size : int
+            The number of decoded chunks to retain.
+        close_parent : bool
+        """
+
+        if parent.raw_ndim != 1 or parent.raw_dtype.itemsize != 1:
+            raise ValueError('The parent data segment must be a one dimensional byte array')
+        self._parent = parent
+        self._close_parent = bool(close_parent)
+        self._codec = get_signal_codec(codec)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_size = max(0, int(cache_size))
+
+        header = self._read_bytes(0, _HEADER_SIZE)
+        self._chunk_index = ChunkIndex.from_bytes(
+            header, lambda count: self._read_bytes(_HEADER_SIZE, _HEADER_SIZE + count))
+        if self._chunk_index.total_size > parent.raw_shape[0]:
+            raise ValueError(
+                'The chunk index describes {} bytes, but the compressed signal array is {} bytes'.format(
+                    self._chunk_index.total_size, parent.raw_shape[0]))
+
+        raw_shape = (self._chunk_index.num_vectors, int(num_samples), 2)
+        DataSegment.__init__(
+            self, raw_dtype, raw_shape, formatted_dtype, raw_shape[:2],
+            format_function=format_function, mode='r')
+
+    @property
+    def parent(self) -> DataSegment:
+        """
+        DataSegment: The compressed byte data segment.
+        """
+
+        return self._parent
+
+    @property
+    def codec(self) -> SignalCodec:
+        """
+        SignalCodec: The codec.
+        """
+
+        return self._codec
+
+    @property
+    def chunk_index(self) -> ChunkIndex:
+        """
+        ChunkIndex: The chunk index.
+        """
+
+        return self._chunk_index
+
+    @property
+    def close_parent(self) -> bool:
+        """
+        bool: Call parent.close() when close is called?
+        """
+
+        return self._close_parent
+
+    @close_parent.setter
+    def close_parent(self, value):
+        self._close_parent = bool(value)
+
+    def _read_bytes(self, start: int, stop: int) -> bytes:
+        return self._parent.read_raw((slice(start, stop, 1), ), squeeze=False).tobytes()
+
+    def get_chunk(self, chunk: int) -> numpy.ndarray:
+        """
+        Gets the decoded raw data for the given chunk.
+
+        Parameters
+        ----------
+        chunk : int
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        with self._lock:
+            if chunk in self._cache:
+                self._cache.move_to_end(chunk)
+                return self._cache[chunk]
+
+        start, stop = self._chunk_index.get_vector_range(chunk)
+        offsets = self._chunk_index.offsets
+        decoded = self._codec.decompress(self._read_bytes(int(offsets[chunk]), int(offsets[chunk+1])))
+        expected_shape = (stop - start, ) + self.raw_shape[1:]
+        out = numpy.frombuffer(decoded, dtype=self.raw_dtype)
+        if out.size != int(numpy.prod(expected_shape)):
+            raise ValueError(
+                'Chunk {} decoded to {} elements, expected shape {}'.format(chunk, out.size, expected_shape))
+        out = numpy.reshape(out, expected_shape)
+
+        if self._cache_size > 0:
+            with self._lock:
+                self._cache[chunk] = out
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return out
+
+    def read_raw(
+            self,
+            subscript: Union[None, int, slice, Sequence[Union[int, slice, Tuple[int, ...]]]],
+            squeeze=True) -> numpy.ndarray:
+        self._validate_closed()
+
+        subscript, out_shape = get_subscript_result_size(subscript, self.raw_shape)
+        vectors = numpy.arange(self.raw_shape[0])[subscript[0]]
+        out = numpy.empty((vectors.size, ) + self.raw_shape[1:], dtype=self.raw_dtype)
+        if vectors.size > 0:
+            chunks = vectors // self._chunk_index.vectors_per_chunk
+            boundaries = numpy.nonzero(numpy.diff(chunks))[0] + 1
+            for first, last in zip(numpy.r_[0, boundaries], numpy.r_[boundaries, vectors.size]):
+                chunk = int(chunks[first])
+                chunk_start, _ = self._chunk_index.get_vector_range(chunk)
+                out[first:last] = self.get_chunk(chunk)[vectors[first:last] - chunk_start]
+        out = out[:, subscript[1], subscript[2]]
+
+        if squeeze:
+            return numpy.squeeze(out)
+        else:
+            return numpy.reshape(out, out_shape)
+
+    def check_fully_written(self, warn: bool = False) -> bool:
+        return True
+
+    def get_raw_bytes(self, warn: bool = True) -> Union[bytes, Tuple]:
+        self._validate_closed()
+        return self._parent.get_raw_bytes(warn=warn)
+
+    def close(self):
+        try:
+            if self._closed:
+                return
+
+            self._cache = None
+            if self.close_parent:
+                self._parent.close()
+            DataSegment.close(self)
+            self._parent = None
+        except AttributeError:
+            return
@@ -8,7 +8,8 @@ __author__ = "Thomas McCullough"
 import os
 from typing import BinaryIO, Callable, Union
 
-from sarpy.io.general.base import SarpyIOError, check_for_openers
+from sarpy.io.general.base import SarpyIOError, check_for_plugin_openers, \
+    OpenerManifestEntry, get_candidate_openers
 from sarpy.io.general.utils import is_file_like
 from sarpy.io.phase_history.base import CPHDTypeReader
 
@@ -16,12 +17,20 @@ from sarpy.io.phase_history.base import CPHDTypeReader
 ###########
 # Module variables
 _openers = []
+_plugin_openers = []
 _parsed_openers = False
+_manifest = (
+    OpenerManifestEntry('sarpy.io.phase_history.cphd', magic=(b'CPHD', ), extensions=('.cphd', )),
+)
+"""
+The openers provided in `sarpy.io.phase_history`, which are only imported when attempted.
+"""
 
 
 def register_opener(open_func: Callable) -> None:
     """
-    Provide a new opener.
+    Provide a new opener. Registered openers are attempted before the openers
+    provided in sarpy, so this may be used to override a provided reader.
 
     Parameters
     ----------
@@ -43,7 +52,9 @@ def register_opener(open_func: Callable) -> None:
 
 def parse_openers() -> None:
     """
-    Automatically find the viable openers (i.e. :func:`is_a`) in the various modules.
+    Find the openers provided by plug-ins, which are attempted after the
+    openers provided in sarpy. The openers provided in sarpy are declared in
+    the module manifest instead, and are only imported when attempted.
     """
 
     global _parsed_openers
@@ -51,7 +62,7 @@ def parse_openers() -> None:
         return
     _parsed_openers = True
 
-    check_for_openers('sarpy.io.phase_history', register_opener)
+    check_for_plugin_openers('sarpy.io.phase_history', _plugin_openers.append)
 
 
 def open_phase_history(file_name: Union[str, BinaryIO]) -> CPHDTypeReader:
@@ -76,7 +87,7 @@ def open_phase_history(file_name: Union[str, BinaryIO]) -> CPHDTypeReader:
     # parse openers, if not already done
     parse_openers()
     # see if we can find a reader though trial and error
-    for opener in _openers:
+    for opener in get_candidate_openers(file_name, _manifest, _openers, _plugin_openers):
         reader = opener(file_name)
         if reader is not None:
             return reader
@@ -9,6 +9,8 @@ __author__ = "Thomas McCullough"
 
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, List, Tuple, Dict, BinaryIO, Optional, Sequence
 from collections import OrderedDict
 import numbers
@@ -23,6 +25,8 @@ from sarpy.io.general.format_function import ComplexFormatFunction
 from sarpy.io.general.slice_parsing import verify_subscript, verify_slice
 
 from sarpy.io.phase_history.base import CPHDTypeReader
+from sarpy.io.phase_history.compression import get_signal_codec, \
+    parse_compression_id, compress_signal_arrays, CompressedSignalSegment
 from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType as CPHDType1, \
     CPHDHeader as CPHDHeader1, CPHD_SECTION_TERMINATOR
 from sarpy.io.phase_history.cphd0_3_elements.CPHD import CPHDType as CPHDType0_3, \
@@ -544,21 +548,32 @@ class CPHDReader1(CPHDReader):
         sample_type = data.SignalArrayFormat
 
         compressed = data.SignalCompressionID
-        if compressed is not None:
-            raw_dtype = numpy.dtype('B')
-        elif sample_type == "CF8":
-            raw_dtype = numpy.dtype('>f4')
+        codec = parse_compression_id(compressed)
+        if sample_type == "CF8":
+            signal_dtype = numpy.dtype('>f4')
         elif sample_type == "CI4":
-            raw_dtype = numpy.dtype('>i2')
+            signal_dtype = numpy.dtype('>i2')
         elif sample_type == "CI2":
-            raw_dtype = numpy.dtype('>i1')
+            signal_dtype = numpy.dtype('>i1')
         else:
             raise ValueError('Got unhandled signal array format {}'.format(sample_type))
+        raw_dtype = signal_dtype if compressed is None else numpy.dtype('B')
 
         block_offset = self.cphd_header.SIGNAL_BLOCK_BYTE_OFFSET
         for entry in data.Channels:
             amp_sf = self.read_pvp_variable('AmpSF', entry.Identifier)
-            if compressed:
+            if codec is not None:
+                # the chunked compression convention, decoded on read
+                compressed_segment = NumpyMemmapSegment(
+                    self.cphd_details.file_object, block_offset+entry.SignalArrayByteOffset,
+                    raw_dtype, (entry.CompressedSignalSize, ), formatted_dtype=raw_dtype,
+                    formatted_shape=(entry.CompressedSignalSize, ), close_file=False)
+                data_segments.append(
+                    CompressedSignalSegment(
+                        compressed_segment, codec, signal_dtype, entry.NumSamples, 'complex64',
+                        format_function=AmpScalingFunction(signal_dtype, amplitude_scaling=amp_sf)))
+                continue
+            elif compressed:
                 raw_shape = (entry.CompressedSignalSize,)
                 formatted_shape = raw_shape
                 formatted_dtype = 'byte'
@@ -1311,6 +1326,13 @@ class CPHDWriter1(BaseWriter):
     """
     The CPHD version 1 writer.
 
+    When constructed with `max_workers` for a file on disk, the writer uses
+    positional writes at the offsets determined by the writing details, so
+    that the block writing methods process channels (and support arrays)
+    concurrently in worker threads, without contending for a shared file
+    position. Signal data may also be provided incrementally, in batches of
+    vectors, using :meth:`write_signal_vectors`.
+
     **Updated in version 1.3.0** for writing changes.
     """
     _writing_details_type = CPHDWritingDetails
@@ -1318,7 +1340,7 @@ class CPHDWriter1(BaseWriter):
     __slots__ = (
         '_file_name', '_file_object', '_in_memory', '_writing_details',
         '_pvp_memmaps', '_support_memmaps', '_signal_data_segments',
-        '_can_write_regular_data')
+        '_can_write_regular_data', '_max_workers', '_vectors_written', '_write_lock')
 
     def __init__(
             self,
@@ -1326,7 +1348,8 @@ class CPHDWriter1(BaseWriter):
             meta: Optional[CPHDType1] = None,
             writing_details: Optional[CPHDWritingDetails] = None,
             check_older_version: bool = False,
-            check_existence: bool = True):
+            check_existence: bool = True,
+            max_workers: Optional[int] = None):
         """
 
         Parameters
@@ -1339,9 +1362,16 @@ class CPHDWriter1(BaseWriter):
             NGA applications
         check_existence : bool
             Should we check if the given file already exists, and raises an exception if so?
+        max_workers : None|int
+            If provided, use positional writes with this many worker threads
+            for the block writing methods. This has no effect for an in-memory
+            file object.
         """
 
         self._writing_details = None
+        self._max_workers = None
+        self._vectors_written = {}  # type: Dict[int, numpy.ndarray]
+        self._write_lock = threading.Lock()
 
         if isinstance(file_object, str):
             if check_existence and os.path.exists(file_object):
@@ -1362,6 +1392,11 @@ class CPHDWriter1(BaseWriter):
 
         if meta is None and writing_details is None:
             raise ValueError('One of meta or writing_details must be provided.')
+        if max_workers is not None:
+            max_workers = int(max_workers)
+            if max_workers < 1:
+                raise ValueError('max_workers must be a positive integer, got {}'.format(max_workers))
+            self._max_workers = max_workers
         if writing_details is None:
             writing_details = self._writing_details_type(meta, check_older_version=check_older_version)
         self.writing_details = writing_details
@@ -1387,6 +1422,53 @@ class CPHDWriter1(BaseWriter):
             raise TypeError('writing_details must be of type {}'.format(CPHDWritingDetails))
         self._writing_details = value
 
+    @property
+    def positional_writes(self) -> bool:
+        """
+        bool: Are the arrays written using positional writes at the precomputed offsets?
+        """
+
+        return self._max_workers is not None and not self._in_memory
+
+    def _write_at(self, offset: int, data: numpy.ndarray) -> None:
+        """
+        Write the bytes of the given array at the given file offset, without
+        using or modifying the file position.
+
+        Parameters
+        ----------
+        offset : int
+        data : numpy.ndarray
+        """
+
+        buffer = memoryview(numpy.ascontiguousarray(data).reshape(-1).view('B'))
+        if hasattr(os, 'pwrite'):
+            file_descriptor = self._file_object.fileno()
+            while buffer.nbytes > 0:
+                count = os.pwrite(file_descriptor, buffer, offset)
+                buffer = buffer[count:]
+                offset += count
+        else:
+            with self._write_lock:
+                self._file_object.seek(offset, os.SEEK_SET)
+                self._file_object.write(buffer)
+
+    def _map_items(self, function, items) -> None:
+        """
+        Apply function to each item, concurrently for positional writes.
+        """
+
+        items = list(items)
+        if not self.positional_writes or self._max_workers == 1 or len(items) < 2:
+            for item in items:
+                function(*item)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(items))) as executor:
+            futures = [executor.submit(function, *item) for item in items]
+            for future in futures:
+                future.result()
+
     @property
     def file_name(self) -> Optional[str]:
         return self._file_name
@@ -1630,10 +1712,15 @@ class CPHDWriter1(BaseWriter):
                 'Support data shape {} is not compatible with\n\t'
                 'that provided in metadata {}'.format(data.shape, out_array.shape))
 
+        details = self.writing_details.support_details[int_index]
+        if self.positional_writes:
+            self._write_at(details.item_offset, numpy.asarray(data, dtype=out_array.dtype))
+            details.item_written = True
+            return
+
         # write the data
         out_array[:] = data
         # mark it as written
-        details = self.writing_details.support_details[int_index]
         if self._in_memory:
             # TODO: we can delete the memmap now?
             details.item_bytes = out_array.tobytes()
@@ -1650,6 +1737,8 @@ class CPHDWriter1(BaseWriter):
         ----------
         identifier : int|str
         data : numpy.ndarray
+            The structured array, whose dtype must have exactly the fields of
+            the PVP definition. A dtype with missing fields is rejected.
         """
 
         self._validate_closed()
@@ -1673,10 +1762,19 @@ class CPHDWriter1(BaseWriter):
             self._signal_data_segments[identifier].format_function.set_amplitude_scaling(amp_sf)
             self._can_write_regular_data[identifier] = True
 
+        details = self.writing_details.pvp_details[int_index]
+        if self.positional_writes:
+            # the fields of data are verified to be exactly the PVP fields, so
+            # zero initialization only affects any padding bytes
+            out_array = numpy.zeros(data.shape, dtype=self._pvp_memmaps[identifier].dtype)
+            out_array[list(data.dtype.names)] = data[list(data.dtype.names)]
+            self._write_at(details.item_offset, out_array)
+            details.item_written = True
+            return
+
         # write the data
         self._pvp_memmaps[identifier][list(data.dtype.names)] = data[list(data.dtype.names)]
         # mark it as written
-        details = self.writing_details.pvp_details[int_index]
         if self._in_memory:
             # TODO: we can likely delete the memmap now?
             details.item_bytes = self._pvp_memmaps[identifier].tobytes()
@@ -1695,8 +1793,7 @@ class CPHDWriter1(BaseWriter):
 
         expected_support_ids = {s.Identifier for s in self.meta.Data.SupportArrays}
         assert expected_support_ids == set(support_block), 'support_block keys do not match those in meta'
-        for identifier, array in support_block.items():
-            self.write_support_array(identifier, array)
+        self._map_items(self.write_support_array, support_block.items())
 
     def write_pvp_block(self, pvp_block: Dict[Union[int, str], numpy.ndarray]) -> None:
         """
@@ -1710,10 +1807,119 @@ class CPHDWriter1(BaseWriter):
 
         expected_channels = {c.Identifier for c in self.meta.Data.Channels}
         assert expected_channels == set(pvp_block), 'pvp_block keys do not match those in meta'
-        for identifier, array in pvp_block.items():
-            self.write_pvp_array(identifier, array)
+        self._map_items(self.write_pvp_array, pvp_block.items())
+
+    def write_signal_vectors(
+            self,
+            identifier: Union[int, str],
+            data: numpy.ndarray,
+            start_vector: int = 0,
+            raw: bool = False) -> None:
+        """
+        Write a contiguous batch of signal vectors for the given channel. The
+        channel signal array is marked as written once every vector has been
+        provided. Any amplitude scaling is applied only to the given batch, so
+        memory use is bounded by the batch size.
 
-    def write_signal_block(self, signal_block: Dict[Union[int, str], numpy.ndarray]) -> None:
+        Parameters
+        ----------
+        identifier : int|str
+        data : numpy.ndarray
+            The signal vectors, of shape `(num_vectors, NumSamples)` in complex64
+            format, or of shape `(num_vectors, NumSamples, 2)` in file storage
+            format if `raw=True`.
+        start_vector : int
+            The index of the first vector in `data`.
+        raw : bool
+        """
+
+        self._validate_closed()
+        int_index = self._validate_channel_index(identifier)
+        identifier = self._validate_channel_key(identifier)
+        entry = self.meta.Data.Channels[int_index]
+        if self.meta.Data.SignalCompressionID is not None:
+            raise ValueError('Writing vector batches is not supported for compressed signal arrays')
+
+        expected_shape = (entry.NumSamples, 2) if raw else (entry.NumSamples, )
+        if data.ndim != len(expected_shape) + 1 or data.shape[1:] != expected_shape:
+            raise ValueError(
+                'Signal vectors for channel {} must have shape (N, {}), got {}'.format(
+                    identifier, ', '.join(str(value) for value in expected_shape), data.shape))
+        start_vector = int(start_vector)
+        stop_vector = start_vector + data.shape[0]
+        if not (0 <= start_vector and stop_vector <= entry.NumVectors):
+            raise ValueError(
+                'Signal vectors [{}, {}) are outside the range [0, {}) for channel {}'.format(
+                    start_vector, stop_vector, entry.NumVectors, identifier))
+
+        if not self.positional_writes:
+            self.__call__(data, start_indices=(start_vector, 0), index=identifier, raw=raw)
+            return
+
+        data_segment = self._signal_data_segments[identifier]
+        if raw:
+            raw_data = numpy.asarray(data, dtype=data_segment.raw_dtype)
+        else:
+            if not self._can_write_regular_data[identifier]:
+                raise ValueError(
+                    'The channel `{}` has an AmpSF which has not been determined,\n\t'
+                    'but the corresponding PVP block has not yet been written'.format(identifier))
+            raw_data = data_segment.format_function.inverse(
+                data, (slice(start_vector, stop_vector, 1), slice(0, entry.NumSamples, 1)))
+
+        details = self.writing_details.signal_details[int_index]
+        vector_bytes = entry.NumSamples*2*data_segment.raw_dtype.itemsize
+        self._write_at(details.item_offset + start_vector*vector_bytes, raw_data)
+
+        # track the vectors actually written, so that overlapping batches can
+        # not mark the channel as written while a gap remains
+        with self._write_lock:
+            written = self._vectors_written.get(int_index, None)
+            if written is None:
+                written = numpy.zeros((entry.NumVectors, ), dtype='bool')
+                self._vectors_written[int_index] = written
+            repeated = int(numpy.count_nonzero(written[start_vector:stop_vector]))
+            written[start_vector:stop_vector] = True
+            complete = bool(numpy.all(written))
+        if repeated > 0:
+            logger.error(
+                'Channel {} signal vectors [{}, {}) include {} vectors which have already been written.\n\t'
+                'This redundancy may be an error'.format(identifier, start_vector, stop_vector, repeated))
+        if complete:
+            details.item_written = True
+
+    def _write_signal_batches(
+            self,
+            identifier: Union[int, str],
+            data: numpy.ndarray,
+            raw: bool,
+            vector_batch_size: int) -> None:
+        for start in range(0, data.shape[0], vector_batch_size):
+            self.write_signal_vectors(identifier, data[start:start+vector_batch_size], start_vector=start, raw=raw)
+
+    def _write_signal_items(
+            self,
+            signal_block: Dict[Union[int, str], numpy.ndarray],
+            raw: bool,
+            vector_batch_size: int) -> None:
+        expected_channels = {c.Identifier for c in self.meta.Data.Channels}
+        assert expected_channels == set(signal_block), 'signal_block keys do not match those in meta'
+        if not self.positional_writes or self.meta.Data.SignalCompressionID is not None:
+            for identifier, array in signal_block.items():
+                self.__call__(array, index=identifier, raw=raw)
+            return
+
+        vector_batch_size = int(vector_batch_size)
+        if vector_batch_size < 1:
+            raise ValueError('vector_batch_size must be positive, got {}'.format(vector_batch_size))
+        self._map_items(
+            self._write_signal_batches,
+            [(identifier, array, raw, vector_batch_size) for identifier, array in signal_block.items()])
+
+    def write_signal_block(
+            self,
+            signal_block: Dict[Union[int, str], numpy.ndarray],
+            vector_batch_size: int = 4096) -> None:
         """
         Write signal block to the file.
 
@@ -1721,14 +1927,17 @@ class CPHDWriter1(BaseWriter):
         ----------
         signal_block: dict
             Dictionary of `numpy.ndarray` containing the signal arrays in complex64 format.
+        vector_batch_size : int
+            For positional writes, the number of vectors converted and written
+            at a time.
         """
 
-        expected_channels = {c.Identifier for c in self.meta.Data.Channels}
-        assert expected_channels == set(signal_block), 'signal_block keys do not match those in meta'
-        for identifier, array in signal_block.items():
-            self.write(array, index=identifier)
+        self._write_signal_items(signal_block, False, vector_batch_size)
 
-    def write_signal_block_raw(self, signal_block):
+    def write_signal_block_raw(
+            self,
+            signal_block: Dict[Union[int, str], numpy.ndarray],
+            vector_batch_size: int = 4096) -> None:
         """
         Write signal block to the file.
 
@@ -1737,12 +1946,11 @@ class CPHDWriter1(BaseWriter):
         signal_block: dict
             Dictionary of `numpy.ndarray` containing the raw formatted
             (i.e. file storage format) signal arrays.
+        vector_batch_size : int
+            For positional writes, the number of vectors written at a time.
         """
 
-        expected_channels = {c.Identifier for c in self.meta.Data.Channels}
-        assert expected_channels == set(signal_block), 'signal_block keys do not match those in meta'
-        for identifier, array in signal_block.items():
-            self.write_raw(array, index=identifier)
+        self._write_signal_items(signal_block, True, vector_batch_size)
 
     def write_file(
             self,
@@ -1883,3 +2091,106 @@ class CPHDWriter1(BaseWriter):
             pass
         self._writing_details = None
         self._file_object.close()
+
+
+def write_compressed_cphd(
+        file_object: Union[str, BinaryIO],
+        meta: CPHDType1,
+        pvp_block: Dict[Union[int, str], numpy.ndarray],
+        signal_block: Dict[Union[int, str], numpy.ndarray],
+        support_block: Optional[Dict[Union[int, str], numpy.ndarray]] = None,
+        codec: str = 'ZLIB',
+        vectors_per_chunk: int = 256,
+        level: Optional[int] = None,
+        raw: bool = False,
+        max_workers: Optional[int] = None,
+        check_existence: bool = True) -> CPHDType1:
+    """
+    Write a CPHD version 1 file with compressed signal arrays, following the
+    chunked convention of :mod:`sarpy.io.phase_history.compression`. The
+    channels are compressed in parallel worker threads, and the resulting file
+    can be read with random access by :class:`CPHDReader1`.
+
+    Parameters
+    ----------
+    file_object : str|BinaryIO
+    meta : CPHDType1
+        The metadata, which will be copied, and the copy populated with
+        `Data.SignalCompressionID` and each `CompressedSignalSize` and
+        `SignalArrayByteOffset`.
+    pvp_block : Dict[str, numpy.ndarray]
+    signal_block : Dict[str, numpy.ndarray]
+        The signal arrays, in complex64 format unless `raw=True`.
+    support_block : None|Dict[str, numpy.ndarray]
+    codec : str
+        The registered signal codec name.
+    vectors_per_chunk : int
+        The number of vectors in each compressed chunk.
+    level : None|int
+        The codec compression level, `None` for the codec default.
+    raw : bool
+        Is the signal data provided in raw (i.e. file storage format) form?
+    max_workers : None|int
+        The maximum number of compression worker threads. `None` uses the
+        :class:`concurrent.futures.ThreadPoolExecutor` default, and `1` gives
+        serial compression.
+    check_existence : bool
+        Should we check if the given file already exists, and raises an exception if so?
+
+    Returns
+    -------
+    CPHDType1
+        The metadata as written.
+    """
+
+    meta = meta.copy()
+    data = meta.Data
+    expected_channels = {c.Identifier for c in data.Channels}
+    if expected_channels != set(signal_block) or expected_channels != set(pvp_block):
+        raise ValueError('pvp_block and signal_block keys do not match those in meta')
+
+    signal_dtype = {'CF8': '>f4', 'CI4': '>i2', 'CI2': '>i1'}.get(data.SignalArrayFormat, None)
+    if signal_dtype is None:
+        raise ValueError('Got unhandled SignalArrayFormat {}'.format(data.SignalArrayFormat))
+    signal_dtype = numpy.dtype(signal_dtype)
+
+    raw_arrays = []
+    for entry in data.Channels:
+        array = signal_block[entry.Identifier]
+        raw_shape = (entry.NumVectors, entry.NumSamples, 2)
+        if raw:
+            if array.shape != raw_shape:
+                raise ValueError(
+                    'Raw signal data for channel {} has shape {}, expected {}'.format(
+                        entry.Identifier, array.shape, raw_shape))
+            raw_arrays.append(numpy.asarray(array, dtype=signal_dtype))
+        else:
+            if array.shape != raw_shape[:2]:
+                raise ValueError(
+                    'Signal data for channel {} has shape {}, expected {}'.format(
+                        entry.Identifier, array.shape, raw_shape[:2]))
+            amp_sf = None if meta.PVP.AmpSF is None else \
+                numpy.copy(pvp_block[entry.Identifier]['AmpSF'])
+            format_function = AmpScalingFunction(
+                signal_dtype, raw_shape=raw_shape, formatted_shape=raw_shape[:2], amplitude_scaling=amp_sf)
+            raw_arrays.append(
+                format_function.inverse(array, (slice(0, raw_shape[0], 1), slice(0, raw_shape[1], 1))))
+
+    compressed = compress_signal_arrays(
+        raw_arrays, codec=codec, vectors_per_chunk=vectors_per_chunk, level=level, max_workers=max_workers)
+    del raw_arrays
+
+    offset = 0
+    for entry, array in zip(data.Channels, compressed):
+        entry.CompressedSignalSize = len(array)
+        entry.SignalArrayByteOffset = offset
+        offset += len(array)
+    data.SignalCompressionID = get_signal_codec(codec).compression_id
+
+    with CPHDWriter1(file_object, meta, check_existence=check_existence) as writer:
+        writer.write_pvp_block(pvp_block)
+        if support_block:
+            writer.write_support_block(support_block)
+        for entry, array in zip(data.Channels, compressed):
+            writer.write_raw(numpy.frombuffer(array, dtype='B'), index=entry.Identifier)
+    return meta
@@ -0,0 +1,372 @@
+"""
+Vectorized computation of the standard geometry parameters derived from the
+per vector parameters of a CPHD channel, following the CPHD reference geometry
+definitions (CPHD 1.0.1, Section 6.5).
+
+All quantities are computed for every vector in single vectorized passes, and
+are cached on first access. A reader provides the cached instance for each
+channel via :meth:`sarpy.io.phase_history.base.CPHDTypeReader.get_pvp_geometry`.
+"""
+
+__classification__ = "UNCLASSIFIED"
+
+import threading
+from typing import Callable, Dict, Any
+
+import numpy
+
+from sarpy.geometry.geocoords import ecf_to_geodetic
+from sarpy.io.complex.sicd_elements.base import speed_of_light
+
+
+_REQUIRED_PVPS = ('TxTime', 'TxPos', 'RcvTime', 'RcvPos', 'SRPPos')
+_PLATFORMS = ('ARP', 'Tx', 'Rcv')
+
+
+def _dot(first: numpy.ndarray, second: numpy.ndarray) -> numpy.ndarray:
+    return numpy.sum(first*second, axis=-1)
+
+
+def _unit(vec: numpy.ndarray) -> numpy.ndarray:
+    return vec/numpy.linalg.norm(vec, axis=-1, keepdims=True)
+
+
+class PVPGeometry(object):
+    """
+    The standard geometry parameters derived from a structured PVP array, for
+    all vectors. Angles are given in degrees. All quantities are lazily computed,
+    cached and shared between threads, so the arrays returned should be treated
+    as read-only.
+    """
+
+    __slots__ = ('_pvp', '_cache', '_lock')
+
+    def __init__(self, pvp: numpy.ndarray):
+        """
+
+        Parameters
+        ----------
+        pvp : numpy.ndarray
+            The structured PVP array, of shape `(num_vectors, )`.
+        """
+
+        if not isinstance(pvp, numpy.ndarray) or pvp.dtype.names is None:
+            raise TypeError('pvp must be a structured numpy array, got type {}'.format(type(pvp)))
+        missing = [entry for entry in _REQUIRED_PVPS if entry not in pvp.dtype.names]
+        if len(missing) > 0:
+            raise ValueError('pvp array is missing required parameters {}'.format(missing))
+        self._pvp = numpy.reshape(pvp, (-1, ))
+        self._cache = {}  # type: Dict[Any, Any]
+        self._lock = threading.RLock()
+
+    def _get(self, key: Any, function: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = function()
+            return self._cache[key]
+
+    def _get_velocity(self, name: str) -> numpy.ndarray:
+        if name not in self._pvp.dtype.names:
+            raise ValueError('The {} parameter is required, and not present'.format(name))
+        return self._pvp[name]
+
+    @property
+    def pvp(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The structured PVP array.
+        """
+
+        return self._pvp
+
+    @property
+    def num_vectors(self) -> int:
+        """
+        int: The number of vectors.
+        """
+
+        return self._pvp.shape[0]
+
+    @property
+    def srp_pos(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The stabilization reference point position.
+        """
+
+        return self._pvp['SRPPos']
+
+    @property
+    def srp_llh(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The geodetic latitude, longitude (degrees) and height of the SRP.
+        """
+
+        return self._get('srp_llh', lambda: ecf_to_geodetic(self.srp_pos))
+
+    @property
+    def srp_enu(self) -> Dict[str, numpy.ndarray]:
+        """
+        Dict[str, numpy.ndarray]: The local east, north and up unit vectors at
+        the SRP, keyed by `'east'`, `'north'` and `'up'`.
+        """
+
+        def compute():
+            lat = numpy.deg2rad(self.srp_llh[:, 0])
+            lon = numpy.deg2rad(self.srp_llh[:, 1])
+            zero = numpy.zeros_like(lat)
+            return {
+                'east': numpy.stack((-numpy.sin(lon), numpy.cos(lon), zero), axis=-1),
+                'north': numpy.stack(
+                    (-numpy.sin(lat)*numpy.cos(lon), -numpy.sin(lat)*numpy.sin(lon), numpy.cos(lat)), axis=-1),
+                'up': numpy.stack(
+                    (numpy.cos(lat)*numpy.cos(lon), numpy.cos(lat)*numpy.sin(lon), numpy.sin(lat)), axis=-1)}
+
+        return self._get('srp_enu', compute)
+
+    @property
+    def arp_time(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The midpoint of the transmit and receive times.
+        """
+
+        return self._get('arp_time', lambda: 0.5*(self._pvp['TxTime'] + self._pvp['RcvTime']))
+
+    @property
+    def arp_pos(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The aperture reference point position, the midpoint of
+        the transmit and receive positions.
+        """
+
+        return self._get('arp_pos', lambda: 0.5*(self._pvp['TxPos'] + self._pvp['RcvPos']))
+
+    @property
+    def arp_vel(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The aperture reference point velocity. This requires the
+        `TxVel` and `RcvVel` parameters.
+        """
+
+        return self._get(
+            'arp_vel', lambda: 0.5*(self._get_velocity('TxVel') + self._get_velocity('RcvVel')))
+
+    @property
+    def range_xmt_srp(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The range from the transmit APC to the SRP.
+        """
+
+        return self._get(
+            'range_xmt_srp', lambda: numpy.linalg.norm(self._pvp['TxPos'] - self.srp_pos, axis=-1))
+
+    @property
+    def range_rcv_srp(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The range from the receive APC to the SRP.
+        """
+
+        return self._get(
+            'range_rcv_srp', lambda: numpy.linalg.norm(self._pvp['RcvPos'] - self.srp_pos, axis=-1))
+
+    @property
+    def range_rate_xmt_srp(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The rate of change of the transmit APC to SRP range.
+        """
+
+        return self.apc_parameters('Tx')['RangeRate']
+
+    @property
+    def range_rate_rcv_srp(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The rate of change of the receive APC to SRP range.
+        """
+
+        return self.apc_parameters('Rcv')['RangeRate']
+
+    @property
+    def reference_time(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The time at which the transmitted pulse reaches the SRP.
+        """
+
+        def compute():
+            r_xmt = self.range_xmt_srp
+            r_rcv = self.range_rcv_srp
+            tx_time = self._pvp['TxTime']
+            return tx_time + r_xmt/(r_xmt + r_rcv)*(self._pvp['RcvTime'] - tx_time)
+
+        return self._get('reference_time', compute)
+
+    @property
+    def afdop(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The Doppler scale factor, derived as in the `aFDOP` parameter.
+        """
+
+        return self._get(
+            'afdop',
+            lambda: (0.5*(self.range_rate_xmt_srp + self.range_rate_rcv_srp))*(-2/speed_of_light))
+
+    def apc_parameters(self, platform: str = 'ARP') -> Dict[str, numpy.ndarray]:
+        """
+        The standard geometry parameters for the given phase center, relative
+        to the SRP (CPHD 1.0.1, Section 6.5.2), for all vectors.
+
+        Parameters
+        ----------
+        platform : str
+            One of `'ARP'`, `'Tx'` or `'Rcv'`.
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            Keyed by `'Pos'`, `'Vel'`, `'SlantRange'`, `'RangeRate'`,
+            `'GroundRange'`, `'Look'` (+1 for left, -1 for right),
+            `'SideOfTrack'`, `'DopplerConeAngle'`, `'GrazeAngle'`,
+            `'IncidenceAngle'`, `'AzimuthAngle'`, `'TwistAngle'`,
+            `'SlopeAngle'` and `'LayoverAngle'`.
+        """
+
+        if platform not in _PLATFORMS:
+            raise ValueError('platform must be one of {}, got `{}`'.format(_PLATFORMS, platform))
+
+        def compute():
+            if platform == 'ARP':
+                position, velocity = self.arp_pos, self.arp_vel
+            else:
+                position = self._pvp['{}Pos'.format(platform)]
+                velocity = self._get_velocity('{}Vel'.format(platform))
+            srp = self.srp_pos
+            enu = self.srp_enu
+            with numpy.errstate(invalid='ignore', divide='ignore'):
+                slant_range = numpy.linalg.norm(position - srp, axis=-1)
+                u_los = (position - srp)/slant_range[:, numpy.newaxis]
+                range_rate = _dot(u_los, velocity)
+
+                uec_pos = _unit(position)
+                uec_srp = _unit(srp)
+                earth_angle = numpy.arccos(numpy.clip(_dot(uec_pos, uec_srp), -1, 1))
+                ground_range = numpy.linalg.norm(srp, axis=-1)*earth_angle
+
+                speed = numpy.linalg.norm(velocity, axis=-1)
+                u_vel = velocity/speed[:, numpy.newaxis]
+                left = numpy.cross(uec_pos, u_vel)
+                look = numpy.where(_dot(left, u_los) < 0, 1, -1)
+                dca = numpy.arccos(-range_rate/speed)
+
+                ugpz = enu['up']
+                ugpy = _unit(numpy.cross(ugpz, u_los))
+                ugpx = numpy.cross(ugpy, ugpz)
+                graze = numpy.arccos(numpy.clip(_dot(u_los, ugpx), -1, 1))
+                azimuth = numpy.arctan2(_dot(ugpx, enu['east']), _dot(ugpx, enu['north']))
+
+                uspn = _unit(look[:, numpy.newaxis]*numpy.cross(u_los, u_vel))
+                twist = -numpy.arcsin(_dot(uspn, ugpy))
+                slope = numpy.arccos(numpy.clip(_dot(ugpz, uspn), -1, 1))
+                layover = numpy.arctan2(_dot(-uspn, enu['east']), _dot(-uspn, enu['north']))
+
+            return {
+                'Pos': position,
+                'Vel': velocity,
+                'SlantRange': slant_range,
+                'RangeRate': range_rate,
+                'GroundRange': ground_range,
+                'Look': look,
+                'SideOfTrack': numpy.where(look == 1, 'L', 'R'),
+                'DopplerConeAngle': numpy.rad2deg(dca),
+                'GrazeAngle': numpy.rad2deg(graze),
+                'IncidenceAngle': 90 - numpy.rad2deg(graze),
+                'AzimuthAngle': numpy.rad2deg(azimuth) % 360,
+                'TwistAngle': numpy.rad2deg(twist),
+                'SlopeAngle': numpy.rad2deg(slope),
+                'LayoverAngle': numpy.rad2deg(layover) % 360}
+
+        return self._get(('apc', platform), compute)
+
+    @property
+    def slant_range(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The ARP to SRP range.
+        """
+
+        return self.apc_parameters('ARP')['SlantRange']
+
+    @property
+    def range_rate(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The rate of change of the ARP to SRP range.
+        """
+
+        return self.apc_parameters('ARP')['RangeRate']
+
+    @property
+    def ground_range(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The ground range from the ARP nadir to the SRP.
+        """
+
+        return self.apc_parameters('ARP')['GroundRange']
+
+    @property
+    def side_of_track(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The side of track, `'L'` or `'R'`, for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['SideOfTrack']
+
+    @property
+    def doppler_cone_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The Doppler cone angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['DopplerConeAngle']
+
+    @property
+    def graze_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The graze angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['GrazeAngle']
+
+    @property
+    def incidence_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The incidence angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['IncidenceAngle']
+
+    @property
+    def azimuth_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The azimuth angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['AzimuthAngle']
+
+    @property
+    def twist_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The twist angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['TwistAngle']
+
+    @property
+    def slope_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The slope angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['SlopeAngle']
+
+    @property
+    def layover_angle(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The layover angle for the ARP.
+        """
+
+        return self.apc_parameters('ARP')['LayoverAngle']
@@ -10,18 +10,30 @@ __author__ = "Thomas McCullough"
 import os
 from typing import Callable
 
-from sarpy.io.general.base import SarpyIOError, check_for_openers
+from sarpy.io.general.base import SarpyIOError, check_for_plugin_openers, \
+    OpenerManifestEntry, get_candidate_openers
 from sarpy.io.product.base import SIDDTypeReader
 
 ###########
 # Module variables
 _openers = []
+_plugin_openers = []
 _parsed_openers = False
+_manifest = (
+    OpenerManifestEntry(
+        'sarpy.io.product.sidd',
+        magic=(b'NITF', b'NSIF'),
+        extensions=('.nitf', '.ntf', '.nsf')),
+)
+"""
+The openers provided in `sarpy.io.product`, which are only imported when attempted.
+"""
 
 
 def register_opener(open_func: Callable) -> None:
     """
-    Provide a new opener.
+    Provide a new opener. Registered openers are attempted before the openers
+    provided in sarpy, so this may be used to override a provided reader.
 
     Parameters
     ----------
@@ -43,7 +55,9 @@ def register_opener(open_func: Callable) -> None:
 
 def parse_openers() -> None:
     """
-    Automatically find the viable openers (i.e. :func:`is_a`) in the various modules.
+    Find the openers provided by plug-ins, which are attempted after the
+    openers provided in sarpy. The openers provided in sarpy are declared in
+    the module manifest instead, and are only imported when attempted.
 
     Returns
     -------
@@ -55,7 +69,7 @@ def parse_openers() -> None:
         return
     _parsed_openers = True
 
-    check_for_openers('sarpy.io.product', register_opener)
+    check_for_plugin_openers('sarpy.io.product', _plugin_openers.append)
 
 
 def open_product(file_name: str) -> SIDDTypeReader:
@@ -80,7 +94,7 @@ def open_product(file_name: str) -> SIDDTypeReader:
     # parse openers, if not already done
     parse_openers()
     # see if we can find a reader though trial and error
-    for opener in _openers:
+    for opener in get_candidate_openers(file_name, _manifest, _openers, _plugin_openers):
         reader = opener(file_name)
         if reader is not None:
             return reader
@@ -490,7 +490,7 @@ class SIDDWritingDetails(NITFWritingDetails):
     __slots__ = (
         '_sidd_meta', '_sicd_meta', '_security_tags',
         '_sidd_security_tags', '_sicd_security_tags',
-        '_row_limit')
+        '_row_limit', '_compression', '_block_size')
 
     def __init__(
             self,
@@ -500,7 +500,9 @@ class SIDDWritingDetails(NITFWritingDetails):
             additional_des: Optional[Sequence[DESSubheaderManager]] = None,
             graphics_managers: Optional[Tuple[GraphicsSubheaderManager, ...]] = None,
             text_managers: Optional[Tuple[TextSubheaderManager, ...]] = None,
-            res_managers: Optional[Tuple[RESSubheaderManager, ...]] = None):
+            res_managers: Optional[Tuple[RESSubheaderManager, ...]] = None,
+            compression: Optional[str] = None,
+            block_size: int = 1024):
         """
 
         Parameters
@@ -514,8 +516,21 @@ class SIDDWritingDetails(NITFWritingDetails):
         graphics_managers: Optional[Tuple[GraphicsSubheaderManager, ...]]
         text_managers: Optional[Tuple[TextSubheaderManager, ...]]
         res_managers: Optional[Tuple[RESSubheaderManager, ...]]
+        compression : None|str
+            The image segment compression, one of `None` (uncompressed), `'C3'`
+            or `'M3'` (blocked jpeg, 8 bit pixel types only), or `'C8'` (jpeg 2000).
+        block_size : int
+            The image block size, in rows and columns, for jpeg compression.
         """
 
+        if compression not in (None, 'C3', 'M3', 'C8'):
+            raise ValueError('compression must be one of None, `C3`, `M3` or `C8`, got `{}`'.format(compression))
+        self._compression = compression
+        block_size = int(block_size)
+        if not (1 <= block_size <= 8192):
+            raise ValueError('block_size must be in the range [1, 8192], got {}'.format(block_size))
+        self._block_size = block_size
+
         self._sidd_meta = None
         self._sidd_security_tags = None
         self._set_sidd_meta(sidd_meta)
@@ -586,6 +601,14 @@ class SIDDWritingDetails(NITFWritingDetails):
     def row_limit(self) -> Tuple[int, ...]:
         return self._row_limit
 
+    @property
+    def compression(self) -> Optional[str]:
+        """
+        None|str: The image segment compression IC value, `None` if uncompressed.
+        """
+
+        return self._compression
+
     def _set_row_limit(self, value) -> None:
         if value is not None:
             if not isinstance(value, int):
@@ -737,7 +760,7 @@ class SIDDWritingDetails(NITFWritingDetails):
 
         basic_args = {
             'ICAT': 'SAR',
-            'IC': 'NC',
+            'IC': 'NC' if self.compression is None else self.compression,
             'IID2': self._get_iid2(sidd_index),
             'ISORCE': self._get_isorce(sidd_index),
             'IDATIM': self._get_collection_datetime(sidd_index)
@@ -767,6 +790,15 @@ class SIDDWritingDetails(NITFWritingDetails):
         else:
             raise ValueError('Unsupported PixelType {}'.format(sidd.Display.PixelType))
 
+        if self.compression in ['C3', 'M3']:
+            if basic_args['NBPP'] != 8:
+                raise ValueError(
+                    'jpeg compression requires an 8 bit PixelType, got {}'.format(sidd.Display.PixelType))
+            basic_args['COMRAT'] = '00.0'
+        elif self.compression == 'C8':
+            basic_args['IMODE'] = 'B'
+            basic_args['COMRAT'] = '\x20'*4  # populated on encoding
+
         rows = sidd.Measurement.PixelFootprint.Row
         cols = sidd.Measurement.PixelFootprint.Col
         icp = self._get_icp(sidd_index)
@@ -786,13 +818,22 @@ class SIDDWritingDetails(NITFWritingDetails):
 
             this_rows = entry[1]-entry[0]
             this_cols = entry[3]-entry[2]
+            if self.compression in ['C3', 'M3']:
+                block_args = {
+                    'NPPBH': min(this_cols, self._block_size),
+                    'NPPBV': min(this_rows, self._block_size),
+                    'NBPR': int(numpy.ceil(this_cols/self._block_size)),
+                    'NBPC': int(numpy.ceil(this_rows/self._block_size))}
+            else:
+                block_args = {
+                    'NPPBH': 0 if this_cols > 8192 else this_cols,
+                    'NPPBV': 0 if this_rows > 8192 else this_rows}
             subhead = ImageSegmentHeader(
                 IID1='SIDD{0:03d}{1:03d}'.format(sidd_index+1, i+1),
                 NROWS=this_rows,
                 NCOLS=this_cols,
                 IGEOLO=interpolate_corner_points_string(numpy.array(entry, dtype=numpy.int64), rows, cols, icp),
-                NPPBH=0 if this_cols > 8192 else this_cols,
-                NPPBV=0 if this_rows > 8192 else this_rows,
+                **block_args,
                 IDLVL=total_image_count,
                 IALVL=0 if i == 0 else (total_image_count - 1),
                 ILOC=iloc,
@@ -904,7 +945,9 @@ class SIDDWriter(NITFWriter):
             sicd_meta: Optional[Union[SICDType, Sequence[SICDType]]] = None,
             sidd_writing_details: Optional[SIDDWritingDetails] = None,
             check_existence: bool = True,
-            in_memory: bool = None):
+            in_memory: bool = None,
+            compression: Optional[str] = None,
+            **kwargs):
         """
 
         Parameters
@@ -917,14 +960,21 @@ class SIDDWriter(NITFWriter):
             Should we check if the given file already exists?
         in_memory : bool
             If True force in-memory writing, if False force file writing.
+        compression : None|str
+            The image segment compression, see :class:`SIDDWritingDetails`. This
+            is only used if `sidd_writing_details` is not provided.
+        kwargs
+            The compression options `max_workers`, `jpeg_quality` and `jpeg2000_ratio`,
+            see :class:`NITFWriter`.
         """
 
         if sidd_meta is None and sidd_writing_details is None:
             raise ValueError('One of sidd_meta or sidd_writing_details must be provided.')
         if sidd_writing_details is None:
-            sidd_writing_details = SIDDWritingDetails(sidd_meta, sicd_meta=sicd_meta)
+            sidd_writing_details = SIDDWritingDetails(sidd_meta, sicd_meta=sicd_meta, compression=compression)
         NITFWriter.__init__(
-            self, file_object, sidd_writing_details, check_existence=check_existence, in_memory=in_memory)
+            self, file_object, sidd_writing_details, check_existence=check_existence, in_memory=in_memory,
+            **kwargs)
 
     @property
     def nitf_writing_details(self) -> SIDDWritingDetails:
@@ -9,7 +9,6 @@ __author__ = "Thomas McCullough"
 import logging
 from typing import Union
 from collections import OrderedDict
-from copy import deepcopy
 
 from sarpy.io.xml.base import Serializable, parse_xml_from_file, parse_xml_from_string
 from sarpy.io.xml.descriptors import SerializableDescriptor
@@ -56,6 +55,7 @@ class SIDDType(Serializable):
         'DownstreamReprocessing', 'ErrorStatistics', 'Radiometric', 'ProductProcessing', 'Annotations')
     _required = (
         'ProductCreation', 'Display', 'GeographicAndTarget', 'Measurement', 'ExploitationFeatures')
+    _copy_reset = ('_coa_projection', )
     # Descriptor
     ProductCreation = SerializableDescriptor(
         'ProductCreation', ProductCreationType, _required, strict=DEFAULT_STRICT,
@@ -399,18 +399,21 @@ class SIDDType(Serializable):
     def to_xml_string(self, urn=None, tag='SIDD', check_validity=False, strict=DEFAULT_STRICT):
         return self.to_xml_bytes(urn=urn, tag=tag, check_validity=check_validity, strict=strict).decode('utf-8')
 
-    def copy(self):
+    def copy(self, copy_on_write=False):
         """
-        Provides a deep copy.
+        Provides a deep copy, including the NITF details.
+
+        Parameters
+        ----------
+        copy_on_write : bool
+            Share the child structures until first accessed? See :meth:`Serializable.copy`.
 
         Returns
         -------
         SIDDType
         """
 
-        out = super(SIDDType, self).copy()
-        out._NITF = deepcopy(self._NITF)
-        return out
+        return super(SIDDType, self).copy(copy_on_write=copy_on_write)
 
     @classmethod
     def from_xml_file(cls, file_path):
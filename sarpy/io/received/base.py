@@ -11,6 +11,7 @@ import numpy
 
 from sarpy.io.general.base import BaseReader
 from sarpy.io.general.data_segment import DataSegment
+from sarpy.io.phase_history.base import VectorIterator, VectorPredicate
 from sarpy.io.received.crsd1_elements.CRSD import CRSDType as CRSDType1_0
 
 
@@ -59,6 +60,45 @@ class CRSDTypeReader(BaseReader):
 
         return self._crsd_meta
 
+    def iterate_vectors(
+            self,
+            index: Union[int, str] = 0,
+            batch_size: int = 1024,
+            predicate: Optional[VectorPredicate] = None,
+            vector_range: Optional[Tuple[int, int]] = None,
+            raw: bool = False,
+            prefetch: bool = True) -> VectorIterator:
+        """
+        Gets an iterator over batches of `(vector_indices, pvp_array, signal_array)`
+        for the given channel, in vector order.
+
+        Parameters
+        ----------
+        index : int|str
+            The channel index or identifier.
+        batch_size : int
+            The number of vectors considered in each batch.
+        predicate : None|Callable
+            A function of the structured pvp array for a batch, which returns
+            a boolean array indicating which vectors are to be yielded. See
+            :func:`sarpy.io.phase_history.base.signal_normal` and
+            :func:`sarpy.io.phase_history.base.time_window`.
+        vector_range : None|Tuple[int, int]
+            The `(start, stop)` range of vectors to iterate over, defaults to all.
+        raw : bool
+            Yield the raw signal data, rather than formatted data?
+        prefetch : bool
+            Read the next batch on a background thread?
+
+        Returns
+        -------
+        VectorIterator
+        """
+
+        return VectorIterator(
+            self, index=index, batch_size=batch_size, predicate=predicate,
+            vector_range=vector_range, raw=raw, prefetch=prefetch)
+
     def read_support_array(self,
                            index: Union[int, str],
                            *ranges: Sequence[Union[None, int, Tuple[int, ...], slice]]) -> numpy.ndarray:
@@ -9,18 +9,27 @@ __author__ = "Thomas McCullough"
 import os
 from typing import Callable
 
-from sarpy.io.general.base import SarpyIOError, BaseReader, check_for_openers
+from sarpy.io.general.base import SarpyIOError, BaseReader, check_for_plugin_openers, \
+    OpenerManifestEntry, get_candidate_openers
 from sarpy.io.received.base import CRSDTypeReader
 
 ###########
 # Module variables
 _openers = []
+_plugin_openers = []
 _parsed_openers = False
+_manifest = (
+    OpenerManifestEntry('sarpy.io.received.crsd', magic=(b'CRSD', ), extensions=('.crsd', )),
+)
+"""
+The openers provided in `sarpy.io.received`, which are only imported when attempted.
+"""
 
 
 def register_opener(open_func: Callable) -> None:
     """
-    Provide a new opener.
+    Provide a new opener. Registered openers are attempted before the openers
+    provided in sarpy, so this may be used to override a provided reader.
 
     Parameters
     ----------
@@ -42,7 +51,9 @@ def register_opener(open_func: Callable) -> None:
 
 def parse_openers() -> None:
     """
-    Automatically find the viable openers (i.e. :func:`is_a`) in the various modules.
+    Find the openers provided by plug-ins, which are attempted after the
+    openers provided in sarpy. The openers provided in sarpy are declared in
+    the module manifest instead, and are only imported when attempted.
     """
 
     global _parsed_openers
@@ -50,7 +61,7 @@ def parse_openers() -> None:
         return
     _parsed_openers = True
 
-    check_for_openers('sarpy.io.received', register_opener)
+    check_for_plugin_openers('sarpy.io.received', _plugin_openers.append)
 
 
 def open_received(file_name: str) -> BaseReader:
@@ -75,7 +86,7 @@ def open_received(file_name: str) -> BaseReader:
     # parse openers, if not already done
     parse_openers()
     # see if we can find a reader though trial and error
-    for opener in _openers:
+    for opener in get_candidate_openers(file_name, _manifest, _openers, _plugin_openers):
         reader = opener(file_name)
         if reader is not None:
             return reader
@@ -771,7 +771,8 @@ class CRSDWriter1(CPHDWriter1):
             file_object: Union[str, BinaryIO],
             meta: Optional[CRSDType] = None,
             writing_details: Optional[CRSDWritingDetails] = None,
-            check_existence: bool = True):
+            check_existence: bool = True,
+            max_workers: Optional[int] = None):
         """
 
         Parameters
@@ -781,11 +782,14 @@ class CRSDWriter1(CPHDWriter1):
         writing_details : None|CRSDWritingDetails
         check_existence : bool
             Should we check if the given file already exists, and raises an exception if so?
+        max_workers : None|int
+            If provided, use positional writes with this many worker threads
+            for the block writing methods.
         """
 
         CPHDWriter1.__init__(
             self, file_object, meta=meta, writing_details=writing_details,
-            check_existence=check_existence)
+            check_existence=check_existence, max_workers=max_workers)
 
     @property
     def writing_details(self) -> CRSDWritingDetails:
@@ -13,7 +13,7 @@ import re
 from collections import OrderedDict
 from datetime    import date, datetime
 from io          import StringIO
-from typing      import Dict, Optional
+from typing      import Dict, Optional, Tuple
 from xml.etree   import ElementTree
 
 from sarpy.compliance import bytes_to_string
@@ -794,6 +794,273 @@ def parse_parameters_collection(value, name, instance):
                 name, instance.__class__.__name__, type(value)))
 
 
+##################
+# Compiled (de)serialization plans
+
+class _XMLReadPlan(object):
+    """
+    The deserialization plan for a given :class:`Serializable` class, xml
+    namespace, and namespace key. This is compiled from the class field
+    definitions, and permits the population of all child elements in a single
+    pass over the node children, with precomputed tags.
+    """
+
+    __slots__ = ('fields', 'errors', 'attributes', 'children', 'fallback')
+
+    def __init__(self, cls, xml_ns, ns_key):
+        self.fields = cls._fields
+        self.errors = {}  # attribute -> error message
+        self.attributes = {}  # attribute -> fetch tag, for xml attributes
+        self.children = {}  # child tag -> list of (attribute, is_list)
+        self.fallback = {}  # attribute -> (is_list, tag, xml_ns_key), for an unresolved namespace
+
+        for attribute in cls._fields:
+            base_tag_name = cls._tag_override.get(attribute, attribute)
+
+            # determine any expected xml namespace for the given entry
+            if attribute in cls._child_xml_ns_key:
+                xml_ns_key = cls._child_xml_ns_key[attribute]
+            else:
+                xml_ns_key = ns_key
+            # verify that the xml namespace will work
+            if xml_ns_key is not None:
+                if xml_ns is None:
+                    self.errors[attribute] = \
+                        'Attribute {} in class {} expects a xml namespace entry of {}, ' \
+                        'but xml_ns is None.'.format(attribute, cls, xml_ns_key)
+                    continue
+                elif xml_ns_key not in xml_ns:
+                    self.errors[attribute] = \
+                        'Attribute {} in class {} expects a xml namespace entry of {}, ' \
+                        'but xml_ns does not contain this key.'.format(attribute, cls, xml_ns_key)
+                    continue
+
+            if attribute in cls._set_as_attribute:
+                xml_ns_key = cls._child_xml_ns_key.get(attribute, None)
+                if xml_ns_key is not None:
+                    self.attributes[attribute] = '{' + xml_ns[xml_ns_key] + '}' + base_tag_name
+                else:
+                    self.attributes[attribute] = base_tag_name
+                continue
+
+            is_list = False
+            if attribute in cls._collections_tags:
+                array_tag = cls._collections_tags[attribute]
+                child_tag = array_tag.get('child_tag', None)
+                if not array_tag.get('array', False):
+                    if child_tag is None:
+                        self.errors[attribute] = \
+                            'Attribute {} in class {} is listed in the _collections_tags dictionary, but the ' \
+                            '`child_tag` value is either not populated or None.'.format(attribute, cls)
+                        continue
+                    is_list = True
+                    base_tag_name = child_tag
+
+            # this mirrors the tag resolution of find_first_child and find_children
+            if xml_ns is None:
+                fetch_tag = base_tag_name
+            else:
+                uri = xml_ns.get('default' if xml_ns_key is None else xml_ns_key, None)
+                if uri is None:
+                    self.fallback[attribute] = (is_list, base_tag_name, xml_ns_key)
+                    continue
+                fetch_tag = '{' + uri + '}' + base_tag_name
+            self.children.setdefault(fetch_tag, []).append((attribute, is_list))
+
+    def populate(self, node, xml_ns, kwargs):
+        """
+        Populate the kwargs dictionary with the xml attribute values and child
+        nodes, for all fields which are not already present.
+
+        Parameters
+        ----------
+        node : ElementTree.Element
+        xml_ns : None|dict
+        kwargs : dict
+        """
+
+        pending = [attribute for attribute in self.fields if attribute not in kwargs]
+        for attribute in pending:
+            if attribute in self.errors:
+                raise ValueError(self.errors[attribute])
+
+        found = {}
+        children = self.children
+        for child in node:
+            entries = children.get(child.tag, None)
+            if entries is None:
+                continue
+            for attribute, is_list in entries:
+                if is_list:
+                    if attribute in found:
+                        found[attribute].append(child)
+                    else:
+                        found[attribute] = [child, ]
+                elif attribute not in found:
+                    found[attribute] = child
+
+        for attribute in pending:
+            if attribute in self.attributes:
+                kwargs[attribute] = node.attrib.get(self.attributes[attribute], None)
+            elif attribute in self.fallback:
+                is_list, the_tag, xml_ns_key = self.fallback[attribute]
+                if is_list:
+                    cnodes = find_children(node, the_tag, xml_ns, xml_ns_key)
+                    kwargs[attribute] = cnodes if len(cnodes) > 0 else None
+                else:
+                    kwargs[attribute] = find_first_child(node, the_tag, xml_ns, xml_ns_key)
+            else:
+                kwargs[attribute] = found.get(attribute, None)
+
+
+_MAX_XML_READ_PLANS = 8
+
+
+def _get_xml_read_plan(cls, xml_ns, ns_key) -> _XMLReadPlan:
+    """
+    Gets the deserialization plan for the given class, xml namespace dictionary
+    and namespace key. The plans are cached on the class itself, for a limited
+    number of distinct namespaces.
+    """
+
+    plans = cls.__dict__.get('_xml_read_plans', None)
+    if plans is None:
+        plans = {}
+        cls._xml_read_plans = plans
+    key = (ns_key, None if xml_ns is None else tuple(xml_ns.items()))
+    plan = plans.get(key, None)
+    if plan is None:
+        plan = _XMLReadPlan(cls, xml_ns, ns_key)
+        if len(plans) >= _MAX_XML_READ_PLANS:
+            plans.clear()
+        plans[key] = plan
+    return plan
+
+
+def _get_xml_write_plan(cls) -> tuple:
+    """
+    Gets the serialization plan for the given class, which is cached on the class.
+    Each entry is of the form `(attribute, tag, set_as_attribute, xml_ns_key_override, collection_entry)`,
+    where `xml_ns_key_override` is `False` when there is no override.
+    """
+
+    plan = cls.__dict__.get('_xml_write_plan', None)
+    if plan is None:
+        plan = tuple(
+            (attribute,
+             cls._tag_override.get(attribute, attribute),
+             attribute in cls._set_as_attribute,
+             cls._child_xml_ns_key.get(attribute, False),
+             cls._collections_tags.get(attribute, None))
+            for attribute in cls._fields)
+        cls._xml_write_plan = plan
+    return plan
+
+
+##################
+# Structural copy and copy-on-write helpers
+
+_IMMUTABLE_TYPES = (str, bytes, int, float, complex, bool, numpy.generic, date, datetime, type)
+
+
+class _DeferredCopy(object):
+    """
+    A value in the instance dictionary of a copy-on-write copy of a
+    :class:`Serializable`, which refers to the unchanged value of the source.
+    The copy obtains its own version on first access through the descriptor.
+    """
+
+    __slots__ = ('value', )
+
+    def __init__(self, value):
+        self.value = value
+
+    def take(self):
+        return _copy_value(self.value)
+
+
+def _get_slot_names(the_type) -> tuple:
+    """
+    Gets the names of all slots defined for the given type.
+    """
+
+    names = []
+    for entry in the_type.__mro__:
+        slots = entry.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots, )
+        names.extend(name for name in slots if name not in ('__dict__', '__weakref__') and name not in names)
+    return tuple(names)
+
+
+def _copy_slotted(value):
+    """
+    Structural copy of an instance which defines __slots__, like
+    :class:`SerializableArray` and :class:`ParametersCollection`.
+    """
+
+    the_type = value.__class__
+    out = the_type.__new__(the_type)
+    for name in _get_slot_names(the_type):
+        try:
+            entry = getattr(value, name)
+        except AttributeError:
+            continue
+        object.__setattr__(out, name, _copy_value(entry))
+    if hasattr(value, '__dict__'):
+        for key, entry in value.__dict__.items():
+            out.__dict__[key] = _copy_value(entry)
+    return out
+
+
+def _copy_value(value):
+    """
+    Structural deep copy of a value from the state of a :class:`Serializable`.
+    """
+
+    if value is None or isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    elif isinstance(value, Serializable):
+        return value.copy()
+    elif isinstance(value, _DeferredCopy):
+        return value.take()
+    elif isinstance(value, numpy.ndarray):
+        if value.dtype.kind != 'O':
+            return value.copy()
+        out = numpy.empty(value.shape, dtype=value.dtype)
+        for index, entry in numpy.ndenumerate(value):
+            out[index] = _copy_value(entry)
+        return out
+    elif isinstance(value, (SerializableArray, ParametersCollection)):
+        return _copy_slotted(value)
+    elif value.__class__ is list:
+        return [_copy_value(entry) for entry in value]
+    elif value.__class__ is tuple:
+        return tuple(_copy_value(entry) for entry in value)
+    elif value.__class__ in (dict, OrderedDict):
+        return value.__class__((key, _copy_value(entry)) for key, entry in value.items())
+    else:
+        return copy.deepcopy(value)
+
+
+def _get_copy_plan(the_type) -> Tuple[frozenset, tuple]:
+    """
+    Gets the copy plan for the given :class:`Serializable` type, of the form
+    `(descriptor managed field names, slot names)`, which is cached on the class.
+    """
+
+    plan = the_type.__dict__.get('_copy_plan', None)
+    if plan is None:
+        # NB: imported here to avoid a circular import
+        from sarpy.io.xml.descriptors import BasicDescriptor
+        descriptor_fields = frozenset(
+            attribute for attribute in the_type._fields
+            if isinstance(getattr(the_type, attribute, None), BasicDescriptor))
+        plan = (descriptor_fields, _get_slot_names(the_type))
+        the_type._copy_plan = plan
+    return plan
+
+
 ##################
 # Main class defining structure
 
@@ -856,6 +1123,11 @@ class Serializable(object):
     The expected namespace key for attributes. No entry indicates the default namespace. 
     This is important for SIDD handling, but not required for SICD handling.
     """
+    _copy_reset = ()
+    """
+    Private attributes holding derived state, for example a cached projection,
+    which are reset to `None` instead of being copied by :func:`copy`.
+    """
 
     # NB: it may be good practice to use __slots__ to further control class functionality?
 
@@ -1123,21 +1395,6 @@ class Serializable(object):
                 'for class {}.'.format(node, cls))
             # return None
 
-        def handle_attribute(the_attribute, the_tag, the_xml_ns_key):
-            if the_xml_ns_key is not None:  # handle namespace, if necessary
-                fetch_tag = '{' + xml_ns[the_xml_ns_key] + '}' + the_tag
-            else:
-                fetch_tag = the_tag
-            kwargs[the_attribute] = node.attrib.get(fetch_tag, None)
-
-        def handle_single(the_attribute, the_tag, the_xml_ns_key):
-            kwargs[the_attribute] = find_first_child(node, the_tag, xml_ns, the_xml_ns_key)
-
-        def handle_list(attrib, ch_tag, the_xml_ns_key):
-            cnodes = find_children(node, ch_tag, xml_ns, the_xml_ns_key)
-            if len(cnodes) > 0:
-                kwargs[attrib] = cnodes
-
         if kwargs is None:
             kwargs = {}
         kwargs['_xml_ns'] = xml_ns
@@ -1147,51 +1404,11 @@ class Serializable(object):
             raise ValueError(
                 "Named input argument kwargs for class {} must be dictionary instance".format(cls))
 
-        for attribute in cls._fields:
-            if attribute in kwargs:
-                continue
-
-            kwargs[attribute] = None
-            # This value will be replaced if tags are present
-            # Note that we want to try explicitly setting to None to trigger descriptor behavior
-            # for required fields (warning or error)
-
-            base_tag_name = cls._tag_override.get(attribute, attribute)
-
-            # determine any expected xml namespace for the given entry
-            if attribute in cls._child_xml_ns_key:
-                xml_ns_key = cls._child_xml_ns_key[attribute]
-            else:
-                xml_ns_key = ns_key
-            # verify that the xml namespace will work
-            if xml_ns_key is not None:
-                if xml_ns is None:
-                    raise ValueError('Attribute {} in class {} expects a xml namespace entry of {}, '
-                                     'but xml_ns is None.'.format(attribute, cls, xml_ns_key))
-                elif xml_ns_key not in xml_ns:
-                    raise ValueError('Attribute {} in class {} expects a xml namespace entry of {}, '
-                                     'but xml_ns does not contain this key.'.format(attribute, cls, xml_ns_key))
-
-            if attribute in cls._set_as_attribute:
-                xml_ns_key = cls._child_xml_ns_key.get(attribute, None)
-                handle_attribute(attribute, base_tag_name, xml_ns_key)
-            elif attribute in cls._collections_tags:
-                # it's a collection type parameter
-                array_tag = cls._collections_tags[attribute]
-                array = array_tag.get('array', False)
-                child_tag = array_tag.get('child_tag', None)
-                if array:
-                    handle_single(attribute, base_tag_name, xml_ns_key)
-                elif child_tag is not None:
-                    handle_list(attribute, child_tag, xml_ns_key)
-                else:
-                    # the metadata is broken
-                    raise ValueError(
-                        'Attribute {} in class {} is listed in the _collections_tags dictionary, but the '
-                        '`child_tag` value is either not populated or None.'.format(attribute, cls))
-            else:
-                # it's a regular property
-                handle_single(attribute, base_tag_name, xml_ns_key)
+        # populate every field not already present in a single pass over the children,
+        # using the compiled plan for this class and namespace. Note that absent fields
+        # are explicitly set to None to trigger descriptor behavior for required fields
+        # (warning or error)
+        _get_xml_read_plan(cls, xml_ns, ns_key).populate(node, xml_ns, kwargs)
         return cls.from_dict(kwargs)
 
     def to_node(self, doc, tag, ns_key=None, parent=None, check_validity=False, strict=DEFAULT_STRICT, exclude=()):
@@ -1331,8 +1548,14 @@ class Serializable(object):
         else:
             nod = create_new_node(doc, tag, parent=parent)
 
-        # serialize the attributes
-        for attribute in self._fields:
+        # the namespace for any child without a specific namespace
+        child_xml_ns_key = getattr(self, '_xml_ns_key', ns_key)
+        if child_xml_ns_key == 'default':
+            child_xml_ns_key = None
+
+        # serialize the attributes, using the compiled plan for this class
+        for attribute, base_tag_name, set_as_attribute, xml_ns_key_override, array_tag in \
+                _get_xml_write_plan(self.__class__):
             if attribute in exclude:
                 continue
 
@@ -1340,21 +1563,14 @@ class Serializable(object):
             if value is None:
                 continue
             fmt_func = self._get_formatter(attribute)
-            base_tag_name = self._tag_override.get(attribute, attribute)
-            if attribute in self._set_as_attribute:
-                xml_ns_key = self._child_xml_ns_key.get(attribute, ns_key)
+            if set_as_attribute:
+                xml_ns_key = ns_key if xml_ns_key_override is False else xml_ns_key_override
                 serialize_attribute(nod, base_tag_name, value, fmt_func, xml_ns_key)
             else:
                 # should we be using some namespace?
-                if attribute in self._child_xml_ns_key:
-                    xml_ns_key = self._child_xml_ns_key[attribute]
-                else:
-                    xml_ns_key = getattr(self, '_xml_ns_key', ns_key)
-                    if xml_ns_key == 'default':
-                        xml_ns_key = None
+                xml_ns_key = child_xml_ns_key if xml_ns_key_override is False else xml_ns_key_override
 
                 if isinstance(value, (numpy.ndarray, list)):
-                    array_tag = self._collections_tags.get(attribute, None)
                     if array_tag is None:
                         raise AttributeError(
                             'The value associated with attribute {} in an instance of class {} is of type {}, '
@@ -1506,16 +1722,47 @@ class Serializable(object):
                 out[attribute] = serialize_plain(attribute, value)
         return out
 
-    def copy(self):
+    def copy(self, copy_on_write=False):
         """
-        Create a deep copy.
+        Create a deep copy. This is a direct structural copy of the instance
+        state, so child objects and numpy arrays are copied without
+        serialization.
+
+        Parameters
+        ----------
+        copy_on_write : bool
+            If `True`, then the child :class:`Serializable` and :class:`SerializableArray`
+            fields of the copy are only copied from this instance on first access
+            from the copy. Subtrees which are never accessed, or which are replaced,
+            are never copied. This instance is not modified, but it must not be
+            modified while the copy is in use, since any change would be visible
+            in the copy's subtrees which have not yet been accessed.
 
         Returns
         -------
-
+        Serializable
         """
 
-        return self.__class__.from_dict(copy.deepcopy(self.to_dict(check_validity=False)))
+        the_type = self.__class__
+        descriptor_fields, slot_names = _get_copy_plan(the_type)
+        out = the_type.__new__(the_type)
+        out_dict = out.__dict__
+        for key, value in self.__dict__.items():
+            if key in self._copy_reset:
+                out_dict[key] = None
+            elif copy_on_write and key in descriptor_fields and \
+                    isinstance(value, (Serializable, SerializableArray, _DeferredCopy)):
+                # a deferred copy never changes, so it can be shared with our own
+                out_dict[key] = value if isinstance(value, _DeferredCopy) else _DeferredCopy(value)
+            else:
+                out_dict[key] = _copy_value(value)
+        for name in slot_names:
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            object.__setattr__(out, name, None if name in self._copy_reset else _copy_value(value))
+        return out
 
     def to_xml_bytes(self, urn=None, tag=None, check_validity=False, strict=DEFAULT_STRICT):
         """
@@ -1555,7 +1802,9 @@ class Serializable(object):
                 node.attrib[key] = urn[key]
         else:
             raise TypeError('Expected string or dictionary of string for urn, got type {}'.format(type(urn)))
-        return ElementTree.tostring(node, encoding='utf-8', method='xml')
+        # NB: serializing to str and then encoding is equivalent, and much faster
+        #   than the incremental encoding performed for encoding='utf-8'
+        return ElementTree.tostring(node, encoding='unicode', method='xml').encode('utf-8')
 
     def to_xml_string(self, urn=None, tag=None, check_validity=False, strict=DEFAULT_STRICT):
         """
@@ -8,13 +8,12 @@ __author__ = "Thomas McCullough"
 import logging
 import re
 from xml.etree import ElementTree
-from weakref import WeakKeyDictionary
 
 import numpy
 from numpy.linalg import norm
 
 from sarpy.io.xml.base import DEFAULT_STRICT, get_node_value, find_children, \
-    Arrayable, ParametersCollection, SerializableArray, \
+    Arrayable, ParametersCollection, SerializableArray, _DeferredCopy, \
     parse_str, parse_bool, parse_int, parse_float, parse_complex, parse_datetime, \
     parse_serializable, parse_serializable_list
 
@@ -25,14 +24,54 @@ _length_text = 'Specified minimum length is `{}`,\n\t' \
 _type_text = 'Field {} of class {} got incompatible type {}.'
 
 
+class _InstanceStorage(object):
+    """
+    Dictionary-like access, keyed by instance, to the value of a descriptor. The
+    value is stored in the `__dict__` of the instance, under the attribute name
+    of the descriptor. Since the descriptor is a data descriptor, this entry is
+    never directly visible via attribute access, and the value shares the
+    lifetime of the instance.
+    """
+
+    __slots__ = ('key', )
+
+    def __init__(self, key):
+        self.key = key
+
+    def get(self, instance, default=None):
+        value = instance.__dict__.get(self.key, default)
+        if value.__class__ is _DeferredCopy:
+            # a copy-on-write value, so obtain our own copy
+            value = value.take()
+            instance.__dict__[self.key] = value
+        return value
+
+    def __getitem__(self, instance):
+        if self.key not in instance.__dict__:
+            raise KeyError(self.key)
+        return self.get(instance)
+
+    def __setitem__(self, instance, value):
+        instance.__dict__[self.key] = value
+
+    def __delitem__(self, instance):
+        del instance.__dict__[self.key]
+
+    def __contains__(self, instance):
+        return self.key in instance.__dict__
+
+
 class BasicDescriptor(object):
-    """A descriptor object for reusable properties. Note that it is required that the calling instance is hashable."""
+    """
+    A descriptor object for reusable properties. The value for a given instance
+    is stored in the `__dict__` of that instance.
+    """
     _typ_string = None
 
     def __init__(self, name, required, strict=DEFAULT_STRICT, default_value=None, docstring=''):
-        self.data = WeakKeyDictionary()  # our instance reference dictionary
-        # WeakDictionary use is subtle here. A reference to a particular class instance in this dictionary
-        # should not be the thing keeping a particular class instance from being destroyed.
+        self.data = _InstanceStorage(name)  # our instance value access
+        # NB: the storage key is replaced by the attribute name in __set_name__, since
+        #   the attribute name and descriptor name may not agree
         self.name = name
         self.required = (name in required)
         self.strict = strict
@@ -87,6 +126,9 @@ class BasicDescriptor(object):
     def _docstring_suffix(self):
         return None
 
+    def __set_name__(self, owner, name):
+        self.data.key = name
+
     def __get__(self, instance, owner):
         """The getter.
 
@@ -107,7 +149,9 @@ class BasicDescriptor(object):
             # this has been access on the class, so return the class
             return self
 
-        fetched = self.data.get(instance, self.default_value)
+        fetched = instance.__dict__.get(self.data.key, self.default_value)
+        if fetched.__class__ is _DeferredCopy:
+            fetched = self.data.get(instance)
         if fetched is not None or not self.required:
             return fetched
         else:
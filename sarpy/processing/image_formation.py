@@ -0,0 +1,1184 @@
+"""
+Basic image formation from FX domain CPHD phase history data.
+
+This provides a chunked, vectorized time domain backprojection processor and a
+polar format (PFA) processor, both of which stream the signal and per vector
+parameter (PVP) arrays from a CPHD version 1.x reader, and populate the
+corresponding SICD structure for the formed image.
+
+These are reference implementations, intended for modest collection sizes,
+simulation studies, and testing. Both assume a spotlight style collection about
+a (nearly) stationary stabilization reference point (SRP), and form the image
+in the ground plane tangent to the WGS-84 ellipsoid at the SRP.
+
+Examples
+--------
+.. code-block:: python
+
+    from sarpy.io.phase_history.cphd import CPHDReader
+    from sarpy.processing.image_formation import create_sicd_from_cphd
+
+    reader = CPHDReader('<path to cphd file>')
+    # form the image and write the sicd file
+    create_sicd_from_cphd(reader, output_file='<path to sicd file>', algorithm='PFA')
+    # or form the image in memory
+    sicd_reader = create_sicd_from_cphd(reader, algorithm='BP', max_workers=4)
+    image = sicd_reader[:, :]
+"""
+
+__classification__ = "UNCLASSIFIED"
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Union, Optional, Tuple, Dict
+
+import numpy
+from numpy.polynomial import polynomial
+from scipy.constants import speed_of_light
+from scipy.fft import fft, ifft, fft2, ifft2, next_fast_len
+from scipy.signal import resample
+
+from sarpy.__about__ import __version__
+from sarpy.geometry.geocoords import wgs_84_norm
+from sarpy.io.complex.base import FlatSICDReader
+from sarpy.io.complex.sicd import SICDWriter
+from sarpy.io.complex.utils import fit_position_xvalidation
+from sarpy.io.complex.sicd_elements.blocks import XYZPolyType, POLARIZATION2_VALUES
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.io.complex.sicd_elements.CollectionInfo import CollectionInfoType, RadarModeType
+from sarpy.io.complex.sicd_elements.ImageCreation import ImageCreationType
+from sarpy.io.complex.sicd_elements.ImageData import ImageDataType
+from sarpy.io.complex.sicd_elements.GeoData import GeoDataType, SCPType
+from sarpy.io.complex.sicd_elements.Position import PositionType
+from sarpy.io.complex.sicd_elements.Grid import GridType, DirParamType, WgtTypeType
+from sarpy.io.complex.sicd_elements.RadarCollection import RadarCollectionType, ChanParametersType, \
+    AreaType, ReferencePlaneType, ReferencePointType, XDirectionType, YDirectionType
+from sarpy.io.complex.sicd_elements.Timeline import TimelineType, IPPSetType
+from sarpy.io.complex.sicd_elements.ImageFormation import ImageFormationType, \
+    RcvChanProcType, ProcessingType
+from sarpy.io.complex.sicd_elements.PFA import PFAType
+from sarpy.io.general.utils import get_worker_count
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDReader1
+from sarpy.processing.sicd import windows
+
+logger = logging.getLogger(__name__)
+
+_ALGORITHMS = ('PFA', 'BP')
+# the maximum number of (vector, pixel) elements considered in a single vectorized step
+_BLOCK_ELEMENTS = 2**20
+_WEIGHT_FUNCTION_SIZE = 64
+
+
+#################
+# helper functions
+
+def _unit(vectors: numpy.ndarray) -> numpy.ndarray:
+    return vectors/numpy.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def _validate_reader(reader: Union[str, CPHDReader1], index: Union[int, str]) -> Tuple[CPHDReader1, int]:
+    """
+    Validate the reader and channel index for image formation.
+
+    Parameters
+    ----------
+    reader : str|CPHDReader1
+    index : int|str
+
+    Returns
+    -------
+    reader : CPHDReader1
+    index : int
+    """
+
+    if isinstance(reader, str):
+        reader = CPHDReader(reader)
+    if not isinstance(reader, CPHDReader1):
+        raise TypeError('Image formation requires a CPHD version 1.x reader, got type {}'.format(type(reader)))
+    if reader.cphd_meta.Global.DomainType != 'FX':
+        raise ValueError(
+            'Image formation requires FX domain CPHD data, got domain type {}'.format(
+                reader.cphd_meta.Global.DomainType))
+    # noinspection PyProtectedMember
+    return reader, reader._validate_index(index)
+
+
+def _get_signal_weights(
+        window: str,
+        window_parameters: Optional[Dict[str, Union[str, float]]],
+        size: int) -> Optional[numpy.ndarray]:
+    if window.upper() == 'UNIFORM':
+        return None
+    return windows.get_window(window, size, parameters=window_parameters, copy=False)
+
+
+def _get_k_space_coefficients(
+        tx_pos: numpy.ndarray,
+        rcv_pos: numpy.ndarray,
+        srp_pos: numpy.ndarray,
+        u_row: numpy.ndarray,
+        u_col: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """
+    Gets the per vector coefficients relating radar frequency to spatial
+    frequency in the image plane, so that the spatial frequency of the sample
+    at frequency `f` is :math:`(f\\cdot a, f\\cdot b)`.
+
+    Parameters
+    ----------
+    tx_pos : numpy.ndarray
+    rcv_pos : numpy.ndarray
+    srp_pos : numpy.ndarray
+    u_row : numpy.ndarray
+    u_col : numpy.ndarray
+
+    Returns
+    -------
+    a : numpy.ndarray
+    b : numpy.ndarray
+    """
+
+    bisector = -(_unit(tx_pos - srp_pos) + _unit(rcv_pos - srp_pos))/speed_of_light
+    return bisector.dot(u_row), bisector.dot(u_col)
+
+
+def _get_time_delays(
+        points: numpy.ndarray,
+        tx_pos: numpy.ndarray,
+        rcv_pos: numpy.ndarray,
+        reference_range: numpy.ndarray,
+        monostatic: bool) -> numpy.ndarray:
+    """
+    Gets the time delay of each point, relative to the SRP, for each vector.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Of shape `(P, 3)`.
+    tx_pos : numpy.ndarray
+        Of shape `(V, 3)`.
+    rcv_pos : numpy.ndarray
+        Of shape `(V, 3)`.
+    reference_range : numpy.ndarray
+        The two way range to the SRP, of shape `(V, )`.
+    monostatic : bool
+        Are the transmit and receive positions identical?
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(V, P)`.
+    """
+
+    def get_range(positions):
+        out = numpy.zeros((positions.shape[0], points.shape[0]), dtype='float64')
+        for i in range(3):
+            out += numpy.square(points[None, :, i] - positions[:, i, None])
+        return numpy.sqrt(out, out=out)
+
+    tx_range = get_range(tx_pos)
+    two_way = 2*tx_range if monostatic else tx_range + get_range(rcv_pos)
+    two_way -= reference_range[:, None]
+    two_way /= speed_of_light
+    return two_way
+
+
+class _VectorGeometry(object):
+    """
+    The collection geometry for a block of vectors.
+    """
+
+    __slots__ = (
+        'tx_pos', 'rcv_pos', 'srp_pos', 'sc0', 'scss', 'times', 'arp_pos', 'arp_vel', 'monostatic')
+
+    def __init__(self, pvp: numpy.ndarray):
+        self.tx_pos = pvp['TxPos']  # type: numpy.ndarray
+        self.rcv_pos = pvp['RcvPos']  # type: numpy.ndarray
+        self.srp_pos = pvp['SRPPos']  # type: numpy.ndarray
+        self.sc0 = pvp['SC0']  # type: numpy.ndarray
+        self.scss = pvp['SCSS']  # type: numpy.ndarray
+        self.times = 0.5*(pvp['TxTime'] + pvp['RcvTime'])  # type: numpy.ndarray
+        self.arp_pos = 0.5*(self.tx_pos + self.rcv_pos)  # type: numpy.ndarray
+        self.arp_vel = 0.5*(pvp['TxVel'] + pvp['RcvVel'])  # type: numpy.ndarray
+        self.monostatic = bool(numpy.all(self.tx_pos == self.rcv_pos))  # type: bool
+
+    @property
+    def reference_range(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The two way range to the SRP for each vector.
+        """
+
+        return numpy.linalg.norm(self.tx_pos - self.srp_pos, axis=1) + \
+            numpy.linalg.norm(self.rcv_pos - self.srp_pos, axis=1)
+
+
+#################
+# image grid definition
+
+class ImageGrid(object):
+    """
+    The definition of the planar output image grid. The image plane contains
+    the scene center point (SCP), with row and column unit vectors `u_row` and
+    `u_col`, and the SCP is located at pixel `scp_pixel`.
+    """
+
+    __slots__ = (
+        '_scp', '_u_row', '_u_col', '_row_ss', '_col_ss', '_num_rows', '_num_cols', '_scp_pixel')
+
+    def __init__(
+            self,
+            scp: numpy.ndarray,
+            u_row: numpy.ndarray,
+            u_col: numpy.ndarray,
+            row_ss: float,
+            col_ss: float,
+            num_rows: int,
+            num_cols: int,
+            scp_pixel: Optional[Tuple[int, int]] = None):
+        """
+
+        Parameters
+        ----------
+        scp : numpy.ndarray|list|tuple
+            The ECF coordinates of the scene center point.
+        u_row : numpy.ndarray|list|tuple
+            The row direction unit vector.
+        u_col : numpy.ndarray|list|tuple
+            The column direction unit vector, which should be orthogonal to `u_row`.
+        row_ss : float
+            The row sample spacing in meters.
+        col_ss : float
+            The column sample spacing in meters.
+        num_rows : int
+        num_cols : int
+        scp_pixel : None|Tuple[int, int]
+            Defaults to the center of the image.
+        """
+
+        self._scp = numpy.array(scp, dtype='float64')
+        self._u_row = _unit(numpy.array(u_row, dtype='float64'))
+        self._u_col = _unit(numpy.array(u_col, dtype='float64'))
+        if self._scp.shape != (3, ) or self._u_row.shape != (3, ) or self._u_col.shape != (3, ):
+            raise ValueError('scp, u_row, and u_col must each be three element vectors')
+        if abs(self._u_row.dot(self._u_col)) > 1e-6:
+            raise ValueError('u_row and u_col must be orthogonal')
+        self._row_ss = float(row_ss)
+        self._col_ss = float(col_ss)
+        if self._row_ss <= 0 or self._col_ss <= 0:
+            raise ValueError('Sample spacings must be positive, got ({}, {})'.format(row_ss, col_ss))
+        self._num_rows = int(num_rows)
+        self._num_cols = int(num_cols)
+        if self._num_rows < 1 or self._num_cols < 1:
+            raise ValueError('Image size must be positive, got ({}, {})'.format(num_rows, num_cols))
+        if scp_pixel is None:
+            scp_pixel = (self._num_rows//2, self._num_cols//2)
+        self._scp_pixel = (int(scp_pixel[0]), int(scp_pixel[1]))
+
+    @property
+    def scp(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The scene center point ECF coordinates.
+        """
+
+        return self._scp
+
+    @property
+    def u_row(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The row direction unit vector.
+        """
+
+        return self._u_row
+
+    @property
+    def u_col(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The column direction unit vector.
+        """
+
+        return self._u_col
+
+    @property
+    def normal(self) -> numpy.ndarray:
+        """
+        numpy.ndarray: The image plane unit normal, `u_row x u_col`.
+        """
+
+        return _unit(numpy.cross(self._u_row, self._u_col))
+
+    @property
+    def row_ss(self) -> float:
+        """
+        float: The row sample spacing.
+        """
+
+        return self._row_ss
+
+    @property
+    def col_ss(self) -> float:
+        """
+        float: The column sample spacing.
+        """
+
+        return self._col_ss
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """
+        Tuple[int, int]: The image size.
+        """
+
+        return self._num_rows, self._num_cols
+
+    @property
+    def scp_pixel(self) -> Tuple[int, int]:
+        """
+        Tuple[int, int]: The scp pixel location.
+        """
+
+        return self._scp_pixel
+
+    def get_plane_coordinates(
+            self,
+            row_range: Tuple[int, int],
+            col_range: Tuple[int, int]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Gets the image plane coordinates, relative to the SCP, of the given
+        block of pixels.
+
+        Parameters
+        ----------
+        row_range : Tuple[int, int]
+        col_range : Tuple[int, int]
+
+        Returns
+        -------
+        x : numpy.ndarray
+            The row coordinate of shape `(rows, )`.
+        y : numpy.ndarray
+            The column coordinate of shape `(cols, )`.
+        """
+
+        x = (numpy.arange(*row_range) - self._scp_pixel[0])*self._row_ss
+        y = (numpy.arange(*col_range) - self._scp_pixel[1])*self._col_ss
+        return x, y
+
+    def get_ecf_coordinates(
+            self,
+            row_range: Tuple[int, int],
+            col_range: Tuple[int, int]) -> numpy.ndarray:
+        """
+        Gets the ECF coordinates of the given block of pixels.
+
+        Parameters
+        ----------
+        row_range : Tuple[int, int]
+        col_range : Tuple[int, int]
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `(rows, cols, 3)`.
+        """
+
+        x, y = self.get_plane_coordinates(row_range, col_range)
+        return self._scp + x[:, None, None]*self._u_row + y[None, :, None]*self._u_col
+
+
+class _KSpaceExtent(object):
+    """
+    The spatial frequency support of the collection in the image plane, and
+    the inscribed rectangle used for image formation.
+    """
+
+    __slots__ = ('a', 'b', 'kr_bounds', 'kc_bounds')
+
+    def __init__(self, geometry: _VectorGeometry, num_samples: int, image_grid: ImageGrid):
+        self.a, self.b = _get_k_space_coefficients(
+            geometry.tx_pos, geometry.rcv_pos, geometry.srp_pos, image_grid.u_row, image_grid.u_col)
+        if numpy.any(self.a <= 0):
+            raise ValueError(
+                'The image row direction must point away from the radar for every vector')
+        kr_first = geometry.sc0*self.a
+        kr_last = (geometry.sc0 + (num_samples - 1)*geometry.scss)*self.a
+        kr_min = float(numpy.max(numpy.minimum(kr_first, kr_last)))
+        kr_max = float(numpy.min(numpy.maximum(kr_first, kr_last)))
+        if kr_min >= kr_max:
+            raise ValueError('The collection has no common range spatial frequency support')
+        tan_theta = self.b/self.a
+        t_min = float(tan_theta.min())
+        t_max = float(tan_theta.max())
+        self.kr_bounds = (kr_min, kr_max)  # type: Tuple[float, float]
+        self.kc_bounds = (max(kr_min*t_min, kr_max*t_min), min(kr_min*t_max, kr_max*t_max))  # type: Tuple[float, float]
+
+    @property
+    def row_bandwidth(self) -> float:
+        return self.kr_bounds[1] - self.kr_bounds[0]
+
+    @property
+    def col_bandwidth(self) -> float:
+        return self.kc_bounds[1] - self.kc_bounds[0]
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return 0.5*sum(self.kr_bounds), 0.5*sum(self.kc_bounds)
+
+
+def get_default_image_grid(
+        reader: Union[str, CPHDReader1],
+        index: Union[int, str] = 0,
+        oversample: float = 1.25,
+        num_rows: Optional[int] = None,
+        num_cols: Optional[int] = None) -> ImageGrid:
+    """
+    Gets the default ground plane image grid for the given CPHD channel. The SCP
+    is the SRP of the channel reference vector, the row direction is the ground
+    plane projection of the range direction at that vector, and the sample
+    spacings are the inverse of the oversampled spatial frequency bandwidths.
+    The default size spans the unambiguous scene extent.
+
+    Parameters
+    ----------
+    reader : str|CPHDReader1
+    index : int|str
+        The CPHD channel index or identifier.
+    oversample : float
+        The oversample factor relative to the Nyquist sample spacing, at least 1.
+    num_rows : None|int
+    num_cols : None|int
+
+    Returns
+    -------
+    ImageGrid
+    """
+
+    reader, index = _validate_reader(reader, index)
+    oversample = float(oversample)
+    if oversample < 1:
+        raise ValueError('oversample must be at least 1, got {}'.format(oversample))
+
+    cphd_meta = reader.cphd_meta
+    channel = cphd_meta.Data.Channels[index]
+    ref_index = cphd_meta.Channel.Parameters[index].RefVectorIndex
+    geometry = _VectorGeometry(reader.read_pvp_array(index))
+
+    scp = geometry.srp_pos[ref_index]
+    normal = wgs_84_norm(scp)
+    look = -(_unit(geometry.tx_pos[ref_index] - scp) + _unit(geometry.rcv_pos[ref_index] - scp))
+    u_row = _unit(look - look.dot(normal)*normal)
+    u_col = numpy.cross(normal, u_row)
+    grid = ImageGrid(scp, u_row, u_col, 1., 1., 1, 1)
+
+    extent = _KSpaceExtent(geometry, channel.NumSamples, grid)
+    row_ss = 1./(oversample*extent.row_bandwidth)
+    col_ss = 1./(oversample*extent.col_bandwidth)
+    if num_rows is None:
+        row_step = numpy.max(numpy.abs(geometry.scss*extent.a))
+        num_rows = int(numpy.ceil(1./(row_step*row_ss)))
+    if num_cols is None:
+        col_step = numpy.max(numpy.abs(numpy.diff(extent.b/extent.a)))*extent.center[0] \
+            if channel.NumVectors > 1 else extent.col_bandwidth
+        num_cols = int(numpy.ceil(1./(col_step*col_ss)))
+    return ImageGrid(scp, u_row, u_col, row_ss, col_ss, num_rows, num_cols)
+
+
+#################
+# simulation
+
+def synthesize_point_targets(
+        pvp: numpy.ndarray,
+        num_samples: int,
+        targets: numpy.ndarray,
+        amplitudes: Optional[numpy.ndarray] = None,
+        sgn: int = -1,
+        dtype: Union[str, numpy.dtype] = 'complex64') -> numpy.ndarray:
+    """
+    Synthesizes the FX domain signal array for a collection of ideal point
+    targets, following the CPHD phase convention for signal sign `sgn`.
+
+    Parameters
+    ----------
+    pvp : numpy.ndarray
+        The structured per vector parameter array.
+    num_samples : int
+    targets : numpy.ndarray
+        The ECF coordinates of the targets, of shape `(3, )` or `(N, 3)`.
+    amplitudes : None|numpy.ndarray
+        The complex amplitudes of the targets, defaults to 1.
+    sgn : int
+        The phase sign convention, one of `{-1, 1}`.
+    dtype : str|numpy.dtype
+
+    Returns
+    -------
+    numpy.ndarray
+        Of shape `(num_vectors, num_samples)`.
+    """
+
+    if sgn not in [-1, 1]:
+        raise ValueError('sgn must be one of -1 or 1, got {}'.format(sgn))
+    targets = numpy.reshape(numpy.asarray(targets, dtype='float64'), (-1, 3))
+    amplitudes = numpy.ones((targets.shape[0], ), dtype='complex128') if amplitudes is None else \
+        numpy.reshape(numpy.asarray(amplitudes, dtype='complex128'), (-1, ))
+    if amplitudes.size != targets.shape[0]:
+        raise ValueError('Got {} amplitudes for {} targets'.format(amplitudes.size, targets.shape[0]))
+
+    geometry = _VectorGeometry(pvp)
+    delays = _get_time_delays(
+        targets, geometry.tx_pos, geometry.rcv_pos, geometry.reference_range, geometry.monostatic)
+    frequencies = geometry.sc0[:, None] + numpy.arange(num_samples)[None, :]*geometry.scss[:, None]
+    out = numpy.zeros((pvp.shape[0], num_samples), dtype='complex128')
+    for delay, amplitude in zip(delays.T, amplitudes):
+        out += amplitude*numpy.exp(sgn*2j*numpy.pi*frequencies*delay[:, None])
+    return out.astype(dtype)
+
+
+#################
+# backprojection
+
+def _backproject_tile(
+        image: numpy.ndarray,
+        points: numpy.ndarray,
+        profiles: numpy.ndarray,
+        geometry: _VectorGeometry,
+        reference_range: numpy.ndarray,
+        sgn: int) -> None:
+    """
+    Accumulates the contribution of a block of range profiles into an image tile.
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        The image tile of shape `(rows, cols)`, modified in place.
+    points : numpy.ndarray
+        The ECF coordinates of shape `(rows*cols, 3)`.
+    profiles : numpy.ndarray
+        The upsampled range profiles of shape `(V, N)`.
+    geometry : _VectorGeometry
+    reference_range : numpy.ndarray
+    sgn : int
+    """
+
+    num_vectors, fft_size = profiles.shape
+    step = max(1, _BLOCK_ELEMENTS//points.shape[0])
+    accumulated = numpy.zeros((points.shape[0], ), dtype='complex128')
+    for start in range(0, num_vectors, step):
+        the_slice = slice(start, min(start + step, num_vectors))
+        delays = _get_time_delays(
+            points, geometry.tx_pos[the_slice], geometry.rcv_pos[the_slice],
+            reference_range[the_slice], geometry.monostatic)
+        position = delays*(fft_size*geometry.scss[the_slice, None])
+        numpy.mod(position, fft_size, out=position)
+        lower = position.astype('int64')
+        fraction = position - lower
+        upper = lower + 1
+        upper[upper == fft_size] = 0
+        block = profiles[the_slice]
+        values = numpy.take_along_axis(block, lower, axis=1)
+        values += fraction*(numpy.take_along_axis(block, upper, axis=1) - values)
+        values *= numpy.exp((-sgn*2j*numpy.pi)*geometry.sc0[the_slice, None]*delays)
+        accumulated += values.sum(axis=0)
+    image += numpy.reshape(accumulated, image.shape)
+
+
+def backproject(
+        reader: Union[str, CPHDReader1],
+        image_grid: Optional[ImageGrid] = None,
+        index: Union[int, str] = 0,
+        window: str = 'UNIFORM',
+        window_parameters: Optional[Dict[str, Union[str, float]]] = None,
+        vector_block_size: int = 256,
+        tile_size: int = 128,
+        upsample: int = 8,
+        max_workers: Optional[int] = None) -> numpy.ndarray:
+    """
+    Forms the image on the given grid by time domain backprojection.
+
+    The signal is streamed from the reader in blocks of vectors. Each block is
+    range compressed to upsampled range profiles, and the image tiles are
+    updated in parallel using a thread pool, with linear interpolation of the
+    upsampled range profiles.
+
+    The resulting image is normalized so that an ideal unit point target has
+    unit peak magnitude, and is demodulated so that the image spatial frequency
+    support is centered at zero.
+
+    Parameters
+    ----------
+    reader : str|CPHDReader1
+    image_grid : None|ImageGrid
+        Defaults to :func:`get_default_image_grid`.
+    index : int|str
+        The CPHD channel index or identifier.
+    window : str
+        The name of the separable weighting window, see :func:`sarpy.processing.sicd.windows.get_window`.
+    window_parameters : None|dict
+    vector_block_size : int
+        The number of vectors read and range compressed at once.
+    tile_size : int
+        The size of the square image tiles processed by each task.
+    upsample : int
+        The range profile upsample factor.
+    max_workers : None|int
+        The maximum number of worker threads. `None` uses the
+        :class:`concurrent.futures.ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    reader, index = _validate_reader(reader, index)
+    if image_grid is None:
+        image_grid = get_default_image_grid(reader, index=index)
+    worker_count = get_worker_count(max_workers)
+    tile_size = int(tile_size)
+    if tile_size < 1:
+        raise ValueError('tile_size must be a positive integer, got {}'.format(tile_size))
+    upsample = int(upsample)
+    if upsample < 1:
+        raise ValueError('upsample must be a positive integer, got {}'.format(upsample))
+
+    sgn = reader.cphd_meta.Global.SGN
+    channel = reader.cphd_meta.Data.Channels[index]
+    num_vectors, num_samples = channel.NumVectors, channel.NumSamples
+    fft_size = next_fast_len(upsample*num_samples)
+    range_weights = _get_signal_weights(window, window_parameters, num_samples)
+    azimuth_weights = _get_signal_weights(window, window_parameters, num_vectors)
+
+    extent = _KSpaceExtent(_VectorGeometry(reader.read_pvp_array(index)), num_samples, image_grid)
+    kr_center, kc_center = extent.center
+
+    num_rows, num_cols = image_grid.shape
+    tiles = []
+    for row_start in range(0, num_rows, tile_size):
+        row_range = (row_start, min(row_start + tile_size, num_rows))
+        for col_start in range(0, num_cols, tile_size):
+            col_range = (col_start, min(col_start + tile_size, num_cols))
+            points = numpy.reshape(image_grid.get_ecf_coordinates(row_range, col_range), (-1, 3))
+            tiles.append((slice(*row_range), slice(*col_range), points))
+
+    image = numpy.zeros((num_rows, num_cols), dtype='complex128')
+    total_weight = 0.0
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        for indices, pvp, signal in reader.iterate_vectors(index, batch_size=vector_block_size):
+            geometry = _VectorGeometry(pvp)
+            signal = signal.astype('complex128')
+            weights = numpy.ones(signal.shape, dtype='float64')
+            if range_weights is not None:
+                weights *= range_weights[None, :]
+                weights *= azimuth_weights[indices, None]
+            signal *= weights
+            total_weight += weights.sum()
+
+            if sgn == -1:
+                profiles = ifft(signal, n=fft_size, axis=1)*fft_size
+            else:
+                profiles = fft(signal, n=fft_size, axis=1)
+            reference_range = geometry.reference_range
+            futures = [
+                executor.submit(
+                    _backproject_tile, image[row_slice, col_slice], points,
+                    profiles, geometry, reference_range, sgn)
+                for row_slice, col_slice, points in tiles]
+            for future in futures:
+                future.result()
+
+    x, y = image_grid.get_plane_coordinates((0, num_rows), (0, num_cols))
+    image *= numpy.exp((sgn*2j*numpy.pi*kr_center)*x)[:, None]
+    image *= numpy.exp((sgn*2j*numpy.pi*kc_center)*y)[None, :]
+    image /= total_weight
+    return image.astype('complex64')
+
+
+#################
+# polar format
+
+class _PolarFormatGrid(object):
+    """
+    The rectangular spatial frequency grid for polar format image formation.
+    """
+
+    __slots__ = ('kr', 'kc', 'row_offset', 'col_offset')
+
+    def __init__(self, extent: _KSpaceExtent, image_grid: ImageGrid):
+        num_rows, num_cols = image_grid.shape
+        kr_step = 1./(num_rows*image_grid.row_ss)
+        kc_step = 1./(num_cols*image_grid.col_ss)
+        row_count = min(num_rows, int(numpy.floor(extent.row_bandwidth/kr_step)) + 1)
+        col_count = min(num_cols, int(numpy.floor(extent.col_bandwidth/kc_step)) + 1)
+        self.row_offset = numpy.arange(row_count) - row_count//2  # type: numpy.ndarray
+        self.col_offset = numpy.arange(col_count) - col_count//2  # type: numpy.ndarray
+        kr_center, kc_center = extent.center
+        self.kr = kr_center + self.row_offset*kr_step  # type: numpy.ndarray
+        self.kc = kc_center + self.col_offset*kc_step  # type: numpy.ndarray
+
+
+def _linear_gather(
+        array: numpy.ndarray,
+        position: numpy.ndarray,
+        axis: int) -> numpy.ndarray:
+    """
+    Linearly interpolates along the given axis at fractional positions, with
+    zero outside the array bounds.
+    """
+
+    size = array.shape[axis]
+    valid = (position >= 0) & (position <= size - 1)
+    position = numpy.where(valid, position, 0)
+    lower = numpy.minimum(position.astype('int64'), size - 2) if size > 1 else \
+        numpy.zeros(position.shape, dtype='int64')
+    fraction = position - lower
+    first = numpy.take_along_axis(array, lower, axis=axis)
+    if size > 1:
+        first = first + fraction*(numpy.take_along_axis(array, lower + 1, axis=axis) - first)
+    first[~valid] = 0
+    return first
+
+
+def _range_interpolate(
+        signal: numpy.ndarray,
+        geometry: _VectorGeometry,
+        a: numpy.ndarray,
+        kr: numpy.ndarray,
+        upsample: int) -> numpy.ndarray:
+    """
+    Interpolates each vector onto the common range spatial frequency grid.
+    """
+
+    num_samples = signal.shape[1]
+    if upsample > 1:
+        signal = resample(signal, upsample*num_samples, axis=1)
+    position = (kr[None, :]/a[:, None] - geometry.sc0[:, None])/geometry.scss[:, None]
+    position *= upsample
+    # the periodic extension beyond the final sample is not valid
+    position[position > upsample*(num_samples - 1)] = -1
+    return _linear_gather(signal, position, axis=1)
+
+
+def polar_format(
+        reader: Union[str, CPHDReader1],
+        image_grid: Optional[ImageGrid] = None,
+        index: Union[int, str] = 0,
+        window: str = 'UNIFORM',
+        window_parameters: Optional[Dict[str, Union[str, float]]] = None,
+        vector_block_size: int = 1024,
+        upsample: int = 2,
+        max_workers: Optional[int] = None) -> numpy.ndarray:
+    """
+    Forms the image on the given grid by the polar format algorithm.
+
+    The signal is streamed from the reader in blocks of vectors, and each block
+    is interpolated (in parallel) onto the range spatial frequency grid. The
+    azimuth interpolation onto the rectangular spatial frequency grid is then
+    performed in parallel blocks of range spatial frequency, followed by a
+    two dimensional FFT. Interpolation is linear, following a Fourier upsample
+    by factor `upsample` in each dimension.
+
+    The image grid row direction should be the range direction at the center of
+    aperture, as provided by :func:`get_default_image_grid`.
+
+    Parameters
+    ----------
+    reader : str|CPHDReader1
+    image_grid : None|ImageGrid
+        Defaults to :func:`get_default_image_grid`.
+    index : int|str
+        The CPHD channel index or identifier.
+    window : str
+        The name of the separable weighting window, see :func:`sarpy.processing.sicd.windows.get_window`.
+    window_parameters : None|dict
+    vector_block_size : int
+        The number of vectors read and interpolated at once.
+    upsample : int
+        The Fourier upsample factor applied before linear interpolation.
+    max_workers : None|int
+        The maximum number of worker threads. `None` uses the
+        :class:`concurrent.futures.ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    reader, index = _validate_reader(reader, index)
+    if image_grid is None:
+        image_grid = get_default_image_grid(reader, index=index)
+    worker_count = get_worker_count(max_workers)
+    upsample = int(upsample)
+    if upsample < 1:
+        raise ValueError('upsample must be a positive integer, got {}'.format(upsample))
+
+    sgn = reader.cphd_meta.Global.SGN
+    channel = reader.cphd_meta.Data.Channels[index]
+    num_vectors, num_samples = channel.NumVectors, channel.NumSamples
+    full_geometry = _VectorGeometry(reader.read_pvp_array(index))
+    if not numpy.allclose(full_geometry.srp_pos, image_grid.scp[None, :], rtol=0, atol=1e-3):
+        logger.warning(
+            'The SRP is not fixed at the image grid SCP, and the polar format\n\t'
+            'image will be defocused away from the SRP')
+    extent = _KSpaceExtent(full_geometry, num_samples, image_grid)
+    k_grid = _PolarFormatGrid(extent, image_grid)
+
+    # interpolate onto the range spatial frequency grid, block by block
+    keystone = numpy.zeros((num_vectors, k_grid.kr.size), dtype='complex64')
+
+    def range_block(indices, pvp, signal):
+        keystone[indices] = _range_interpolate(signal, _VectorGeometry(pvp), extent.a[indices], k_grid.kr, upsample)
+
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        # bound the number of signal blocks held in memory
+        pending = set()
+        for indices, pvp, signal in reader.iterate_vectors(index, batch_size=vector_block_size):
+            if len(pending) >= 2*worker_count:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(executor.submit(range_block, indices, pvp, signal))
+        for future in pending:
+            future.result()
+
+    # interpolate onto the azimuth spatial frequency grid
+    tan_theta = extent.b/extent.a
+    if num_vectors > 1 and tan_theta[-1] < tan_theta[0]:
+        tan_theta = tan_theta[::-1]
+        keystone = keystone[::-1]
+    if numpy.any(numpy.diff(tan_theta) <= 0):
+        raise ValueError('The polar angle must be strictly monotonic over the collection')
+    if upsample > 1 and num_vectors > 1:
+        keystone = resample(keystone, upsample*num_vectors, axis=0)
+        tan_theta = numpy.interp(
+            numpy.arange(upsample*num_vectors)/float(upsample), numpy.arange(num_vectors), tan_theta)
+        tan_theta[upsample*(num_vectors - 1) + 1:] = numpy.inf
+    vector_index = numpy.arange(tan_theta.size, dtype='float64')
+
+    spectrum = numpy.zeros((k_grid.kr.size, k_grid.kc.size), dtype='complex128')
+
+    def azimuth_block(the_slice):
+        ratio = k_grid.kc[None, :]/k_grid.kr[the_slice, None]
+        position = numpy.interp(ratio, tan_theta, vector_index, left=-1, right=-1)
+        spectrum[the_slice] = _linear_gather(keystone[:, the_slice].T, position, axis=1)
+
+    step = max(1, _BLOCK_ELEMENTS//max(1, keystone.shape[0]))
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        futures = [
+            executor.submit(azimuth_block, slice(start, min(start + step, k_grid.kr.size)))
+            for start in range(0, k_grid.kr.size, step)]
+        for future in futures:
+            future.result()
+    del keystone
+
+    if window.upper() != 'UNIFORM':
+        spectrum *= windows.get_window(window, k_grid.kr.size, parameters=window_parameters, copy=False)[:, None]
+        spectrum *= windows.get_window(window, k_grid.kc.size, parameters=window_parameters, copy=False)[None, :]
+        total_weight = windows.get_window(window, k_grid.kr.size, parameters=window_parameters).sum() * \
+            windows.get_window(window, k_grid.kc.size, parameters=window_parameters).sum()
+    else:
+        total_weight = float(k_grid.kr.size*k_grid.kc.size)
+
+    num_rows, num_cols = image_grid.shape
+    padded = numpy.zeros((num_rows, num_cols), dtype='complex128')
+    padded[numpy.ix_(k_grid.row_offset % num_rows, k_grid.col_offset % num_cols)] = spectrum
+    del spectrum
+    if sgn == -1:
+        image = ifft2(padded, overwrite_x=True, workers=worker_count)*(num_rows*num_cols)
+    else:
+        image = fft2(padded, overwrite_x=True, workers=worker_count)
+    image = numpy.roll(image, image_grid.scp_pixel, axis=(0, 1))
+    image /= total_weight
+    return image.astype('complex64')
+
+
+#################
+# sicd structure
+
+def _get_polarization(reader: CPHDReader1, index: int) -> Tuple[str, str]:
+    polarization = reader.cphd_meta.Channel.Parameters[index].Polarization
+    tx_pol = polarization.TxPol if polarization.TxPol in POLARIZATION2_VALUES else 'OTHER'
+    rcv_pol = polarization.RcvPol if polarization.RcvPol in POLARIZATION2_VALUES else 'OTHER'
+    return tx_pol, rcv_pol
+
+
+def get_sicd_structure(
+        reader: Union[str, CPHDReader1],
+        image_grid: ImageGrid,
+        index: Union[int, str] = 0,
+        algorithm: str = 'PFA',
+        window: str = 'UNIFORM',
+        window_parameters: Optional[Dict[str, Union[str, float]]] = None) -> SICDType:
+    """
+    Gets the SICD structure describing the image formed from the given CPHD
+    channel on the given image grid.
+
+    Parameters
+    ----------
+    reader : str|CPHDReader1
+    image_grid : ImageGrid
+    index : int|str
+    algorithm : str
+        One of `('PFA', 'BP')`.
+    window : str
+    window_parameters : None|dict
+
+    Returns
+    -------
+    SICDType
+    """
+
+    def get_collection_info() -> CollectionInfoType:
+        collection_id = cphd_meta.CollectionID
+        return CollectionInfoType(
+            CollectorName=collection_id.CollectorName,
+            IlluminatorName=collection_id.IlluminatorName,
+            CoreName=collection_id.CoreName,
+            CollectType=collection_id.CollectType,
+            RadarMode=RadarModeType(
+                ModeType=collection_id.RadarMode.ModeType, ModeID=collection_id.RadarMode.ModeID),
+            Classification=collection_id.Classification,
+            CountryCodes=collection_id.CountryCodes)
+
+    def get_image_creation() -> ImageCreationType:
+        return ImageCreationType(
+            Application='sarpy {} image formation'.format(algorithm),
+            DateTime=numpy.datetime64(datetime.now()),
+            Profile='sarpy {}'.format(__version__))
+
+    def get_image_data() -> ImageDataType:
+        num_rows, num_cols = image_grid.shape
+        return ImageDataType(
+            NumRows=num_rows,
+            NumCols=num_cols,
+            FirstRow=0,
+            FirstCol=0,
+            PixelType='RE32F_IM32F',
+            FullImage=(num_rows, num_cols),
+            SCPPixel=image_grid.scp_pixel)
+
+    def get_position() -> PositionType:
+        max_degree = min(5, geometry.times.size - 1)
+        px, py, pz = fit_position_xvalidation(
+            geometry.times, geometry.arp_pos, geometry.arp_vel, max_degree=max_degree)
+        return PositionType(ARPPoly=XYZPolyType(X=px, Y=py, Z=pz))
+
+    def get_direction(ss: float, bandwidth: float, k_center: float) -> DirParamType:
+        weight_type = WgtTypeType(WindowName=window.upper(), Parameters=window_parameters)
+        weight_function = None
+        if window.upper() != 'UNIFORM':
+            weight_function = windows.get_window(window, _WEIGHT_FUNCTION_SIZE, parameters=window_parameters)
+        return DirParamType(
+            UVectECF=None,
+            SS=ss,
+            Sgn=sgn,
+            ImpRespBW=bandwidth,
+            ImpRespWid=windows.get_ipr_width(window, parameters=window_parameters)/bandwidth,
+            KCtr=k_center,
+            DeltaK1=-0.5*bandwidth,
+            DeltaK2=0.5*bandwidth,
+            DeltaKCOAPoly=[[0.0, ], ],
+            WgtType=weight_type,
+            WgtFunct=weight_function)
+
+    def get_grid() -> GridType:
+        kr_center, kc_center = extent.center
+        if algorithm == 'PFA':
+            k_grid = _PolarFormatGrid(extent, image_grid)
+            row_bw = min(k_grid.kr.size/(image_grid.shape[0]*image_grid.row_ss), extent.row_bandwidth)
+            col_bw = min(k_grid.kc.size/(image_grid.shape[1]*image_grid.col_ss), extent.col_bandwidth)
+            kr_center, kc_center = k_grid.kr[k_grid.row_offset == 0][0], k_grid.kc[k_grid.col_offset == 0][0]
+            grid_type = 'RGAZIM'
+        else:
+            row_bw = min(extent.row_bandwidth, 1./image_grid.row_ss)
+            col_bw = min(extent.col_bandwidth, 1./image_grid.col_ss)
+            grid_type = 'PLANE'
+        row = get_direction(image_grid.row_ss, row_bw, kr_center)
+        col = get_direction(image_grid.col_ss, col_bw, kc_center)
+        row.UVectECF = image_grid.u_row
+        col.UVectECF = image_grid.u_col
+        return GridType(
+            ImagePlane='GROUND',
+            Type=grid_type,
+            TimeCOAPoly=[[t_coa, ], ],
+            Row=row,
+            Col=col)
+
+    def get_radar_collection() -> RadarCollectionType:
+        # the output plane is exactly the image grid
+        num_rows, num_cols = image_grid.shape
+        plane = ReferencePlaneType(
+            RefPt=ReferencePointType(
+                ECF=image_grid.scp, Line=image_grid.scp_pixel[0], Sample=image_grid.scp_pixel[1]),
+            XDir=XDirectionType(
+                UVectECF=image_grid.u_row, LineSpacing=image_grid.row_ss, NumLines=num_rows, FirstLine=0),
+            YDir=YDirectionType(
+                UVectECF=image_grid.u_col, SampleSpacing=image_grid.col_ss, NumSamples=num_cols, FirstSample=0),
+            Orientation='ARBITRARY')
+        return RadarCollectionType(
+            TxFrequency=(cphd_meta.Global.FxBand.FxMin, cphd_meta.Global.FxBand.FxMax),
+            TxPolarization=tx_pol,
+            Area=AreaType(Plane=plane),
+            RcvChannels=[ChanParametersType(TxRcvPolarization=tx_rcv_pol, index=1), ])
+
+    def get_timeline() -> TimelineType:
+        ipp = None
+        duration = float(geometry.times.max())
+        if tx_times.size > 1:
+            # the final interval ends one pulse repetition interval after the final pulse
+            pri = (tx_times[-1] - tx_times[0])/(tx_times.size - 1)
+            ipp = [IPPSetType(
+                TStart=float(tx_times[0]),
+                TEnd=float(tx_times[-1] + pri),
+                IPPStart=0,
+                IPPEnd=tx_times.size - 1,
+                IPPPoly=polynomial.polyfit(tx_times, numpy.arange(tx_times.size), 1)), ]
+            duration = float(tx_times[-1] + pri - tx_times[0])
+        return TimelineType(
+            CollectStart=cphd_meta.Global.Timeline.CollectionStart,
+            CollectDuration=duration,
+            IPP=ipp)
+
+    def get_image_formation() -> ImageFormationType:
+        processings = None
+        if algorithm == 'BP':
+            processings = [ProcessingType(Type='Backprojection', Applied=True), ]
+        return ImageFormationType(
+            RcvChanProc=RcvChanProcType(NumChanProc=1, PRFScaleFactor=1, ChanIndices=[1, ]),
+            ImageFormAlgo='PFA' if algorithm == 'PFA' else 'OTHER',
+            TStartProc=float(geometry.times.min()),
+            TEndProc=float(geometry.times.max()),
+            TxRcvPolarizationProc=tx_rcv_pol,
+            TxFrequencyProc=(
+                float(numpy.min(geometry.sc0)),
+                float(numpy.max(geometry.sc0 + (channel.NumSamples - 1)*geometry.scss))),
+            STBeamComp='NO',
+            ImageBeamComp='NO',
+            AzAutofocus='NO',
+            RgAutofocus='NO',
+            Processings=processings)
+
+    def get_pfa() -> PFAType:
+        theta = numpy.arctan2(extent.b, extent.a)
+        ksf = 0.5*speed_of_light*numpy.hypot(extent.a, extent.b)
+        # fit in scaled time about the reference time, for conditioning
+        angle_order = min(5, geometry.times.size - 1)
+        time_scale = max(float(numpy.ptp(geometry.times)), 1e-6)
+        scaled_coefs = polynomial.polyfit((geometry.times - t_coa)/time_scale, theta, angle_order)
+        relative_poly = polynomial.Polynomial(scaled_coefs/time_scale**numpy.arange(scaled_coefs.size))
+        polar_coefs = relative_poly(polynomial.Polynomial([-t_coa, 1.])).coef
+        sf_coefs = polynomial.polyfit(theta, ksf, min(2, theta.size - 1))
+        normal = image_grid.normal
+        return PFAType(
+            FPN=normal,
+            IPN=normal,
+            PolarAngRefTime=t_coa,
+            PolarAngPoly=polar_coefs,
+            SpatialFreqSFPoly=sf_coefs,
+            Krg1=extent.kr_bounds[0],
+            Krg2=extent.kr_bounds[1],
+            Kaz1=extent.kc_bounds[0],
+            Kaz2=extent.kc_bounds[1])
+
+    reader, index = _validate_reader(reader, index)
+    algorithm = algorithm.upper()
+    if algorithm not in _ALGORITHMS:
+        raise ValueError('algorithm must be one of {}, got {}'.format(_ALGORITHMS, algorithm))
+
+    cphd_meta = reader.cphd_meta
+    sgn = cphd_meta.Global.SGN
+    channel = cphd_meta.Data.Channels[index]
+    ref_index = cphd_meta.Channel.Parameters[index].RefVectorIndex
+    pvp = reader.read_pvp_array(index)
+    geometry = _VectorGeometry(pvp)
+    tx_times = pvp['TxTime']
+    extent = _KSpaceExtent(geometry, channel.NumSamples, image_grid)
+    t_coa = float(geometry.times[ref_index])
+    tx_pol, rcv_pol = _get_polarization(reader, index)
+    tx_rcv_pol = '{}:{}'.format(tx_pol, rcv_pol)
+
+    sicd = SICDType(
+        CollectionInfo=get_collection_info(),
+        ImageCreation=get_image_creation(),
+        ImageData=get_image_data(),
+        GeoData=GeoDataType(SCP=SCPType(ECF=image_grid.scp)),
+        Position=get_position(),
+        Grid=get_grid(),
+        RadarCollection=get_radar_collection(),
+        Timeline=get_timeline(),
+        ImageFormation=get_image_formation(),
+        PFA=get_pfa() if algorithm == 'PFA' else None)
+    sicd.derive()
+    return sicd
+
+
+#################
+# image formation to sicd
+
+def create_sicd_from_cphd(
+        reader: Union[str, CPHDReader1],
+        output_file: Optional[str] = None,
+        index: Union[int, str] = 0,
+        algorithm: str = 'PFA',
+        image_grid: Optional[ImageGrid] = None,
+        window: str = 'UNIFORM',
+        window_parameters: Optional[Dict[str, Union[str, float]]] = None,
+        check_existence: bool = True,
+        max_workers: Optional[int] = None,
+        **kwargs) -> Optional[FlatSICDReader]:
+    """
+    Forms the complex image from the given CPHD channel, and populates the
+    corresponding SICD structure.
+
+    Parameters
+    ----------
+    reader : str|CPHDReader1
+    output_file : None|str
+        If `None`, a :class:`FlatSICDReader` for the in-memory image will be
+        returned. Otherwise, the image will be written to this SICD file.
+    index : int|str
+        The CPHD channel index or identifier.
+    algorithm : str
+        One of `'PFA'` (polar format) or `'BP'` (backprojection).
+    image_grid : None|ImageGrid
+        Defaults to :func:`get_default_image_grid`.
+    window : str
+        The name of the separable weighting window, see :func:`sarpy.processing.sicd.windows.get_window`.
+    window_parameters : None|dict
+    check_existence : bool
+        Should we check if the output file already exists, and raise an exception if so?
+    max_workers : None|int
+        The maximum number of worker threads. `None` uses the
+        :class:`concurrent.futures.ThreadPoolExecutor` default.
+    kwargs
+        Keyword arguments passed through to :func:`polar_format` or :func:`backproject`.
+
+    Returns
+    -------
+    None|FlatSICDReader
+    """
+
+    reader, index = _validate_reader(reader, index)
+    algorithm = algorithm.upper()
+    if algorithm not in _ALGORITHMS:
+        raise ValueError('algorithm must be one of {}, got {}'.format(_ALGORITHMS, algorithm))
+    if image_grid is None:
+        image_grid = get_default_image_grid(reader, index=index)
+    sicd = get_sicd_structure(
+        reader, image_grid, index=index, algorithm=algorithm,
+        window=window, window_parameters=window_parameters)
+
+    method = polar_format if algorithm == 'PFA' else backproject
+    start = time.perf_counter()
+    image = method(
+        reader, image_grid, index=index, window=window, window_parameters=window_parameters,
+        max_workers=max_workers, **kwargs)
+    elapsed = time.perf_counter() - start
+    channel = reader.cphd_meta.Data.Channels[index]
+    logger.info(
+        '{} image formation of {} image from {} signal samples in {:.3f} seconds'.format(
+            algorithm, image.shape, channel.NumVectors*channel.NumSamples, elapsed))
+
+    if output_file is None:
+        return FlatSICDReader(sicd, image)
+    with SICDWriter(output_file, sicd, check_existence=check_existence) as writer:
+        writer(image, start_indices=(0, 0))
+    return None
@@ -25,6 +25,38 @@ from .ortho_methods import OrthorectificationHelper
 logger = logging.getLogger(__name__)
 
 
+def _fit_geo_transform(
+        raster_points: numpy.ndarray,
+        lon_lat: numpy.ndarray) -> Tuple[Tuple[float, ...], float]:
+    """
+    Fit the affine transform, of GDAL convention, from raster `(column, row)`
+    coordinates to `(longitude, latitude)`. Longitude values are unwrapped with
+    respect to the first point, to avoid a discontinuity at the antimeridian.
+
+    Parameters
+    ----------
+    raster_points : numpy.ndarray
+        Of shape `(N, 2)`, giving `(column, row)` values.
+    lon_lat : numpy.ndarray
+        Of shape `(N, 2)`, giving `(longitude, latitude)` values.
+
+    Returns
+    -------
+    geo_transform : Tuple[float, ...]
+        Of the form `(lon0, dlon/dcol, dlon/drow, lat0, dlat/dcol, dlat/drow)`.
+    max_residual : float
+        The maximum absolute residual of the fit, in degrees.
+    """
+
+    raster_points = numpy.reshape(numpy.asarray(raster_points, dtype='float64'), (-1, 2))
+    lon_lat = numpy.array(numpy.reshape(lon_lat, (-1, 2)), dtype='float64')
+    lon_lat[:, 0] = numpy.mod(lon_lat[:, 0] - lon_lat[0, 0] + 180, 360) - 180 + lon_lat[0, 0]
+    design = numpy.column_stack((numpy.ones(raster_points.shape[0]), raster_points))
+    coefficients, _, _, _ = numpy.linalg.lstsq(design, lon_lat, rcond=None)
+    max_residual = float(numpy.max(numpy.abs(design.dot(coefficients) - lon_lat)))
+    return tuple(float(entry) for entry in coefficients.T.flatten()), max_residual
+
+
 class FullResolutionFetcher(object):
     """
     This is a base class for provided a simple API for processing schemes where
@@ -519,6 +551,61 @@ class OrthorectificationIterator(object):
         else:
             return ecf_to_geodetic(ecf_corners)
 
+    def get_geo_transform(self, grid_size: int = 5) -> Optional[Tuple[float, ...]]:
+        """
+        The affine transform, of GDAL convention, from the `(column, row)`
+        coordinates of the upper left corner of an output pixel to WGS-84
+        `(longitude, latitude)`. This is the least squares fit over a grid of
+        points spanning the overall ortho-rectified output, and is exact for
+        a plate carree projection.
+
+        Parameters
+        ----------
+        grid_size : int
+            The number of fit points along each dimension.
+
+        Returns
+        -------
+        None|Tuple[float, ...]
+            Of the form `(lon0, dlon/dcol, dlon/drow, lat0, dlat/dcol, dlat/drow)`.
+        """
+
+        if self.ortho_bounds is None:
+            return None
+        grid_size = max(2, int(grid_size))
+        rows, cols = self.ortho_data_size
+        raster_cols, raster_rows = numpy.meshgrid(
+            numpy.linspace(0, cols, grid_size), numpy.linspace(0, rows, grid_size))
+        raster_points = numpy.column_stack((raster_cols.flatten(), raster_rows.flatten()))
+        # output pixel centers are at integer ortho coordinates
+        ortho_coords = numpy.column_stack(
+            (raster_points[:, 1] + self.ortho_bounds[0] - 0.5, raster_points[:, 0] + self.ortho_bounds[2] - 0.5))
+        llh = self._ortho_helper.proj_helper.ortho_to_llh(ortho_coords)
+        geo_transform, max_residual = _fit_geo_transform(raster_points, llh[:, 1::-1])
+        pixel_size = max(numpy.hypot(geo_transform[1], geo_transform[4]), numpy.hypot(geo_transform[2], geo_transform[5]))
+        if max_residual > pixel_size:
+            logger.warning(
+                'The affine geo-transform for the ortho-rectified output has maximum error\n\t'
+                '{:0.3G} pixels, relative to the projection'.format(max_residual/pixel_size))
+        return geo_transform
+
+    def _get_fetch_block_size(self, start_element: int, stop_element: int) -> int:
+        """
+        Gets the calculator fetch block size for the given full resolution
+        section, for a single fetch of the iteration.
+
+        Parameters
+        ----------
+        start_element : int
+        stop_element : int
+
+        Returns
+        -------
+        int
+        """
+
+        return self.calculator.get_fetch_block_size(start_element, stop_element)
+
     def _prepare_state(self, recalc_remap_globals: bool = False) -> None:
         """
         Prepare the iteration state.
@@ -533,11 +620,11 @@ class OrthorectificationIterator(object):
         """
 
         if self.calculator.dimension == 0:
-            column_block_size = self.calculator.get_fetch_block_size(self.ortho_bounds[0], self.ortho_bounds[1])
+            column_block_size = self._get_fetch_block_size(self.ortho_bounds[0], self.ortho_bounds[1])
             self._iteration_blocks, _ = self.calculator.extract_blocks(
                 (self.ortho_bounds[2], self.ortho_bounds[3], 1), column_block_size)
         else:
-            row_block_size = self.calculator.get_fetch_block_size(self.ortho_bounds[2], self.ortho_bounds[3])
+            row_block_size = self._get_fetch_block_size(self.ortho_bounds[2], self.ortho_bounds[3])
             self._iteration_blocks, _ = self.calculator.extract_blocks(
                 (self.ortho_bounds[0], self.ortho_bounds[1], 1), row_block_size)
 
@@ -697,12 +697,18 @@ class OrthorectificationHelper(object):
         if pixel_rows.shape == value_array.shape and pixel_cols.shape == value_array.shape:
             rows_meters = (pixel_rows - self.sicd.ImageData.SCPPixel.Row)*self.sicd.Grid.Row.SS
             cols_meters = (pixel_cols - self.sicd.ImageData.SCPPixel.Col)*self.sicd.Grid.Col.SS
+
+            def evaluate(poly):
+                return poly(rows_meters, cols_meters)
         elif value_array.ndim == 2 and \
             (pixel_rows.ndim == 1 and pixel_rows.size == value_array.shape[0]) and \
                 (pixel_cols.ndim == 1 and pixel_cols.size == value_array.shape[1]):
-            cols_meters, rows_meters = numpy.meshgrid(
-                (pixel_cols - self.sicd.ImageData.SCPPixel.Col)*self.sicd.Grid.Col.SS,
-                (pixel_rows - self.sicd.ImageData.SCPPixel.Row) * self.sicd.Grid.Row.SS)
+            # evaluate on the grid directly, rather than constructing the mesh
+            rows_meters = (pixel_rows - self.sicd.ImageData.SCPPixel.Row)*self.sicd.Grid.Row.SS
+            cols_meters = (pixel_cols - self.sicd.ImageData.SCPPixel.Col)*self.sicd.Grid.Col.SS
+
+            def evaluate(poly):
+                return poly.evaluate_grid(rows_meters, cols_meters)
         else:
             raise ValueError(
                 'Either pixel_rows, pixel_cols, and value_array must all have the same shape, '
@@ -712,7 +718,7 @@ class OrthorectificationHelper(object):
 
         # calculate pixel power, with noise subtracted if necessary
         if self._noise_poly is not None:
-            noise = numpy.exp(10 * self._noise_poly(rows_meters, cols_meters))  # convert from db to power
+            noise = numpy.exp(10 * evaluate(self._noise_poly))  # convert from db to power
             pixel_power = value_array*value_array - noise
             del noise
         else:
@@ -721,7 +727,7 @@ class OrthorectificationHelper(object):
         if self._rad_poly is None:
             return numpy.sqrt(pixel_power)
         else:
-            return pixel_power*self._rad_poly(rows_meters, cols_meters)
+            return pixel_power*evaluate(self._rad_poly)
 
     def _validate_row_col_values(self, row_array, col_array, value_array, value_is_flat=False):
         """
@@ -821,9 +827,11 @@ class OrthorectificationHelper(object):
             return self._get_orthrectified_from_array_flat(ortho_bounds, row_array, col_array, value_array)
         else:  # it must be three dimensional, as checked by _validate_row_col_values()
             ortho_array = self._initialize_workspace(ortho_bounds, final_dimension=value_array.shape[2])
+            # the pixel coordinates are independent of the band, so only project once
+            pixel_mesh = self._get_pixel_mesh(ortho_bounds)
             for i in range(value_array.shape[2]):
                 ortho_array[:, :, i] = self._get_orthrectified_from_array_flat(
-                    ortho_bounds, row_array, col_array, value_array[:, :, i])
+                    ortho_bounds, row_array, col_array, value_array[:, :, i], pixel_mesh=pixel_mesh)
             return ortho_array
 
     def get_orthorectified_for_ortho_bounds(self, bounds):
@@ -909,7 +917,23 @@ class OrthorectificationHelper(object):
         bounds = self.get_orthorectification_bounds_from_latlon_object(ll_coordinates)
         return self.get_orthorectified_for_ortho_bounds(bounds)
 
-    def _setup_flat_workspace(self, ortho_bounds, row_array, col_array, value_array):
+    def _get_pixel_mesh(self, ortho_bounds):
+        """
+        Determine the pixel coordinates for the ortho coordinates meshgrid.
+
+        Parameters
+        ----------
+        ortho_bounds : numpy.ndarray
+            Of the form `(min row, max row, min col, max col)`.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        return self.proj_helper.ortho_to_pixel(self._get_ortho_mesh(ortho_bounds))
+
+    def _setup_flat_workspace(self, ortho_bounds, row_array, col_array, value_array, pixel_mesh=None):
         """
         Helper method for setting up the flat workspace.
 
@@ -927,6 +951,9 @@ class OrthorectificationHelper(object):
         value_array : numpy.ndarray
             The values array. If this has complex dtype and `complex_valued=False`,
             then the :func:`numpy.abs` will be applied.
+        pixel_mesh : None|numpy.ndarray
+            The pixel coordinates for the ortho coordinates meshgrid, as provided
+            by :meth:`_get_pixel_mesh`. This will be calculated, if not provided.
 
         Returns
         -------
@@ -937,14 +964,13 @@ class OrthorectificationHelper(object):
         # set up the results workspace
         ortho_array = self._initialize_workspace(ortho_bounds)
         # determine the pixel coordinates for the ortho coordinates meshgrid
-        ortho_mesh = self._get_ortho_mesh(ortho_bounds)
-        # determine the nearest neighbor pixel coordinates
-        pixel_mesh = self.proj_helper.ortho_to_pixel(ortho_mesh)
+        if pixel_mesh is None:
+            pixel_mesh = self._get_pixel_mesh(ortho_bounds)
         pixel_rows = pixel_mesh[:, :, 0]
         pixel_cols = pixel_mesh[:, :, 1]
         return value_array, pixel_rows, pixel_cols, ortho_array
 
-    def _get_orthrectified_from_array_flat(self, ortho_bounds, row_array, col_array, value_array):
+    def _get_orthrectified_from_array_flat(self, ortho_bounds, row_array, col_array, value_array, pixel_mesh=None):
         """
         Construct the orthorecitified array covering the orthorectified region given by
         `ortho_bounds` based on the `values_array`, which spans the pixel region defined by
@@ -964,6 +990,9 @@ class OrthorectificationHelper(object):
         value_array
             The values array. If this has complex dtype and `complex_valued=False`,
             then the :func:`numpy.abs` will be applied.
+        pixel_mesh : None|numpy.ndarray
+            The pixel coordinates for the ortho coordinates meshgrid, as provided
+            by :meth:`_get_pixel_mesh`. This will be calculated, if not provided.
 
         Returns
         -------
@@ -1017,10 +1046,10 @@ class NearestNeighborMethod(OrthorectificationHelper):
             pad_value=pad_value, apply_radiometric=apply_radiometric,
             subtract_radiometric_noise=subtract_radiometric_noise)
 
-    def _get_orthrectified_from_array_flat(self, ortho_bounds, row_array, col_array, value_array):
+    def _get_orthrectified_from_array_flat(self, ortho_bounds, row_array, col_array, value_array, pixel_mesh=None):
         # setup the result workspace
         value_array, pixel_rows, pixel_cols, ortho_array = self._setup_flat_workspace(
-            ortho_bounds, row_array, col_array, value_array)
+            ortho_bounds, row_array, col_array, value_array, pixel_mesh=pixel_mesh)
         # potentially apply the radiometric parameters to the value array
         value_array = self._apply_radiometric_params(row_array, col_array, value_array)
         if value_array.size > 0:
@@ -1119,10 +1148,10 @@ class BivariateSplineMethod(OrthorectificationHelper):
             raise ValueError('col_order must take value between 1 and 5.')
         self._col_order = value
 
-    def _get_orthrectified_from_array_flat(self, ortho_bounds, row_array, col_array, value_array):
+    def _get_orthrectified_from_array_flat(self, ortho_bounds, row_array, col_array, value_array, pixel_mesh=None):
         # setup the result workspace
         value_array, pixel_rows, pixel_cols, ortho_array = self._setup_flat_workspace(
-            ortho_bounds, row_array, col_array, value_array)
+            ortho_bounds, row_array, col_array, value_array, pixel_mesh=pixel_mesh)
         value_array = self._apply_radiometric_params(row_array, col_array, value_array)
 
         if value_array.size > 0:
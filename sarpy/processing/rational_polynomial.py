@@ -9,7 +9,6 @@ import logging
 from typing import List, Tuple, Sequence, Optional, Union
 
 import numpy
-from numpy.polynomial import polynomial
 from scipy.linalg import lstsq, LinAlgError
 
 from sarpy.compliance import SarpyError
@@ -54,31 +53,154 @@ def _get_num_variables(coeff_list: Sequence[Union[int, Tuple[int, ...]]]) -> int
     return variables
 
 
-def _map_list_to_poly_matrix(coeffs: Sequence[float], coeff_list: Sequence[Tuple[int, ...]]) -> numpy.ndarray:
+_EVALUATION_BLOCK_SIZE = 2**16
+
+
+class _MonomialBasis(object):
+    """
+    A compiled monomial basis for a coefficient listing. The exponents are stored
+    as an integer array, and the basis is evaluated from a table of powers of
+    each variable, so that each monomial costs one multiplication per variable
+    with non-zero exponent.
+    """
+
+    __slots__ = ('_exponents', '_max_powers')
+
+    def __init__(self, coeff_list: Sequence[Union[int, Tuple[int, ...]]]):
+        """
+
+        Parameters
+        ----------
+        coeff_list : Sequence[int|Tuple[int, ...]]
+        """
+
+        variables = _get_num_variables(coeff_list)
+        exponents = numpy.array(
+            [(entry, ) if isinstance(entry, int) else entry for entry in coeff_list], dtype='int64')
+        exponents = numpy.reshape(exponents, (len(coeff_list), variables))
+        if numpy.any(exponents < 0):
+            raise ValueError('The exponents in coeff_list must be non-negative')
+        self._exponents = exponents
+        self._max_powers = numpy.amax(exponents, axis=0)
+
+    @property
+    def size(self) -> int:
+        """
+        int: The number of monomial terms.
+        """
+
+        return self._exponents.shape[0]
+
+    @property
+    def variables(self) -> int:
+        """
+        int: The number of variables.
+        """
+
+        return self._exponents.shape[1]
+
+    def evaluate(
+            self,
+            variables: Sequence[numpy.ndarray],
+            out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Evaluates the monomial terms at the given points.
+
+        Parameters
+        ----------
+        variables : Sequence[numpy.ndarray]
+            The one-dimensional arrays of values for each variable, all of the same size.
+        out : None|numpy.ndarray
+            Optional output array of shape `(N, size)`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `(N, size)`, where `N` is the number of points.
+        """
+
+        if len(variables) != self.variables:
+            raise ValueError(
+                'Got {} variables, but the basis requires {}'.format(len(variables), self.variables))
+        count = variables[0].size
+        if out is None:
+            out = numpy.empty((count, self.size), dtype='float64')
+        out[:] = 1.0
+        for i, values in enumerate(variables):
+            max_power = self._max_powers[i]
+            if max_power == 0:
+                continue
+            powers = numpy.empty((max_power+1, count), dtype='float64')
+            powers[0] = 1.0
+            powers[1] = values
+            for k in range(2, max_power+1):
+                numpy.multiply(powers[k-1], values, out=powers[k])
+            for j, exponent in enumerate(self._exponents[:, i]):
+                if exponent > 0:
+                    out[:, j] *= powers[exponent]
+        return out
+
+    def evaluate_coefficients(
+            self,
+            variables: Sequence[numpy.ndarray],
+            coefficients: numpy.ndarray,
+            block_size: int = _EVALUATION_BLOCK_SIZE) -> numpy.ndarray:
+        """
+        Evaluates linear combinations of the monomial terms at the given points,
+        over blocks of points.
+
+        Parameters
+        ----------
+        variables : Sequence[numpy.ndarray]
+            The one-dimensional arrays of values for each variable, all of the same size.
+        coefficients : numpy.ndarray
+            Of shape `(size, K)`, for the `K` linear combinations to evaluate.
+        block_size : int
+            The number of points evaluated at a time.
+
+        Returns
+        -------
+        numpy.ndarray
+            Of shape `(N, K)`.
+        """
+
+        count = variables[0].size
+        out = numpy.empty((count, coefficients.shape[1]), dtype='float64')
+        work = None
+        for start in range(0, count, block_size):
+            end = min(start + block_size, count)
+            if work is None or work.shape[0] != end - start:
+                work = numpy.empty((end - start, self.size), dtype='float64')
+            self.evaluate([entry[start:end] for entry in variables], out=work)
+            numpy.dot(work, coefficients, out=out[start:end])
+        return out
+
+
+def _get_design_matrix(
+        variables: Sequence[numpy.ndarray],
+        data: numpy.ndarray,
+        coeff_list: Sequence[Union[int, Tuple[int, ...]]]) -> numpy.ndarray:
     """
-    Maps the coefficients and coefficient listing to corresponding
-    numpy polynomial coefficient matrix.
+    Constructs the linear least squares design matrix for fitting the rational
+    polynomial `P(X)/(1 + Q(X)) = d`, which is reformulated as `P(X) - d*Q(X) = d`.
 
     Parameters
     ----------
-    coeffs : Sequence[float]
-    coeff_list : Sequence[Tuple[int, ...]]
+    variables : Sequence[numpy.ndarray]
+    data : numpy.ndarray
+    coeff_list : Sequence
 
     Returns
     -------
-    coefficient_array : numpy.ndarray
+    numpy.ndarray
     """
 
-    variables = _get_num_variables(coeff_list)
-
-    matrix_shape = []
-    for i in range(variables):
-        matrix_shape.append(max(entry[i] for entry in coeff_list)+1)
-
-    coefficient_array = numpy.zeros(tuple(matrix_shape), dtype='float64')
-    for i, entry in enumerate(coeff_list):
-        coefficient_array[entry] = coeffs[i]
-    return coefficient_array
+    basis = _MonomialBasis(coeff_list)
+    terms = len(coeff_list)
+    A = numpy.empty((data.size, 2*terms - 1), dtype=numpy.float64)
+    basis.evaluate(variables, out=A[:, :terms])
+    numpy.multiply(A[:, 1:terms], -data[:, numpy.newaxis], out=A[:, terms:])
+    return A
 
 
 def get_default_coefficient_ordering(variables: int, order: int) -> Sequence[Tuple[int, ...]]:
@@ -159,19 +281,10 @@ def rational_poly_fit_1d(
     #   P(x) - d*Q(x) = d
     # This can be formulated as a strictly linear problem A*t = d
 
-    A = numpy.empty((x.size, 2*len(coeff_list) - 1), dtype=numpy.float64)
-    for i, entry in enumerate(coeff_list):
+    for entry in coeff_list:
         if not (isinstance(entry, int) or (isinstance(entry, tuple) and len(entry) == 1 and isinstance(entry[0], int))):
             raise TypeError('coeff_list must be a list of integers or length 1 tuples of ints')
-        if isinstance(entry, tuple):
-            entry = entry[0]
-
-        u = 1
-        if entry > 0:
-            u *= numpy.power(x, entry)
-        A[:, i] = u
-        if i > 0:
-            A[:, i+len(coeff_list) - 1] = -u*data
+    A = _get_design_matrix([x, ], data, coeff_list)
 
     # perform least squares fit
     try:
@@ -240,19 +353,10 @@ def rational_poly_fit_2d(
     #   P(x, y) - d*Q(x, y) = d
     # This can be formulated as a strictly linear problem A*t = d
 
-    A = numpy.empty((x.size, 2 * len(coeff_list) - 1), dtype=numpy.float64)
-    for i, entry in enumerate(coeff_list):
+    for entry in coeff_list:
         if len(entry) != 2:
             raise TypeError('coeff_list must be a list of tuples of length 2')
-
-        u = 1
-        if entry[0] > 0:
-            u *= numpy.power(x, entry[0])
-        if entry[1] > 0:
-            u *= numpy.power(y, entry[1])
-        A[:, i] = u
-        if i > 0:
-            A[:, i + len(coeff_list) - 1] = -u*data
+    A = _get_design_matrix([x, y], data, coeff_list)
 
     # perform least squares fit
     try:
@@ -324,21 +428,10 @@ def rational_poly_fit_3d(
     #   P(x, y, z) - d*Q(x, y, z) = d
     # This can be formulated as a strictly linear problem A*t = d
 
-    A = numpy.empty((x.size, 2*len(coeff_list) - 1), dtype=numpy.float64)
-    for i, entry in enumerate(coeff_list):
+    for entry in coeff_list:
         if len(entry) != 3:
             raise TypeError('coeff_list must be a list of tuples of length 3')
-
-        u = 1
-        if entry[0] > 0:
-            u *= numpy.power(x, entry[0])
-        if entry[1] > 0:
-            u *= numpy.power(y, entry[1])
-        if entry[2] > 0:
-            u *= numpy.power(z, entry[2])
-        A[:, i] = u
-        if i > 0:
-            A[:, i + len(coeff_list) - 1] = -u*data
+    A = _get_design_matrix([x, y, z], data, coeff_list)
 
     # perform least squares fit
     try:
@@ -390,7 +483,7 @@ class RationalPolynomial(object):
 
     __slots__ = (
         '_numerator', '_denominator', '_coeff_list', '_variables', '_input_offsets', '_input_scales',
-        '_output_offset', '_output_scale', '_numerator_array', '_denominator_array')
+        '_output_offset', '_output_scale', '_basis', '_coefficients')
 
     def __init__(
             self,
@@ -437,8 +530,10 @@ class RationalPolynomial(object):
         self._output_offset = float(output_offset)
         self._output_scale = float(output_scale)
 
-        self._numerator_array = _map_list_to_poly_matrix(numerator, coeff_list)
-        self._denominator_array = _map_list_to_poly_matrix(denominator, coeff_list)
+        # the compiled basis, shared between the numerator and denominator
+        self._basis = _MonomialBasis(coeff_list)
+        self._coefficients = numpy.stack(
+            [numpy.asarray(numerator, dtype='float64'), numpy.asarray(denominator, dtype='float64')], axis=1)
 
     @property
     def variables(self) -> int:
@@ -488,58 +583,47 @@ class RationalPolynomial(object):
 
         return self._denominator
 
-    def __call__(self, *input_variables: List[numpy.ndarray]) -> numpy.ndarray:
-        def ensure_the_type(data):
-            if isinstance(data, (numpy.number, int, float, numpy.ndarray)):
-                return data
-            else:
-                return numpy.array(data)
+    def _get_scaled_variables(
+            self,
+            input_variables: Sequence[numpy.ndarray]) -> Tuple[List[numpy.ndarray], Tuple[int, ...]]:
+        """
+        Gets the flattened, normalized variables and the shape of the output.
+
+        Parameters
+        ----------
+        input_variables : Sequence[numpy.ndarray]
+
+        Returns
+        -------
+        variables : List[numpy.ndarray]
+        shape : Tuple[int, ...]
+        """
 
         if len(input_variables) not in [1, self.variables]:
             raise ValueError('Got an unexpected number of input arguments')
-        if len(input_variables) == 1:
-            separate = False
-            inp_vars = ensure_the_type(input_variables[0])
-        else:
-            separate = True
-            inp_vars = [ensure_the_type(entry) for entry in input_variables]
-
-        # todo: should we evaluate the viability of the input?
-        if self.variables == 1:
-            x = (inp_vars - self._input_offsets[0])/self._input_scales[0]
-            value = polynomial.polyval(x, self._numerator_array) / \
-                polynomial.polyval(x, self._denominator_array)
-        elif self.variables == 2:
-            if separate:
-                x = (inp_vars[0] - self._input_offsets[0])/self._input_scales[0]
-                y = (inp_vars[1] - self._input_offsets[1])/self._input_scales[1]
-            else:
-                if inp_vars.shape[-1] != 2:
-                    raise ValueError(
-                        'Final dimension of input data ({}) must match the number '
-                        'of variables ({}).'.format(inp_vars.shape, self.variables))
-                x = (inp_vars[..., 0] - self._input_offsets[0])/self._input_scales[0]
-                y = (inp_vars[..., 1] - self._input_offsets[1])/self._input_scales[1]
-            value = polynomial.polyval2d(x, y, self._numerator_array) / \
-                polynomial.polyval2d(x, y, self._denominator_array)
-        elif self.variables == 3:
-            if separate:
-                x = (inp_vars[0] - self._input_offsets[0])/self._input_scales[0]
-                y = (inp_vars[1] - self._input_offsets[1])/self._input_scales[1]
-                z = (inp_vars[2] - self._input_offsets[2])/self._input_scales[2]
-            else:
-                if inp_vars.shape[-1] != 3:
-                    raise ValueError(
-                        'Final dimension of input data ({}) must match the number '
-                        'of variables ({}).'.format(inp_vars.shape, self.variables))
-                x = (inp_vars[..., 0] - self._input_offsets[0])/self._input_scales[0]
-                y = (inp_vars[..., 1] - self._input_offsets[1])/self._input_scales[1]
-                z = (inp_vars[..., 2] - self._input_offsets[2]) / self._input_scales[2]
-            value = polynomial.polyval3d(x, y, z, self._numerator_array) / \
-                polynomial.polyval3d(x, y, z, self._denominator_array)
+        if len(input_variables) == 1 and self.variables > 1:
+            inp_vars = numpy.asarray(input_variables[0], dtype='float64')
+            if inp_vars.ndim < 1 or inp_vars.shape[-1] != self.variables:
+                raise ValueError(
+                    'Final dimension of input data ({}) must match the number '
+                    'of variables ({}).'.format(inp_vars.shape, self.variables))
+            inp_vars = [inp_vars[..., i] for i in range(self.variables)]
         else:
-            raise ValueError('More than 3 variables is unsupported')
-        return value*self._output_scale + self._output_offset
+            inp_vars = numpy.broadcast_arrays(
+                *[numpy.asarray(entry, dtype='float64') for entry in input_variables])
+
+        shape = inp_vars[0].shape
+        variables = [
+            (numpy.ravel(entry) - offset)/scale for entry, offset, scale in
+            zip(inp_vars, self._input_offsets, self._input_scales)]
+        return variables, shape
+
+    def __call__(self, *input_variables: List[numpy.ndarray]) -> numpy.ndarray:
+        variables, shape = self._get_scaled_variables(input_variables)
+        values = self._basis.evaluate_coefficients(variables, self._coefficients)
+        value = numpy.reshape(values[:, 0]/values[:, 1], shape)
+        value = value*self._output_scale + self._output_offset
+        return value[()] if value.ndim == 0 else value
 
 
 def _get_scale_and_offset(array: numpy.ndarray) -> Tuple[float, float]:
@@ -547,6 +631,8 @@ def _get_scale_and_offset(array: numpy.ndarray) -> Tuple[float, float]:
     max_value = numpy.max(array)
     scale_value = 0.5*(max_value - min_value)
     offset_value = 0.5*(max_value + min_value)
+    if scale_value == 0:
+        scale_value = 1.0
     return offset_value, scale_value
 
 
@@ -588,8 +674,8 @@ def get_rational_poly_1d(
     if _get_num_variables(coeff_list) != 1:
         raise ValueError('The number of variables defined by the coefficient list must be 1.')
 
-    scale_x, offset_x = _get_scale_and_offset(x)
-    scale_data, offset_data = _get_scale_and_offset(data)
+    offset_x, scale_x = _get_scale_and_offset(x)
+    offset_data, scale_data = _get_scale_and_offset(data)
 
     numerator, denominator = rational_poly_fit_1d(
         (x-offset_x)/scale_x,
@@ -641,9 +727,9 @@ def get_rational_poly_2d(
     if _get_num_variables(coeff_list) != 2:
         raise ValueError('The number of variables defined by the coefficient list must be 2.')
 
-    scale_x, offset_x = _get_scale_and_offset(x)
-    scale_y, offset_y = _get_scale_and_offset(y)
-    scale_data, offset_data = _get_scale_and_offset(data)
+    offset_x, scale_x = _get_scale_and_offset(x)
+    offset_y, scale_y = _get_scale_and_offset(y)
+    offset_data, scale_data = _get_scale_and_offset(data)
 
     numerator, denominator = rational_poly_fit_2d(
         (x-offset_x)/scale_x, (y-offset_y)/scale_y,
@@ -697,10 +783,10 @@ def get_rational_poly_3d(
     if _get_num_variables(coeff_list) != 3:
         raise ValueError('The number of variables defined by the coefficient list must be 3.')
 
-    scale_x, offset_x = _get_scale_and_offset(x)
-    scale_y, offset_y = _get_scale_and_offset(y)
-    scale_z, offset_z = _get_scale_and_offset(z)
-    scale_data, offset_data = _get_scale_and_offset(data)
+    offset_x, scale_x = _get_scale_and_offset(x)
+    offset_y, scale_y = _get_scale_and_offset(y)
+    offset_z, scale_z = _get_scale_and_offset(z)
+    offset_data, scale_data = _get_scale_and_offset(data)
 
     numerator, denominator = rational_poly_fit_3d(
         (x-offset_x)/scale_x, (y-offset_y)/scale_y, (z-offset_z)/scale_z,
@@ -721,7 +807,7 @@ class CombinedRationalPolynomial(object):
     variables into a single multi-variable output object.
     """
 
-    __slots__ = ('_collection', )
+    __slots__ = ('_collection', '_shared_coefficients')
 
     def __init__(self, *collection: List[RationalPolynomial]):
         if len(collection) == 1 and isinstance(collection[0], Sequence):
@@ -745,11 +831,34 @@ class CombinedRationalPolynomial(object):
             coll.append(entry)
         self._collection = tuple(coll)
 
+        # when fit from the same inputs, all members share the monomial basis and input
+        # normalization, so the basis can be evaluated once for all members
+        first = self._collection[0]
+        if all(
+                tuple(entry.coefficient_list) == tuple(first.coefficient_list) and
+                numpy.array_equal(entry._input_offsets, first._input_offsets) and
+                numpy.array_equal(entry._input_scales, first._input_scales)
+                for entry in self._collection[1:]):
+            self._shared_coefficients = numpy.hstack([entry._coefficients for entry in self._collection])
+        else:
+            self._shared_coefficients = None
+
     def __call__(
             self,
             *args: List[numpy.ndarray],
             combine: bool = True) -> Union[Tuple[numpy.ndarray, ...], numpy.ndarray]:
-        out = tuple([entry(*args) for entry in self._collection])
+        if self._shared_coefficients is None:
+            out = tuple([entry(*args) for entry in self._collection])
+        else:
+            first = self._collection[0]
+            variables, shape = first._get_scaled_variables(args)
+            values = first._basis.evaluate_coefficients(variables, self._shared_coefficients)
+            out = []
+            for i, entry in enumerate(self._collection):
+                value = numpy.reshape(values[:, 2*i]/values[:, 2*i+1], shape)
+                value = value*entry._output_scale + entry._output_offset
+                out.append(value[()] if value.ndim == 0 else value)
+            out = tuple(out)
         if combine:
             return numpy.stack(out, axis=-1)
         else:
@@ -8,26 +8,33 @@ __author__ = "Thomas McCullough"
 import logging
 from tempfile import mkstemp
 import os
-from typing import Dict, Tuple, Optional, Union
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from typing import Dict, Tuple, Optional, Union, List, Callable
 
 import numpy
 from numpy.polynomial import polynomial
-from numpy.random import randn
 from scipy.signal import resample
 
 from sarpy.io.general.base import SarpyIOError
+from sarpy.io.general.utils import get_worker_count
 from sarpy.processing.ortho_rectify import FullResolutionFetcher
 from sarpy.processing.sicd.fft_base import fft, ifft, fftshift, ifftshift, \
     fft_sicd, ifft_sicd
+from sarpy.processing.sicd.windows import resample_window
 
 from sarpy.io.complex.base import FlatSICDReader, SICDTypeReader
 from sarpy.io.complex.converter import open_complex
 from sarpy.io.complex.sicd import SICDWriter
 from sarpy.io.complex.sicd_elements.SICD import SICDType
 from sarpy.io.complex.sicd_elements.Grid import WgtTypeType
+from sarpy.io.complex.sicd_elements.blocks import poly2d_grid
 
 logger = logging.getLogger(__name__)
 
+_SKEW_BLOCK_ELEMENTS = 2**20
+
 
 ##################
 # helper functions
@@ -73,8 +80,22 @@ def apply_skew_poly(
     delta_kcoa_poly_int = polynomial.polyint(delta_kcoa_poly, axis=dimension)
     if forward:
         fft_sgn *= -1
-    return input_data*numpy.exp(1j*fft_sgn*2*numpy.pi*polynomial.polygrid2d(
-        row_array, col_array, delta_kcoa_poly_int))
+
+    # evaluate the phase over blocks of rows, rather than over the full mesh at once
+    row_array = numpy.atleast_1d(row_array)
+    col_array = numpy.atleast_1d(col_array)
+    output_data = numpy.empty(
+        (row_array.size, col_array.size), dtype=numpy.result_type(input_data, numpy.complex128))
+    block_size = max(1, _SKEW_BLOCK_ELEMENTS//max(1, col_array.size))
+    phase = None
+    for start in range(0, row_array.size, block_size):
+        end = min(start + block_size, row_array.size)
+        if phase is None or phase.shape[0] != end - start:
+            phase = numpy.empty((end - start, col_array.size), dtype='float64')
+        poly2d_grid(row_array[start:end], col_array, delta_kcoa_poly_int, out=phase)
+        phase *= fft_sgn*2*numpy.pi
+        numpy.multiply(input_data[start:end], numpy.exp(1j*phase), out=output_data[start:end])
+    return output_data
 
 
 def determine_weight_array(
@@ -119,7 +140,7 @@ def determine_weight_array(
     if weight_array.size == weight_size:
         return weight_array, weight_ind_start, weight_ind_end
     else:
-        return resample(weight_array, weight_size), weight_ind_start, weight_ind_end
+        return resample_window(weight_array, weight_size, copy=False), weight_ind_start, weight_ind_end
 
 
 def apply_weight_array(
@@ -748,6 +769,222 @@ def noise_scaling(
     return second_moment
 
 
+class _DimensionReweight(object):
+    """
+    The along dimension processing for :func:`sicd_degrade_reweight`. This
+    transforms a strip of data which is full resolution along the processing
+    dimension, so that strips are independent of each other.
+    """
+
+    __slots__ = (
+        '_sicd', '_dimension', '_fft_sgn', '_delta_kcoa', '_deskew',
+        '_cur_aperture_limits', '_cur_weight_function', '_deweight',
+        '_new_aperture_limits', '_new_weight_function', '_subaperture', '_reweight')
+
+    def __init__(
+            self,
+            sicd: SICDType,
+            dimension: int,
+            fft_sgn: int,
+            delta_kcoa: numpy.ndarray,
+            deskew: bool,
+            cur_aperture_limits: Tuple[int, int],
+            cur_weight_function: numpy.ndarray,
+            deweight: bool,
+            new_aperture_limits: Tuple[int, int],
+            new_weight_function: numpy.ndarray,
+            subaperture: bool,
+            reweight: bool):
+        """
+
+        Parameters
+        ----------
+        sicd : SICDType
+            The sicd structure, used for the fft sign.
+        dimension : int
+        fft_sgn : int
+        delta_kcoa : numpy.ndarray
+            The original delta kcoa polynomial.
+        deskew : bool
+            Deskew before transforming?
+        cur_aperture_limits : Tuple[int, int]
+        cur_weight_function : numpy.ndarray
+        deweight : bool
+            Remove the current weighting?
+        new_aperture_limits : Tuple[int, int]
+        new_weight_function : numpy.ndarray
+        subaperture : bool
+            Zero the phase history outside the new aperture?
+        reweight : bool
+            Apply the new weighting?
+        """
+
+        self._sicd = sicd
+        self._dimension = dimension
+        self._fft_sgn = fft_sgn
+        self._delta_kcoa = delta_kcoa
+        self._deskew = deskew
+        self._cur_aperture_limits = cur_aperture_limits
+        self._cur_weight_function = cur_weight_function
+        self._deweight = deweight
+        self._new_aperture_limits = new_aperture_limits
+        self._new_weight_function = new_weight_function
+        self._subaperture = subaperture
+        self._reweight = reweight
+
+    @property
+    def dimension(self) -> int:
+        """
+        int: The processing dimension.
+        """
+
+        return self._dimension
+
+    def __call__(
+            self,
+            data: numpy.ndarray,
+            row_array: numpy.ndarray,
+            col_array: numpy.ndarray) -> numpy.ndarray:
+        """
+        Apply the processing to the given strip of data.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            The strip of data, which must be full resolution along the processing dimension.
+        row_array : numpy.ndarray
+            The row coordinates in meters.
+        col_array : numpy.ndarray
+            The column coordinates in meters.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+
+        dimension = self._dimension
+        # perform deskew, if necessary
+        if self._deskew:
+            data = apply_skew_poly(
+                data, self._delta_kcoa, row_array, col_array, self._fft_sgn, dimension,
+                forward=False).astype('complex64')
+
+        # perform fourier transform along the given dimension
+        data = fftshift(fft_sicd(data, dimension, self._sicd), axes=dimension)
+
+        # perform deweight, if necessary
+        cur_start, cur_end = self._cur_aperture_limits
+        new_start, new_end = self._new_aperture_limits
+        if self._deweight:
+            if dimension == 0:
+                data[cur_start:cur_end, :] /= self._cur_weight_function[:, numpy.newaxis]
+            else:
+                data[:, cur_start:cur_end] /= self._cur_weight_function
+
+        # do sub-aperture, if necessary
+        if self._subaperture:
+            if dimension == 0:
+                data[:new_start, :] = 0
+                data[new_end:, :] = 0
+            else:
+                data[:, :new_start] = 0
+                data[:, new_end:] = 0
+
+        # perform reweight, if necessary
+        if self._reweight:
+            if dimension == 0:
+                data[new_start:new_end, :] *= self._new_weight_function[:, numpy.newaxis]
+            else:
+                data[:, new_start:new_end] *= self._new_weight_function
+
+        # perform inverse fourier transform along the given dimension
+        data = ifft_sicd(ifftshift(data, axes=dimension), dimension, self._sicd)
+
+        # perform the (original) reskew, if necessary
+        if not numpy.all(self._delta_kcoa == 0):
+            data = apply_skew_poly(
+                data, self._delta_kcoa, row_array, col_array, self._fft_sgn, dimension, forward=True)
+        return data
+
+
+def _process_strips(
+        strips: List[Tuple[int, int]],
+        fetch: Callable[[int, int], numpy.ndarray],
+        process: Callable[[numpy.ndarray, int, int], numpy.ndarray],
+        store: Callable[[numpy.ndarray, int, int], None],
+        worker_count: int,
+        label: str) -> None:
+    """
+    Performs the fetch, process, store cycle for each strip using a pool of
+    worker threads. Fetching and storing are serialized, while processing is
+    concurrent. At most `worker_count` strips are held in memory at once.
+    Progress and throughput are logged as each strip completes.
+
+    Parameters
+    ----------
+    strips : List[Tuple[int, int]]
+        The `(start, stop)` index definition of each strip.
+    fetch : Callable
+        Fetches the data for `(start, stop)`.
+    process : Callable
+        Processes the data for `(data, start, stop)`, returning the result.
+    store : Callable
+        Stores the result for `(data, start, stop)`.
+    worker_count : int
+    label : str
+        The description of this pass, for logging.
+
+    Returns
+    -------
+    None
+    """
+
+    io_lock = threading.Lock()
+
+    def do_strip(start_index: int, stop_index: int) -> int:
+        with io_lock:
+            data = fetch(start_index, stop_index)
+        data = process(data, start_index, stop_index)
+        with io_lock:
+            store(data, start_index, stop_index)
+        return data.nbytes
+
+    start_time = time.time()
+    total_bytes = 0
+    completed = 0
+
+    def log_progress() -> None:
+        elapsed = max(time.time() - start_time, 1e-6)
+        logger.info(
+            '{}: completed strip {} of {} ({:0.1f} MB/s)'.format(
+                label, completed, len(strips), total_bytes/(elapsed*2**20)))
+
+    if worker_count == 1 or len(strips) == 1:
+        for the_strip in strips:
+            nbytes = do_strip(*the_strip)
+            completed += 1
+            total_bytes += nbytes
+            log_progress()
+        return
+
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        pending = set()
+        for the_strip in strips:
+            if len(pending) >= worker_count:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    nbytes = future.result()
+                    completed += 1
+                    total_bytes += nbytes
+                    log_progress()
+            pending.add(executor.submit(do_strip, *the_strip))
+        for future in as_completed(pending):
+            nbytes = future.result()
+            completed += 1
+            total_bytes += nbytes
+            log_progress()
+
+
 def sicd_degrade_reweight(
         reader: SICDTypeReader,
         output_file: Optional[str] = None,
@@ -762,7 +999,8 @@ def sicd_degrade_reweight(
         pixel_threshold: Optional[int] = 1500*1500,
         check_existence: bool = True,
         check_older_version: bool = False,
-        repopulate_rniirs: bool = True) -> Optional[FlatSICDReader]:
+        repopulate_rniirs: bool = True,
+        max_workers: Optional[int] = None) -> Optional[FlatSICDReader]:
     r"""
     Given input, create a SICD (file or reader) with modified weighting/subaperture
     parameters. Any additional noise will be added **before** performing any sub-aperture
@@ -773,6 +1011,13 @@ def sicd_degrade_reweight(
     magnitude of the noise in pixel power by :math:`ratio`, or subtracts
     :math:`10*\log_{10}(ratio)` from the noise given in dB.
 
+    The processing is performed in (at most) two passes. The row pass operates
+    on column strips, and the column pass operates on row strips, so that each
+    strip is full resolution along the processing dimension and is processed
+    independently by a pool of worker threads. When processing out of memory,
+    the result of the first pass is held in a memory-mapped temporary file,
+    and the final pass writes directly to the output file.
+
     .. warning::
 
         To ensure correctness of metadata, if the Noise Polynomial is present,
@@ -814,12 +1059,17 @@ def sicd_degrade_reweight(
         processing actually reduces the resulting noise, which will also be considered.
     pixel_threshold : None|int
         Approximate pixel area threshold for performing this directly in memory.
+        This is also the approximate pixel area of each processing strip, and
+        `None` indicates processing as a single strip.
     check_existence : bool
         Should we check if the given file already exists, and raise an exception if so?
     check_older_version : bool
         Try to use a less recent version of SICD (1.1), for possible application compliance issues?
     repopulate_rniirs : bool
         Should we try to repopulate the estimated RNIIRS value?
+    max_workers : None|int
+        The maximum number of worker threads used for processing strips. `None`
+        uses the :class:`concurrent.futures.ThreadPoolExecutor` default.
 
     Returns
     -------
@@ -852,10 +1102,10 @@ def sicd_degrade_reweight(
         return _lims
 
     def get_iterations(max_index, other_index):
-        if in_memory:
+        if pixel_threshold is None:
             return [(0, max_index), ]
+        block = max(1, int(pixel_threshold / float(other_index)))
         out = []
-        block = int(pixel_threshold / float(other_index))
         _start_ind = 0
         while _start_ind < max_index:
             _end_ind = min(_start_ind + block, max_index)
@@ -872,36 +1122,28 @@ def sicd_degrade_reweight(
             multiplier = sicd.Grid.Col.SS
         return (numpy.arange(start_index, end_index) + shift)*multiplier
 
-    def do_add_noise():
+    def get_noise_sigma():
         if add_noise is None:
-            return
+            return None
 
         # noinspection PyBroadException
         try:
             variance = float(add_noise)
             if variance <= 0:
                 logger.error('add_noise was provided as `{}`, but must be a positive number'.format(add_noise))
-                return
+                return None
         except Exception:
             logger.error('add_noise was provided as `{}`, but must be a positive number'.format(add_noise))
-            return
+            return None
 
-        sigma = numpy.sqrt(0.5*variance)
         if noise_level is not None:
             noise_constant_power = numpy.exp(numpy.log(10)*0.1*noise_level.NoisePoly[0, 0])
             noise_constant_power += variance
             noise_constant_db = 10*numpy.log10(noise_constant_power)
             noise_level.NoisePoly[0, 0] = noise_constant_db
+        return numpy.sqrt(0.5*variance)
 
-        for (_start_ind, _stop_ind) in row_iterations:
-            d_shape = (_stop_ind - _start_ind, data_shape[1])
-            added_noise = numpy.empty(d_shape, dtype='complex64')
-            added_noise[:].real = randn(*d_shape).astype('float32')
-            added_noise[:].imag = randn(*d_shape).astype('float32')
-            added_noise *= sigma
-            working_data[_start_ind:_stop_ind, :] += added_noise
-
-    def do_dimension(dimension):
+    def get_dimension_processing(dimension):
         if dimension == 0:
             dir_params = sicd.Grid.Row
             aperture_in = row_aperture
@@ -935,7 +1177,7 @@ def sicd_degrade_reweight(
 
         if aperture_in is None and weighting_in is None:
             # nothing to be done in this dimension
-            return noise_adjustment_multiplier
+            return None, 1.0
 
         new_weight = None if weighting_in is None else weighting_in['WgtFunct']
         dimension_limits, cur_aperture_limits, cur_weight_function, \
@@ -948,97 +1190,24 @@ def sicd_degrade_reweight(
         noise_multiplier = noise_scaling(
             cur_aperture_limits, cur_weight_function, new_aperture_limits, new_weight_function)
 
-        # perform deskew, if necessary
-        if not not_skewed:
-            if dimension == 0:
-                row_array = get_direction_array_meters(0, 0, out_data_shape[0])
-                for (_start_ind, _stop_ind) in col_iterations:
-                    col_array = get_direction_array_meters(1, _start_ind, _stop_ind)
-                    working_data[:, _start_ind:_stop_ind] = apply_skew_poly(
-                        working_data[:, _start_ind:_stop_ind], delta_kcoa,
-                        row_array, col_array, dir_params.Sgn, 0, forward=False)
-            else:
-                col_array = get_direction_array_meters(1, 0, out_data_shape[1])
-                for (_start_ind, _stop_ind) in row_iterations:
-                    row_array = get_direction_array_meters(0, _start_ind, _stop_ind)
-                    working_data[_start_ind:_stop_ind, :] = apply_skew_poly(
-                        working_data[_start_ind:_stop_ind, :], delta_kcoa,
-                        row_array, col_array, dir_params.Sgn, 1, forward=False)
-
-        # perform fourier transform along the given dimension
-        if dimension == 0:
-            for (_start_ind, _stop_ind) in col_iterations:
-                working_data[:, _start_ind:_stop_ind] = fftshift(
-                    fft_sicd(working_data[:, _start_ind:_stop_ind], dimension, sicd), axes=dimension)
-        else:
-            for (_start_ind, _stop_ind) in row_iterations:
-                working_data[_start_ind:_stop_ind, :] = fftshift(
-                    fft_sicd(working_data[_start_ind:_stop_ind, :], dimension, sicd), axes=dimension)
+        processing = _DimensionReweight(
+            sicd, dimension, dir_params.Sgn, delta_kcoa.copy(), not not_skewed,
+            cur_aperture_limits, cur_weight_function, not uniform_weight,
+            new_aperture_limits, new_weight_function, aperture_in is not None,
+            weighting_in is not None or not uniform_weight)
 
-        # perform deweight, if necessary
-        if not uniform_weight:
-            if dimension == 0:
-                working_data[cur_aperture_limits[0]:cur_aperture_limits[1], :] /= cur_weight_function[:, numpy.newaxis]
-            else:
-                working_data[:, cur_aperture_limits[0]:cur_aperture_limits[1]] /= cur_weight_function
-
-        # do sub-aperture, if necessary
         if aperture_in is not None:
-            if dimension == 0:
-                working_data[:new_aperture_limits[0], :] = 0
-                working_data[new_aperture_limits[1]:, :] = 0
-            else:
-                working_data[:, :new_aperture_limits[0]] = 0
-                working_data[:, new_aperture_limits[1]:] = 0
-
             the_ratio = float(new_aperture_limits[1] - new_aperture_limits[0]) / \
                 float(cur_aperture_limits[1] - cur_aperture_limits[0])
             # modify the ImpRespBW value (derived ImpRespWid handled at the end)
             dir_params.ImpRespBW *= the_ratio
 
-        # perform reweight, if necessary
         if weighting_in is not None:
-            if dimension == 0:
-                working_data[new_aperture_limits[0]:new_aperture_limits[1], :] *= new_weight_function[:, numpy.newaxis]
-            else:
-                working_data[:, new_aperture_limits[0]:new_aperture_limits[1]] *= new_weight_function
             # modify the weight definition
             dir_params.WgtType = WgtTypeType(
                 WindowName=weighting_in['WindowName'],
                 Parameters=weighting_in.get('Parameters', None))
             dir_params.WgtFunct = weighting_in['WgtFunct'].copy()
-        elif not uniform_weight:
-            if dimension == 0:
-                working_data[new_aperture_limits[0]:new_aperture_limits[1], :] *= new_weight_function[:, numpy.newaxis]
-            else:
-                working_data[:, new_aperture_limits[0]:new_aperture_limits[1]] *= new_weight_function
-
-        # perform inverse fourier transform along the given dimension
-        if dimension == 0:
-            for (_start_ind, _stop_ind) in col_iterations:
-                working_data[:, _start_ind:_stop_ind] = ifft_sicd(
-                    ifftshift(working_data[:, _start_ind:_stop_ind], axes=dimension), dimension, sicd)
-        else:
-            for (_start_ind, _stop_ind) in row_iterations:
-                working_data[_start_ind:_stop_ind, :] = ifft_sicd(
-                    ifftshift(working_data[_start_ind:_stop_ind, :], axes=dimension), dimension, sicd)
-
-        # perform the (original) reskew, if necessary
-        if not numpy.all(delta_kcoa == 0):
-            if dimension == 0:
-                row_array = get_direction_array_meters(0, 0, out_data_shape[0])
-                for (_start_ind, _stop_ind) in col_iterations:
-                    col_array = get_direction_array_meters(1, _start_ind, _stop_ind)
-                    working_data[:, _start_ind:_stop_ind] = apply_skew_poly(
-                        working_data[:, _start_ind:_stop_ind], delta_kcoa,
-                        row_array, col_array, dir_params.Sgn, 0, forward=True)
-            else:
-                col_array = get_direction_array_meters(1, 0, out_data_shape[1])
-                for (_start_ind, _stop_ind) in row_iterations:
-                    row_array = get_direction_array_meters(0, _start_ind, _stop_ind)
-                    working_data[_start_ind:_stop_ind, :] = apply_skew_poly(
-                        working_data[_start_ind:_stop_ind, :], delta_kcoa,
-                        row_array, col_array, dir_params.Sgn, 1, forward=True)
 
         # modify the delta_kcoa_poly - introduce the shift necessary for additional offset
         if new_center_index != cur_center_index:
@@ -1046,7 +1215,62 @@ def sicd_degrade_reweight(
             delta_kcoa[0, 0] += additional_shift
             dir_params.DeltaKCOAPoly = delta_kcoa
 
-        return noise_adjustment_multiplier*noise_multiplier
+        return processing, noise_multiplier
+
+    def get_fetch_function(dimension, from_reader):
+        def fetch(start_index, stop_index):
+            if from_reader:
+                if dimension == 0:
+                    return reader[
+                        row_limits[0]:row_limits[1],
+                        start_index+column_limits[0]:stop_index+column_limits[0], index]
+                else:
+                    return reader[
+                        start_index+row_limits[0]:stop_index+row_limits[0],
+                        column_limits[0]:column_limits[1], index]
+            elif dimension == 0:
+                return numpy.array(working_data[:, start_index:stop_index], dtype='complex64')
+            else:
+                return numpy.array(working_data[start_index:stop_index, :], dtype='complex64')
+        return fetch
+
+    def get_store_function(dimension, to_writer):
+        def store(data, start_index, stop_index):
+            if to_writer:
+                start_indices = (0, start_index) if dimension == 0 else (start_index, 0)
+                writer.write_chip(data.astype('complex64', copy=False), start_indices=start_indices)
+            elif dimension == 0:
+                working_data[:, start_index:stop_index] = data
+            else:
+                working_data[start_index:stop_index, :] = data
+        return store
+
+    def get_process_function(processing, dimension, include_noise):
+        strips = row_iterations if dimension == 1 else col_iterations
+        seeds = None
+        if include_noise:
+            # independent and reproducible noise streams for each strip
+            seed_sequence = numpy.random.SeedSequence(numpy.random.randint(0, 2**31 - 1))
+            seeds = dict(zip(strips, seed_sequence.spawn(len(strips))))
+
+        def process(data, start_index, stop_index):
+            if data.ndim < 2:
+                data = numpy.reshape(data, (-1, 1) if dimension == 0 else (1, -1))
+            if seeds is not None:
+                rng = numpy.random.default_rng(seeds[(start_index, stop_index)])
+                data = data.astype('complex64', copy=True)
+                data.real += sigma*rng.standard_normal(data.shape, dtype='float32')
+                data.imag += sigma*rng.standard_normal(data.shape, dtype='float32')
+            if processing is None:
+                return data
+            if dimension == 0:
+                row_array = get_direction_array_meters(0, 0, out_data_shape[0])
+                col_array = get_direction_array_meters(1, start_index, stop_index)
+            else:
+                row_array = get_direction_array_meters(0, start_index, stop_index)
+                col_array = get_direction_array_meters(1, 0, out_data_shape[1])
+            return processing(data, row_array, col_array)
+        return process
 
     if isinstance(reader, str):
         reader = open_complex(reader)
@@ -1058,6 +1282,7 @@ def sicd_degrade_reweight(
     old_sicd = reader.get_sicds_as_tuple()[index]
     validate_sicd(old_sicd)
     validate_filename()
+    worker_count = get_worker_count(max_workers)
 
     data_shape = reader.get_data_size_as_tuple()[index]
 
@@ -1088,31 +1313,18 @@ def sicd_degrade_reweight(
     out_data_shape = (sicd.ImageData.NumRows, sicd.ImageData.NumCols)
 
     pixel_area = out_data_shape[0]*out_data_shape[1]
-    temp_file = None
     in_memory = True if (output_file is None or pixel_threshold is None) else (pixel_area < pixel_threshold)
 
     row_iterations = get_iterations(out_data_shape[0], out_data_shape[1])
     col_iterations = get_iterations(out_data_shape[1], out_data_shape[0])
 
-    if in_memory:
-        working_data = reader[row_limits[0]:row_limits[1], column_limits[0]:column_limits[1], index]
-    else:
-        _, temp_file = mkstemp(suffix='.sarpy.cache', text=False)
-        working_data = numpy.memmap(temp_file, dtype='complex64', mode='r+', offset=0, shape=out_data_shape)
-        for (start_ind, stop_ind) in row_iterations:
-            working_data[start_ind:stop_ind, :] = reader[
-                                                  start_ind+row_limits[0]:stop_ind+row_limits[0],
-                                                  column_limits[0]:column_limits[1], index]
-
-    noise_adjustment_multiplier = 1.0
-
     # NB: I'm adding Gaussian white noise first
-    do_add_noise()
+    sigma = get_noise_sigma()
 
-    # do, as necessary, along the row
-    noise_adjustment_multiplier = do_dimension(0)
-    # do, as necessary, along the row
-    noise_adjustment_multiplier = do_dimension(1)
+    # determine the processing, as necessary, along the row and column
+    row_processing, row_noise_multiplier = get_dimension_processing(0)
+    col_processing, col_noise_multiplier = get_dimension_processing(1)
+    noise_adjustment_multiplier = row_noise_multiplier*col_noise_multiplier
 
     # re-derive the various ImpResp parameters
     sicd.Grid.derive_direction_params(sicd.ImageData, populate=True)
@@ -1139,16 +1351,46 @@ def sicd_degrade_reweight(
     if repopulate_rniirs:
         sicd.populate_rniirs(override=True)
 
-    if output_file is None:
-        return FlatSICDReader(sicd, working_data)
-    else:
-        # write out the new sicd file
-        with SICDWriter(
-                output_file, sicd,
-                check_older_version=check_older_version, check_existence=check_existence) as writer:
-            for (start_ind, stop_ind) in row_iterations:
-                writer.write_chip(working_data[start_ind:stop_ind, :], start_indices=(start_ind, 0))
+    # define the processing passes - the row pass operates on column strips,
+    #   and the column pass operates on row strips
+    passes = []
+    if row_processing is not None:
+        passes.append(('Row pass', 0, row_processing))
+    if col_processing is not None:
+        passes.append(('Column pass', 1, col_processing))
+    if len(passes) == 0:
+        passes.append(('Copy pass', 1, None))
 
-        if temp_file is not None and os.path.exists(temp_file):
+    temp_file = None
+    working_data = None
+    if output_file is None or (len(passes) > 1 and in_memory):
+        working_data = numpy.empty(out_data_shape, dtype='complex64')
+    elif len(passes) > 1:
+        _, temp_file = mkstemp(suffix='.sarpy.cache', text=False)
+        working_data = numpy.memmap(temp_file, dtype='complex64', mode='r+', offset=0, shape=out_data_shape)
+
+    writer = None
+    try:
+        if output_file is not None:
+            writer = SICDWriter(
+                output_file, sicd,
+                check_older_version=check_older_version, check_existence=check_existence)
+
+        for i, (label, dimension, processing) in enumerate(passes):
+            _process_strips(
+                row_iterations if dimension == 1 else col_iterations,
+                get_fetch_function(dimension, i == 0),
+                get_process_function(processing, dimension, sigma is not None and i == 0),
+                get_store_function(dimension, writer is not None and i == len(passes) - 1),
+                worker_count,
+                label)
+    finally:
+        if writer is not None:
+            writer.close()
+        if temp_file is not None:
             working_data = None
-            os.remove(temp_file)
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+    if output_file is None:
+        return FlatSICDReader(sicd, working_data)
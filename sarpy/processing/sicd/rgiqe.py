@@ -743,6 +743,7 @@ def quality_degrade(
         desired_resolution: Optional[Tuple[float, float]] = None,
         desired_bandwidth: Optional[Tuple[float, float]] = None,
         desired_nesz: Optional[float] = None,
+        max_workers: Optional[int] = None,
         **kwargs) -> Optional[FlatSICDReader]:
     r"""
     Create a degraded quality SICD based on the desired resolution (impulse response width)
@@ -779,6 +780,10 @@ def quality_degrade(
         The desired Noise Equivalent Sigma Zero value in power units, this is after
         modifications which change the noise due to sub-aperture degradation and/or
         de-weighting.
+    max_workers : None|int
+        The maximum number of worker threads used for processing strips, passed
+        through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`.
+        `None` uses the :class:`concurrent.futures.ThreadPoolExecutor` default.
     kwargs
         Keyword arguments passed through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`
 
@@ -817,7 +822,7 @@ def quality_degrade(
         reader, output_file=output_file, index=index,
         row_aperture=row_aperture, row_weighting=row_weighting,
         column_aperture=column_aperture, column_weighting=column_weighting,
-        add_noise=add_noise, **kwargs)
+        add_noise=add_noise, max_workers=max_workers, **kwargs)
 
 
 def quality_degrade_resolution(
@@ -826,6 +831,7 @@ def quality_degrade_resolution(
         output_file: Optional[str] = None,
         desired_resolution: Optional[Tuple[float, float]] = None,
         desired_bandwidth: Optional[Tuple[float, float]] = None,
+        max_workers: Optional[int] = None,
         **kwargs) -> Optional[FlatSICDReader]:
     """
     Create a degraded quality SICD based on INCREASING the impulse response width
@@ -849,6 +855,10 @@ def quality_degrade_resolution(
     desired_bandwidth : None|tuple
         The desired ImpRespBW (Row, Col) tuple. Exactly one of `desired_resolution`
         and `desired_bandwidth` must be provided.
+    max_workers : None|int
+        The maximum number of worker threads used for processing strips, passed
+        through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`.
+        `None` uses the :class:`concurrent.futures.ThreadPoolExecutor` default.
     kwargs
         Keyword arguments passed through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`
 
@@ -862,7 +872,7 @@ def quality_degrade_resolution(
     return quality_degrade(
         reader, index=index, output_file=output_file,
         desired_resolution=desired_resolution, desired_bandwidth=desired_bandwidth,
-        **kwargs)
+        max_workers=max_workers, **kwargs)
 
 
 def quality_degrade_noise(
@@ -870,6 +880,7 @@ def quality_degrade_noise(
         index: int = 0,
         output_file: Optional[str] = None,
         desired_nesz: Optional[float] = None,
+        max_workers: Optional[int] = None,
         **kwargs) -> Optional[FlatSICDReader]:
     """
     Create a degraded quality SICD based on INCREASING the noise to the desired
@@ -890,6 +901,10 @@ def quality_degrade_noise(
         this is the path for the produced output SICD file.
     desired_nesz : None|float
         The desired noise equivalent sigma zero value.
+    max_workers : None|int
+        The maximum number of worker threads used for processing strips, passed
+        through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`.
+        `None` uses the :class:`concurrent.futures.ThreadPoolExecutor` default.
     kwargs
         Keyword arguments passed through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`
 
@@ -900,7 +915,9 @@ def quality_degrade_noise(
         reader object.
     """
 
-    return quality_degrade(reader, index=index, output_file=output_file, desired_nesz=desired_nesz, **kwargs)
+    return quality_degrade(
+        reader, index=index, output_file=output_file, desired_nesz=desired_nesz,
+        max_workers=max_workers, **kwargs)
 
 
 def quality_degrade_rniirs(
@@ -909,6 +926,7 @@ def quality_degrade_rniirs(
         output_file: Optional[str] = None,
         desired_rniirs: Optional[float] = None,
         alpha: float = 0,
+        max_workers: Optional[int] = None,
         **kwargs) -> Optional[FlatSICDReader]:
     r"""
     Create a degraded quality SICD based on the desired estimated RNIIRS value.
@@ -947,6 +965,10 @@ def quality_degrade_rniirs(
         This must be a number in the interval [0, 1] defining the (geometric)
         distribution of variability between required influence from increasing
         noise and require influence of decreasing bandwidth.
+    max_workers : None|int
+        The maximum number of worker threads used for processing strips, passed
+        through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`.
+        `None` uses the :class:`concurrent.futures.ThreadPoolExecutor` default.
     kwargs
         Keyword arguments passed through to :func:`sarpy.processing.sicd.normalize_sicd.sicd_degrade_reweight`
 
@@ -958,7 +980,7 @@ def quality_degrade_rniirs(
     """
 
     if desired_rniirs is None:
-        return quality_degrade(reader, index=index, output_file=output_file, **kwargs)
+        return quality_degrade(reader, index=index, output_file=output_file, max_workers=max_workers, **kwargs)
 
     reader, index = _validate_reader(reader, index)
     sicd = reader.get_sicds_as_tuple()[index]
@@ -982,4 +1004,4 @@ def quality_degrade_rniirs(
         reader, output_file=output_file, index=index,
         row_aperture=row_aperture, row_weighting=row_weighting,
         column_aperture=column_aperture, column_weighting=column_weighting,
-        add_noise=add_noise, **kwargs)
+        add_noise=add_noise, max_workers=max_workers, **kwargs)
@@ -82,32 +82,11 @@ class Taper:
         """Make the sample values of a 1-D symmetric window"""
         window_size = self.default_size if window_size is None else window_size
 
-        if self.window_type == 'UNIFORM':
-            wgts = np.ones(window_size)
-
-        elif self.window_type in ['HAMMING']:
-            wgts = windows.hamming(window_size, sym=True)
-
-        elif self.window_type in ['HANNING', 'HANN']:
-            wgts = windows.hanning(window_size, sym=True)
-
-        elif self.window_type in ['GENERAL_HAMMING']:
-            alpha = float(self.window_pars['ALPHA'])
-            wgts = windows.general_hamming(window_size, alpha=alpha, sym=True)
-
-        elif self.window_type == 'TAYLOR':
-            nbar = int(self.window_pars['NBAR'])
-            sll = float(self.window_pars['SLL'])
-            wgts = windows.taylor(window_size, nbar=nbar, sll=-np.abs(sll), sym=True)
-
-        elif self.window_type == 'KAISER':
-            beta = float(self.window_pars['BETA'])
-            wgts = windows.kaiser(window_size, beta=beta, sym=True)
-
-        else:
+        if self.window_type not in self.default_pars:
             raise ValueError(f'Window type "{self.window_type}" is not supported.')
 
-        return wgts
+        pars = {key: self.window_pars[key] for key in self.default_pars[self.window_type]}
+        return windows.get_window(self.window_type, window_size, parameters=pars, sym=True)
 
     def get_vals(self, size, sym=True):
         """
@@ -273,9 +252,7 @@ def _fit_1d_window(window_vals, desired_size):
     if len(window_vals) == desired_size:
         w = window_vals
     else:
-        x = np.linspace(0, 1, len(window_vals))
-        f = spi.interp1d(x, window_vals, kind='cubic')
-        w = f(np.linspace(0, 1, desired_size))
+        w = windows.resample_window(window_vals, desired_size, kind='cubic')
     return w
 
 
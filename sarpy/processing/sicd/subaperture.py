@@ -7,13 +7,16 @@ __classification__ = "UNCLASSIFIED"
 
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Generator, Tuple, List, Optional, Sequence
 
 import numpy
 from scipy.constants import speed_of_light
 
 from sarpy.processing.sicd.fft_base import FFTCalculator, fft, ifft, fftshift, fft2_sicd, ifft2_sicd
-from sarpy.io.general.slice_parsing import validate_slice_int, verify_slice
+from sarpy.io.general.slice_parsing import validate_slice_int, verify_slice, verify_subscript
+from sarpy.io.general.utils import get_worker_count
+from sarpy.io.complex.utils import get_fetch_block_size
 from sarpy.processing.sicd.normalize_sicd import DeskewCalculator
 from sarpy.processing.ortho_rectify import OrthorectificationHelper, OrthorectificationIterator
 from sarpy.visualization.remap import RemapFunction
@@ -179,6 +182,71 @@ def subaperture_processing_phase_history(
         return ifft(phase_array[:, aperture_indices[0]:aperture_indices[1]], axis=1, n=output_resolution)
 
 
+def subaperture_processing_phase_history_frames(
+        phase_array: numpy.ndarray,
+        frame_collection: List[Tuple[int, int]],
+        output_resolution: int,
+        dimension: int = 0,
+        frames: Union[None, Sequence[int], numpy.ndarray] = None,
+        max_workers: Optional[int] = None) -> numpy.ndarray:
+    """
+    Perform the sub-aperture processing for a collection of frames on the given
+    complex phase history data. The phase history is shared between all frames,
+    so the forward transform need only be performed once, and the frames are
+    calculated concurrently.
+
+    Parameters
+    ----------
+    phase_array : numpy.ndarray
+        The complex array data. Dimension other than 2 is not supported.
+    frame_collection : List[Tuple[int, int]]
+        The start/stop indices for each frame, as provided by :func:`frame_definition`.
+    output_resolution : int
+        The output resolution parameter.
+    dimension : int
+        The dimension along which to perform the sub-aperture processing. Must be
+        one of 0 or 1.
+    frames : None|Sequence[int]|numpy.ndarray
+        The frames to calculate. This defaults to all frames in `frame_collection`.
+    max_workers : None|int
+        The maximum number of worker threads. `None` uses the
+        :class:`concurrent.futures.ThreadPoolExecutor` default.
+
+    Returns
+    -------
+    numpy.ndarray
+        The complex64 array with the frame index as the final dimension.
+    """
+
+    phase_array = _validate_input(phase_array)
+    dimension = _validate_dimension(dimension)
+    worker_count = get_worker_count(max_workers)
+
+    if frames is None:
+        frames = numpy.arange(len(frame_collection))
+    frames = numpy.atleast_1d(numpy.asarray(frames, dtype=numpy.int64))
+
+    if dimension == 0:
+        out_shape = (output_resolution, phase_array.shape[1], frames.size)
+    else:
+        out_shape = (phase_array.shape[0], output_resolution, frames.size)
+    out = numpy.empty(out_shape, dtype=numpy.complex64)
+
+    def do_frame(i: int) -> None:
+        out[:, :, i] = subaperture_processing_phase_history(
+            phase_array, frame_collection[int(frames[i])], output_resolution, dimension=dimension)
+
+    if frames.size == 1 or worker_count == 1:
+        for j in range(frames.size):
+            do_frame(j)
+    else:
+        # the fft calculations release the GIL, so threads are effective here
+        with ThreadPoolExecutor(max_workers=min(worker_count, frames.size)) as executor:
+            for _ in executor.map(do_frame, range(frames.size)):
+                pass
+    return out
+
+
 class SubapertureCalculator(FFTCalculator):
     """
     Class for performing sub-aperture processing from a reader instance.
@@ -188,7 +256,7 @@ class SubapertureCalculator(FFTCalculator):
     not decrease the amount of data which must be fetched.
     """
 
-    __slots__ = ('_frame_count', '_aperture_fraction', '_method', '_frame_definition')
+    __slots__ = ('_frame_count', '_aperture_fraction', '_method', '_frame_definition', '_max_workers')
 
     def __init__(
             self,
@@ -198,7 +266,8 @@ class SubapertureCalculator(FFTCalculator):
             block_size: int = 10,
             frame_count: int = 9,
             aperture_fraction: float = 0.2,
-            method: str = 'FULL'):
+            method: str = 'FULL',
+            max_workers: Optional[int] = None):
         """
 
         Parameters
@@ -219,18 +288,24 @@ class SubapertureCalculator(FFTCalculator):
         method : str
             The subaperture processing method, which must be one of
             `('NORMAL', 'FULL', 'MINIMAL')`.
+        max_workers : None|int
+            The maximum number of worker threads used to calculate the frames
+            from the shared phase history. `None` uses the
+            :class:`concurrent.futures.ThreadPoolExecutor` default.
         """
 
         self._frame_count = 9
         self._aperture_fraction = 0.2
         self._method = 'FULL'
         self._frame_definition = None
+        self._max_workers = None
         super(SubapertureCalculator, self).__init__(
             reader, dimension=dimension, index=index, block_size=block_size)
 
         self.frame_count = frame_count
         self.aperture_fraction = aperture_fraction
         self.method = method
+        self.max_workers = max_workers
 
     @property
     def frame_count(self) -> int:
@@ -277,6 +352,46 @@ class SubapertureCalculator(FFTCalculator):
             raise ValueError('method must be one of {}, got {}'.format(_METHOD_VALUES, value))
         self._method = value
 
+    @property
+    def max_workers(self) -> Optional[int]:
+        """
+        None|int: The maximum number of worker threads for frame calculation.
+        """
+
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        self._max_workers = None if value is None else get_worker_count(value)
+
+    def get_fetch_block_size(
+            self,
+            start_element: int,
+            stop_element: int,
+            frame_count: Optional[int] = None) -> int:
+        """
+        Gets the fetch block size for the given full resolution section. This
+        accounts for the complex64 phase history workspace, and the complex64
+        output for each frame calculated from it.
+
+        Parameters
+        ----------
+        start_element : int
+        stop_element : int
+        frame_count : None|int
+            The number of frames calculated from each fetched block. This
+            defaults to a single frame, as for fetching one frame at a time.
+
+        Returns
+        -------
+        int
+        """
+
+        if frame_count is None:
+            frame_count = 1
+        return get_fetch_block_size(
+            start_element, stop_element, self.block_size_in_bytes, bands=1+int(frame_count))
+
     def _parse_frame_argument(self, the_frame):
         if the_frame is None:
             return numpy.arange(self.frame_count)
@@ -310,10 +425,72 @@ class SubapertureCalculator(FFTCalculator):
             raise TypeError(
                 'The final slice dimension is of unsupported type {}'.format(type(the_frame)))
 
-    def _parse_slicing(self, item) -> Tuple[slice, slice, Optional[int]]:
+    def _parse_slicing(self, item) -> Tuple[slice, slice, Union[int, numpy.ndarray]]:
+        if isinstance(item, tuple) and len(item) == 3:
+            row_range, col_range = verify_subscript(item[:2], self._data_size)
+            return row_range, col_range, self._parse_frame_argument(item[2])
         row_range, col_range, the_frame = super(SubapertureCalculator, self)._parse_slicing(item)
         return row_range, col_range, self._parse_frame_argument(the_frame)
 
+    @staticmethod
+    def _get_dimension_details(
+            the_range: Union[slice, Tuple[int, int, int]]) -> Tuple[Tuple[int, int, int], int, int]:
+        if isinstance(the_range, Sequence):
+            start, stop, step = the_range
+        elif isinstance(the_range, slice):
+            start = the_range.start
+            stop = the_range.stop
+            step = the_range.step
+        else:
+            raise TypeError('Got unexpected range input {}'.format(the_range))
+
+        the_snip = -1 if step < 0 else 1
+        t_full_range = (start, stop, the_snip)
+        t_full_size = stop - start
+        t_step = abs(step)
+        return t_full_range, t_full_size, t_step
+
+    def _get_phase_history(
+            self,
+            row_range: Union[slice, Tuple[int, int, int]],
+            col_range: Union[slice, Tuple[int, int, int]]) -> Tuple[numpy.ndarray, int, int]:
+        """
+        Fetches the full resolution data block and transforms it to phase history.
+
+        Parameters
+        ----------
+        row_range : slice|Tuple[int, int, int]
+        col_range : slice|Tuple[int, int, int]
+
+        Returns
+        -------
+        phase_history : numpy.ndarray
+        full_size : int
+            The full resolution size along the processing dimension.
+        step : int
+            The step along the processing dimension to apply to the output.
+        """
+
+        row_slice = slice(*row_range) if isinstance(row_range, tuple) else row_range
+        col_slice = slice(*col_range) if isinstance(col_range, tuple) else col_range
+
+        if self.dimension == 0:
+            # determine the full resolution block of data to fetch
+            this_row_range, full_size, step = self._get_dimension_details(row_range)
+            data = self.reader[(slice(*this_row_range), col_slice, self.index)]
+            if data.ndim < 2:
+                data = numpy.reshape(data, (-1, 1))
+        else:
+            # determine the full resolution block of data to fetch
+            this_col_range, full_size, step = self._get_dimension_details(col_range)
+            data = self.reader[(row_slice, slice(*this_col_range), self.index)]
+            if data.ndim < 2:
+                data = numpy.reshape(data, (1, -1))
+        # handle any nonsense data as 0
+        data[~numpy.isfinite(data)] = 0
+        # transform the data to phase space
+        return fftshift(fft(data, axis=self.dimension), axes=self.dimension), full_size, step
+
     def subaperture_generator(
             self,
             row_range: Union[slice, Tuple[int, int, int]],
@@ -322,7 +499,8 @@ class SubapertureCalculator(FFTCalculator):
         """
         Supplies a generator for the given row and column ranges and frames collection.
         **Note that this IGNORES the block_size parameter in fetching, and fetches the
-        entire required block.**
+        entire required block.** See :meth:`frame_batch_generator` for tiled
+        processing of all frames at once.
 
         The full resolution data in the processing dimension is required, even if
         down-sampled by the row_range or col_range parameter.
@@ -341,23 +519,6 @@ class SubapertureCalculator(FFTCalculator):
         Generator[numpy.ndarray]
         """
 
-        def get_dimension_details(
-                the_range: Union[slice, Tuple[int, int, int]]) -> Tuple[Tuple[int, int, int], int, int]:
-            if isinstance(the_range, Sequence):
-                start, stop, step = the_range
-            elif isinstance(the_range, slice):
-                start = the_range.start
-                stop = the_range.stop
-                step = the_range.step
-            else:
-                raise TypeError('Got unexpected range input {}'.format(the_range))
-
-            the_snip = -1 if step < 0 else 1
-            t_full_range = (start, stop, the_snip)
-            t_full_size = stop - start
-            t_step = abs(step)
-            return t_full_range, t_full_size, t_step
-
         if self._fill is None:
             raise ValueError('Unable to proceed unless the index and dimension are set.')
 
@@ -365,29 +526,7 @@ class SubapertureCalculator(FFTCalculator):
         if isinstance(frames, int):
             frames = [frames, ]
 
-        if isinstance(row_range, tuple):
-            row_slice = slice(*row_range)
-        else:
-            row_slice = row_range
-        if isinstance(col_range, tuple):
-            col_slice = slice(*col_range)
-        else:
-            col_slice = row_range
-
-        if self.dimension == 0:
-            # determine the full resolution block of data to fetch
-            this_row_range, full_size, step = get_dimension_details(row_range)
-            # fetch the necessary data block
-            data = self.reader[(slice(*this_row_range), col_slice, self.index)]
-        else:
-            # determine the full resolution block of data to fetch
-            this_col_range, full_size, step = get_dimension_details(col_range)
-            # fetch the necessary data block, and transform to phase space
-            data = self.reader[(row_slice, slice(*this_col_range), self.index)]
-        # handle any nonsense data as 0
-        data[~numpy.isfinite(data)] = 0
-        # transform the data to phase space
-        data = fftshift(fft(data, axis=self.dimension), axes=self.dimension)
+        data, full_size, step = self._get_phase_history(row_range, col_range)
         # define our frame collection
         frame_collection, output_resolution = frame_definition(
             full_size, frame_count=self.frame_count, aperture_fraction=self.aperture_fraction,
@@ -404,6 +543,124 @@ class SubapertureCalculator(FFTCalculator):
             else:
                 yield this_subap_data[:, ::step]
 
+    def get_frame_batch(
+            self,
+            row_range: Union[slice, Tuple[int, int, int]],
+            col_range: Union[slice, Tuple[int, int, int]],
+            frames: Union[None, int, list, tuple, numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Calculates the given frames for the given row and column ranges as a
+        single batch. The required full resolution block is fetched and transformed
+        to phase history once, and all frames are calculated from this shared
+        phase history using up to `max_workers` threads.
+
+        **Note that this IGNORES the block_size parameter in fetching, and fetches
+        the entire required block.** See :meth:`frame_batch_generator` for tiled
+        processing.
+
+        Parameters
+        ----------
+        row_range : slice|Tuple[int, int, int]
+            The row range.
+        col_range : slice|Tuple[int, int, int]
+            The column range.
+        frames : None|int|list|tuple|numpy.ndarray
+            The frame or frame collection.
+
+        Returns
+        -------
+        numpy.ndarray
+            The complex64 array with the frame index as the final dimension.
+        """
+
+        if self._fill is None:
+            raise ValueError('Unable to proceed unless the index and dimension are set.')
+
+        frames = numpy.atleast_1d(self._parse_frame_argument(frames))
+        data, full_size, step = self._get_phase_history(row_range, col_range)
+        frame_collection, output_resolution = frame_definition(
+            full_size, frame_count=self.frame_count, aperture_fraction=self.aperture_fraction,
+            fill=self.fill, method=self.method)
+        out = subaperture_processing_phase_history_frames(
+            data, frame_collection, output_resolution, dimension=self.dimension,
+            frames=frames, max_workers=self.max_workers)
+        del data
+        if step == 1:
+            return out
+        elif self.dimension == 0:
+            return out[::step, :, :]
+        else:
+            return out[:, ::step, :]
+
+    def _get_frame_batch_blocks(
+            self,
+            row_range: Union[slice, Tuple[int, int, int]],
+            col_range: Union[slice, Tuple[int, int, int]],
+            frame_count: int) -> Tuple[List[Tuple[int, int, int]], List[Tuple[int, int]]]:
+        """
+        Gets the tiling along the off processing dimension in keeping with the
+        block size, accounting for the number of frames being calculated.
+
+        Parameters
+        ----------
+        row_range : slice|Tuple[int, int, int]
+        col_range : slice|Tuple[int, int, int]
+        frame_count : int
+
+        Returns
+        -------
+        range_definitions: List[Tuple[int, int, int]]
+        limit_indices: List[Tuple[int, int]]
+        """
+
+        if self.dimension == 0:
+            full_range, _, _ = self._get_dimension_details(row_range)
+            off_range = col_range
+        else:
+            full_range, _, _ = self._get_dimension_details(col_range)
+            off_range = row_range
+        index_block_size = self.get_fetch_block_size(full_range[0], full_range[1], frame_count=frame_count)
+        return self.extract_blocks(off_range, index_block_size)
+
+    def frame_batch_generator(
+            self,
+            row_range: Union[slice, Tuple[int, int, int]],
+            col_range: Union[slice, Tuple[int, int, int]],
+            frames: Union[None, int, list, tuple, numpy.ndarray] = None) -> Generator[
+                Tuple[Tuple[int, int], numpy.ndarray], None, None]:
+        """
+        Supplies a generator of frame batches for the given row and column ranges,
+        tiled along the off processing dimension in keeping with the block_size
+        parameter. The block size accounts for the phase history workspace and
+        the output for every requested frame, and each tile is fetched and
+        transformed to phase history exactly once.
+
+        Parameters
+        ----------
+        row_range : slice|Tuple[int, int, int]
+            The row range.
+        col_range : slice|Tuple[int, int, int]
+            The column range.
+        frames : None|int|list|tuple|numpy.ndarray
+            The frame or frame collection.
+
+        Yields
+        ------
+        result_range : Tuple[int, int]
+            The start/stop indices for positioning of the tile along the off
+            processing dimension, relative to the given range.
+        data : numpy.ndarray
+            The complex64 array with the frame index as the final dimension.
+        """
+
+        frames = numpy.atleast_1d(self._parse_frame_argument(frames))
+        blocks, result_blocks = self._get_frame_batch_blocks(row_range, col_range, frames.size)
+        for this_range, result_range in zip(blocks, result_blocks):
+            if self.dimension == 0:
+                yield result_range, self.get_frame_batch(row_range, this_range, frames)
+            else:
+                yield result_range, self.get_frame_batch(this_range, col_range, frames)
+
     def _prepare_output(
             self,
             row_range: Union[slice, Tuple[int, int, int]],
@@ -452,43 +709,23 @@ class SubapertureCalculator(FFTCalculator):
 
         # parse the slicing to ensure consistent structure
         row_range, col_range, frames = self._parse_slicing(item)
-        if isinstance(frames, int):
-            frames = [frames, ]
-
-        if self.dimension == 0:
-            column_block_size = self.get_fetch_block_size(row_range.start, row_range.stop)
-            # get our block definitions
-            column_blocks, result_blocks = self.extract_blocks(col_range, column_block_size)
-            if column_blocks == 1 and len(frames) == 1:
-                # no need to prepare output, which will take twice the memory, so just return
-                out = self.subaperture_generator(row_range, col_range, frames).__next__()
-            else:
-                out = self._prepare_output(row_range, col_range, frames=frames)
-                # noinspection PyTypeChecker
-                for this_column_range, result_range in zip(column_blocks, result_blocks):
-                    generator = self.subaperture_generator(row_range, this_column_range, frames)
-                    if len(frames) == 1:
-                        out[:, result_range[0]:result_range[1]] = generator.__next__()
-                    else:
-                        for i, data in enumerate(generator):
-                            out[:, result_range[0]:result_range[1], i] = data
-        else:
-            row_block_size = self.get_fetch_block_size(col_range.start, col_range.stop)
-            # get our block definitions
-            row_blocks, result_blocks = self.extract_blocks(row_range, row_block_size)
-            if row_blocks == 1 and len(frames) == 1:
-                out = self.subaperture_generator(row_range, col_range, frames).__next__()
+        frames = numpy.atleast_1d(frames)
+
+        blocks, result_blocks = self._get_frame_batch_blocks(row_range, col_range, frames.size)
+        if len(blocks) == 1:
+            # no need to prepare output, which will take twice the memory, so just return
+            out = self.get_frame_batch(row_range, col_range, frames)
+            return out[:, :, 0] if frames.size == 1 else out
+
+        out = self._prepare_output(row_range, col_range, frames=frames)
+        if frames.size == 1:
+            out = out[:, :, numpy.newaxis]
+        for result_range, data in self.frame_batch_generator(row_range, col_range, frames):
+            if self.dimension == 0:
+                out[:, result_range[0]:result_range[1], :] = data
             else:
-                out = self._prepare_output(row_range, col_range, frames=frames)
-                # noinspection PyTypeChecker
-                for this_row_range, result_range in zip(row_blocks, result_blocks):
-                    generator = self.subaperture_generator(this_row_range, col_range, frames)
-                    if len(frames) == 1:
-                        out[result_range[0]:result_range[1], :] = generator.__next__()
-                    else:
-                        for i, data in enumerate(generator):
-                            out[result_range[0]:result_range[1], :, i] = data
-        return out
+                out[result_range[0]:result_range[1], :, :] = data
+        return out[:, :, 0] if frames.size == 1 else out
 
 
 class SubapertureOrthoIterator(OrthorectificationIterator):
@@ -496,15 +733,18 @@ class SubapertureOrthoIterator(OrthorectificationIterator):
     An iterator class for the ortho-rectified subaperture processing.
 
     Iterating depth first requires the least fetching from the reader once for
-    all frames. Otherwise, iterating requires redundantly fetching data once
-    for each frame.
+    all frames. In this case, each block is transformed to phase history once,
+    all frames are calculated from the shared phase history concurrently and
+    ortho-rectified together, and the iteration block size accounts for the
+    memory required for all frames. Otherwise, iterating requires redundantly
+    fetching data once for each frame.
 
     It should be noted that fetching data is not time intensive if working using
     a local file (i.e. on your computer), but it may be if working using some
     kind of network file system.
     """
 
-    __slots__ = ('_depth_first', '_this_frame', '_generator')
+    __slots__ = ('_depth_first', '_this_frame', '_frame_batch')
 
     def __init__(
             self,
@@ -536,7 +776,7 @@ class SubapertureOrthoIterator(OrthorectificationIterator):
             fetching from the reader, once per frame.
         """
 
-        self._generator = None
+        self._frame_batch = None
         self._this_frame = None
         self._depth_first = bool(depth_first)
 
@@ -553,6 +793,12 @@ class SubapertureOrthoIterator(OrthorectificationIterator):
         # noinspection PyTypeChecker
         return self._calculator
 
+    def _get_fetch_block_size(self, start_element: int, stop_element: int) -> int:
+        # depth first iteration calculates all frames from each block at once,
+        # otherwise a single frame is calculated from each block
+        frame_count = self.calculator.frame_count if self._depth_first else 1
+        return self.calculator.get_fetch_block_size(start_element, stop_element, frame_count=frame_count)
+
     def _depth_first_iteration(self) -> Tuple[numpy.ndarray, Tuple[int, int], int]:
         if not self._depth_first:
             raise ValueError('Requires depth_first = True')
@@ -570,16 +816,22 @@ class SubapertureOrthoIterator(OrthorectificationIterator):
         if self._this_index >= len(self._iteration_blocks):
             self._this_index = None  # reset the iteration scheme
             self._this_frame = None
+            self._frame_batch = None
             raise StopIteration()
 
         this_ortho_bounds, this_pixel_bounds = self._get_state_parameters()
         # accommodate for real pixel limits
         this_pixel_bounds = self._ortho_helper.get_real_pixel_bounds(this_pixel_bounds)
         if self._this_frame == 0:
-            # set up the iterator from the calculator
-            self._generator = self.calculator.subaperture_generator(
+            # calculate and ortho-rectify all frames for this block at once
+            self._frame_batch = None
+            data = self.calculator.get_frame_batch(
                 (this_pixel_bounds[0], this_pixel_bounds[1], 1),
                 (this_pixel_bounds[2], this_pixel_bounds[3], 1))
+            row_array, col_array = self._get_ortho_helper(this_pixel_bounds, data)
+            self._frame_batch = self._ortho_helper.get_orthorectified_from_array(
+                this_ortho_bounds, row_array, col_array, data)
+            del data
 
         logger.info(
             'Fetching orthorectified coordinate block ({}:{}, {}:{}) of ({}:{}) for frame {}'.format(
@@ -587,8 +839,9 @@ class SubapertureOrthoIterator(OrthorectificationIterator):
                 this_ortho_bounds[2] - self.ortho_bounds[2], this_ortho_bounds[3] - self.ortho_bounds[2],
                 self.ortho_bounds[1] - self.ortho_bounds[0], self.ortho_bounds[3] - self.ortho_bounds[2],
                 self._this_frame))
-        data = self._generator.__next__()
-        ortho_data = self._get_orthorectified_version(this_ortho_bounds, this_pixel_bounds, data)
+        ortho_data = self._frame_batch[:, :, self._this_frame]
+        if self.remap_function is not None:
+            ortho_data = self.remap_function(ortho_data)
         start_indices = (this_ortho_bounds[0] - self.ortho_bounds[0],
                          this_ortho_bounds[2] - self.ortho_bounds[2])
         return ortho_data, start_indices, self._this_frame
@@ -1,39 +1,59 @@
 """
 Window function definitions and a few helper functions. This just passes through
 to scipy functions after managing scipy version dependent import structure.
+
+The named window factory :func:`get_window`, the resampling helpers and the
+impulse response width helpers are memoized with least recently used eviction,
+since the same handful of windows are requested repeatedly when processing is
+tiled over many chips. Cached arrays are stored read-only.
 """
 
 __classification__ = "UNCLASSIFIED"
 __author__ = "Thomas McCullough"
 
-from typing import Union, Optional
+import functools
+from typing import Union, Optional, Dict, Tuple, List, Sequence, Any
 
-import scipy
 import numpy
-from scipy.optimize import newton
-
-
-_version_string_parts = scipy.__version__.split('.')
-_version = (int(_version_string_parts[0]), int(_version_string_parts[1]))
 
 
 ############
 # some basic window function definitions
 
-if _version >= (1, 1):
-    # noinspection PyUnresolvedReferences
-    from scipy.signal.windows import general_hamming as _general_hamming, \
-        kaiser as _kaiser
-else:
-    _general_hamming = None
-    # noinspection PyUnresolvedReferences
-    from scipy.signal import kaiser as _kaiser
+@functools.lru_cache(maxsize=None)
+def _get_scipy_windows() -> Tuple[Optional[Any], Any, Optional[Any]]:
+    """
+    Gets the scipy window functions, managing the scipy version dependent import
+    structure. Importing :mod:`scipy.signal` is slow, so this is deferred until
+    a window is actually requested.
+
+    Returns
+    -------
+    (None|Callable, Callable, None|Callable)
+        The general hamming, kaiser and taylor window functions, where `None`
+        indicates that the scipy version does not provide it.
+    """
+
+    import scipy
+
+    version_string_parts = scipy.__version__.split('.')
+    version = (int(version_string_parts[0]), int(version_string_parts[1]))
 
-if _version >= (1, 6):
-    # noinspection PyUnresolvedReferences
-    from scipy.signal.windows import taylor as _taylor
-else:
-    _taylor = None
+    if version >= (1, 1):
+        # noinspection PyUnresolvedReferences
+        from scipy.signal.windows import general_hamming as the_general_hamming, \
+            kaiser as the_kaiser
+    else:
+        the_general_hamming = None
+        # noinspection PyUnresolvedReferences
+        from scipy.signal import kaiser as the_kaiser
+
+    if version >= (1, 6):
+        # noinspection PyUnresolvedReferences
+        from scipy.signal.windows import taylor as the_taylor
+    else:
+        the_taylor = None
+    return the_general_hamming, the_kaiser, the_taylor
 
 
 def general_hamming(
@@ -59,8 +79,9 @@ def general_hamming(
     numpy.ndarray
     """
 
-    if _general_hamming is not None:
-        return _general_hamming(M, alpha, sym=sym)
+    the_general_hamming = _get_scipy_windows()[0]
+    if the_general_hamming is not None:
+        return the_general_hamming(M, alpha, sym=sym)
 
     if (M % 2) == 0:
         k = int(M / 2)
@@ -161,10 +182,11 @@ def taylor(
     numpy.ndarray
     """
 
-    if _taylor is not None:
+    the_taylor = _get_scipy_windows()[2]
+    if the_taylor is not None:
         if sll < 0:
             sll *= -1
-        return _taylor(M, nbar=nbar, sll=sll, norm=norm, sym=sym)
+        return the_taylor(M, nbar=nbar, sll=sll, norm=norm, sym=sym)
 
     if sll > 0:
         sll *= -1
@@ -226,12 +248,43 @@ def kaiser(
     numpy.ndarray
     """
 
-    return _kaiser(M, beta, sym=sym)
+    return _get_scipy_windows()[1](M, beta, sym=sym)
 
 
 #################
 # helper methods
 
+_CACHE_SIZE = 256
+
+
+def _array_key(array: numpy.ndarray) -> Tuple[str, bytes]:
+    """
+    Gets a hashable key describing the contents of a one-dimensional array.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+
+    Returns
+    -------
+    Tuple[str, bytes]
+    """
+
+    array = numpy.ascontiguousarray(array)
+    if array.ndim != 1:
+        raise ValueError('Window arrays must be one-dimensional, got shape {}'.format(array.shape))
+    return array.dtype.str, array.tobytes()
+
+
+def _array_from_key(array_key: Tuple[str, bytes]) -> numpy.ndarray:
+    return numpy.frombuffer(array_key[1], dtype=array_key[0])
+
+
+def _read_only(array: numpy.ndarray) -> numpy.ndarray:
+    array.flags.writeable = False
+    return array
+
+
 def hamming_ipr(
         x: Union[numpy.ndarray, float],
         a: float) -> Union[numpy.ndarray, float]:
@@ -252,10 +305,26 @@ def hamming_ipr(
     return a*numpy.sinc(x) + 0.5*(1-a)*(numpy.sinc(x-1) + numpy.sinc(x+1)) - a/numpy.sqrt(2)
 
 
+@functools.lru_cache(maxsize=128)
 def get_hamming_broadening_factor(coef: float) -> float:
+    """
+    Gets the impulse response broadening factor for the (generalized) Hamming
+    window with the given coefficient. The result is cached.
+
+    Parameters
+    ----------
+    coef : float
+
+    Returns
+    -------
+    float
+    """
+
     test_array = numpy.linspace(0.3, 2.5, 100)
     values = hamming_ipr(test_array, coef)
     init_value = test_array[numpy.argmin(numpy.abs(values))]
+    from scipy.optimize import newton
+
     zero = newton(hamming_ipr, init_value, args=(coef,), tol=1e-12, maxiter=100)
     return 2 * zero
 
@@ -279,6 +348,12 @@ def find_half_power(
     if wgt_funct is None:
         return None
 
+    return _find_half_power(_array_key(wgt_funct), int(oversample))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _find_half_power(array_key: Tuple[str, bytes], oversample: int) -> float:
+    wgt_funct = _array_from_key(array_key)
     # solve for the half-power point in an oversampled impulse response
     impulse_response = numpy.abs(numpy.fft.fft(wgt_funct, wgt_funct.size*oversample))/numpy.sum(wgt_funct)
     ind = numpy.flatnonzero(impulse_response < 1 / numpy.sqrt(2))[0]
@@ -288,3 +363,337 @@ def find_half_power(
     v1 = impulse_response[ind]
     zero_ind = ind - 1 + (1./numpy.sqrt(2) - v0)/(v1 - v0)
     return 2*zero_ind/oversample
+
+
+#################
+# memoized window factory
+
+_WINDOW_DEFAULTS = {
+    'UNIFORM': {},
+    'HAMMING': {},
+    'HANNING': {},
+    'HANN': {},
+    'GENERAL_HAMMING': {'ALPHA': 0.5},
+    'KAISER': {'BETA': 4.0},
+    'TAYLOR': {'NBAR': 4, 'SLL': -30.0}}
+
+
+def _normalize_window_definition(
+        name: str,
+        parameters: Optional[Dict[str, Any]]) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+    """
+    Gets the canonical (hashable) definition of a named window.
+
+    Parameters
+    ----------
+    name : str
+    parameters : None|dict
+
+    Returns
+    -------
+    name : str
+    parameters : Tuple[Tuple[str, Any], ...]
+    """
+
+    if not isinstance(name, str):
+        raise TypeError('window name must be a string, got type {}'.format(type(name)))
+    name = name.upper()
+    if name not in _WINDOW_DEFAULTS:
+        raise ValueError('Window type "{}" is not supported.'.format(name))
+    the_parameters = dict(_WINDOW_DEFAULTS[name])
+    if parameters:
+        for key, value in parameters.items():
+            key = key.upper()
+            if key not in the_parameters:
+                raise ValueError('Window type "{}" does not accept parameter "{}"'.format(name, key))
+            the_parameters[key] = value
+    if name == 'TAYLOR':
+        the_parameters['NBAR'] = int(the_parameters['NBAR'])
+        the_parameters['SLL'] = -abs(float(the_parameters['SLL']))
+    else:
+        the_parameters = {key: float(value) for key, value in the_parameters.items()}
+    return name, tuple(sorted(the_parameters.items()))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _get_window(
+        name: str,
+        parameters: Tuple[Tuple[str, Any], ...],
+        M: int,
+        sym: bool) -> numpy.ndarray:
+    pars = dict(parameters)
+    if name == 'UNIFORM':
+        value = numpy.ones((M, ), dtype='float64')
+    elif name == 'HAMMING':
+        value = hamming(M, sym=sym)
+    elif name in ['HANNING', 'HANN']:
+        value = hanning(M, sym=sym)
+    elif name == 'GENERAL_HAMMING':
+        value = general_hamming(M, pars['ALPHA'], sym=sym)
+    elif name == 'KAISER':
+        value = kaiser(M, pars['BETA'], sym=sym)
+    elif name == 'TAYLOR':
+        value = taylor(M, nbar=pars['NBAR'], sll=pars['SLL'], norm=True, sym=sym)
+    else:
+        raise ValueError('Window type "{}" is not supported.'.format(name))
+    return _read_only(numpy.asarray(value, dtype='float64'))
+
+
+def get_window(
+        name: str,
+        M: int,
+        parameters: Optional[Dict[str, Any]] = None,
+        sym: bool = True,
+        copy: bool = True) -> numpy.ndarray:
+    """
+    Gets the named window of the given size. The window values are cached, keyed
+    on the window name, parameters, size and symmetry.
+
+    Parameters
+    ----------
+    name : str
+        The (case insensitive) window name, one of `'UNIFORM'`, `'HAMMING'`,
+        `'HANNING'`, `'HANN'`, `'GENERAL_HAMMING'` (parameter `'ALPHA'`),
+        `'KAISER'` (parameter `'BETA'`), or `'TAYLOR'` (parameters `'NBAR'`
+        and `'SLL'`).
+    M : int
+        Number of points in the output window.
+    parameters : None|dict
+        The (case insensitive) window parameters. Any parameters not provided
+        take their default values.
+    sym : bool
+        When `True` (default), generates a symmetric window, for use in filter
+        design. When `False`, generates a periodic window, for use in spectral analysis.
+    copy : bool
+        If `False`, the cached read-only array is returned directly.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    M = int(M)
+    if M < 1:
+        raise ValueError('Window size must be a positive integer, got {}'.format(M))
+    name, the_parameters = _normalize_window_definition(name, parameters)
+    value = _get_window(name, the_parameters, M, bool(sym))
+    return value.copy() if copy else value
+
+
+def get_windows(
+        name: str,
+        sizes: Sequence[int],
+        parameters: Optional[Dict[str, Any]] = None,
+        sym: bool = True,
+        copy: bool = True) -> List[numpy.ndarray]:
+    """
+    Gets the named window evaluated at each of the given sizes. This is intended
+    for processing which is tiled over blocks of varying size.
+
+    Parameters
+    ----------
+    name : str
+    sizes : Sequence[int]
+    parameters : None|dict
+    sym : bool
+    copy : bool
+
+    Returns
+    -------
+    List[numpy.ndarray]
+        The windows, in the order of `sizes`.
+
+    See Also
+    --------
+    get_window
+    """
+
+    name, the_parameters = _normalize_window_definition(name, parameters)
+    out = []
+    for size in sizes:
+        size = int(size)
+        if size < 1:
+            raise ValueError('Window size must be a positive integer, got {}'.format(size))
+        value = _get_window(name, the_parameters, size, bool(sym))
+        out.append(value.copy() if copy else value)
+    return out
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _resample_window(array_key: Tuple[str, bytes], size: int, kind: str) -> numpy.ndarray:
+    window_vals = _array_from_key(array_key)
+    if kind == 'fourier':
+        from scipy.signal import resample
+        value = resample(window_vals, size)
+    else:
+        from scipy.interpolate import interp1d
+        f = interp1d(numpy.linspace(0, 1, window_vals.size), window_vals, kind=kind)
+        value = f(numpy.linspace(0, 1, size))
+    return _read_only(value)
+
+
+def resample_window(
+        window_vals: numpy.ndarray,
+        size: int,
+        kind: str = 'fourier',
+        copy: bool = True) -> numpy.ndarray:
+    """
+    Resamples the given window values to the given size. The result is cached,
+    keyed on the window values, size, and kind.
+
+    Parameters
+    ----------
+    window_vals : numpy.ndarray
+        The one-dimensional window values.
+    size : int
+        The output size.
+    kind : str
+        `'fourier'` for Fourier method resampling (:func:`scipy.signal.resample`),
+        otherwise the interpolation kind passed to :func:`scipy.interpolate.interp1d`,
+        for example `'cubic'`.
+    copy : bool
+        If `False`, the cached read-only array is returned directly.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    size = int(size)
+    if size < 1:
+        raise ValueError('Window size must be a positive integer, got {}'.format(size))
+    value = _resample_window(_array_key(window_vals), size, kind)
+    return value.copy() if copy else value
+
+
+def resample_windows(
+        window_vals: numpy.ndarray,
+        sizes: Sequence[int],
+        kind: str = 'fourier',
+        copy: bool = True) -> List[numpy.ndarray]:
+    """
+    Resamples the given window values to each of the given sizes.
+
+    Parameters
+    ----------
+    window_vals : numpy.ndarray
+    sizes : Sequence[int]
+    kind : str
+    copy : bool
+
+    Returns
+    -------
+    List[numpy.ndarray]
+        The resampled windows, in the order of `sizes`.
+
+    See Also
+    --------
+    resample_window
+    """
+
+    array_key = _array_key(window_vals)
+    out = []
+    for size in sizes:
+        size = int(size)
+        if size < 1:
+            raise ValueError('Window size must be a positive integer, got {}'.format(size))
+        value = _resample_window(array_key, size, kind)
+        out.append(value.copy() if copy else value)
+    return out
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _get_ipr_width(
+        name: str,
+        parameters: Tuple[Tuple[str, Any], ...],
+        size: int,
+        oversample: int) -> float:
+    pars = dict(parameters)
+    if name == 'UNIFORM':
+        return get_hamming_broadening_factor(1.0)
+    elif name == 'HAMMING':
+        return get_hamming_broadening_factor(0.54)
+    elif name in ['HANNING', 'HANN']:
+        return get_hamming_broadening_factor(0.5)
+    elif name == 'GENERAL_HAMMING':
+        return get_hamming_broadening_factor(pars['ALPHA'])
+    return find_half_power(_get_window(name, parameters, size, True), oversample=oversample)
+
+
+def get_ipr_width(
+        name: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        size: int = 512,
+        oversample: int = 1024) -> float:
+    """
+    Gets the half power impulse response width, in units of inverse bandwidth
+    (i.e. the broadening factor), for the named window. The raised cosine family
+    uses the analytic result, otherwise this is estimated from the window of the
+    given size using :func:`find_half_power`. The result is cached.
+
+    Parameters
+    ----------
+    name : str
+    parameters : None|dict
+    size : int
+        The window size used for the numerical estimate.
+    oversample : int
+        The oversample factor used for the numerical estimate.
+
+    Returns
+    -------
+    float
+    """
+
+    name, the_parameters = _normalize_window_definition(name, parameters)
+    return _get_ipr_width(name, the_parameters, int(size), int(oversample))
+
+
+def get_ipr_width_table(
+        name: str,
+        parameter: str,
+        values: Sequence[float],
+        parameters: Optional[Dict[str, Any]] = None,
+        size: int = 512,
+        oversample: int = 1024) -> numpy.ndarray:
+    """
+    Gets a table of half power impulse response widths for the named window
+    as the given parameter varies over the given values.
+
+    Parameters
+    ----------
+    name : str
+    parameter : str
+        The name of the parameter to vary, for example `'BETA'` for the Kaiser window.
+    values : Sequence[float]
+        The parameter values.
+    parameters : None|dict
+        The values for any other window parameters.
+    size : int
+    oversample : int
+
+    Returns
+    -------
+    numpy.ndarray
+        The impulse response widths, in the order of `values`.
+
+    See Also
+    --------
+    get_ipr_width
+    """
+
+    the_parameters = dict(parameters) if parameters else {}
+    out = numpy.empty((len(values), ), dtype='float64')
+    for i, value in enumerate(values):
+        the_parameters[parameter] = value
+        out[i] = get_ipr_width(name, parameters=the_parameters, size=size, oversample=oversample)
+    return out
+
+
+def clear_window_caches() -> None:
+    """
+    Clears all the cached windows, resampled windows and impulse response widths.
+    """
+
+    for cached in [_get_window, _resample_window, _get_ipr_width, _find_half_power, get_hamming_broadening_factor]:
+        cached.cache_clear()
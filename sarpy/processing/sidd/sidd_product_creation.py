@@ -11,7 +11,8 @@ Create a variety of sidd products.
 
     from sarpy.io.complex.converter import open_complex
     from sarpy.processing.ortho_rectify import BivariateSplineMethod, NearestNeighborMethod
-    from sarpy.processing.sidd.sidd_product_creation import create_detected_image_sidd, create_csi_sidd, create_dynamic_image_sidd
+    from sarpy.processing.sidd.sidd_product_creation import create_detected_image_sidd, create_csi_sidd, \
+        create_dynamic_image_sidd, create_detected_image_geotiff
 
     # open a sicd type file
     reader = open_complex('<sicd type object file name>')
@@ -24,6 +25,8 @@ Create a variety of sidd products.
     create_csi_sidd(ortho_helper, '<output directory>', dimension=0, version=2)
     # create a sidd version 2 dynamic image/sub-aperture stack for the whole file
     create_dynamic_image_sidd(ortho_helper, '<output directory>', dimension=0, version=2)
+    # create a tiled GeoTIFF detected image, with overviews, for the whole file
+    create_detected_image_geotiff(ortho_helper, '<output directory>', block_size=10)
 """
 
 __classification__ = "UNCLASSIFIED"
@@ -36,6 +39,7 @@ from sarpy.processing.sidd.sidd_structure_creation import create_sidd_structure
 from sarpy.processing.sicd.csi import CSICalculator
 from sarpy.processing.sicd.subaperture import SubapertureCalculator, SubapertureOrthoIterator
 from sarpy.io.product.sidd import SIDDWriter
+from sarpy.io.general.tiff import GeoTiffWriter
 from sarpy.io.general.base import SarpyIOError
 from sarpy.visualization.remap import MonochromaticRemap, NRL
 
@@ -181,6 +185,97 @@ def create_detected_image_sidd(
             writer(data, start_indices=start_indices, index=0)
 
 
+def create_detected_image_geotiff(
+        ortho_helper, output_directory, output_file=None, block_size=10, dimension=0,
+        bounds=None, remap_function=None, tile_size=512, compression='deflate', overview_levels=None):
+    """
+    Create a tiled GeoTIFF, with internal overviews, of a basic detected image
+    from a SICD type reader. This is the cloud optimized GeoTIFF analog of
+    :func:`create_detected_image_sidd`, and the ortho-rectified data is
+    streamed directly to the file.
+
+    The georeferencing is the affine WGS-84 `(longitude, latitude)` transform
+    fit to the ortho-rectification grid, see
+    :meth:`sarpy.processing.ortho_rectify.OrthorectificationIterator.get_geo_transform`.
+
+    Parameters
+    ----------
+    ortho_helper : OrthorectificationHelper
+        The ortho-rectification helper object.
+    output_directory : str
+        The output directory for the given file.
+    output_file : None|str
+        The file name, this will default to a sensible value.
+    block_size : int
+        The approximate processing block size to fetch, given in MB. The
+        minimum value for use here will be 1.
+    dimension : int
+        Which dimension to split over in block processing? Must be either 0 or 1.
+    bounds : None|numpy.ndarray|list|tuple
+        The sicd pixel bounds of the form `(min row, max row, min col, max col)`.
+        This will default to the full image.
+    remap_function : None|MonochromaticRemap
+        The applied remap function. If one is not provided, then a default is
+        used. Required global parameters will be calculated if they are missing,
+        so the internal state of this remap function may be modified.
+    tile_size : int
+        The GeoTIFF tile size, which must be a multiple of 16.
+    compression : None|str
+        One of `None` or `'deflate'`.
+    overview_levels : None|int
+        The number of overview levels, this will default to a sensible value.
+
+    Returns
+    -------
+    str
+        The output file name.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from sarpy.io.complex.converter import open_complex
+        from sarpy.processing.ortho_rectify import NearestNeighborMethod
+        from sarpy.processing.sidd.sidd_product_creation import create_detected_image_geotiff
+
+        reader = open_complex('<sicd type object file name>')
+        ortho_helper = NearestNeighborMethod(reader, index=0)
+        create_detected_image_geotiff(ortho_helper, '<output directory>', tile_size=512)
+    """
+
+    if not os.path.isdir(output_directory):
+        raise SarpyIOError(_output_text.format(output_directory))
+
+    if not isinstance(ortho_helper, OrthorectificationHelper):
+        raise TypeError(_orthohelper_text.format(type(ortho_helper)))
+
+    if remap_function is None:
+        remap_function = DEFAULT_IMG_REMAP(override_name='IMG_DEFAULT')
+    _validate_remap_function(remap_function)
+
+    # construct the ortho-rectification iterator - for a basic data fetcher
+    calculator = FullResolutionFetcher(
+        ortho_helper.reader, dimension=dimension, index=ortho_helper.index, block_size=block_size)
+    ortho_iterator = OrthorectificationIterator(
+        ortho_helper, calculator=calculator, bounds=bounds,
+        remap_function=remap_function, recalc_remap_globals=False)
+
+    if output_file is None:
+        output_file = ortho_helper.sicd.get_suggested_name(ortho_helper.index)+'_IMG.tif'
+    full_filename = os.path.join(os.path.expanduser(output_directory), os.path.split(output_file)[1])
+    if os.path.exists(full_filename):
+        raise SarpyIOError('File {} already exists.'.format(full_filename))
+
+    with GeoTiffWriter(
+            full_filename, ortho_iterator.ortho_data_size, dtype=remap_function.output_dtype,
+            tile_size=tile_size, compression=compression, overview_levels=overview_levels,
+            geo_transform=ortho_iterator.get_geo_transform(), epsg=4326) as writer:
+        # iterate and write
+        for data, start_indices in ortho_iterator:
+            writer(data, start_indices=start_indices)
+    return full_filename
+
+
 def create_csi_sidd(
         ortho_helper, output_directory, output_file=None, dimension=0,
         block_size=30, bounds=None, version=3, include_sicd=True, remap_function=None):
@@ -274,7 +369,7 @@ def create_csi_sidd(
 def create_dynamic_image_sidd(
         ortho_helper, output_directory, output_file=None, dimension=0, block_size=10,
         bounds=None, frame_count=9, aperture_fraction=0.2, method='FULL', version=3,
-        include_sicd=True, remap_function=None):
+        include_sicd=True, remap_function=None, max_workers=None):
     """
     Create a SIDD version of a Dynamic Image (Sub-Aperture Stack) from a SICD type reader.
 
@@ -309,6 +404,10 @@ def create_dynamic_image_sidd(
         The applied remap function. If one is not provided, then a default is
         used. Required global parameters will be calculated if they are missing,
         so the internal state of this remap function may be modified.
+    max_workers : None|int
+        The maximum number of worker threads used to calculate the frames for
+        each processing block. The block_size accounts for all frames, since
+        each block is transformed to phase history once and shared by all frames.
 
     Returns
     -------
@@ -340,7 +439,8 @@ def create_dynamic_image_sidd(
     # construct the subaperture calculator class
     subap_calculator = SubapertureCalculator(
         ortho_helper.reader, dimension=dimension, index=ortho_helper.index, block_size=block_size,
-        frame_count=frame_count, aperture_fraction=aperture_fraction, method=method)
+        frame_count=frame_count, aperture_fraction=aperture_fraction, method=method,
+        max_workers=max_workers)
 
     if remap_function is None:
         remap_function = DEFAULT_DI_REMAP(override_name='DI_DEFAULT')
@@ -0,0 +1,418 @@
+"""
+Create a subset of a CPHD file, by channel, transmit time window, vector range,
+vector decimation and/or sample range.
+
+The signal data is streamed in batches of vectors directly from the input
+file to the output file, so the full signal arrays are never read into memory.
+The `Data.Channels`, PVP arrays, `Channel.Parameters` and `Global` parameters
+are all updated to be consistent with the subset.
+
+From the command-line
+
+>>> python -m sarpy.utils.subset_cphd <input file> <output file> --channels 1 --time-window 0.5 1.5 --vector-step 4
+
+For a basic help on the command-line, check
+
+>>> python -m sarpy.utils.subset_cphd --help
+
+"""
+
+__classification__ = "UNCLASSIFIED"
+
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Optional, Sequence, Tuple, Dict
+
+import numpy
+
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDReader1, CPHDWriter1
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+from sarpy.io.general.utils import get_worker_count
+from sarpy.io.phase_history.compression import CompressedSignalSegment
+
+logger = logging.getLogger(__name__)
+
+
+def _verify_range(
+        the_range: Optional[Sequence[Union[int, float]]],
+        name: str) -> Optional[Tuple[Union[int, float], Union[int, float]]]:
+    if the_range is None:
+        return None
+    if len(the_range) != 2 or not (the_range[0] < the_range[1]):
+        raise ValueError('{} must be an increasing pair of values, got `{}`'.format(name, the_range))
+    return the_range[0], the_range[1]
+
+
+def _get_channel_index(meta: CPHDType, channel: Union[int, str]) -> int:
+    """
+    Get the integer index of the channel, given by index or identifier.
+
+    Parameters
+    ----------
+    meta : CPHDType
+    channel : int|str
+
+    Returns
+    -------
+    int
+    """
+
+    identifiers = [entry.Identifier for entry in meta.Data.Channels]
+    if isinstance(channel, str):
+        if channel not in identifiers:
+            raise KeyError('No channel with identifier `{}`, the identifiers are {}'.format(channel, identifiers))
+        return identifiers.index(channel)
+    int_index = int(channel)
+    if not (0 <= int_index < len(identifiers)):
+        raise ValueError('Channel index must be in the range [0, {}), got {}'.format(len(identifiers), channel))
+    return int_index
+
+
+def get_subset_vectors(
+        reader: CPHDReader1,
+        index: Union[int, str],
+        time_window: Optional[Tuple[float, float]] = None,
+        vector_range: Optional[Tuple[int, int]] = None,
+        vector_step: int = 1) -> numpy.ndarray:
+    """
+    Determine the indices of the vectors of the given channel to be retained.
+
+    Parameters
+    ----------
+    reader : CPHDReader1
+    index : int|str
+        The channel index or identifier.
+    time_window : None|Tuple[float, float]
+        Retain vectors with `start <= TxTime < stop`.
+    vector_range : None|Tuple[int, int]
+        Retain vectors with index in the range `[start, stop)`.
+    vector_step : int
+        Retain every `vector_step` vector of the selection, for decimation.
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+
+    num_vectors = reader.cphd_meta.Data.Channels[_get_channel_index(reader.cphd_meta, index)].NumVectors
+    vector_range = _verify_range(vector_range, 'vector_range')
+    start, stop = (0, num_vectors) if vector_range is None else \
+        (max(0, int(vector_range[0])), min(num_vectors, int(vector_range[1])))
+    vectors = numpy.arange(start, stop, dtype='int64')
+    time_window = _verify_range(time_window, 'time_window')
+    if time_window is not None and vectors.size > 0:
+        tx_time = reader.read_pvp_variable('TxTime', index, the_range=(start, stop, 1))
+        vectors = vectors[(tx_time >= time_window[0]) & (tx_time < time_window[1])]
+    vector_step = int(vector_step)
+    if vector_step < 1:
+        raise ValueError('vector_step must be a positive integer, got {}'.format(vector_step))
+    return vectors[::vector_step]
+
+
+def _subset_pvp(
+        pvp: numpy.ndarray,
+        domain_type: str,
+        sample_start: int,
+        num_samples: int) -> numpy.ndarray:
+    """
+    Adjust the PVPs for retaining samples `[sample_start, sample_start + num_samples)`.
+    """
+
+    pvp = numpy.copy(pvp)
+    if sample_start != 0:
+        pvp['SC0'] += sample_start*pvp['SCSS']
+    first = pvp['SC0']
+    last = pvp['SC0'] + (num_samples - 1)*pvp['SCSS']
+    if domain_type == 'FX':
+        names = [('FX1', 'FX2'), ('FXN1', 'FXN2')]
+    else:
+        names = [('TOA1', 'TOA2')]
+    for name1, name2 in names:
+        if name1 in pvp.dtype.names:
+            pvp[name1] = numpy.maximum(pvp[name1], numpy.minimum(first, last))
+            pvp[name2] = numpy.minimum(pvp[name2], numpy.maximum(first, last))
+    return pvp
+
+
+def _update_channel_parameters(meta: CPHDType, pvp_block: Dict[str, numpy.ndarray], ref_indices: Dict[str, int]):
+    """
+    Update the Channel and Global parameters to be consistent with the given PVPs.
+    """
+
+    def is_fixed(array):
+        return bool(numpy.all(array == array[0]))
+
+    kept = set(pvp_block.keys())
+    meta.Channel.Parameters = [entry for entry in meta.Channel.Parameters if entry.Identifier in kept]
+    if meta.Channel.RefChId not in kept:
+        new_ref = meta.Data.Channels[0].Identifier
+        logger.warning(
+            'The reference channel {} is not retained, using channel {} as the reference channel'.format(
+                meta.Channel.RefChId, new_ref))
+        meta.Channel.RefChId = new_ref
+
+    for entry in meta.Channel.Parameters:
+        pvp = pvp_block[entry.Identifier]
+        entry.RefVectorIndex = ref_indices[entry.Identifier]
+        entry.FxC = 0.5*(numpy.nanmax(pvp['FX2']) + numpy.nanmin(pvp['FX1']))
+        entry.FxBW = numpy.nanmax(pvp['FX2']) - numpy.nanmin(pvp['FX1'])
+        if entry.FxBWNoise is not None and 'FXN1' in pvp.dtype.names:
+            entry.FxBWNoise = numpy.nanmax(pvp['FXN2']) - numpy.nanmin(pvp['FXN1'])
+        entry.TOASaved = numpy.nanmax(pvp['TOA2']) - numpy.nanmin(pvp['TOA1'])
+        entry.FXFixed = is_fixed(pvp['FX1']) and is_fixed(pvp['FX2'])
+        entry.TOAFixed = is_fixed(pvp['TOA1']) and is_fixed(pvp['TOA2'])
+        entry.SRPFixed = is_fixed(pvp['SRPPos'])
+
+    all_pvp = numpy.concatenate([pvp_block[entry.Identifier] for entry in meta.Data.Channels])
+    meta.Channel.FXFixedCPHD = is_fixed(all_pvp['FX1']) and is_fixed(all_pvp['FX2'])
+    meta.Channel.TOAFixedCPHD = is_fixed(all_pvp['TOA1']) and is_fixed(all_pvp['TOA2'])
+    meta.Channel.SRPFixedCPHD = is_fixed(all_pvp['SRPPos'])
+
+    meta.Global.Timeline.TxTime1 = numpy.nanmin(all_pvp['TxTime'])
+    meta.Global.Timeline.TxTime2 = numpy.nanmax(all_pvp['TxTime'])
+    meta.Global.FxBand.FxMin = numpy.nanmin(all_pvp['FX1'])
+    meta.Global.FxBand.FxMax = numpy.nanmax(all_pvp['FX2'])
+    meta.Global.TOASwath.TOAMin = numpy.nanmin(all_pvp['TOA1'])
+    meta.Global.TOASwath.TOAMax = numpy.nanmax(all_pvp['TOA2'])
+
+
+def _as_slice(vectors: numpy.ndarray) -> Optional[slice]:
+    """
+    Express the vector indices as a slice, if they are evenly spaced.
+    """
+
+    if vectors.size == 1:
+        return slice(int(vectors[0]), int(vectors[0]) + 1, 1)
+    step = int(vectors[1] - vectors[0])
+    if step > 0 and numpy.all(numpy.diff(vectors) == step):
+        return slice(int(vectors[0]), int(vectors[-1]) + 1, step)
+    return None
+
+
+def subset_cphd(
+        input_reader: Union[str, CPHDReader1],
+        output_file: str,
+        channels: Optional[Sequence[Union[int, str]]] = None,
+        time_window: Optional[Tuple[float, float]] = None,
+        vector_range: Optional[Tuple[int, int]] = None,
+        vector_step: int = 1,
+        sample_range: Optional[Tuple[int, int]] = None,
+        vector_batch_size: int = 4096,
+        max_workers: Optional[int] = None,
+        check_existence: bool = True) -> CPHDType:
+    """
+    Create a subset of the given CPHD file.
+
+    The selected signal data is copied in batches of at most `vector_batch_size`
+    vectors. Evenly spaced vector selections are read as (zero-copy) slices of
+    the input memory map, and written at the computed output offsets.
+
+    If a channel reference vector is not retained, then the nearest retained
+    vector is used as reference vector. Note that the `ReferenceGeometry` is
+    not recalculated.
+
+    Parameters
+    ----------
+    input_reader : str|CPHDReader1
+        The input file name or reader. A reader opened here from a file name
+        is closed before returning.
+    output_file : str
+    channels : None|Sequence[int|str]
+        The channel indices or identifiers to retain, all if not provided.
+    time_window : None|Tuple[float, float]
+        Retain vectors with `start <= TxTime < stop`.
+    vector_range : None|Tuple[int, int]
+        Retain vectors with index in `[start, stop)`, applied to each channel.
+    vector_step : int
+        Retain every `vector_step` vector, for decimation.
+    sample_range : None|Tuple[int, int]
+        Retain samples with index in `[start, stop)`, applied to each channel.
+    vector_batch_size : int
+        The maximum number of vectors copied at a time.
+    max_workers : None|int
+        The maximum number of worker threads for copying channels concurrently.
+        `None` uses the :class:`concurrent.futures.ThreadPoolExecutor` default.
+    check_existence : bool
+        Check for the existence of the output file before overwriting?
+
+    Returns
+    -------
+    CPHDType
+        The metadata for the subset file.
+    """
+
+    if not isinstance(input_reader, str):
+        return _subset_cphd_reader(
+            input_reader, output_file, channels, time_window, vector_range, vector_step,
+            sample_range, vector_batch_size, max_workers, check_existence)
+
+    # the reader is opened here, so it must be closed here
+    reader = CPHDReader(input_reader)
+    try:
+        return _subset_cphd_reader(
+            reader, output_file, channels, time_window, vector_range, vector_step,
+            sample_range, vector_batch_size, max_workers, check_existence)
+    finally:
+        reader.close()
+
+
+def _subset_cphd_reader(
+        input_reader: CPHDReader1,
+        output_file: str,
+        channels: Optional[Sequence[Union[int, str]]],
+        time_window: Optional[Tuple[float, float]],
+        vector_range: Optional[Tuple[int, int]],
+        vector_step: int,
+        sample_range: Optional[Tuple[int, int]],
+        vector_batch_size: int,
+        max_workers: Optional[int],
+        check_existence: bool) -> CPHDType:
+    """
+    Create a subset of the CPHD file for the given reader, as documented in
+    :func:`subset_cphd`.
+    """
+
+    if not isinstance(input_reader, CPHDReader1):
+        raise TypeError('Subsetting requires a CPHD version 1 reader, got type `{}`'.format(type(input_reader)))
+    vector_batch_size = int(vector_batch_size)
+    if vector_batch_size < 1:
+        raise ValueError('vector_batch_size must be a positive integer, got {}'.format(vector_batch_size))
+
+    in_meta = input_reader.cphd_meta
+    data_segments = input_reader.get_data_segment_as_tuple()
+    if in_meta.Data.SignalCompressionID is not None and \
+            not all(isinstance(entry, CompressedSignalSegment) for entry in data_segments):
+        raise ValueError(
+            'The signal arrays are compressed using unsupported method `{}`'.format(
+                in_meta.Data.SignalCompressionID))
+
+    if channels is None:
+        channel_ids = [entry.Identifier for entry in in_meta.Data.Channels]
+    else:
+        channel_ids = [in_meta.Data.Channels[_get_channel_index(in_meta, entry)].Identifier for entry in channels]
+        if len(set(channel_ids)) != len(channel_ids):
+            raise ValueError('Got duplicate channels `{}`'.format(channels))
+    sample_range = _verify_range(sample_range, 'sample_range')
+
+    meta = in_meta.copy()
+    meta.Data.SignalCompressionID = None
+    out_channels = []
+    selections = {}
+    pvp_block = {}
+    ref_indices = {}
+    signal_offset = 0
+    pvp_offset = 0
+    sample_bytes = data_segments[0].raw_dtype.itemsize*2
+    for identifier in channel_ids:
+        int_index = _get_channel_index(in_meta, identifier)
+        entry = meta.Data.Channels[int_index]
+        vectors = get_subset_vectors(
+            input_reader, identifier, time_window=time_window, vector_range=vector_range, vector_step=vector_step)
+        if vectors.size == 0:
+            logger.warning('No vectors are selected for channel {}, and it will be omitted'.format(identifier))
+            continue
+
+        sample_start, sample_stop = (0, entry.NumSamples) if sample_range is None else \
+            (max(0, int(sample_range[0])), min(entry.NumSamples, int(sample_range[1])))
+        if sample_stop <= sample_start:
+            raise ValueError('sample_range {} selects no samples for channel {}'.format(sample_range, identifier))
+
+        pvp = input_reader.read_pvp_array(identifier)[vectors]
+        pvp_block[identifier] = _subset_pvp(pvp, meta.Global.DomainType, sample_start, sample_stop - sample_start)
+        reference = meta.Channel.Parameters[
+            [param.Identifier for param in meta.Channel.Parameters].index(identifier)].RefVectorIndex
+        ref_indices[identifier] = int(numpy.argmin(numpy.abs(vectors - reference)))
+        selections[identifier] = (vectors, slice(sample_start, sample_stop, 1))
+
+        entry.NumVectors = vectors.size
+        entry.NumSamples = sample_stop - sample_start
+        entry.CompressedSignalSize = None
+        entry.SignalArrayByteOffset = signal_offset
+        entry.PVPArrayByteOffset = pvp_offset
+        signal_offset += entry.NumVectors*entry.NumSamples*sample_bytes
+        pvp_offset += entry.NumVectors*meta.Data.NumBytesPVP
+        out_channels.append(entry)
+
+    if len(out_channels) == 0:
+        raise ValueError('The subset parameters select no data')
+    meta.Data.Channels = out_channels
+    _update_channel_parameters(meta, pvp_block, ref_indices)
+
+    def copy_channel(identifier):
+        vectors, sample_slice = selections[identifier]
+        for start in range(0, vectors.size, vector_batch_size):
+            batch = vectors[start:start+vector_batch_size]
+            vector_slice = _as_slice(batch)
+            if vector_slice is None:
+                raw = input_reader.read_raw(
+                    slice(int(batch[0]), int(batch[-1]) + 1, 1), sample_slice, index=identifier,
+                    squeeze=False)[batch - batch[0]]
+            else:
+                raw = input_reader.read_raw(vector_slice, sample_slice, index=identifier, squeeze=False)
+            writer.write_signal_vectors(identifier, raw, start_vector=start, raw=True)
+
+    worker_count = get_worker_count(max_workers)
+    with CPHDWriter1(output_file, meta, check_existence=check_existence, max_workers=worker_count) as writer:
+        writer.write_pvp_block(pvp_block)
+        if meta.Data.SupportArrays:
+            writer.write_support_block(input_reader.read_support_block())
+        if worker_count == 1 or len(pvp_block) < 2:
+            for the_id in pvp_block:
+                copy_channel(the_id)
+        else:
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                for result in [executor.submit(copy_channel, the_id) for the_id in pvp_block]:
+                    result.result()
+    logger.info(
+        'Wrote subset of {} channels, {} vectors to {}'.format(
+            len(out_channels), sum(entry.NumVectors for entry in out_channels), output_file))
+    return meta
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Create a subset of a CPHD file.",
+        formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument(
+        'input_file', metavar='input_file', help='Path to the input CPHD file.')
+    parser.add_argument(
+        'output_file', metavar='output_file', help='Path to the output CPHD file.')
+    parser.add_argument(
+        '-c', '--channels', nargs='+', default=None,
+        help='The identifiers of the channels to retain, all if not provided.')
+    parser.add_argument(
+        '-t', '--time-window', nargs=2, type=float, default=None,
+        help='Retain vectors with start <= TxTime < stop, floats: start stop')
+    parser.add_argument(
+        '-r', '--vector-range', nargs=2, type=int, default=None,
+        help='Retain vectors with index in [start, stop), integers: start stop')
+    parser.add_argument(
+        '-d', '--vector-step', type=int, default=1,
+        help='Retain every VECTOR_STEP vector, for decimation.')
+    parser.add_argument(
+        '-s', '--sample-range', nargs=2, type=int, default=None,
+        help='Retain samples with index in [start, stop), integers: start stop')
+    parser.add_argument(
+        '-j', '--workers', type=int, default=None,
+        help='The number of worker threads for copying channels concurrently.')
+    parser.add_argument(
+        '-w', '--overwrite', action='store_true',
+        help='Overwrite output file, if it already exists?')
+    parser.add_argument(
+        '-v', '--verbose', action='store_true', help='Verbose (level="INFO") logging?')
+
+    args = parser.parse_args(args)
+
+    level = 'INFO' if args.verbose else 'WARNING'
+    logging.basicConfig(level=level)
+    logging.getLogger('sarpy').setLevel(level)
+
+    subset_cphd(
+        args.input_file, args.output_file, channels=args.channels, time_window=args.time_window,
+        vector_range=args.vector_range, vector_step=args.vector_step, sample_range=args.sample_range,
+        max_workers=args.workers, check_existence=not args.overwrite)
+
+
+if __name__ == '__main__':
+    main()    # pragma: no cover
@@ -15,6 +15,7 @@ import shapely.geometry as shg
 
 import sarpy.visualization.kmz_product_creation as kpc
 from sarpy.io.kml import Document
+from sarpy.io.phase_history.pvp_geometry import PVPGeometry
 from sarpy.visualization import kmz_utils
 
 logger = logging.getLogger(__name__)
@@ -107,15 +108,34 @@ def imagearea_kml_coord(scenecoords_node, imagearea_node):
     return _xy_to_kml_coord(scenecoords_node, verts)
 
 
-def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
+def cphd_create_kmz_view(
+    reader,
+    output_directory,
+    file_stem="view",
+    position_tolerance=5.0,
+    footprint_tolerance=50.0,
+    max_vectors=256,
+    max_candidates=8192,
+):
     """
     Create a kmz view for the reader contents.
 
+    The displayed tracks use an adaptively decimated subset of the vectors, see
+    :func:`cphd_channel_geometry`.
+
     Parameters
     ----------
     reader : CPHDTypeReader
     output_directory : str
     file_stem : str
+    position_tolerance : float
+        The allowed error (meters) of the decimated aperture and SRP tracks.
+    footprint_tolerance : float
+        The allowed error (meters) of the decimated boresight ground tracks.
+    max_vectors : int
+        The maximum number of vectors displayed per channel.
+    max_candidates : int
+        The maximum number of vectors per channel for which geometry is computed.
 
     Returns
     -------
@@ -140,6 +160,13 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
 
     """
 
+    geometry_args = {
+        "position_tolerance": position_tolerance,
+        "footprint_tolerance": footprint_tolerance,
+        "max_vectors": max_vectors,
+        "max_candidates": max_candidates,
+    }
+
     def add_global(kmz_doc, root):
         logger.info("Adding global to kmz.")
         folder = kmz_doc.add_container(
@@ -173,34 +200,15 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
     def add_channel(kmz_doc, root, channel_name):
         channel_names = [chan.Identifier for chan in reader.cphd_meta.Data.Channels]
         channel_index = channel_names.index(channel_name)
-        pvp_array = reader.read_pvp_array(channel_index)
         logger.info(f"Adding channel '{channel_name}' to kmz.")
+        geometry = cphd_channel_geometry(reader, channel_index, **geometry_args)
 
-        if "SIGNAL" in pvp_array.dtype.names:
-            signal = pvp_array["SIGNAL"]
-        else:
-            num_vectors = reader.cphd_meta.Data.Channels[channel_index].NumVectors
-            signal = np.ones(num_vectors)
-
-        num_subselect = 24
-        indices = np.where(signal == 1)[0]
-        geom_indices = indices[
-            np.round(
-                np.linspace(0, indices.size - 1, num_subselect, endpoint=True)
-            ).astype(int)
-        ]
-
-        times = (
-            pvp_array["TxTime"][geom_indices] + pvp_array["RcvTime"][geom_indices]
-        ) / 2.0
-        arp_pos = (
-            pvp_array["TxPos"][geom_indices] + pvp_array["RcvPos"][geom_indices]
-        ) / 2.0
-        srp_pos = pvp_array["SRPPos"][geom_indices]
+        arp_pos = geometry["arp_pos"]
+        srp_pos = geometry["srp_pos"]
         collection_start = reader.cphd_meta.Global.Timeline.CollectionStart.astype(
             "datetime64[us]"
         )
-        whens = collection_start + (times * 1e6).astype("timedelta64[us]")
+        whens = collection_start + (geometry["times"] * 1e6).astype("timedelta64[us]")
         whens = [str(time) + "Z" for time in whens]
 
         time_args = {"beginTime": whens[0], "endTime": whens[-1]}
@@ -264,8 +272,6 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
                 altitudeMode="absolute",
             )
 
-        chan_params = reader.cphd_meta.Channel.Parameters[channel_index]
-
         antenna_folder = kmz_doc.add_container(
             the_type="Folder",
             par=folder,
@@ -285,37 +291,16 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
             description=f"Beam Footprints for channel {channel_name}",
         )
 
-        footprint_labels = {
-            "start": indices[0],
-            "middle": indices[len(indices) // 2],
-            "end": indices[-1],
-        }
-
-        footprints = {}
-        for txrcv in ("Tx", "Rcv"):
-            aiming = antenna_aiming(
-                reader.cphd_meta.Antenna,
-                pvp_array,
-                txrcv=txrcv,
-                apc_id=getattr(chan_params.Antenna, f"{txrcv}APCId"),
-                antpat_id=getattr(chan_params.Antenna, f"{txrcv}APATId"),
-            )
-            if not aiming:
-                break
-
+        for txrcv in geometry["aiming"]:
             for boresight_type in ("mechanical", "electrical"):
                 visibility = txrcv == "Rcv"  # only display Rcv by default
                 name = f"{txrcv} {boresight_type} boresight"
 
-                on_earth_ecf = np.asarray(
-                    [
-                        kmz_utils.ray_intersect_earth(apc_pos, along)
-                        for apc_pos, along in zip(
-                            aiming["raw"]["positions"][geom_indices],
-                            aiming[boresight_type][geom_indices],
-                        )
-                    ]
-                )
+                on_earth_ecf = geometry["boresights"][(txrcv, boresight_type)]
+                on_earth = np.isfinite(on_earth_ecf).all(axis=1)
+                if on_earth.sum() < 2:
+                    logger.warning(f"{name} for channel {channel_name} does not intersect the earth")
+                    continue
 
                 placemark = kmz_doc.add_container(
                     par=boresight_folder,
@@ -324,21 +309,15 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
                     styleUrl=f"#{boresight_type}_boresight",
                     visibility=visibility,
                 )
-                boresight_coords = kmz_utils.ecef_to_kml_coord(on_earth_ecf)
+                boresight_coords = kmz_utils.ecef_to_kml_coord(on_earth_ecf[on_earth])
                 kmz_utils.add_los_polygon(
-                    kmz_doc, placemark, arp_coords, boresight_coords
+                    kmz_doc,
+                    placemark,
+                    [coord for coord, keep in zip(arp_coords, on_earth) if keep],
+                    boresight_coords,
                 )
 
-            array_gain_poly = aiming["raw"]["pattern"].Array.GainPoly
-            element_gain_poly = aiming["raw"]["pattern"].Element.GainPoly
-            footprints[txrcv] = kmz_utils.make_beam_footprints(
-                aiming,
-                footprint_labels,
-                array_gain_poly,
-                element_gain_poly,
-                contour_level=-3,
-            )
-            for when, this_footprint in footprints[txrcv].items():
+            for when, this_footprint in geometry["footprints"][txrcv].items():
                 name = f"{txrcv} beam footprint @ {when}"
                 timestamp = (
                     str(
@@ -360,6 +339,7 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
                     " ".join(coords),
                     par=placemark,
                 )
+        footprints = geometry["footprints"]
 
         # Try to add TOA extents
         if reader.cphd_meta.SceneCoordinates.ReferenceSurface.Planar is None:
@@ -377,15 +357,15 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
             return np.squeeze(np.atleast_2d(x) @ np.stack((uiax, uiay), axis=-1))
 
         valid_toa_points = {}
-        for when, index in footprint_labels.items():
+        for when, label_pvp in geometry["label_pvp"].items():
             # define "bp" coordinate system aligned with bistatic pointing vector in scene plane
             bp = (
-                _unit(pvp_array["TxPos"][index] - pvp_array["SRPPos"][index])
-                + _unit(pvp_array["RcvPos"][index] - pvp_array["SRPPos"][index])
+                _unit(label_pvp["TxPos"] - label_pvp["SRPPos"])
+                + _unit(label_pvp["RcvPos"] - label_pvp["SRPPos"])
             ) / 2.0
             bp_in_plane = _unit(_in_scene_plane(bp))
             cross_bp_in_plane = np.array([-bp_in_plane[1], bp_in_plane[0]])
-            srp_in_plane = _in_scene_plane(pvp_array["SRPPos"][index] - iarp_ecf)
+            srp_in_plane = _in_scene_plane(label_pvp["SRPPos"] - iarp_ecf)
             transform_from_bp_to_scene = np.vstack(
                 (
                     np.stack([bp_in_plane, cross_bp_in_plane, srp_in_plane], axis=-1),
@@ -406,9 +386,9 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
                     )
                     this_toa = _geom_to_toa(
                         pt_ecf,
-                        pvp_array["TxPos"][index],
-                        pvp_array["RcvPos"][index],
-                        pvp_array["SRPPos"][index],
+                        label_pvp["TxPos"],
+                        label_pvp["RcvPos"],
+                        label_pvp["SRPPos"],
                     )
                     return np.abs(this_toa - toa_target)
 
@@ -454,7 +434,7 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
                 np.zeros(2) if toa_point_center is None else toa_point_center
             )
             centers = {
-                x: _get_toa_point_ecf(toa_point_center, pvp_array[x][index])
+                x: _get_toa_point_ecf(toa_point_center, label_pvp[x])
                 for x in ("TOA1", "TOA2")
             }
 
@@ -466,24 +446,24 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
                     [
                         _get_toa_point_ecf(
                             toa_point_center + [0, toa_point_width / 2],
-                            pvp_array[x][index],
+                            label_pvp[x],
                         ),
                         centers[x],
                         _get_toa_point_ecf(
                             toa_point_center + [0, -toa_point_width / 2],
-                            pvp_array[x][index],
+                            label_pvp[x],
                         ),
                     ],
                     axis=0,
                 )
                 for x in ("TOA1", "TOA2")
             }
-            if {"TOAE1", "TOAE2"}.issubset(pvp_array.dtype.names):
+            if {"TOAE1", "TOAE2"}.issubset(label_pvp.dtype.names):
                 for param in ("TOAE1", "TOAE2"):
                     toa_points[param] = np.concatenate(
                         [
                             _get_toa_point_ecf(
-                                toa_point_center + [0, offset], pvp_array[param][index]
+                                toa_point_center + [0, offset], label_pvp[param]
                             )
                             for offset in (toa_point_width / 2, 0, -toa_point_width / 2)
                         ],
@@ -526,6 +506,136 @@ def cphd_create_kmz_view(reader, output_directory, file_stem="view"):
             add_channel(kmz_doc, root, channel_name=chan.Identifier)
 
 
+def cphd_channel_geometry(
+    reader,
+    channel_index,
+    *,
+    position_tolerance=5.0,
+    footprint_tolerance=50.0,
+    max_vectors=256,
+    max_candidates=8192,
+):
+    """
+    Compute the decimated geometry for the kmz view of a CPHD channel.
+
+    The geometry is computed for at most `max_candidates` evenly spaced normal
+    (`SIGNAL == 1`) vectors, from which at least 24 and at most `max_vectors`
+    vectors are selected so that the aperture and SRP tracks, and the boresight
+    ground tracks, are reproduced within the given tolerances. The result is
+    cached per file and channel.
+
+    Parameters
+    ----------
+    reader : CPHDTypeReader
+    channel_index : int
+    position_tolerance : float
+    footprint_tolerance : float
+    max_vectors : int
+    max_candidates : int
+
+    Returns
+    -------
+    dict
+    """
+
+    meta = reader.cphd_meta
+    chan_params = meta.Channel.Parameters[channel_index]
+
+    def compute():
+        num_vectors = meta.Data.Channels[channel_index].NumVectors
+        signal = reader.read_pvp_variable("SIGNAL", channel_index)
+        indices = (
+            np.arange(num_vectors) if signal is None else np.where(signal == 1)[0]
+        )
+        labels = {
+            "start": indices[0],
+            "middle": indices[len(indices) // 2],
+            "end": indices[-1],
+        }
+        candidates = np.union1d(
+            indices[
+                np.round(
+                    np.linspace(0, indices.size - 1, min(indices.size, max_candidates))
+                ).astype(int)
+            ],
+            list(labels.values()),
+        )
+        pvp_array = kmz_utils.read_pvp_rows(reader, channel_index, candidates)
+        pvp_geometry = PVPGeometry(pvp_array)
+
+        times = pvp_geometry.arp_time
+        arp_pos = pvp_geometry.arp_pos
+        srp_pos = pvp_geometry.srp_pos
+
+        aiming = {}
+        boresights = {}
+        for txrcv in ("Tx", "Rcv"):
+            if chan_params.Antenna is None:
+                break
+            this_aiming = antenna_aiming(
+                meta.Antenna,
+                pvp_array,
+                txrcv=txrcv,
+                apc_id=getattr(chan_params.Antenna, f"{txrcv}APCId"),
+                antpat_id=getattr(chan_params.Antenna, f"{txrcv}APATId"),
+            )
+            if not this_aiming:
+                break
+            aiming[txrcv] = this_aiming
+            for boresight_type in ("mechanical", "electrical"):
+                boresights[(txrcv, boresight_type)] = kmz_utils.ray_intersect_earth_array(
+                    this_aiming["raw"]["positions"], this_aiming[boresight_type]
+                )
+
+        selected = kmz_utils.adaptive_track_indices(
+            times,
+            [arp_pos, srp_pos] + list(boresights.values()),
+            [position_tolerance, position_tolerance]
+            + [footprint_tolerance] * len(boresights),
+            min_count=24,
+            max_count=max_vectors,
+        )
+        label_positions = {
+            label: int(np.searchsorted(candidates, index))
+            for label, index in labels.items()
+        }
+        footprints = {
+            txrcv: kmz_utils.make_beam_footprints(
+                this_aiming,
+                label_positions,
+                this_aiming["raw"]["pattern"].Array.GainPoly,
+                this_aiming["raw"]["pattern"].Element.GainPoly,
+                contour_level=-3,
+            )
+            for txrcv, this_aiming in aiming.items()
+        }
+        return {
+            "vector_indices": candidates[selected],
+            "times": times[selected],
+            "arp_pos": arp_pos[selected],
+            "srp_pos": srp_pos[selected],
+            "aiming": tuple(aiming.keys()),
+            "boresights": {key: value[selected] for key, value in boresights.items()},
+            "footprints": footprints,
+            "label_pvp": {
+                label: pvp_array[position] for label, position in label_positions.items()
+            },
+        }
+
+    # the antenna metadata may be modified in memory, so it forms part of the key
+    key = (
+        "cphd",
+        channel_index,
+        position_tolerance,
+        footprint_tolerance,
+        max_vectors,
+        max_candidates,
+        None if meta.Antenna is None else meta.Antenna.to_xml_string(),
+        None if chan_params.Antenna is None else chan_params.Antenna.to_xml_string(),
+    )
+    return kmz_utils.cached_geometry(reader.file_name, key, compute)
+
+
 def _apply_homogeneous_transform(x, t, is_position=True):
     homogeneous_coord = np.ones if is_position else np.zeros
     return (t @ np.vstack([x, homogeneous_coord((1, x.shape[1]))]))[:-1, ...]
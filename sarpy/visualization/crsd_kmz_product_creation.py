@@ -16,15 +16,34 @@ from sarpy.visualization import kmz_utils
 logger = logging.getLogger(__name__)
 
 
-def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
+def crsd_create_kmz_view(
+    reader,
+    output_directory,
+    file_stem="view",
+    position_tolerance=5.0,
+    footprint_tolerance=50.0,
+    max_vectors=256,
+    max_candidates=8192,
+):
     """
     Create a kmz view for the reader contents.
 
+    The displayed tracks use an adaptively decimated subset of the vectors, see
+    :func:`crsd_platform_geometry`.
+
     Parameters
     ----------
     reader : CRSDTypeReader
     output_directory : str
     file_stem : str
+    position_tolerance : float
+        The allowed error (meters) of the decimated APC tracks.
+    footprint_tolerance : float
+        The allowed error (meters) of the decimated boresight ground tracks.
+    max_vectors : int
+        The maximum number of vectors displayed per channel and platform.
+    max_candidates : int
+        The maximum number of vectors per channel for which geometry is computed.
 
     Returns
     -------
@@ -49,6 +68,13 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
 
     """
 
+    geometry_args = {
+        "position_tolerance": position_tolerance,
+        "footprint_tolerance": footprint_tolerance,
+        "max_vectors": max_vectors,
+        "max_candidates": max_candidates,
+    }
+
     def add_global(kmz_doc, root):
         logger.info("Adding global to kmz.")
         folder = kmz_doc.add_container(
@@ -83,7 +109,6 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
     def add_channel(kmz_doc, root, channel_name):
         channel_names = [chan.Identifier for chan in reader.crsd_meta.Data.Channels]
         channel_index = channel_names.index(channel_name)
-        pvp_array = reader.read_pvp_array(channel_index)
         logger.info(f"Adding channel '{channel_name}' to kmz.")
         channel_folder = kmz_doc.add_container(
             par=root,
@@ -99,19 +124,26 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
             if txrcv == "Tx" and sar_imaging_node is None:
                 continue
 
-            pos_pvp = pvp_array[f"{txrcv}Pos"]
-            time_pvp = pvp_array[f"{txrcv}Time"]
-            num_subselect = 24
-            indices = np.where(
-                np.logical_and(np.isfinite(time_pvp), np.isfinite(pos_pvp).all(axis=1))
-            )[0]
-            indices = indices[
-                np.round(
-                    np.linspace(0, indices.size - 1, num_subselect, endpoint=True)
-                ).astype(int)
-            ]
-            time_pvp = time_pvp[indices]
-            apc_pos = pos_pvp[indices]
+            if txrcv == "Tx":
+                antenna_node = sar_imaging_node.TxAntenna
+            else:
+                antenna_node = chan_params.RcvAntenna
+            if antenna_node is None:
+                apc_id = antpat_id = None
+            else:
+                apc_id = getattr(antenna_node, f"{txrcv}APCId")
+                antpat_id = getattr(antenna_node, f"{txrcv}APATId")
+
+            geometry = crsd_platform_geometry(
+                reader,
+                channel_index,
+                txrcv,
+                apc_id=apc_id,
+                antpat_id=antpat_id,
+                **geometry_args,
+            )
+            time_pvp = geometry["times"]
+            apc_pos = geometry["apc_pos"]
             collection_start = (
                 reader.crsd_meta.Global.Timeline.CollectionRefTime.astype(
                     "datetime64[us]"
@@ -170,21 +202,8 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
                 altitudeMode="absolute",
             )
 
-            if txrcv == "Tx":
-                if (
-                    chan_params.SARImaging is not None
-                    and chan_params.SARImaging.TxAntenna is not None
-                ):
-                    apc_id = chan_params.SARImaging.TxAntenna.TxAPCId
-                    antpat_id = chan_params.SARImaging.TxAntenna.TxAPATId
-                else:
-                    return
-            else:
-                if chan_params.RcvAntenna is not None:
-                    apc_id = chan_params.RcvAntenna.RcvAPCId
-                    antpat_id = chan_params.RcvAntenna.RcvAPATId
-                else:
-                    return
+            if not geometry["boresights"]:
+                return
 
             antenna_folder = kmz_doc.add_container(
                 the_type="Folder",
@@ -199,27 +218,15 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
                 description=f"Boresights for channel {channel_name}",
             )
 
-            aiming = cphd_kpc.antenna_aiming(
-                reader.crsd_meta.Antenna,
-                pvp_array,
-                txrcv=txrcv,
-                apc_id=apc_id,
-                antpat_id=antpat_id,
-            )
-
             for boresight_type in ("mechanical", "electrical"):
                 visibility = txrcv == "Rcv"  # only display Rcv by default
                 name = f"{txrcv} {boresight_type} boresight"
 
-                on_earth_ecf = np.asarray(
-                    [
-                        kmz_utils.ray_intersect_earth(apc_pos, along)
-                        for apc_pos, along in zip(
-                            aiming["raw"]["positions"][indices],
-                            aiming[boresight_type][indices],
-                        )
-                    ]
-                )
+                on_earth_ecf = geometry["boresights"][boresight_type]
+                on_earth = np.isfinite(on_earth_ecf).all(axis=1)
+                if on_earth.sum() < 2:
+                    logger.warning(f"{name} for channel {channel_name} does not intersect the earth")
+                    continue
 
                 placemark = kmz_doc.add_container(
                     par=boresight_folder,
@@ -228,8 +235,13 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
                     styleUrl=f"#{boresight_type}_boresight",
                     visibility=visibility,
                 )
-                boresight_coords = kmz_utils.ecef_to_kml_coord(on_earth_ecf)
-                kmz_utils.add_los_polygon(kmz_doc, placemark, apc_coords, boresight_coords)
+                boresight_coords = kmz_utils.ecef_to_kml_coord(on_earth_ecf[on_earth])
+                kmz_utils.add_los_polygon(
+                    kmz_doc,
+                    placemark,
+                    [coord for coord, keep in zip(apc_coords, on_earth) if keep],
+                    boresight_coords,
+                )
 
     kmz_file = os.path.join(output_directory, f"{file_stem}_crsd.kmz")
     with cphd_kpc.prepare_kmz_file(kmz_file, name=reader.file_name) as kmz_doc:
@@ -239,3 +251,105 @@ def crsd_create_kmz_view(reader, output_directory, file_stem="view"):
         add_global(kmz_doc, root)
         for chan in reader.crsd_meta.Data.Channels:
             add_channel(kmz_doc, root, channel_name=chan.Identifier)
+
+
+def crsd_platform_geometry(
+    reader,
+    channel_index,
+    txrcv,
+    *,
+    apc_id=None,
+    antpat_id=None,
+    position_tolerance=5.0,
+    footprint_tolerance=50.0,
+    max_vectors=256,
+    max_candidates=8192,
+):
+    """
+    Compute the decimated geometry for the kmz view of a CRSD channel platform.
+
+    The geometry is computed for at most `max_candidates` evenly spaced vectors
+    with valid time and position, from which at least 24 and at most `max_vectors`
+    vectors are selected so that the APC track, and the boresight ground tracks
+    if `antpat_id` is provided, are reproduced within the given tolerances. The
+    result is cached per file and channel.
+
+    Parameters
+    ----------
+    reader : CRSDTypeReader
+    channel_index : int
+    txrcv : str
+        One of "Tx" or "Rcv".
+    apc_id : None|str
+    antpat_id : None|str
+    position_tolerance : float
+    footprint_tolerance : float
+    max_vectors : int
+    max_candidates : int
+
+    Returns
+    -------
+    dict
+    """
+
+    meta = reader.crsd_meta
+
+    def compute():
+        time_pvp = reader.read_pvp_variable(f"{txrcv}Time", channel_index)
+        pos_pvp = reader.read_pvp_variable(f"{txrcv}Pos", channel_index)
+        indices = np.where(
+            np.logical_and(np.isfinite(time_pvp), np.isfinite(pos_pvp).all(axis=1))
+        )[0]
+        candidates = indices[
+            np.unique(
+                np.round(
+                    np.linspace(0, indices.size - 1, min(indices.size, max_candidates))
+                ).astype(int)
+            )
+        ]
+        pvp_array = kmz_utils.read_pvp_rows(reader, channel_index, candidates)
+        times = pvp_array[f"{txrcv}Time"]
+        apc_pos = pvp_array[f"{txrcv}Pos"]
+
+        boresights = {}
+        if antpat_id is not None and meta.Antenna is not None:
+            aiming = cphd_kpc.antenna_aiming(
+                meta.Antenna,
+                pvp_array,
+                txrcv=txrcv,
+                apc_id=apc_id,
+                antpat_id=antpat_id,
+            )
+            for boresight_type in ("mechanical", "electrical"):
+                boresights[boresight_type] = kmz_utils.ray_intersect_earth_array(
+                    aiming["raw"]["positions"], aiming[boresight_type]
+                )
+
+        selected = kmz_utils.adaptive_track_indices(
+            times,
+            [apc_pos] + list(boresights.values()),
+            [position_tolerance] + [footprint_tolerance] * len(boresights),
+            min_count=24,
+            max_count=max_vectors,
+        )
+        return {
+            "vector_indices": candidates[selected],
+            "times": times[selected],
+            "apc_pos": apc_pos[selected],
+            "boresights": {key: value[selected] for key, value in boresights.items()},
+        }
+
+    # the antenna metadata may be modified in memory, so it forms part of the key
+    key = (
+        "crsd",
+        channel_index,
+        txrcv,
+        apc_id,
+        antpat_id,
+        position_tolerance,
+        footprint_tolerance,
+        max_vectors,
+        max_candidates,
+        None if meta.Antenna is None else meta.Antenna.to_xml_string(),
+    )
+    return kmz_utils.cached_geometry(reader.file_name, key, compute)
@@ -6,11 +6,19 @@ __classification__ = "UNCLASSIFIED"
 __author__ = "Valkyrie Systems Corporation"
 
 import logging
+import os
+import threading
+from collections import OrderedDict
 
 import matplotlib.pyplot as plt
 import numpy as np
 import shapely.geometry as shg
 
+try:
+    import contourpy
+except ImportError:
+    contourpy = None
+
 from sarpy.geometry.geocoords import ecf_to_geodetic
 
 WGS84_SEMIMAJOR = 6378137.0
@@ -18,6 +26,10 @@ WGS84_SEMIMINOR = 6356752.314245
 
 logger = logging.getLogger(__name__)
 
+_GEOMETRY_CACHE = OrderedDict()
+_GEOMETRY_CACHE_SIZE = 32
+_GEOMETRY_CACHE_LOCK = threading.Lock()
+
 
 def ecef_to_kml_coord(ecf_points):
     """Convert a list of ECEF points to a list of KML coordinates"""
@@ -212,6 +224,189 @@ def ray_intersect_earth(position, direction):
     return point_ecf
 
 
+def ray_intersect_earth_array(positions, directions):
+    """Intersect ECEF rays with the earth, vectorized over the rays
+
+    Parameters
+    ----------
+    positions: array-like
+        Ray origins in ECEF, of shape `(N, 3)`
+    directions: array-like
+        Ray directions in ECEF, of shape `(N, 3)`
+
+    Returns
+    -------
+    numpy.ndarray
+        Points of intersection in ECEF, of shape `(N, 3)`. The entry is NaN for
+        any ray which does not intersect the earth, or points away from it.
+    """
+    positions = np.atleast_2d(np.asarray(positions, dtype="float64"))
+    directions = np.atleast_2d(np.asarray(directions, dtype="float64"))
+    # scale the ellipsoid to the unit sphere, and solve the quadratic
+    scale = np.array([WGS84_SEMIMAJOR, WGS84_SEMIMAJOR, WGS84_SEMIMINOR])
+    scaled_pos = positions / scale
+    scaled_dir = directions / scale
+    quad_a = np.sum(scaled_dir * scaled_dir, axis=-1)
+    quad_b = np.sum(scaled_pos * scaled_dir, axis=-1)
+    quad_c = np.sum(scaled_pos * scaled_pos, axis=-1) - 1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        distance = (-quad_b - np.sqrt(quad_b**2 - quad_a * quad_c)) / quad_a
+    distance[~(distance >= 0)] = np.nan
+    return positions + distance[:, np.newaxis] * directions
+
+
+def adaptive_track_indices(times, tracks, tolerances, min_count=24, max_count=256):
+    """Select samples of tracks on an error bound, for decimated display
+
+    Starting from `min_count` evenly spaced samples, the sample with the largest
+    error is added to every segment whose piecewise linear (in time) interpolation
+    differs from any track by more than the corresponding tolerance. This repeats
+    until all tracks are within tolerance, or `max_count` samples are selected.
+    So, straight and slowly varying tracks use few samples, and curved tracks or
+    rapidly changing beam footprints use more.
+
+    Parameters
+    ----------
+    times: array-like
+        The sample times, of shape `(N,)`, which are assumed non-decreasing
+    tracks: Sequence[array-like]
+        The tracks, each of shape `(N, ...)`. NaN entries are ignored.
+    tolerances: Sequence[float]
+        The allowed interpolation error for each track
+    min_count: int
+    max_count: int
+
+    Returns
+    -------
+    numpy.ndarray
+        The sorted indices of the selected samples
+    """
+    times = np.asarray(times, dtype="float64")
+    count = times.size
+    if len(tracks) != len(tolerances):
+        raise ValueError(
+            f"Got {len(tracks)} tracks and {len(tolerances)} tolerances"
+        )
+    if count <= max(min_count, 2):
+        return np.arange(count)
+    tracks = [
+        np.reshape(np.asarray(track, dtype="float64"), (count, -1)) / tolerance
+        for track, tolerance in zip(tracks, tolerances)
+    ]
+    positions = np.arange(count)
+    selected = np.unique(
+        np.round(np.linspace(0, count - 1, max(min_count, 2))).astype("int64")
+    )
+    while selected.size < max_count:
+        segment = np.clip(
+            np.searchsorted(selected, positions, side="right") - 1,
+            0,
+            selected.size - 2,
+        )
+        left = selected[segment]
+        right = selected[segment + 1]
+        span = times[right] - times[left]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(
+                span > 0,
+                (times - times[left]) / span,
+                (positions - left) / (right - left),
+            )
+        error = np.zeros((count,), dtype="float64")
+        for track in tracks:
+            estimate = track[left] + weight[:, np.newaxis] * (track[right] - track[left])
+            error = np.fmax(error, np.linalg.norm(track - estimate, axis=-1))
+        # the worst sample of each segment which exceeds the tolerance
+        order = np.argsort(-error, kind="stable")
+        order = order[error[order] > 1]
+        _, first = np.unique(segment[order], return_index=True)
+        additions = order[np.sort(first)][: max_count - selected.size]
+        if additions.size == 0:
+            break
+        selected = np.union1d(selected, additions)
+    return selected
+
+
+def read_pvp_rows(reader, channel_index, rows, block_size=65536):
+    """Read the per vector parameters for the given vectors of a channel
+
+    Evenly spaced vectors are read with a single strided read, otherwise the
+    vectors are read in blocks spanning at most `block_size` vectors, so the
+    full PVP array is never held in memory.
+
+    Parameters
+    ----------
+    reader: CPHDTypeReader|CRSDTypeReader
+    channel_index: int
+    rows: array-like
+        The sorted, unique vector indices
+    block_size: int
+
+    Returns
+    -------
+    numpy.ndarray
+    """
+    rows = np.asarray(rows, dtype="int64")
+    if rows.size > 1:
+        step = int(rows[1] - rows[0])
+        if step > 0 and np.all(np.diff(rows) == step):
+            return reader.read_pvp_array(
+                channel_index, the_range=(int(rows[0]), int(rows[-1]) + 1, step)
+            )
+    blocks = []
+    start = 0
+    while start < rows.size:
+        stop = int(np.searchsorted(rows, rows[start] + block_size))
+        block = reader.read_pvp_array(
+            channel_index, the_range=(int(rows[start]), int(rows[stop - 1]) + 1, 1)
+        )
+        blocks.append(block[rows[start:stop] - rows[start]])
+        start = stop
+    return np.concatenate(blocks)
+
+
+def cached_geometry(file_name, key, function):
+    """Fetch derived geometry from the cache, computing it if necessary
+
+    The cache is keyed on the file path, modification time and size, so entries
+    for a modified file are not reused. The least recently used entries are
+    evicted once the cache is full.
+
+    Parameters
+    ----------
+    file_name: None|str
+        The file from which the geometry is derived. No caching is performed if `None`.
+    key: tuple
+        The hashable identifier of the geometry, e.g. channel and parameters
+    function: callable
+        Function with no arguments which computes the geometry
+
+    Returns
+    -------
+    object
+    """
+    if file_name is None or not os.path.isfile(file_name):
+        return function()
+    stat = os.stat(file_name)
+    full_key = (os.path.abspath(file_name), stat.st_mtime_ns, stat.st_size) + tuple(key)
+    with _GEOMETRY_CACHE_LOCK:
+        if full_key in _GEOMETRY_CACHE:
+            _GEOMETRY_CACHE.move_to_end(full_key)
+            return _GEOMETRY_CACHE[full_key]
+    value = function()
+    with _GEOMETRY_CACHE_LOCK:
+        _GEOMETRY_CACHE[full_key] = value
+        while len(_GEOMETRY_CACHE) > _GEOMETRY_CACHE_SIZE:
+            _GEOMETRY_CACHE.popitem(last=False)
+    return value
+
+
+def clear_geometry_cache():
+    """Clear the cache populated by :func:`cached_geometry`"""
+    with _GEOMETRY_CACHE_LOCK:
+        _GEOMETRY_CACHE.clear()
+
+
 def add_los_polygon(kmz_doc, parent_placemark, apc_coords, ground_coords):
     """Add a polygon connecting a path above the earth to a path on the earth"""
     # complex 3d polygons don't always render nicely.  So, we'll manually triangluate it.
@@ -239,92 +434,181 @@ def add_los_polygon(kmz_doc, parent_placemark, apc_coords, ground_coords):
         kmz_doc.add_polygon(" ".join(coords), par=mg, altitudeMode="absolute")
 
 
-def make_beam_footprints(
-    aiming_metadata,
-    labelled_indices,
-    array_gain_poly,
-    element_gain_poly,
-    contour_level=-3,
-):
-    """Attempt to make beam footprints for the labelled slowtimes"""
-
-    def _find_central_contour(max_dc, eb_dcx, eb_dcy):
-        Ns = 201
-        dcs = np.linspace(-max_dc, max_dc, Ns)
-        dcx, dcy = np.meshgrid(dcs, dcs, indexing="ij")
-        gain_pattern = array_gain_poly(dcx, dcy) + element_gain_poly(dcx + eb_dcx, dcy + eb_dcy)
+def _closed_contours(dcx, dcy, gain_pattern, contour_level):
+    """Find the closed contour polygons of a gain pattern at the given level"""
+    if contourpy is not None:
+        lines = contourpy.contour_generator(dcx, dcy, gain_pattern).lines(contour_level)
+    else:
         contour_sets = plt.contour(dcx, dcy, gain_pattern, levels=[contour_level])
         plt.close()  # close the figure created by contour
-
-        # We don't know the validity range of the gain polynomials and may have gone
-        # outside, resulting in multiple contours
-
-        # Only keep contours that form a closed shape
         try:
             paths = contour_sets.get_paths()
         except AttributeError:
             # matplotlib deprecated collections attribute in 3.8
             paths = contour_sets.collections[0].get_paths()
-
-        polygons = [
+        lines = [
             polygon
             for path in paths
             for polygon in path.to_polygons(closed_only=False)
-            if np.array_equal(polygon[0], polygon[-1]) and len(polygon) > 1  # only consider closed polygons
         ]
-        if polygons:
-            # Keep contour closest to center
-            return min(
-                polygons, key=lambda vertices: np.linalg.norm(np.mean(vertices, axis=0))
-            )
-        return None
 
+    # We don't know the validity range of the gain polynomials and may have gone
+    # outside, resulting in multiple contours
 
-    result = {}
-    for name, pvp_index in labelled_indices.items():
-        try:
-            eb_dcx = aiming_metadata["raw"]["eb_dcx"][pvp_index]
-            eb_dcy = aiming_metadata["raw"]["eb_dcy"][pvp_index]
-            uacx = aiming_metadata["raw"]["uacx"][pvp_index]
-            uacy = aiming_metadata["raw"]["uacy"][pvp_index]
-            time = aiming_metadata["raw"]["times"][pvp_index]
-            apc_pos = aiming_metadata["raw"]["positions"][pvp_index]
-
-            contour = _find_central_contour(1, eb_dcx, eb_dcy)
-            for n in range(10):
-                next_contour = _find_central_contour(8**(-n-1), eb_dcx, eb_dcy)
-                if next_contour is None and contour is not None:
-                    break
-                if contour is not None and next_contour is not None:
-                    cpoly = shg.Polygon(contour)
-                    ncpoly = shg.Polygon(next_contour)
-                    if np.isclose(cpoly.intersection(ncpoly).area, ncpoly.area, atol=0, rtol=0.05):
-                        # close enough
-                        contour = next_contour
-                        break
-                contour = next_contour
-
-            if contour is None:
-                raise ValueError("unable to find contour")
-
-            delta_dcx = contour[:, 0]
-            delta_dcy = contour[:, 1]
-
-            contour_pointing = acf_to_ecef(
-                delta_dcx + eb_dcx,
-                delta_dcy + eb_dcy,
-                uacx,
-                uacy,
-            )
+    # Only keep contours that form a closed shape
+    return [
+        polygon
+        for polygon in lines
+        if len(polygon) > 1 and np.array_equal(polygon[0], polygon[-1])
+    ]
 
-            contour_earth_ecf = []
-            for along in contour_pointing:
-                contour_earth_ecf.append(ray_intersect_earth(apc_pos, along))
-            result[name] = {"time": time, "contour": contour_earth_ecf}
-        except Exception as exc:
-            logger.warning(
-                f"Exception while calculating {name} beam footprint of {aiming_metadata['antpat_id']}"
-            )
-            logger.warning(exc, exc_info=True)
 
+def make_beam_footprints(
+    aiming_metadata,
+    labelled_indices,
+    array_gain_poly,
+    element_gain_poly,
+    contour_level=-3,
+):
+    """Attempt to make beam footprints for the labelled slowtimes
+
+    The gain patterns for all labelled slowtimes are evaluated together at each
+    direction cosine scale, and the contours are intersected with the earth in
+    a single vectorized computation.
+    """
+    Ns = 201
+    names = list(labelled_indices.keys())
+    pvp_indices = np.array([labelled_indices[name] for name in names], dtype="int64")
+    if pvp_indices.size == 0:
+        return {}
+    eb_dcx = np.asarray(aiming_metadata["raw"]["eb_dcx"])[pvp_indices]
+    eb_dcy = np.asarray(aiming_metadata["raw"]["eb_dcy"])[pvp_indices]
+
+    def _find_central_contours(max_dc, active):
+        dcs = np.linspace(-max_dc, max_dc, Ns)
+        dcx, dcy = np.meshgrid(dcs, dcs, indexing="ij")
+        # the array pattern is common, the element pattern follows the electrical boresight
+        gain_patterns = array_gain_poly(dcx, dcy) + element_gain_poly(
+            dcx + eb_dcx[active, np.newaxis, np.newaxis],
+            dcy + eb_dcy[active, np.newaxis, np.newaxis],
+        )
+        result = []
+        for gain_pattern in gain_patterns:
+            polygons = _closed_contours(dcx, dcy, gain_pattern, contour_level)
+            if polygons:
+                # Keep contour closest to center
+                result.append(
+                    min(polygons, key=lambda vertices: np.linalg.norm(np.mean(vertices, axis=0)))
+                )
+            else:
+                result.append(None)
+        return result
+
+    def _warn(name, exc):
+        logger.warning(
+            f"Exception while calculating {name} beam footprint of {aiming_metadata['antpat_id']}"
+        )
+        logger.warning(exc, exc_info=True)
+
+    # refine the direction cosine extent for all slowtimes together
+    contours = [None] * len(names)
+    finished = np.zeros((len(names),), dtype="bool")
+    failed = np.zeros((len(names),), dtype="bool")
+
+    def _fail(position, exc):
+        _warn(names[position], exc)
+        contours[position] = None
+        failed[position] = True
+        finished[position] = True
+
+    def _evaluate_contours(max_dc, active):
+        try:
+            return _find_central_contours(max_dc, active)
+        except Exception:
+            # evaluate each slowtime separately, so only the failing ones are lost
+            next_contours = []
+            for position in active:
+                try:
+                    next_contours.append(_find_central_contours(max_dc, np.array([position]))[0])
+                except Exception as exc:
+                    _fail(position, exc)
+                    next_contours.append(None)
+            return next_contours
+
+    for n in range(-1, 10):
+        active = np.nonzero(~finished)[0]
+        if active.size == 0:
+            break
+        next_contours = _evaluate_contours(1 if n < 0 else 8 ** (-n - 1), active)
+        for position, next_contour in zip(active, next_contours):
+            if failed[position]:
+                continue
+            try:
+                contour = contours[position]
+                if n >= 0:
+                    if next_contour is None and contour is not None:
+                        finished[position] = True
+                        continue
+                    if contour is not None and next_contour is not None:
+                        cpoly = shg.Polygon(contour)
+                        ncpoly = shg.Polygon(next_contour)
+                        if np.isclose(cpoly.intersection(ncpoly).area, ncpoly.area, atol=0, rtol=0.05):
+                            # close enough
+                            finished[position] = True
+                contours[position] = next_contour
+            except Exception as exc:
+                _fail(position, exc)
+
+    valid = []
+    for position, name in enumerate(names):
+        if failed[position]:
+            continue
+        if contours[position] is None:
+            _warn(name, ValueError("unable to find contour"))
+        else:
+            valid.append(position)
+    if not valid:
+        return {}
+
+    def _intersect_earth(positions):
+        # intersect all contour pointing directions with the earth at once
+        counts = [len(contours[position]) for position in positions]
+        repeats = np.repeat(np.arange(len(positions)), counts)
+        stacked = np.concatenate([contours[position] for position in positions], axis=0)
+        position_indices = pvp_indices[positions][repeats]
+        contour_pointing = acf_to_ecef(
+            stacked[:, 0] + eb_dcx[positions][repeats],
+            stacked[:, 1] + eb_dcy[positions][repeats],
+            np.asarray(aiming_metadata["raw"]["uacx"])[position_indices],
+            np.asarray(aiming_metadata["raw"]["uacy"])[position_indices],
+        )
+        contour_earth_ecf = ray_intersect_earth_array(
+            np.asarray(aiming_metadata["raw"]["positions"])[position_indices], contour_pointing
+        )
+        return np.split(contour_earth_ecf, np.cumsum(counts)[:-1])
+
+    try:
+        earth_contours = _intersect_earth(valid)
+    except Exception:
+        # intersect each slowtime separately, so only the failing ones are lost
+        earth_contours = []
+        for position in valid:
+            try:
+                earth_contours.extend(_intersect_earth([position]))
+            except Exception as exc:
+                _warn(names[position], exc)
+                earth_contours.append(None)
+
+    result = {}
+    for position, contour_ecf in zip(valid, earth_contours):
+        name = names[position]
+        if contour_ecf is None:
+            continue
+        if not np.all(np.isfinite(contour_ecf)):
+            _warn(name, ValueError("Ray does not intersect ellipsoid"))
+            continue
+        result[name] = {
+            "time": aiming_metadata["raw"]["times"][pvp_indices[position]],
+            "contour": contour_ecf,
+        }
     return result
@@ -0,0 +1,58 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.annotation.afrl_rde_elements import ObjectInfo, FiducialInfo
+
+
+@pytest.fixture(scope='module')
+def sicd():
+    xml_file = pathlib.Path(__file__).parents[1] / 'data/example.sicd.xml'
+    return SICDType.from_xml_file(xml_file)
+
+
+@pytest.fixture(scope='module')
+def geo_coords(sicd):
+    rng = np.random.default_rng(0)
+    pixels = rng.uniform(10, [sicd.ImageData.NumRows - 10, sicd.ImageData.NumCols - 10], (10, 2))
+    return sicd.project_image_to_ground_geo(pixels)
+
+
+def test_object_image_locations(sicd, geo_coords):
+    geo_locations = [
+        ObjectInfo.GeoLocationType(
+            CenterPixel=entry, LeftFrontPixel=entry + [1e-5, 0, 0], RightFrontPixel=entry + [1e-5, 1e-5, 0],
+            RightRearPixel=entry + [0, 1e-5, 0], LeftRearPixel=entry)
+        for entry in geo_coords]
+    geo_locations.append(None)
+    batched = ObjectInfo.ImageLocationType.from_geolocations(geo_locations, sicd)
+    assert batched[-1] is None
+    for geo_location, image_location in zip(geo_locations[:-1], batched[:-1]):
+        single = ObjectInfo.ImageLocationType.from_geolocation(geo_location, sicd)
+        for attribute in ObjectInfo.ImageLocationType._fields:
+            assert np.all(
+                getattr(single, attribute).get_array() == getattr(image_location, attribute).get_array())
+
+    objects = [
+        ObjectInfo.TheObjectType(SystemName='object_{}'.format(i), GeoLocation=entry)
+        for i, entry in enumerate(geo_locations[:-1])]
+    object_info = ObjectInfo.ObjectInfoType(NumberOfObjectsInScene=len(objects), Objects=objects)
+    object_info.set_image_location_from_sicd(sicd, populate_in_periphery=True)
+    assert object_info.NumberOfObjectsInImage == len(objects)
+    for the_object, image_location in zip(object_info.Objects, batched):
+        assert np.all(the_object.ImageLocation.CenterPixel.get_array() == image_location.CenterPixel.get_array())
+
+
+def test_fiducial_image_locations(sicd, geo_coords):
+    fiducials = [
+        FiducialInfo.TheFiducialType(
+            Name='fiducial_{}'.format(i), GeoLocation=FiducialInfo.GeoLocationType(CenterPixel=entry))
+        for i, entry in enumerate(geo_coords)]
+    fiducial_info = FiducialInfo.FiducialInfoType(NumberOfFiducialsInScene=len(fiducials), Fiducials=fiducials)
+    fiducial_info.set_image_location_from_sicd(sicd)
+    assert fiducial_info.NumberOfFiducialsInImage == len(fiducials)
+    for the_fiducial in fiducial_info.Fiducials:
+        single = FiducialInfo.ImageLocationType.from_geolocation(the_fiducial.GeoLocation, sicd)
+        assert np.all(the_fiducial.ImageLocation.CenterPixel.get_array() == single.CenterPixel.get_array())
@@ -0,0 +1,137 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.geometry.geometry_elements import Point, Polygon, MultiPolygon, LineString, GeometryCollection
+from sarpy.annotation.base import AnnotationCollection, AnnotationFeature, AnnotationProperties, \
+    FileAnnotationCollection, project_collection_to_ground, project_collection_to_image
+from sarpy.annotation.rcs import FileRCSCollection
+
+
+@pytest.fixture(scope='module')
+def sicd():
+    xml_file = pathlib.Path(__file__).parents[1] / 'data/example.sicd.xml'
+    return SICDType.from_xml_file(xml_file)
+
+
+@pytest.fixture(scope='module')
+def collection(sicd):
+    rng = np.random.default_rng(0)
+    out = AnnotationCollection()
+    for i in range(20):
+        row, col = rng.uniform(100, [sicd.ImageData.NumRows - 100, sicd.ImageData.NumCols - 100])
+        ring = [[row, col], [row + 20, col], [row + 20, col + 20], [row, col + 20], [row, col]]
+        out.add_feature(AnnotationFeature(
+            geometry=Polygon(coordinates=[ring, ]), properties=AnnotationProperties(name='polygon_{}'.format(i))))
+    out.add_feature(AnnotationFeature(
+        geometry=Point(coordinates=[row, col]), properties=AnnotationProperties(name='point')))
+    return out
+
+
+def test_project_collection(sicd, collection):
+    ground = project_collection_to_ground(collection, sicd)
+    assert isinstance(ground, AnnotationCollection)
+    assert len(ground) == len(collection)
+    for original, projected in zip(collection.features, ground.features):
+        assert projected.uid == original.uid
+        assert projected.get_name() == original.get_name()
+        expected = original.geometry.apply_projection(sicd.project_image_to_ground_geo)
+        assert np.allclose(
+            np.array(projected.geometry.get_coordinate_list()), np.array(expected.get_coordinate_list()))
+
+    image = project_collection_to_image(ground, sicd)
+    for original, projected in zip(collection.features, image.features):
+        assert np.allclose(
+            np.array(projected.geometry.get_coordinate_list()),
+            np.array(original.geometry.get_coordinate_list()), atol=1e-2)
+
+
+def test_project_collection_hae(sicd):
+    scp_llh = sicd.GeoData.SCP.LLH.get_array()
+    collection = AnnotationCollection()
+    collection.add_feature(AnnotationFeature(
+        geometry=Point(coordinates=scp_llh[:2]), properties=AnnotationProperties(name='scp')))
+    with pytest.raises(ValueError, match='hae must be provided'):
+        project_collection_to_image(collection, sicd)
+
+    image = project_collection_to_image(collection, sicd, hae=scp_llh[2])
+    scp_pixel = sicd.ImageData.SCPPixel.get_array()
+    assert np.allclose(image[0].geometry.coordinates, scp_pixel, atol=1e-2)
+
+
+@pytest.fixture()
+def file_collection():
+    features = []
+    for i in range(30):
+        geometry = Polygon(coordinates=[[[i, i], [i + 2, i], [i + 2, i + 2], [i, i + 2], [i, i]], ])
+        features.append(AnnotationFeature(geometry=geometry, properties=AnnotationProperties(name='feature_{}'.format(i))))
+    features.append(AnnotationFeature(geometry=None, properties=AnnotationProperties(name='empty')))
+    features.append(AnnotationFeature(
+        geometry=MultiPolygon(coordinates=[[[[0, 0], [1, 0], [1, 1], [0, 0]]], [[[5, 5], [6, 5], [6, 6], [5, 5]]]]),
+        properties=AnnotationProperties(name='multi')))
+    features.append(AnnotationFeature(
+        geometry=GeometryCollection(geometries=[Point(coordinates=[100, 100, 3]), LineString(coordinates=[[90, 90], [91, 91]])]),
+        properties=AnnotationProperties(name='collection')))
+    return FileAnnotationCollection(image_file_name='image.nitf', annotations=AnnotationCollection(features=features))
+
+
+def test_iterate_features(file_collection, tmp_path):
+    file_name = str(tmp_path / 'annotations.json')
+    file_collection.to_file(file_name)
+    features = list(FileAnnotationCollection.iterate_features(file_name))
+    assert [entry.to_dict() for entry in features] == \
+        [entry.to_dict() for entry in file_collection.annotations.features]
+
+    names = [entry.get_name() for entry in FileAnnotationCollection.iterate_features(file_name, bbox=[10, 10, 12.5, 20])]
+    assert names == ['feature_{}'.format(i) for i in range(8, 13)]
+    names = [entry.get_name() for entry in FileAnnotationCollection.iterate_features(file_name, bbox=[99, 99, 101, 101])]
+    assert names == ['collection']
+    names = [entry.get_name() for entry in FileAnnotationCollection.iterate_features(
+        file_name, filter_function=lambda the_dict: the_dict['properties']['name'].startswith('m'))]
+    assert names == ['multi']
+
+    with pytest.raises(ValueError, match='cannot be constructed'):
+        list(FileRCSCollection.iterate_features(file_name))
+
+
+@pytest.mark.parametrize('initial', ['array', 'empty', 'null', 'absent'])
+def test_append_to_file(file_collection, tmp_path, initial):
+    file_name = str(tmp_path / 'annotations.json')
+    if initial == 'empty':
+        file_collection.annotations = AnnotationCollection()
+        file_collection.annotations._features = []
+    elif initial == 'null':
+        file_collection.annotations = AnnotationCollection()
+    elif initial == 'absent':
+        file_collection.annotations = None
+    file_collection.to_file(file_name)
+    original_count = 0 if file_collection.annotations is None else len(file_collection.annotations)
+
+    new_features = [
+        AnnotationFeature(geometry=Point(coordinates=[i, i]), properties=AnnotationProperties(name='new_{}'.format(i)))
+        for i in range(3)]
+    FileAnnotationCollection.append_to_file(file_name, new_features[:2])
+    FileAnnotationCollection.append_to_file(file_name, new_features[2].to_dict())
+
+    reloaded = FileAnnotationCollection.from_file(file_name)
+    assert len(reloaded.annotations) == original_count + 3
+    assert [entry.get_name() for entry in reloaded.annotations.features[-3:]] == ['new_0', 'new_1', 'new_2']
+    assert reloaded.image_file_name == 'image.nitf'
+    with pytest.raises(TypeError, match='requires an'):
+        FileAnnotationCollection.append_to_file(file_name, Point(coordinates=[0, 0]))
+
+
+def test_sidecar(file_collection, tmp_path):
+    file_name = str(tmp_path / 'annotations.npz')
+    file_collection.to_sidecar(file_name)
+    reloaded = FileAnnotationCollection.from_sidecar(file_name)
+    assert reloaded.to_dict() == file_collection.to_dict()
+
+    subset = FileAnnotationCollection.from_sidecar(file_name, bbox=[10, 10, 12.5, 20])
+    assert [entry.get_name() for entry in subset.annotations] == ['feature_{}'.format(i) for i in range(8, 13)]
+    assert subset.image_file_name == 'image.nitf'
+
+    with pytest.raises(ValueError, match='cannot be constructed'):
+        FileRCSCollection.from_sidecar(file_name)
@@ -155,6 +155,24 @@ def test_check_with_ignore_specific(dummycon, should_ignore):
     assert was_tested != should_ignore
 
 
+def test_concurrent_checks_and_timings(dummycon):
+    dummycon.check()
+    sequential = dummycon.all()
+    assert list(dummycon.timings()) == list(sequential)
+    assert all(elapsed >= 0 for elapsed in dummycon.timings().values())
+
+    concurrent_con = type(dummycon)()
+    concurrent_con.check(max_workers=4)
+    assert list(concurrent_con.all()) == list(sequential)
+    for name, result in concurrent_con.all().items():
+        assert result['passed'] == sequential[name]['passed']
+        assert [item['details'] for item in result['details']] == \
+            [item['details'] for item in sequential[name]['details']]
+
+    with pytest.raises(ValueError, match='max_workers'):
+        dummycon.check(max_workers=0)
+
+
 def test_invalid(dummycon):
     with pytest.raises(ValueError):
         dummycon.check('this_does_not_exist')
@@ -1104,3 +1104,41 @@ def test_check_channel_dwell_polys(good_cphd):
                                cphd_con.schema, cphd_con.check_signal_data)
     cphd_con.check(ignore_patterns=['check_(?!channel_dwell_polys.+)'])
     assert cphd_con.failures()
+
+
+@pytest.fixture
+def synthetic_cphd(tmpdir):
+    from sarpy.io.phase_history.cphd import CPHDWriter1
+    from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+
+    xml_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'syntax-only-cphd-1.1.0-monostatic-minimal.xml')
+    cphd_meta = CPHDType.from_xml_file(xml_file)
+    cphd_meta.Data.Channels[0].NumVectors = 50
+    cphd_meta.Data.Channels[0].NumSamples = 20
+    cphd_meta.Channel.Parameters[0].RefVectorIndex = 25
+    pvp = np.zeros((50, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    signal = np.ones((50, 20), dtype='complex64')
+    signal[37, 4] = np.nan
+    cphd_file = os.path.join(tmpdir, 'synthetic.cphd')
+    with CPHDWriter1(cphd_file, cphd_meta, check_existence=False) as writer:
+        writer.write_file({'1': pvp}, {'1': signal}, {})
+    return cphd_file
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_chunked_signal_check_and_concurrent_run(synthetic_cphd):
+    cphd_con = CphdConsistency.from_file(synthetic_cphd, check_signal_data=True, signal_chunk_bytes=800)
+    cphd_con.check('check_channel_signal_data', allow_prefix=True)
+    result = cphd_con.all()['check_channel_signal_data_1']
+    assert not result['passed']
+    assert 'Vector 37 has a non-finite signal sample' in result['details'][-1]['message']
+
+    sequential = CphdConsistency.from_file(synthetic_cphd, check_signal_data=True)
+    sequential.check()
+    concurrent = CphdConsistency.from_file(synthetic_cphd, check_signal_data=True)
+    concurrent.check(max_workers=4)
+    assert list(concurrent.all()) == list(sequential.all())
+    assert set(concurrent.failures()) == set(sequential.failures())
+    assert set(concurrent.timings()) == set(sequential.all())
+    # the reference geometry calculation is shared between checks
+    assert concurrent._get_refgeom_parameters() is concurrent._get_refgeom_parameters()
@@ -202,3 +202,121 @@ def test_wgs84_norm(input):
                             [0.,  0., -1.],
                             [0.,  1.,  0.]])
     assert wgs84_norm == pytest.approx(expected, abs=TOLERANCE)
+
+
+def _reference_ecf_to_geodetic(ecf):
+    # the closed form method of Zhu, previously used by ecf_to_geodetic
+    a, b = geocoords._A, geocoords._B
+    a2, b2, e2 = a*a, b*b, geocoords._E2
+    x, y, z = ecf[:, 0], ecf[:, 1], ecf[:, 2]
+    r = numpy.sqrt(x*x + y*y)
+    F = 54.0*b2*z*z
+    G = r*r + (1 - e2)*z*z - e2*(a2 - b2)
+    C = e2*e2*F*r*r/(G*G*G)
+    S = numpy.cbrt(1.0 + C + numpy.sqrt(C*C + 2*C))
+    P = F/(3.0*(G*(S + 1.0/S + 1.0))**2)
+    Q = numpy.sqrt(1.0 + 2.0*e2*e2*P)
+    R0 = -P*e2*r/(1.0 + Q) + numpy.sqrt(numpy.abs(
+        0.5*a2*(1.0 + 1/Q) - P*(1 - e2)*z*z/(Q*(1.0 + Q)) - 0.5*P*r*r))
+    T = r - e2*R0
+    U = numpy.sqrt(T*T + z*z)
+    V = numpy.sqrt(T*T + (1 - e2)*z*z)
+    z0 = b2*z/(a*V)
+    return numpy.stack([
+        numpy.rad2deg(numpy.arctan2(z + (a2 - b2)/b2*z0, r)),
+        numpy.rad2deg(numpy.arctan2(y, x)),
+        U*(1.0 - b2/(a*V))], axis=-1)
+
+
+def test_ecf_to_geodetic_accuracy():
+    rng = numpy.random.default_rng(271828)
+    count = 10000
+    llh = numpy.empty((count, 3), dtype='float64')
+    llh[:, 0] = 180*(rng.random(count) - 0.5)
+    llh[:, 1] = 360*(rng.random(count) - 0.5)
+    llh[:, 2] = 10**rng.uniform(-2, 8, count) - 1e3
+    llh[:3, 0] = [90, -90, 0]
+
+    ecf = geocoords.geodetic_to_ecf(llh)
+    out = geocoords.ecf_to_geodetic(ecf)
+    reference = _reference_ecf_to_geodetic(ecf)
+    assert out[:, :2] == pytest.approx(reference[:, :2], abs=1e-11)
+    assert out[:, 2] == pytest.approx(reference[:, 2], abs=1e-6)
+    assert out[:, :2] == pytest.approx(llh[:, :2], abs=1e-11)
+    assert out[:, 2] == pytest.approx(llh[:, 2], abs=1e-6)
+
+    # the single point calculation agrees with the array calculation
+    for index in range(20):
+        point = geocoords.ecf_to_geodetic(ecf[index])
+        assert point[:2] == pytest.approx(out[index, :2], abs=1e-11)
+        assert point[2] == pytest.approx(out[index, 2], abs=1e-6)
+        assert geocoords.geodetic_to_ecf(llh[index]) == pytest.approx(ecf[index], abs=1e-8)
+
+    # points near the center of the earth have no unique solution
+    interior = numpy.array([[0, 0, 0], [10, 0, 0], [0, 0, 3e4]], dtype='float64')
+    assert numpy.all(numpy.isnan(geocoords.ecf_to_geodetic(interior)))
+    assert numpy.all(numpy.isnan(geocoords.ecf_to_geodetic(interior[1])))
+    mixed = geocoords.ecf_to_geodetic(numpy.vstack((ecf[:2], interior)))
+    assert numpy.all(numpy.isfinite(mixed[:2])) and numpy.all(numpy.isnan(mixed[2:]))
+
+
+def test_output_arguments(input):
+    ecf = input['ecf']
+    llh = input['llh']
+
+    buffer = numpy.empty(ecf.shape, dtype='float64')
+    out = geocoords.ecf_to_geodetic(ecf, out=buffer)
+    assert out is buffer
+    assert out == pytest.approx(llh, abs=TOLERANCE)
+    out = geocoords.geodetic_to_ecf(llh, out=buffer)
+    assert out is buffer
+    assert out == pytest.approx(ecf, abs=TOLERANCE)
+
+    # reduced precision output
+    out = geocoords.ecf_to_geodetic(ecf, dtype='float32')
+    assert out.dtype == numpy.float32
+    assert out == pytest.approx(llh, abs=1e-3)
+    out = geocoords.ecf_to_ned(ecf, input['orp'], dtype='float32')
+    assert out.dtype == numpy.float32
+    assert out == pytest.approx(input['ned'], abs=1)
+
+    # in place conversion
+    values = numpy.copy(llh)
+    out = geocoords.geodetic_to_ecf(values, out=values)
+    assert out is values
+    assert values == pytest.approx(ecf, abs=TOLERANCE)
+    out = geocoords.ecf_to_enu(values, input['orp'], out=values)
+    assert values == pytest.approx(input['enu'], abs=TOLERANCE)
+
+    with pytest.raises(ValueError):
+        geocoords.ecf_to_geodetic(ecf, out=numpy.empty((4, 3)))
+    with pytest.raises(ValueError):
+        geocoords.ecf_to_geodetic(ecf, out=numpy.empty(ecf.shape, dtype='int64'))
+    with pytest.raises(ValueError):
+        geocoords.geodetic_to_ecf(llh, dtype='int32')
+
+
+def test_batched_origins():
+    shp = (4, 5)
+    rng = numpy.random.default_rng(161803)
+    llh = numpy.empty(shp + (3, ), dtype='float64')
+    llh[..., 0] = 180*(rng.random(shp) - 0.5)
+    llh[..., 1] = 360*(rng.random(shp) - 0.5)
+    llh[..., 2] = 1e4*rng.random(shp)
+    orp = geocoords.geodetic_to_ecf(llh)
+    ecf = orp + 1e3*(rng.random(shp + (3, )) - 0.5)
+
+    for forward, inverse in [
+            (geocoords.ecf_to_ned, geocoords.ned_to_ecf),
+            (geocoords.ecf_to_enu, geocoords.enu_to_ecf)]:
+        for absolute_coords in [True, False]:
+            local = forward(ecf, orp, absolute_coords=absolute_coords)
+            assert local.shape == ecf.shape
+            for index in numpy.ndindex(shp):
+                expected = forward(ecf[index], orp[index], absolute_coords=absolute_coords)
+                assert local[index] == pytest.approx(expected, abs=TOLERANCE)
+            assert inverse(local, orp, absolute_coords=absolute_coords) == \
+                pytest.approx(ecf, abs=TOLERANCE)
+
+    with pytest.raises(ValueError):
+        geocoords.ecf_to_ned(ecf, orp[:2])
@@ -582,6 +582,106 @@ def test_linear_ring():
         ring2.coordinates = [[0, 0, 0, 0, 0], [1, 1, 1, 1, 1]]
 
 
+def test_grid_contained():
+    ring = geometry_elements.LinearRing([[0, 0], [3, 0], [3, 3], [0, 3], [0, 0]])
+    grid = np.arange(-1, 5)
+    mask = ring.grid_contained(grid, grid)
+    assert mask.shape == (6, 6)
+    # boundary points are included
+    assert np.all(mask[1:5, 1:5])
+    assert mask.sum() == 16
+
+    # random points agree with the point inclusion test
+    star = geometry_elements.LinearRing(
+        [[5, 0], [6, 4], [10, 5], [6, 6], [5, 10], [4, 6], [0, 5], [4, 4], [5, 0]])
+    grid_x = np.linspace(-0.5, 10.5, 37)
+    grid_y = np.linspace(-0.5, 10.5, 41)
+    mask = star.grid_contained(grid_x, grid_y)
+    pts_x, pts_y = np.meshgrid(grid_x, grid_y, indexing='ij')
+    assert np.all(mask == star.contain_coordinates(pts_x, pts_y))
+
+    # the fill rules differ in the center of a pentagram
+    angles = np.pi/2 + 4*np.pi*np.arange(6)/5
+    pentagram = geometry_elements.LinearRing(np.stack((10*np.cos(angles), 10*np.sin(angles)), axis=1))
+    center = np.array([0.])
+    assert pentagram.grid_contained(center, center, fill_rule='nonzero')[0, 0]
+    assert not pentagram.grid_contained(center, center, fill_rule='evenodd')[0, 0]
+    with pytest.raises(ValueError, match='fill_rule'):
+        pentagram.grid_contained(center, center, fill_rule='winding')
+
+    # polygon holes are excluded
+    polygon = geometry_elements.Polygon(
+        [[[0, 0], [6, 0], [6, 6], [0, 6], [0, 0]], [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]])
+    mask = polygon.grid_contained(np.arange(7) + 0.5, np.arange(7) + 0.5)
+    assert mask[0, 0] and not mask[2, 2] and not mask[6, 6]
+
+
+def test_grid_coverage():
+    square = geometry_elements.Polygon([[[0, 0], [1, 0], [1, 2], [0, 2], [0, 0]]])
+    coverage = square.grid_coverage(np.arange(-1, 3), np.arange(-1, 4), subsamples=8)
+    assert coverage.shape == (4, 5)
+    assert np.allclose(coverage[1, 1], 0.25)
+    assert np.allclose(coverage[1, 2], 0.5)
+    assert np.allclose(coverage[0, :], 0)
+    assert np.allclose(coverage.sum(), 2)
+    with pytest.raises(ValueError, match='subsamples'):
+        square.grid_coverage(np.arange(3), np.arange(3), subsamples=0)
+
+
+def test_rasterize_labels():
+    first = geometry_elements.Polygon([[[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]])
+    second = geometry_elements.Polygon([[[3, 3], [6, 3], [6, 6], [3, 6], [3, 3]]])
+    outside = geometry_elements.Polygon([[[20, 20], [21, 20], [21, 21], [20, 21], [20, 20]]])
+    labels = geometry_elements.rasterize_labels([first, second, outside], (8, 8))
+    assert labels.dtype == np.int32
+    assert np.all(labels[:3, :3] == 1)
+    assert np.all(labels[3:7, 3:7] == 2)
+    assert labels[7, 7] == 0
+    assert labels[0, 5] == 0
+
+    labels = geometry_elements.rasterize_labels(
+        [first, second], (4, 4), labels=[7, 9], offset=(2, 2))
+    assert labels[0, 0] == 7 and labels[1, 1] == 9 and labels[3, 0] == 0
+    with pytest.raises(ValueError, match='labels must have shape'):
+        geometry_elements.rasterize_labels([first], (4, 4), labels=[1, 2])
+
+
+def test_apply_projection_batched():
+    calls = []
+
+    def proj_method(coords):
+        calls.append(coords.shape)
+        return np.concatenate((coords[..., :2] + 1, 2*coords[..., :1]), axis=-1)
+
+    geometries = [
+        geometry_elements.Point(coordinates=[1, 2]),
+        None,
+        geometry_elements.Polygon(
+            [[[0, 0], [6, 0], [6, 6], [0, 6], [0, 0]], [[2, 2], [4, 2], [4, 4], [2, 4], [2, 2]]]),
+        geometry_elements.GeometryCollection(geometries=[
+            geometry_elements.LineString(coordinates=[[0, 0], [1, 1]]),
+            geometry_elements.MultiPoint(coordinates=[[3, 3], [4, 4]])]),
+        geometry_elements.Point(coordinates=[1, 2, 3])]
+    batched = geometry_elements.apply_projection_batched(geometries, proj_method)
+    # the individual projections are for comparison
+    individual = [None if entry is None else entry.apply_projection(proj_method) for entry in geometries]
+    # one call for the two-dimensional coordinates, one for the three-dimensional
+    assert calls[:2] == [(15, 2), (1, 3)]
+    assert batched[1] is None
+    for expected, result in zip(individual, batched):
+        if expected is not None:
+            assert result.to_dict() == expected.to_dict()
+
+    collection = geometry_elements.FeatureCollection(features=[
+        geometry_elements.Feature(uid='first', geometry=geometries[0], properties={'value': 1}),
+        geometry_elements.Feature(uid='second', geometry=geometries[2])])
+    projected = collection.apply_projection(proj_method)
+    assert projected['first'].geometry.coordinates.tolist() == [2, 3, 2]
+    assert projected['first'].properties == {'value': 1}
+    assert projected['first'].properties is not collection['first'].properties
+    assert projected['second'].geometry.get_bbox()[:2] == [1, 1]
+
+
 def test_basic_assemble(test_elements):
     poly_coords1 = [[0, 0], [3, 0], [3, 3], [0, 3], [0, 0]]
     poly_coords2 = [[1, 1], [2, 1], [2, 2], [1, 2], [1, 1]]
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from sarpy.geometry.spatial_index import PackedRTree
+from sarpy.geometry import geometry_elements
+
+
+def _random_boxes(count, seed=0):
+    rng = np.random.default_rng(seed)
+    corners = rng.uniform(0, 1000, (count, 2))
+    return np.hstack((corners, corners + rng.uniform(0, 20, (count, 2))))
+
+
+def _brute_force(boxes, bbox):
+    return np.nonzero(
+        (boxes[:, 0] <= bbox[2]) & (boxes[:, 2] >= bbox[0]) &
+        (boxes[:, 1] <= bbox[3]) & (boxes[:, 3] >= bbox[1]))[0]
+
+
+@pytest.mark.parametrize('count', [0, 1, 7, 50, 2000])
+def test_query_bbox(count):
+    boxes = _random_boxes(count)
+    if count > 3:
+        boxes[2, :] = np.nan
+    tree = PackedRTree(boxes, node_size=4)
+    assert len(tree) == count
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        start = rng.uniform(-10, 1000, 2)
+        bbox = np.hstack((start, start + rng.uniform(0, 300, 2)))
+        assert np.array_equal(tree.query_bbox(bbox), _brute_force(boxes, bbox))
+
+
+def test_query_point():
+    tree = PackedRTree([[0, 0, 2, 2], [1, 1, 3, 3], [5, 5, 6, 6]])
+    assert tree.query_point([1.5, 1.5]).tolist() == [0, 1]
+    assert tree.query_point([3, 3]).tolist() == [1]
+    assert tree.query_point([4, 4]).tolist() == []
+
+
+def test_nearest():
+    boxes = _random_boxes(500)
+    boxes[10, :] = np.nan
+    tree = PackedRTree(boxes, node_size=8)
+    point = np.array([500., 500.])
+    indices, distances = tree.nearest(point, k=5)
+    delta = np.maximum(np.maximum(boxes[:, :2] - point, point - boxes[:, 2:]), 0)
+    truth = np.hypot(delta[:, 0], delta[:, 1])
+    truth[10] = np.inf
+    assert np.allclose(distances, np.sort(truth)[:5])
+    assert np.allclose(truth[indices], distances)
+    assert tree.nearest(point, k=0)[0].size == 0
+
+
+def test_insert():
+    boxes = _random_boxes(100)
+    tree = PackedRTree(boxes, node_size=4)
+    new_boxes = _random_boxes(300, seed=2)
+    for i, box in enumerate(new_boxes):
+        assert tree.insert(box) == 100 + i
+    all_boxes = np.vstack((boxes, new_boxes))
+    assert np.array_equal(tree.boxes, all_boxes)
+    bbox = [200, 200, 600, 700]
+    assert np.array_equal(tree.query_bbox(bbox), _brute_force(all_boxes, bbox))
+    assert tree.nearest([250, 250], k=3)[0].size == 3
+
+    with pytest.raises(ValueError, match='single bounding box'):
+        tree.insert([[0, 0, 1, 1], [0, 0, 1, 1]])
+    with pytest.raises(ValueError, match='node_size'):
+        PackedRTree(boxes, node_size=1)
+
+
+def test_feature_collection_queries():
+    features = []
+    for i in range(20):
+        features.append(geometry_elements.Feature(
+            uid='feature_{}'.format(i),
+            geometry=geometry_elements.Point(coordinates=[10*i, 5*i])))
+    features.append(geometry_elements.Feature(uid='empty'))
+    collection = geometry_elements.FeatureCollection(features=features)
+
+    found = collection.query_bbox([15, 0, 45, 100])
+    assert [entry.uid for entry in found] == ['feature_2', 'feature_3', 'feature_4']
+    assert [entry.uid for entry in collection.query_point([30, 15])] == ['feature_3']
+    assert [entry.uid for entry in collection.nearest([52, 26], k=2)] == ['feature_5', 'feature_6']
+
+    # the index is updated on adding, and rebuilt after deleting
+    collection.add_feature(geometry_elements.Feature(
+        uid='added', geometry=geometry_elements.Polygon([[[40, 0], [41, 0], [41, 1], [40, 0]]])))
+    assert [entry.uid for entry in collection.query_bbox([35, 0, 45, 1])] == ['added']
+    del collection['feature_4']
+    assert [entry.uid for entry in collection.query_bbox([15, 0, 45, 100])] == \
+        ['feature_2', 'feature_3', 'added']
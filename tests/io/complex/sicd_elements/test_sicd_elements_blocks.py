@@ -720,6 +720,35 @@ def test_blocks_poly2dtype(sicd, poly2d_doc, kwargs):
     assert poly.Coefs[0][0] == 0.0
 
 
+def test_blocks_poly2dtype_evaluate_grid(sicd):
+    poly = blocks.Poly2DType(Coefs=sicd.Radiometric.RCSSFPoly.Coefs)
+    rows = np.linspace(-5000, 5000, 301)
+    cols = np.linspace(-4000, 4000, 257)
+    expected = np.polynomial.polynomial.polygrid2d(rows, cols, poly.Coefs)
+
+    values = poly.evaluate_grid(rows, cols)
+    assert values.shape == (301, 257)
+    np.testing.assert_allclose(values, expected, rtol=1e-12)
+
+    # the transposed polynomial exercises the Horner steps along columns
+    transposed = blocks.poly2d_grid(cols, rows, poly.Coefs.T, block_size=7)
+    np.testing.assert_allclose(transposed, expected.T, rtol=1e-12)
+
+    out = np.empty((301, 257), dtype=np.float32)
+    result = poly.evaluate_grid(rows, cols, out=out, dtype='float32', block_size=10)
+    assert result is out
+    np.testing.assert_allclose(out, expected, rtol=1e-4)
+
+    assert poly.evaluate_grid(0, 0)[0, 0] == poly.Coefs[0, 0]
+
+    with pytest.raises(ValueError, match="out must be a numpy array"):
+        poly.evaluate_grid(rows, cols, out=np.empty((257, 301)))
+    with pytest.raises(ValueError, match="dtype"):
+        poly.evaluate_grid(rows, cols, dtype='int32')
+    with pytest.raises(ValueError, match="one-dimensional"):
+        poly.evaluate_grid(np.zeros((2, 2)), cols)
+
+
 def test_blocks_xyzpolytype(sicd, kwargs):
     # Smoke test
     poly = blocks.XYZPolyType(
@@ -850,6 +879,20 @@ def test_blocks_xyzpolytype(sicd, kwargs):
     assert len(poly.X.Coefs) == 5
 
 
+def test_blocks_xyzpolytype_evaluate(sicd):
+    poly = sicd.Position.ARPPoly
+    times = np.linspace(0, sicd.Timeline.CollectDuration, 24).reshape((4, 6))
+    values = poly.evaluate(times)
+    assert values.shape == (4, 6, 3)
+    np.testing.assert_allclose(values, poly(times), rtol=1e-12)
+    np.testing.assert_allclose(poly.evaluate(1.5), poly(1.5), rtol=1e-12)
+
+    out = np.empty((4, 6, 3), dtype=np.float32)
+    assert poly.evaluate(times, out=out, dtype='float32') is out
+    with pytest.raises(ValueError, match="out must be a numpy array"):
+        poly.evaluate(times, out=np.empty((24, 3)))
+
+
 def test_blocks_xyzpolyattrtype(sicd, kwargs):
     # Smoke test
     poly = blocks.XYZPolyAttributeType(
@@ -1,3 +1,4 @@
+import importlib
 import pathlib
 
 import pytest
@@ -23,3 +24,65 @@ def test_plugin_openers(load_plugin, sarpy_module, plugin_module):
     sarpy.io.general.base.check_for_openers(sarpy_module, openers.append)
     loaded_modules = [opener.__module__ for opener in openers]
     assert plugin_module in loaded_modules
+
+
+@pytest.mark.parametrize('converter_module',
+                         ['sarpy.io.general.converter',
+                          'sarpy.io.complex.converter',
+                          'sarpy.io.product.converter',
+                          'sarpy.io.phase_history.converter',
+                          'sarpy.io.received.converter'])
+def test_opener_manifest(converter_module):
+    # the static manifest must declare exactly the openers found by walking the package
+    converter = importlib.import_module(converter_module)
+    openers = []
+    sarpy.io.general.base.check_for_openers(converter_module.rsplit('.', 1)[0], openers.append)
+    assert {entry.module_name for entry in converter._manifest} == {opener.__module__ for opener in openers}
+
+
+def test_candidate_openers(tmp_path):
+    manifest = (
+        sarpy.io.general.base.OpenerManifestEntry('sarpy.io.general.tiff', magic=(b'II*\x00', )),
+        sarpy.io.general.base.OpenerManifestEntry('sarpy.io.general.nitf', magic=(b'NITF', )),
+    )
+
+    def registered(file_name):
+        return None
+
+    nitf_file = tmp_path / 'example.dat'
+    nitf_file.write_bytes(b'NITF02.10')
+    def plugin(file_name):
+        return None
+
+    openers = list(sarpy.io.general.base.get_candidate_openers(
+        str(nitf_file), manifest, [registered, ], [plugin, ]))
+    assert openers[0] is registered
+    assert [opener.__module__ for opener in openers[1:3]] == ['sarpy.io.general.nitf', 'sarpy.io.general.tiff']
+    assert openers[3] is plugin
+
+    with open(nitf_file, 'rb') as fi:
+        fi.seek(4)
+        openers = list(sarpy.io.general.base.get_candidate_openers(fi, manifest))
+        assert fi.tell() == 4
+    assert openers[0].__module__ == 'sarpy.io.general.nitf'
+
+    entry = sarpy.io.general.base.OpenerManifestEntry('sarpy.io.general.tiff', extensions=('.TIF', ))
+    assert entry.matches(None, '.tif')
+    assert not entry.matches(b'NITF', '.ntf')
+    # a directory has neither header nor relevant extension, so manifest order applies
+    openers = list(sarpy.io.general.base.get_candidate_openers(str(tmp_path), manifest))
+    assert [opener.__module__ for opener in openers] == ['sarpy.io.general.tiff', 'sarpy.io.general.nitf']
+
+
+def test_registered_opener_precedence(tmp_path, monkeypatch):
+    # an explicitly registered opener must be attempted before a matching provided reader
+    converter = importlib.import_module('sarpy.io.complex.converter')
+    sicd = importlib.import_module('sarpy.io.complex.sicd')
+    monkeypatch.setattr(converter, '_openers', [])
+    monkeypatch.setattr(sicd, 'is_a', lambda file_name: 'provided reader')
+    nitf_file = tmp_path / 'example.nitf'
+    nitf_file.write_bytes(b'NITF02.10')
+    assert converter.open_complex(str(nitf_file)) == 'provided reader'
+
+    converter.register_opener(lambda file_name: 'registered reader')
+    assert converter.open_complex(str(nitf_file)) == 'registered reader'
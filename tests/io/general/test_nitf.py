@@ -6,6 +6,7 @@
 import filecmp
 
 import numpy as np
+import pytest
 
 import sarpy.io.general.nitf
 
@@ -78,4 +79,27 @@ def test_in_memory_write(tests_path, tmp_path):
             writer_mem.write(data_mem)
 
         assert not fd_mem.closed
-    assert filecmp.cmp(in_nitf_mem, out_nitf_mem, shallow=False)
\ No newline at end of file
+    assert filecmp.cmp(in_nitf_mem, out_nitf_mem, shallow=False)
+
+
+def test_find_jpeg_delimiters():
+    first = b'\xff\xd8' + b'\x01'*10 + b'\xff\xd9'
+    second = b'\xff\xd8' + b'\x02'*5 + b'\xff\xd9'
+    assert sarpy.io.general.nitf.find_jpeg_delimiters(first + second) == [(0, 14), (14, 23)]
+    with pytest.raises(ValueError):
+        sarpy.io.general.nitf.find_jpeg_delimiters(first + b'\x00')
+
+
+def test_compressed_write_requires_in_memory(tests_path, tmp_path):
+    in_nitf = tests_path / "data/iq.nitf"
+    with sarpy.io.general.nitf.NITFReader(str(in_nitf)) as reader:
+        image_header = reader.get_image_header(0)
+        image_header.IC = 'C3'
+        writer_details = sarpy.io.general.nitf.NITFWritingDetails(
+            reader.nitf_details.nitf_header,
+            (sarpy.io.general.nitf.ImageSubheaderManager(image_header),),
+            reader.image_segment_collections,
+        )
+        with pytest.raises(ValueError):
+            sarpy.io.general.nitf.NITFWriter(
+                str(tmp_path / "out.nitf"), writing_details=writer_details, in_memory=False)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from sarpy.io.general.base import SarpyIOError
+from sarpy.io.general.tiff import GeoTiffWriter, _downsample_by_two
+
+
+@pytest.mark.parametrize('bands, compression', [(1, 'deflate'), (3, None), (1, None)])
+def test_geotiff_writer(tmp_path, bands, compression):
+    shape = (300, 410)
+    rng = np.random.default_rng(1234)
+    data = rng.integers(0, 256, size=shape + ((bands, ) if bands > 1 else ()), dtype='uint8')
+    geo_transform = (10.0, 0.001, 0.0, 20.0, 0.0, -0.001)
+
+    out_file = str(tmp_path / 'test.tif')
+    with GeoTiffWriter(
+            out_file, shape, bands=bands, tile_size=128, compression=compression,
+            geo_transform=geo_transform) as writer:
+        # write out of order, in blocks not aligned with the tiles
+        for col_start in [200, 0]:
+            writer(data[:, col_start:col_start+200], start_indices=(0, col_start))
+        writer(data[:, 400:], start_indices=(0, 400))
+    assert writer.overview_count == 2
+    assert not writer.bigtiff
+
+    with Image.open(out_file) as image:
+        assert image.n_frames == 3
+        assert np.array_equal(np.asarray(image), data)
+        assert image.tag_v2[259] == (1 if compression is None else 8)
+        assert image.tag_v2[34264][3] == geo_transform[0]
+        assert image.tag_v2[34264][7] == geo_transform[3]
+        assert image.tag_v2[34735][:4] == (1, 1, 0, 3)
+
+        image.seek(1)
+        assert image.tag_v2[254] == 1
+        assert np.array_equal(np.asarray(image), _downsample_by_two(data))
+        image.seek(2)
+        assert np.asarray(image).shape[:2] == (75, 103)
+
+
+def test_geotiff_writer_incomplete(tmp_path):
+    out_file = str(tmp_path / 'test.tif')
+    with GeoTiffWriter(out_file, (100, 100), dtype='float32', tile_size=64, overview_levels=0) as writer:
+        writer(np.ones((50, 100), dtype='float32'))
+    with Image.open(out_file) as image:
+        assert image.n_frames == 1
+        data = np.asarray(image)
+    assert np.all(data[:50] == 1)
+    assert np.all(data[50:] == 0)
+
+    with pytest.raises(SarpyIOError):
+        GeoTiffWriter(out_file, (100, 100))
+
+
+def test_geotiff_writer_validation(tmp_path):
+    out_file = str(tmp_path / 'test.tif')
+    with pytest.raises(ValueError, match='tile_size'):
+        GeoTiffWriter(out_file, (100, 100), tile_size=100)
+    with pytest.raises(ValueError, match='compression'):
+        GeoTiffWriter(out_file, (100, 100), compression='lzw')
+    with GeoTiffWriter(out_file, (100, 100), tile_size=64) as writer:
+        with pytest.raises(ValueError):
+            writer(np.zeros((10, 10), dtype='uint8'), start_indices=(95, 0))
+
+
+def test_downsample_by_two():
+    data = np.array([[0, 1, 2], [3, 4, 5]], dtype='uint8')
+    assert np.array_equal(_downsample_by_two(data), [[2, 4]])
+    assert np.allclose(_downsample_by_two(data.astype('float32')), [[2.0, 3.5]])
@@ -1,11 +1,15 @@
 import math
 import pathlib
+import subprocess
+import sys
 import unittest
 
 import pytest
 
 import sarpy.io.general.nitf_elements.tres.registration
-from sarpy.io.general.nitf_elements.tres.registration import find_tre
+from sarpy.io.general.nitf_elements.base import TRE
+from sarpy.io.general.nitf_elements.tres.registration import find_tre, build_tre_index
+from sarpy.io.general.nitf_elements.tres._tre_index import TRE_MODULE_INDEX
 from sarpy.io.general.nitf_elements.tres.unclass.ACFTA import ACFTA
 
 
@@ -67,12 +71,52 @@ def load_plugin(monkeypatch):
         mock_dir = pathlib.Path(__file__).parents[2] / 'mock_site-packages'
         mp.syspath_prepend(mock_dir)
         sarpy.io.general.nitf_elements.tres.registration._parsed_package = False
+        sarpy.io.general.nitf_elements.tres.registration._loaded_plugins = False
         sarpy.io.general.nitf_elements.tres.registration._TRE_Registry = {}
         yield
     sarpy.io.general.nitf_elements.tres.registration._parsed_package = False
+    sarpy.io.general.nitf_elements.tres.registration._loaded_plugins = False
     sarpy.io.general.nitf_elements.tres.registration._TRE_Registry = {}
     assert find_tre('SPLUGA') is None
 
 
 def test_plugin_tres(load_plugin):
     assert find_tre('SPLUGA') is not None
+
+
+def test_tre_index():
+    assert TRE_MODULE_INDEX == build_tre_index()
+
+
+def test_find_tre_imports_only_required_module():
+    code = (
+        'import sys\n'
+        'from sarpy.io.general.nitf_elements.tres.registration import find_tre\n'
+        'assert find_tre("ACFTA") is not None\n'
+        'assert find_tre(b"BANDSB") is not None\n'
+        'loaded = sorted(name for name in sys.modules if ".tres.unclass." in name)\n'
+        'assert loaded == ["{0}.ACFTA", "{0}.BANDSB"], loaded\n'.format(
+            'sarpy.io.general.nitf_elements.tres.unclass'))
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_deferred_parsing(tests_path):
+    tre_bytes = (tests_path / 'data/example_bandsb_tre.bin').read_bytes()
+    tre_obj = TRE.from_bytes(tre_bytes, 0)
+    assert not tre_obj.is_parsed
+    assert tre_obj.get_bytes_length() == len(tre_bytes)
+    assert tre_obj.to_bytes() == tre_bytes
+    assert not tre_obj.is_parsed
+
+    assert tre_obj.DATA.COUNT == 172
+    assert tre_obj.is_parsed
+    assert tre_obj.to_bytes() == tre_bytes
+
+
+def test_deferred_parsing_failure(tests_path):
+    tre_bytes = (tests_path / 'data/example_bandsb_tre.bin').read_bytes()
+    tre_bytes = tre_bytes[:11] + b'XXXXX' + tre_bytes[16:]
+    tre_obj = TRE.from_bytes(tre_bytes, 0)
+    assert tre_obj.DATA == tre_bytes[11:]
+    assert not tre_obj.is_parsed
+    assert tre_obj.to_bytes() == tre_bytes
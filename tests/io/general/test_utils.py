@@ -0,0 +1,13 @@
+import os
+
+import pytest
+
+from sarpy.io.general.utils import get_worker_count
+
+
+def test_get_worker_count():
+    assert get_worker_count(None) == min(32, (os.cpu_count() or 1) + 4)
+    assert get_worker_count(1) == 1
+    assert get_worker_count('3') == 3
+    with pytest.raises(ValueError):
+        get_worker_count(0)
@@ -0,0 +1,117 @@
+import pathlib
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from sarpy.io.phase_history import compression
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDWriter1, write_compressed_cphd
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+from sarpy.io.phase_history.cphd1_elements.PVP import PerVectorParameterF8
+
+CPHD_XML = pathlib.Path(__file__).parents[2] / "data/syntax-only-cphd-1.1.0-monostatic-minimal.xml"
+NUM_VECTORS = 90
+NUM_SAMPLES = 32
+
+
+@pytest.fixture(scope='module')
+def cphd_parts():
+    cphd_meta = CPHDType.from_xml_file(str(CPHD_XML))
+    cphd_meta.Data.Channels[0].NumVectors = NUM_VECTORS
+    cphd_meta.Data.Channels[0].NumSamples = NUM_SAMPLES
+    pvp = np.zeros((NUM_VECTORS, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    pvp['TxTime'] = np.linspace(0, 1, NUM_VECTORS)
+    rng = np.random.default_rng(3)
+    signal = np.round(rng.standard_normal((NUM_VECTORS, NUM_SAMPLES, 2))*4).astype('float32')
+    signal = (signal[..., 0] + 1j*signal[..., 1]).astype('complex64')
+    return cphd_meta, pvp, signal
+
+
+@pytest.mark.parametrize("codec", ['ZLIB', 'lzma'])
+def test_compressed_round_trip_and_partial_reads(cphd_parts, tmp_path, codec):
+    cphd_meta, pvp, signal = cphd_parts
+    file_name = str(tmp_path / 'compressed.cphd')
+    written_meta = write_compressed_cphd(
+        file_name, cphd_meta, {'1': pvp}, {'1': signal}, codec=codec, vectors_per_chunk=16, max_workers=3)
+    assert written_meta.Data.SignalCompressionID == 'SARPY_CHUNKED_' + codec.upper()
+    assert cphd_meta.Data.SignalCompressionID is None
+
+    reader = CPHDReader(file_name)
+    assert reader.cphd_meta.Data.Channels[0].CompressedSignalSize == written_meta.Data.Channels[0].CompressedSignalSize
+    np.testing.assert_array_equal(reader.read_pvp_array(0), pvp)
+    np.testing.assert_array_equal(reader[:, :, '1'], signal)
+    np.testing.assert_array_equal(reader[17:50:3, 5:20], signal[17:50:3, 5:20])
+    np.testing.assert_array_equal(reader[70:10:-7, ::-1], signal[70:10:-7, ::-1])
+
+    segment = reader.get_data_segment_as_tuple()[0]
+    assert isinstance(segment, compression.CompressedSignalSegment)
+    assert segment.chunk_index.num_chunks == 6
+    with mock.patch.object(segment.codec, '_decompress', wraps=segment.codec._decompress) as decompress:
+        segment._cache.clear()
+        np.testing.assert_array_equal(reader[33:40, :], signal[33:40, :])
+        assert decompress.call_count == 1
+
+    batches = list(reader.iterate_vectors(0, batch_size=25))
+    np.testing.assert_array_equal(np.concatenate([entry[2] for entry in batches]), signal)
+    reader.close()
+
+
+def test_compressed_with_amplitude_scaling(cphd_parts, tmp_path):
+    cphd_meta, pvp, signal = cphd_parts
+    cphd_meta = cphd_meta.copy()
+    cphd_meta.Data.SignalArrayFormat = 'CI2'
+    cphd_meta.PVP.AmpSF = PerVectorParameterF8(
+        Offset=cphd_meta.PVP.get_vector_dtype().itemsize//8, Size=1, Format='F8')
+    scaled_pvp = np.zeros((NUM_VECTORS, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    scaled_pvp['TxTime'] = pvp['TxTime']
+    scaled_pvp['AmpSF'] = np.linspace(0.5, 2, NUM_VECTORS)
+    expected = (signal*scaled_pvp['AmpSF'][:, None]).astype('complex64')
+
+    file_name = str(tmp_path / 'scaled.cphd')
+    write_compressed_cphd(file_name, cphd_meta, {'1': scaled_pvp}, {'1': expected}, vectors_per_chunk=64)
+    reader = CPHDReader(file_name)
+    np.testing.assert_allclose(reader[:, :], expected, rtol=1e-6)
+    raw = reader.read_raw(slice(3, 5), None, index=0)
+    np.testing.assert_array_equal(raw[..., 0] + 1j*raw[..., 1], signal[3:5])
+    reader.close()
+
+
+def test_unrecognized_compression_is_opaque(cphd_parts, tmp_path):
+    cphd_meta, pvp, _ = cphd_parts
+    cphd_meta = cphd_meta.copy()
+    cphd_meta.Data.SignalCompressionID = 'PROPRIETARY'
+    cphd_meta.Data.Channels[0].CompressedSignalSize = 100
+    file_name = str(tmp_path / 'opaque.cphd')
+    payload = np.arange(100, dtype='uint8')
+    with CPHDWriter1(file_name, cphd_meta, check_existence=False) as writer:
+        writer.write_pvp_block({'1': pvp})
+        writer.write_raw(payload, index=0)
+    reader = CPHDReader(file_name)
+    np.testing.assert_array_equal(reader.read_raw(None, index=0), payload)
+    reader.close()
+
+
+def test_codec_registry(cphd_parts):
+    assert {'ZLIB', 'LZMA'}.issubset(compression.available_signal_codecs())
+    assert compression.get_signal_codec('sarpy_chunked_zlib').name == 'ZLIB'
+    assert compression.parse_compression_id('PROPRIETARY') is None
+    with pytest.raises(KeyError, match='No signal codec'):
+        compression.get_signal_codec('BOGUS')
+
+    identity = compression.SignalCodec('identity', lambda data, level: data, lambda data: data)
+    compression.register_signal_codec(identity)
+    try:
+        assert compression.parse_compression_id('SARPY_CHUNKED_IDENTITY') is identity
+        raw = np.arange(5*4*2, dtype='>i2').reshape((5, 4, 2))
+        encoded = compression.compress_signal_arrays([raw], 'IDENTITY', vectors_per_chunk=2)[0]
+        index = compression.ChunkIndex.from_bytes(encoded[:32], lambda count: encoded[32:32+count])
+        assert index.num_chunks == 3
+        assert index.get_vector_range(2) == (4, 5)
+        assert encoded[index.offsets[0]:] == raw.tobytes()
+    finally:
+        compression._SIGNAL_CODECS.pop('IDENTITY')
+
+    with pytest.raises(ValueError, match='vectors_per_chunk'):
+        compression.compress_signal_arrays([raw], vectors_per_chunk=0)
+    with pytest.raises(ValueError, match='max_workers'):
+        compression.compress_signal_arrays([raw], max_workers=0)
@@ -180,3 +180,89 @@ def test_cphd_read_write_compressed(cphd_path, tmp_path):
         numpy.testing.assert_array_equal(write_signal[signal_key], reread_signal[signal_key])
 
     assert not sarpy.consistency.cphd_consistency.main([str(written_cphd_name), '--signal-data'])
+
+
+def _make_multichannel_meta(signal_array_format, num_vectors, num_samples):
+    from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+    from sarpy.io.phase_history.cphd1_elements.Data import ChannelSizeType
+    from sarpy.io.phase_history.cphd1_elements.PVP import PerVectorParameterF8
+
+    cphd_meta = CPHDType.from_xml_file(
+        str(pathlib.Path(__file__).parents[2] / 'data/syntax-only-cphd-1.1.0-monostatic-minimal.xml'))
+    cphd_meta.Data.SignalArrayFormat = signal_array_format
+    cphd_meta.PVP.AmpSF = PerVectorParameterF8(
+        Offset=cphd_meta.PVP.get_vector_dtype().itemsize//8, Size=1, Format='F8')
+    cphd_meta.Data.NumBytesPVP = cphd_meta.PVP.get_vector_dtype().itemsize
+    sample_bytes = {'CF8': 8, 'CI4': 4, 'CI2': 2}[signal_array_format]
+    cphd_meta.Data.Channels = [
+        ChannelSizeType(
+            Identifier=str(index + 1), NumVectors=num_vectors, NumSamples=num_samples,
+            SignalArrayByteOffset=index*num_vectors*num_samples*sample_bytes,
+            PVPArrayByteOffset=index*num_vectors*cphd_meta.Data.NumBytesPVP)
+        for index in range(3)]
+    return cphd_meta
+
+
+@pytest.mark.parametrize('signal_array_format', ['CF8', 'CI2'])
+def test_cphd_positional_parallel_write(signal_array_format, tmp_path):
+    num_vectors, num_samples = 70, 16
+    cphd_meta = _make_multichannel_meta(signal_array_format, num_vectors, num_samples)
+    rng = np.random.default_rng(4)
+    pvp_block = {}
+    signal_block = {}
+    for entry in cphd_meta.Data.Channels:
+        pvp = np.zeros((num_vectors, ), dtype=cphd_meta.PVP.get_vector_dtype())
+        pvp['TxTime'] = rng.uniform(size=num_vectors)
+        pvp['AmpSF'] = rng.uniform(0.5, 2, size=num_vectors)
+        raw = rng.integers(-100, 100, size=(num_vectors, num_samples, 2))
+        pvp_block[entry.Identifier] = pvp
+        signal_block[entry.Identifier] = ((raw[..., 0] + 1j*raw[..., 1])*pvp['AmpSF'][:, None]).astype('complex64')
+
+    serial_name = str(tmp_path / 'serial.cphd')
+    with CPHDWriter1(serial_name, cphd_meta, check_existence=False) as writer:
+        writer.write_file(pvp_block, signal_block)
+
+    parallel_name = str(tmp_path / 'parallel.cphd')
+    with CPHDWriter1(parallel_name, cphd_meta, check_existence=False, max_workers=3) as writer:
+        assert writer.positional_writes
+        writer.write_pvp_block(pvp_block)
+        writer.write_signal_block(signal_block, vector_batch_size=16)
+    assert pathlib.Path(parallel_name).read_bytes() == pathlib.Path(serial_name).read_bytes()
+
+    # incremental vector batches, out of order
+    incremental_name = str(tmp_path / 'incremental.cphd')
+    with CPHDWriter1(incremental_name, cphd_meta, check_existence=False, max_workers=2) as writer:
+        writer.write_pvp_block(pvp_block)
+        for identifier, signal in signal_block.items():
+            for start in [40, 0, 25]:
+                stop = {40: num_vectors, 0: 25, 25: 40}[start]
+                assert not writer.writing_details.signal_details[int(identifier) - 1].item_written
+                writer.write_signal_vectors(identifier, signal[start:stop], start_vector=start)
+            assert writer.writing_details.signal_details[int(identifier) - 1].item_written
+        with pytest.raises(ValueError, match='outside the range'):
+            writer.write_signal_vectors('1', signal_block['1'][:5], start_vector=num_vectors - 2)
+    assert pathlib.Path(incremental_name).read_bytes() == pathlib.Path(serial_name).read_bytes()
+
+    # overlapping batches totalling NumVectors leave a gap, which is not written
+    with CPHDWriter1(str(tmp_path / 'gap.cphd'), cphd_meta, check_existence=False, max_workers=2) as writer:
+        writer.write_pvp_block(pvp_block)
+        details = writer.writing_details.signal_details[0]
+        writer.write_signal_vectors('1', signal_block['1'][:40], start_vector=0)
+        writer.write_signal_vectors('1', signal_block['1'][10:40], start_vector=10)
+        assert not details.item_written
+        writer.write_signal_vectors('1', signal_block['1'][40:], start_vector=40)
+        assert details.item_written
+        for identifier in ['2', '3']:
+            writer.write_signal_vectors(identifier, signal_block[identifier])
+
+        partial_pvp = pvp_block['1'][['TxTime', 'AmpSF']]
+        with pytest.raises(ValueError, match='dtype'):
+            writer.write_pvp_array('1', partial_pvp)
+
+    reader = CPHDReader(parallel_name)
+    for identifier, signal in signal_block.items():
+        numpy.testing.assert_allclose(reader.read_signal_block()[identifier], signal, rtol=1e-5)
+        numpy.testing.assert_array_equal(reader.read_pvp_array(identifier), pvp_block[identifier])
+
+    with pytest.raises(ValueError, match='max_workers'):
+        CPHDWriter1(str(tmp_path / 'invalid.cphd'), cphd_meta, max_workers=0)
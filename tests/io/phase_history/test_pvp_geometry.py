@@ -0,0 +1,104 @@
+import pathlib
+
+import numpy as np
+import pytest
+import scipy.constants
+
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDWriter1
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+from sarpy.io.phase_history.pvp_geometry import PVPGeometry
+
+CPHD_XML = pathlib.Path(__file__).parents[2] / "data/syntax-only-cphd-1.1.0-monostatic-minimal.xml"
+EARTH_A = 6378137.0
+PVP_DTYPE = [
+    ('TxTime', 'f8'), ('TxPos', 'f8', 3), ('TxVel', 'f8', 3),
+    ('RcvTime', 'f8'), ('RcvPos', 'f8', 3), ('RcvVel', 'f8', 3), ('SRPPos', 'f8', 3)]
+
+
+def _simple_pvp(heights, north_offsets):
+    # the SRP on the equator at longitude 0, so that east is +y, north is +z and up is +x
+    pvp = np.zeros((len(heights), ), dtype=PVP_DTYPE)
+    pvp['SRPPos'] = [EARTH_A, 0, 0]
+    position = np.stack([EARTH_A + np.asarray(heights), np.zeros(len(heights)), north_offsets], axis=-1)
+    for txrcv in ('Tx', 'Rcv'):
+        pvp[f'{txrcv}Pos'] = position
+        pvp[f'{txrcv}Vel'] = [0, 200, 0]
+    pvp['TxTime'] = np.arange(len(heights))
+    pvp['RcvTime'] = pvp['TxTime'] + 1e-4
+    return pvp
+
+
+def test_simple_geometry():
+    heights = np.array([5000., 8000., 10000.])
+    offsets = np.array([10000., 8000., 6000.])
+    geometry = PVPGeometry(_simple_pvp(heights, offsets))
+    assert geometry.num_vectors == 3
+    np.testing.assert_allclose(geometry.srp_enu['up'], [[1, 0, 0]]*3, atol=1e-12)
+    np.testing.assert_allclose(geometry.srp_enu['east'], [[0, 1, 0]]*3, atol=1e-12)
+    np.testing.assert_allclose(geometry.slant_range, np.hypot(heights, offsets))
+    np.testing.assert_allclose(geometry.range_rate, 0, atol=1e-9)
+    np.testing.assert_allclose(geometry.doppler_cone_angle, 90)
+    np.testing.assert_allclose(geometry.graze_angle, np.rad2deg(np.arctan2(heights, offsets)))
+    np.testing.assert_allclose(geometry.incidence_angle, 90 - geometry.graze_angle)
+    np.testing.assert_allclose(geometry.slope_angle, geometry.graze_angle)
+    np.testing.assert_allclose(geometry.azimuth_angle, 0, atol=1e-9)
+    np.testing.assert_allclose(geometry.twist_angle, 0, atol=1e-9)
+    np.testing.assert_allclose(geometry.layover_angle % 360, 0, atol=1e-9)
+    np.testing.assert_allclose(geometry.ground_range, EARTH_A*np.arctan2(offsets, EARTH_A + heights))
+    np.testing.assert_array_equal(geometry.side_of_track, ['R', 'R', 'R'])
+
+    # cached, and consistent between the ARP and the (coincident) Tx and Rcv phase centers
+    assert geometry.apc_parameters('ARP') is geometry.apc_parameters()
+    np.testing.assert_allclose(geometry.apc_parameters('Tx')['GrazeAngle'], geometry.graze_angle)
+    with pytest.raises(ValueError, match='platform'):
+        geometry.apc_parameters('Other')
+
+
+def test_bistatic_quantities():
+    rng = np.random.default_rng(2)
+    pvp = _simple_pvp(np.full(20, 7000.), np.linspace(-3000, 3000, 20))
+    pvp['RcvPos'] += rng.normal(scale=2000, size=(20, 3))
+    pvp['RcvVel'] = rng.normal(scale=100, size=(20, 3))
+    geometry = PVPGeometry(pvp)
+
+    r_xmt = np.linalg.norm(pvp['TxPos'] - pvp['SRPPos'], axis=-1)
+    r_rcv = np.linalg.norm(pvp['RcvPos'] - pvp['SRPPos'], axis=-1)
+    np.testing.assert_allclose(
+        geometry.reference_time, pvp['TxTime'] + r_xmt/(r_xmt + r_rcv)*(pvp['RcvTime'] - pvp['TxTime']))
+    np.testing.assert_allclose(geometry.arp_pos, 0.5*(pvp['TxPos'] + pvp['RcvPos']))
+    rdot_rcv = np.sum(pvp['RcvVel']*(pvp['RcvPos'] - pvp['SRPPos']), axis=-1)/r_rcv
+    np.testing.assert_allclose(geometry.range_rate_rcv_srp, rdot_rcv)
+    np.testing.assert_allclose(
+        geometry.afdop, (geometry.range_rate_xmt_srp + rdot_rcv)*(-1/scipy.constants.speed_of_light))
+
+
+def test_validation():
+    with pytest.raises(TypeError):
+        PVPGeometry(np.zeros((3, 3)))
+    with pytest.raises(ValueError, match='missing'):
+        PVPGeometry(np.zeros((3, ), dtype=[('TxTime', 'f8')]))
+    pvp = np.zeros((3, ), dtype=[entry for entry in PVP_DTYPE if not entry[0].endswith('Vel')])
+    geometry = PVPGeometry(pvp)
+    assert geometry.arp_time.shape == (3, )
+    with pytest.raises(ValueError, match='TxVel'):
+        _ = geometry.arp_vel
+
+
+def test_reader_pvp_geometry(tmp_path):
+    cphd_meta = CPHDType.from_xml_file(str(CPHD_XML))
+    cphd_meta.Data.Channels[0].NumVectors = 3
+    cphd_meta.Data.Channels[0].NumSamples = 4
+    pvp = np.zeros((3, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    simple = _simple_pvp([5000., 8000., 10000.], [10000., 8000., 6000.])
+    for name in simple.dtype.names:
+        pvp[name] = simple[name]
+    file_name = str(tmp_path / 'geometry.cphd')
+    with CPHDWriter1(file_name, cphd_meta, check_existence=False) as writer:
+        writer.write_file({'1': pvp}, {'1': np.zeros((3, 4), dtype='complex64')}, {})
+
+    reader = CPHDReader(file_name)
+    geometry = reader.get_pvp_geometry('1')
+    assert reader.get_pvp_geometry(0) is geometry
+    np.testing.assert_allclose(geometry.graze_angle, PVPGeometry(simple).graze_angle)
+    reader.close()
+    assert len(reader._pvp_geometry) == 0
@@ -0,0 +1,85 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from sarpy.io.phase_history.base import signal_normal, time_window
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDWriter1
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+from sarpy.io.phase_history.cphd1_elements.PVP import PerVectorParameterI8
+
+CPHD_XML = pathlib.Path(__file__).parents[2] / "data/syntax-only-cphd-1.1.0-monostatic-minimal.xml"
+NUM_VECTORS = 103
+NUM_SAMPLES = 24
+
+
+@pytest.fixture(scope='module')
+def cphd_file(tmp_path_factory):
+    cphd_meta = CPHDType.from_xml_file(str(CPHD_XML))
+    cphd_meta.Data.Channels[0].NumVectors = NUM_VECTORS
+    cphd_meta.Data.Channels[0].NumSamples = NUM_SAMPLES
+    cphd_meta.PVP.SIGNAL = PerVectorParameterI8(
+        Offset=cphd_meta.PVP.get_vector_dtype().itemsize//8, Size=1, Format='I8')
+
+    pvp = np.zeros((NUM_VECTORS, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    pvp['TxTime'] = np.linspace(0, 2, NUM_VECTORS)
+    pvp['SIGNAL'] = 1
+    pvp['SIGNAL'][[5, 6, 40, 99]] = 0
+    rng = np.random.default_rng(0)
+    signal = (rng.standard_normal((NUM_VECTORS, NUM_SAMPLES)) +
+              1j*rng.standard_normal((NUM_VECTORS, NUM_SAMPLES))).astype('complex64')
+
+    file_name = tmp_path_factory.mktemp('vector_iterator') / 'example.cphd'
+    with CPHDWriter1(str(file_name), cphd_meta, check_existence=False) as writer:
+        writer.write_file({'1': pvp}, {'1': signal}, {})
+    return str(file_name), pvp, signal
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterate_all_vectors(cphd_file, prefetch):
+    file_name, pvp, signal = cphd_file
+    reader = CPHDReader(file_name)
+    batches = list(reader.iterate_vectors('1', batch_size=20, prefetch=prefetch))
+    assert [entry[0].size for entry in batches] == [20, 20, 20, 20, 20, 3]
+    np.testing.assert_array_equal(np.concatenate([entry[0] for entry in batches]), np.arange(NUM_VECTORS))
+    np.testing.assert_array_equal(np.concatenate([entry[1] for entry in batches]), pvp)
+    np.testing.assert_array_equal(np.concatenate([entry[2] for entry in batches]), signal)
+
+
+def test_iterate_with_predicate_and_range(cphd_file):
+    file_name, pvp, signal = cphd_file
+    reader = CPHDReader(file_name)
+    expected = np.nonzero(pvp['SIGNAL'] == 1)[0]
+    batches = list(reader.iterate_vectors(0, batch_size=16, predicate=signal_normal))
+    indices = np.concatenate([entry[0] for entry in batches])
+    np.testing.assert_array_equal(indices, expected)
+    np.testing.assert_array_equal(np.concatenate([entry[2] for entry in batches]), signal[expected])
+    np.testing.assert_array_equal(np.concatenate([entry[1] for entry in batches])['SIGNAL'], 1)
+
+    # a window with no selected vectors in most batches
+    window = time_window(1.0, 1.1)
+    expected = np.nonzero((pvp['TxTime'] >= 1.0) & (pvp['TxTime'] < 1.1))[0]
+    batches = list(reader.iterate_vectors(0, batch_size=10, predicate=window))
+    assert len(batches) == 1
+    np.testing.assert_array_equal(batches[0][0], expected)
+
+    batches = list(reader.iterate_vectors(0, batch_size=7, vector_range=(10, 30), raw=True))
+    np.testing.assert_array_equal(np.concatenate([entry[0] for entry in batches]), np.arange(10, 30))
+    raw = np.concatenate([entry[2] for entry in batches])
+    assert raw.shape == (20, NUM_SAMPLES, 2)
+    np.testing.assert_array_equal(raw[..., 0] + 1j*raw[..., 1], signal[10:30])
+
+
+def test_iterate_early_exit_and_validation(cphd_file):
+    file_name, pvp, _ = cphd_file
+    reader = CPHDReader(file_name)
+    for indices, batch_pvp, _ in reader.iterate_vectors(0, batch_size=10):
+        np.testing.assert_array_equal(batch_pvp, pvp[indices])
+        break
+
+    with pytest.raises(ValueError, match='batch_size'):
+        reader.iterate_vectors(0, batch_size=0)
+    with pytest.raises(ValueError, match='vector_range'):
+        reader.iterate_vectors(0, vector_range=(5, NUM_VECTORS + 1))
+    with pytest.raises(ValueError, match='predicate'):
+        list(reader.iterate_vectors(0, predicate=lambda x: np.ones(3, dtype='bool')))
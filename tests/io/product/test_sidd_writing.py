@@ -5,6 +5,8 @@ import tempfile
 import shutil
 import unittest
 
+import numpy
+
 from sarpy.io.complex.sicd import SICDReader
 from sarpy.io.general.nitf import NITFWritingDetails, NITFWriter, ImageSubheaderManager, ImageSegmentHeader
 from sarpy.io.product.sidd import SIDDReader
@@ -152,6 +154,42 @@ class TestSIDDWriting(unittest.TestCase):
         ]
         assert expected_imhdrs == actual_imhdrs
 
+    def test_compressed_sidd_writing(self):
+        sidd_xml = pathlib.Path(__file__).parents[2] / 'data/example.sidd.xml'
+        sidd_meta = sarpy.io.product.sidd.SIDDType2.from_xml_file(sidd_xml)
+        sidd_meta.Measurement.PixelFootprint.Row = 700
+        sidd_meta.Measurement.PixelFootprint.Col = 900
+        rows, cols = numpy.mgrid[:700, :900]
+        data = (127 + 100*numpy.sin(cols/50.)*numpy.cos(rows/70.)).astype('uint8')
+        data[:512, :512] = 0
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            for compression, tolerance in [('C3', 8), ('M3', 8), ('C8', 0)]:
+                with self.subTest(msg='compression {}'.format(compression)):
+                    sidd_file = os.path.join(tmp_path, '{}.nitf'.format(compression))
+                    sidd_writing_details = sarpy.io.product.sidd.SIDDWritingDetails(
+                        sidd_meta, None, compression=compression, block_size=512)
+                    with sarpy.io.product.sidd.SIDDWriter(
+                            sidd_file, sidd_writing_details=sidd_writing_details, max_workers=2) as writer:
+                        writer.write_chip(data)
+
+                    reader = SIDDReader(sidd_file)
+                    image_header = reader.nitf_details.img_headers[0]
+                    self.assertEqual(image_header.IC, compression)
+                    self.assertLess(os.path.getsize(sidd_file), data.size)
+                    read_data = reader[:, :]
+                    self.assertEqual(read_data.shape, data.shape)
+                    self.assertLessEqual(numpy.abs(read_data.astype('int32') - data).max(), tolerance)
+                    if compression == 'M3':
+                        # the entirely zero block is omitted
+                        self.assertEqual(image_header.mask_subheader.BMR[0, 0], 0xFFFFFFFF)
+                        self.assertEqual(numpy.count_nonzero(image_header.mask_subheader.BMR == 0xFFFFFFFF), 1)
+                    reader.close()
+
+        with self.assertRaises(ValueError):
+            sidd_meta.Display.PixelType = 'MONO16I'
+            sarpy.io.product.sidd.SIDDWritingDetails(sidd_meta, None, compression='C3')
+
     def test_nitf_with_legend(self):
         """Ensure SARPy can be used to write out a SIDD with a legend"""
         sidd_xml = pathlib.Path(__file__).parents[2] / 'data/example.sidd.xml'
@@ -0,0 +1,67 @@
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+import sarpy.io.complex.sicd
+
+
+# cumulative import time budget in microseconds for the opener modules, which
+# is deliberately generous to avoid spurious failures on a loaded host
+IMPORT_TIME_BUDGET = int(os.environ.get('SARPY_IMPORT_TIME_BUDGET', 3000000))
+HEAVY_MODULES = ('scipy', 'h5py', 'PIL')
+
+
+def _import_times(code):
+    """
+    Runs the code in a fresh interpreter using `-X importtime`, and returns
+    the map of module name to cumulative import time in microseconds.
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        check=True, capture_output=True, text=True,
+        cwd=str(pathlib.Path(__file__).parents[2]))
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture
+def temp_sicd(tmp_path):
+    sicd_xml = pathlib.Path(__file__).parents[1] / "data/example.sicd.xml"
+    sicd_meta = sarpy.io.complex.sicd.SICDType.from_xml_file(str(sicd_xml))
+    sicd_file = tmp_path / "data-example.sicd"
+    with sarpy.io.complex.sicd.SICDWriter(str(sicd_file), sicd_meta):
+        pass  # don't care about pixels
+    yield sicd_file
+
+
+@pytest.mark.parametrize('module_name',
+                         ['sarpy.io.general.converter',
+                          'sarpy.io.complex.converter',
+                          'sarpy.io.product.converter',
+                          'sarpy.io.phase_history.converter',
+                          'sarpy.io.received.converter'])
+def test_converter_import_time(module_name):
+    times = _import_times('import {}'.format(module_name))
+    heavy = [name for name in times if name.split('.')[0] in HEAVY_MODULES]
+    assert heavy == []
+    assert times[module_name] < IMPORT_TIME_BUDGET
+
+
+def test_open_sicd_imports(temp_sicd):
+    times = _import_times(
+        'from sarpy.io.complex.converter import open_complex\n'
+        'open_complex({!r}).close()'.format(str(temp_sicd)))
+    heavy = [name for name in times if name.split('.')[0] in HEAVY_MODULES]
+    assert heavy == []
+    # only the sicd opener is a candidate
+    for name in ['capella', 'csk', 'gff', 'iceye', 'nisar', 'palsar2', 'radarsat', 'sentinel', 'tsx']:
+        assert 'sarpy.io.complex.{}'.format(name) not in times
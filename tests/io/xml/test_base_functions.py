@@ -1156,3 +1156,91 @@ class TestParseParametersCollection(unittest.TestCase):
             base.parse_parameters_collection("not_a_list_or_dict", 'params', 
                                              ParseParametersCollectionDummyInstance())
 
+
+
+# ********************************
+# compiled (de)serialization tests
+# ********************************
+from sarpy.io.xml.descriptors import IntegerDescriptor, StringDescriptor, StringListDescriptor
+
+
+class CompiledDummyType(base.Serializable):
+    _fields = ('Name', 'Count', 'Items', 'Renamed')
+    _required = ('Name', )
+    _set_as_attribute = ('Name', )
+    _tag_override = {'Renamed': 'Other'}
+    _collections_tags = {'Items': {'array': False, 'child_tag': 'Item'}}
+    Name = StringDescriptor('Name', _required)
+    Count = IntegerDescriptor('Count', _required)
+    Items = StringListDescriptor('Items', _required)
+    Renamed = StringDescriptor('Renamed', _required)
+
+    def __init__(self, Name=None, Count=None, Items=None, Renamed=None, **kwargs):
+        if '_xml_ns_key' in kwargs:
+            self._xml_ns_key = kwargs['_xml_ns_key']
+        self.Name = Name
+        self.Count = Count
+        self.Items = Items
+        self.Renamed = Renamed
+        super(CompiledDummyType, self).__init__(**kwargs)
+
+
+class TestCompiledSerialization(unittest.TestCase):
+    xml_plain = '<Dummy Name="first"><Count>2</Count><Item>a</Item><Other>x</Other>' \
+                '<Item>b</Item><Count>5</Count><!-- comment --></Dummy>'
+    xml_ns = '<Dummy xmlns="urn:dummy" Name="first"><Count>2</Count><Item>a</Item>' \
+             '<Other>x</Other><Item>b</Item></Dummy>'
+
+    def check_instance(self, the_instance):
+        self.assertEqual(the_instance.Name, 'first')
+        self.assertEqual(the_instance.Count, 2)  # the first occurrence
+        self.assertEqual(the_instance.Items, ['a', 'b'])
+        self.assertEqual(the_instance.Renamed, 'x')
+
+    def test_from_node(self):
+        node, xml_ns = base.parse_xml_from_string(self.xml_plain)
+        self.assertIsNone(xml_ns)
+        self.check_instance(CompiledDummyType.from_node(node, xml_ns))
+
+        node, xml_ns = base.parse_xml_from_string(self.xml_ns)
+        self.check_instance(CompiledDummyType.from_node(node, xml_ns, ns_key='default'))
+        self.check_instance(CompiledDummyType.from_node(node, xml_ns))
+        # a different namespace uses a distinct plan, and nothing is found
+        other = CompiledDummyType.from_node(node, {'default': 'urn:other'})
+        self.assertIsNone(other.Count)
+        self.assertIsNone(other.Items)
+        # the plans are held by the class itself, and are bounded in number
+        plans = CompiledDummyType.__dict__['_xml_read_plans']
+        self.assertGreaterEqual(len(plans), 3)
+        for i in range(20):
+            CompiledDummyType.from_node(node, {'default': 'urn:other{}'.format(i)})
+        self.assertLessEqual(len(plans), base._MAX_XML_READ_PLANS)
+        self.assertNotIn('_xml_read_plans', base.Serializable.__dict__)
+
+    def test_from_node_bad_namespace(self):
+        node, xml_ns = base.parse_xml_from_string(self.xml_ns)
+        with self.assertRaisesRegex(ValueError, 'does not contain this key'):
+            CompiledDummyType.from_node(node, xml_ns, ns_key='missing')
+
+    def test_round_trip(self):
+        node, xml_ns = base.parse_xml_from_string(self.xml_plain)
+        the_instance = CompiledDummyType.from_node(node, xml_ns)
+        xml_bytes = the_instance.to_xml_bytes(tag='Dummy')
+        self.assertEqual(
+            xml_bytes,
+            b'<Dummy Name="first"><Count>2</Count><Item>a</Item><Item>b</Item><Other>x</Other></Dummy>')
+        node, xml_ns = base.parse_xml_from_string(xml_bytes)
+        self.check_instance(CompiledDummyType.from_node(node, xml_ns))
+
+    def test_sicd_copy(self):
+        import pathlib
+        from sarpy.io.complex.sicd_elements.SICD import SICDType
+
+        sicd_xml = pathlib.Path(__file__).parents[2] / 'data/example.sicd.xml'
+        sicd = SICDType.from_xml_file(str(sicd_xml))
+        sicd.define_coa_projection()
+        for the_copy in [sicd.copy(), sicd.copy(copy_on_write=True)]:
+            self.assertIsNone(the_copy.coa_projection)
+            self.assertEqual(the_copy.to_xml_bytes(), sicd.to_xml_bytes())
+            self.assertIsNot(the_copy.Grid, sicd.Grid)
+            self.assertIsNot(the_copy.Grid.TimeCOAPoly, sicd.Grid.TimeCOAPoly)
@@ -0,0 +1,107 @@
+import copy
+import pickle
+import unittest
+
+from sarpy.io.xml.base import Serializable
+from sarpy.io.xml.descriptors import StringDescriptor, FloatDescriptor, StringEnumDescriptor, \
+    SerializableDescriptor
+
+
+class DescriptorDummyType(Serializable):
+    _fields = ('Name', 'Value', 'Side')
+    _required = ('Name', )
+    Name = StringDescriptor('Name', _required)
+    Value = FloatDescriptor('Value', _required, default_value=1.0)
+    # the descriptor name intentionally differs from the attribute name
+    Side = StringEnumDescriptor('Other', {'LEFT', 'RIGHT'}, _required)
+
+    def __init__(self, Name=None, Value=None, Side=None, **kwargs):
+        self.Name = Name
+        self.Value = Value
+        self.Side = Side
+        super(DescriptorDummyType, self).__init__(**kwargs)
+
+    def __eq__(self, other):
+        # instances are deliberately not hashable
+        return self.to_dict() == other.to_dict()
+
+
+class TestInstanceStorage(unittest.TestCase):
+    def test_values(self):
+        first = DescriptorDummyType(Name='first', Value=2, Side='LEFT')
+        second = DescriptorDummyType(Name='second')
+        self.assertEqual((first.Name, first.Value, first.Side), ('first', 2.0, 'LEFT'))
+        self.assertEqual((second.Name, second.Value, second.Side), ('second', 1.0, None))
+
+        # the values are stored on the instance, under the attribute name
+        self.assertEqual(first.__dict__['Side'], 'LEFT')
+        self.assertNotIn('Other', first.__dict__)
+        self.assertIsInstance(DescriptorDummyType.Name, StringDescriptor)
+
+        second.Value = '3.5'
+        self.assertEqual(second.Value, 3.5)
+        self.assertEqual(first.Value, 2.0)
+
+    def test_copy(self):
+        first = DescriptorDummyType(Name='first', Value=2, Side='RIGHT')
+        for other in [first.copy(), copy.deepcopy(first), pickle.loads(pickle.dumps(first))]:
+            self.assertIsNot(other, first)
+            self.assertEqual(other, first)
+        other = first.copy()
+        other.Name = 'changed'
+        self.assertEqual(first.Name, 'first')
+
+
+class DescriptorParentType(Serializable):
+    _fields = ('Child', 'Other')
+    _required = ()
+    Child = SerializableDescriptor('Child', DescriptorDummyType, _required)
+    Other = SerializableDescriptor('Other', DescriptorDummyType, _required)
+
+    def __init__(self, Child=None, Other=None, **kwargs):
+        self._cache = None
+        self.Child = Child
+        self.Other = Other
+        super(DescriptorParentType, self).__init__(**kwargs)
+
+
+class TestCopyOnWrite(unittest.TestCase):
+    def get_parent(self):
+        return DescriptorParentType(
+            Child=DescriptorDummyType(Name='child', Value=2), Other=DescriptorDummyType(Name='other'))
+
+    def test_structural_copy(self):
+        parent = self.get_parent()
+        parent._cache = ['a']
+        other = parent.copy()
+        self.assertEqual(other.to_dict(), parent.to_dict())
+        self.assertIsNot(other.Child, parent.Child)
+        self.assertEqual(other._cache, ['a'])
+        self.assertIsNot(other._cache, parent._cache)
+
+    def test_copy_on_write(self):
+        parent = self.get_parent()
+        original_child = parent.Child
+        original_other = parent.Other
+        first = parent.copy(copy_on_write=True)
+        second = first.copy(copy_on_write=True)
+
+        # the source is untouched
+        self.assertIs(parent.Child, original_child)
+        self.assertIs(parent.Other, original_other)
+
+        # modifications are isolated, including through earlier references
+        first.Child.Name = 'first'
+        self.assertEqual(second.Child.Name, 'child')
+        original_child.Value = 5
+        self.assertEqual((first.Child.Name, first.Child.Value), ('first', 2.0))
+        self.assertEqual((parent.Child.Name, parent.Child.Value), ('child', 5.0))
+        self.assertEqual((second.Child.Name, second.Child.Value), ('child', 2.0))
+        self.assertEqual(len({id(entry.Child) for entry in [parent, first, second]}), 3)
+        self.assertEqual(len({id(entry.Other) for entry in [parent, first, second]}), 3)
+
+        # replaced values are simply replaced
+        third = parent.copy(copy_on_write=True)
+        third.Other = DescriptorDummyType(Name='third')
+        self.assertEqual(parent.Other.Name, 'other')
+        self.assertEqual(third.to_dict()['Other'], {'Name': 'third', 'Value': 1.0})
@@ -0,0 +1,95 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+import sarpy.io.complex.sicd
+from sarpy.io.complex.converter import open_complex
+from sarpy.io.complex.sicd_elements.Grid import WgtTypeType
+from sarpy.processing.sicd import normalize_sicd, rgiqe
+from sarpy.processing.sicd.normalize_sicd import sicd_degrade_reweight
+
+
+@pytest.fixture(scope='module')
+def sicd_file(tmp_path_factory):
+    sicd_xml = pathlib.Path(__file__).parents[2] / "data/example.sicd.rma.xml"
+    sicd_meta = sarpy.io.complex.sicd.SICDType.from_xml_file(str(sicd_xml))
+    for dir_params in [sicd_meta.Grid.Row, sicd_meta.Grid.Col]:
+        dir_params.WgtType = WgtTypeType(WindowName='HAMMING')
+        dir_params.WgtFunct = 0.54 - 0.46*np.cos(2*np.pi*np.arange(64)/63.)
+    rng = np.random.default_rng(12345)
+    shape = (sicd_meta.ImageData.NumRows, sicd_meta.ImageData.NumCols)
+    data = (rng.standard_normal(shape) + 1j*rng.standard_normal(shape)).astype('complex64')
+    sicd_file = tmp_path_factory.mktemp('normalize') / "data-example.sicd"
+    with sarpy.io.complex.sicd.SICDWriter(str(sicd_file), sicd_meta) as writer:
+        writer(data, start_indices=(0, 0))
+    return str(sicd_file)
+
+
+_UNIFORM = {'WindowName': 'UNIFORM', 'WgtFunct': np.ones(32)}
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(row_aperture=(100, 900), row_weighting=_UNIFORM),
+    dict(column_aperture=(200, 1200), column_weighting=_UNIFORM),
+    dict(row_aperture=(100, 900), column_aperture=(200, 1200), row_weighting=_UNIFORM, column_weighting=_UNIFORM),
+])
+def test_degrade_reweight_strips_match_in_memory(sicd_file, tmp_path, kwargs):
+    reader = open_complex(sicd_file)
+    limits = dict(row_limits=(10, 1400), column_limits=(5, 1700))
+    in_memory = sicd_degrade_reweight(reader, max_workers=1, **limits, **kwargs)
+    expected = in_memory[:, :]
+    assert expected.shape == (1390, 1695)
+
+    output_file = str(tmp_path / 'degraded.sicd')
+    sicd_degrade_reweight(
+        reader, output_file=output_file, pixel_threshold=200*1000, max_workers=3, **limits, **kwargs)
+    out_reader = open_complex(output_file)
+    np.testing.assert_allclose(out_reader[:, :], expected, rtol=0, atol=1e-5)
+    assert out_reader.sicd_meta.Grid.Row.ImpRespBW == pytest.approx(in_memory.sicd_meta.Grid.Row.ImpRespBW)
+
+
+def test_degrade_reweight_add_noise_with_limits(sicd_file, tmp_path):
+    reader = open_complex(sicd_file)
+    np.random.seed(3)
+    first = sicd_degrade_reweight(
+        reader, row_limits=(0, 1000), column_limits=(100, 1100), add_noise=4.0, max_workers=2)
+    np.random.seed(3)
+    second = sicd_degrade_reweight(
+        reader, row_limits=(0, 1000), column_limits=(100, 1100), add_noise=4.0, max_workers=1)
+    original = reader[0:1000, 100:1100]
+    noise = first[:, :] - original
+    assert noise.shape == (1000, 1000)
+    assert np.mean(np.abs(noise)**2) == pytest.approx(4.0, rel=0.05)
+    np.testing.assert_array_equal(first[:, :], second[:, :])
+
+    with pytest.raises(ValueError, match='max_workers'):
+        sicd_degrade_reweight(reader, add_noise=4.0, max_workers=0)
+
+
+def test_dimension_reweight_skips_zero_skew(monkeypatch):
+    sicd_xml = pathlib.Path(__file__).parents[2] / "data/example.sicd.rma.xml"
+    sicd_meta = sarpy.io.complex.sicd.SICDType.from_xml_file(str(sicd_xml))
+
+    def fail(*args, **kwargs):
+        raise AssertionError('apply_skew_poly should not be called')
+
+    monkeypatch.setattr(normalize_sicd, 'apply_skew_poly', fail)
+    processing = normalize_sicd._DimensionReweight(
+        sicd_meta, 0, -1, np.zeros((1, 1)), False, (0, 64), np.ones(64), False,
+        (0, 64), np.ones(64), False, False)
+    rng = np.random.default_rng(5)
+    data = (rng.standard_normal((64, 8)) + 1j*rng.standard_normal((64, 8))).astype('complex64')
+    np.testing.assert_allclose(processing(data, np.arange(64.), np.arange(8.)), data, atol=1e-5)
+
+
+def test_quality_degrade_max_workers(sicd_file, monkeypatch):
+    found = []
+
+    def record(*args, **kwargs):
+        found.append(kwargs['max_workers'])
+
+    monkeypatch.setattr(rgiqe, 'sicd_degrade_reweight', record)
+    rgiqe.quality_degrade(sicd_file, max_workers=3)
+    rgiqe.quality_degrade_resolution(sicd_file, desired_bandwidth=(0.5, 0.5), max_workers=2)
+    assert found == [3, 2]
@@ -0,0 +1,97 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+import sarpy.io.complex.sicd
+from sarpy.processing.ortho_rectify import NearestNeighborMethod
+from sarpy.processing.sicd import subaperture
+
+
+@pytest.fixture
+def sicd_reader(tmp_path):
+    sicd_xml = pathlib.Path(__file__).parents[2] / "data/example.sicd.xml"
+    sicd_meta = sarpy.io.complex.sicd.SICDType.from_xml_file(str(sicd_xml))
+    rng = np.random.default_rng(12345)
+    shape = (sicd_meta.ImageData.NumRows, sicd_meta.ImageData.NumCols)
+    data = (rng.standard_normal(shape) + 1j*rng.standard_normal(shape)).astype('complex64')
+    sicd_file = tmp_path / "data-example.sicd"
+    with sarpy.io.complex.sicd.SICDWriter(str(sicd_file), sicd_meta) as writer:
+        writer(data, start_indices=(0, 0))
+    reader = sarpy.io.complex.sicd.is_a(str(sicd_file))
+    yield reader
+    reader.close()
+
+
+@pytest.mark.parametrize("dimension", [0, 1])
+def test_phase_history_frames_matches_single_frame(dimension):
+    rng = np.random.default_rng(0)
+    array = (rng.standard_normal((64, 48)) + 1j*rng.standard_normal((64, 48))).astype('complex64')
+    phase = subaperture.fftshift(subaperture.fft(array, axis=dimension), axes=dimension)
+    frame_collection, output_resolution = subaperture.frame_definition(array.shape[dimension], frame_count=5)
+
+    batch = subaperture.subaperture_processing_phase_history_frames(
+        phase, frame_collection, output_resolution, dimension=dimension, max_workers=3)
+    assert batch.shape[2] == 5
+    for i, frame_def in enumerate(frame_collection):
+        expected = subaperture.subaperture_processing_phase_history(
+            phase, frame_def, output_resolution, dimension=dimension)
+        np.testing.assert_allclose(batch[:, :, i], expected, rtol=1e-5, atol=1e-5)
+
+    subset = subaperture.subaperture_processing_phase_history_frames(
+        phase, frame_collection, output_resolution, dimension=dimension, frames=[3, 1], max_workers=1)
+    np.testing.assert_allclose(subset[:, :, 0], batch[:, :, 3])
+    np.testing.assert_allclose(subset[:, :, 1], batch[:, :, 1])
+
+    with pytest.raises(ValueError, match="max_workers"):
+        subaperture.subaperture_processing_phase_history_frames(
+            phase, frame_collection, output_resolution, dimension=dimension, max_workers=0)
+
+
+@pytest.mark.parametrize("dimension", [0, 1])
+def test_calculator_tiling_matches_generator(sicd_reader, dimension):
+    calculator = subaperture.SubapertureCalculator(
+        sicd_reader, dimension=dimension, block_size=0.25, frame_count=4, max_workers=2)
+    row_range = (100, 300, 1)
+    col_range = (200, 420, 1)
+    blocks, _ = calculator._get_frame_batch_blocks(row_range, col_range, 4)
+    assert len(blocks) > 1
+
+    tiled = calculator[100:300, 200:420]
+    assert tiled.shape == (200, 220, 4)
+    expected = np.stack(list(calculator.subaperture_generator(row_range, col_range)), axis=-1)
+    np.testing.assert_allclose(tiled, expected, rtol=1e-4, atol=1e-4)
+
+    single = calculator[100:300, 200:420, 2]
+    assert single.shape == (200, 220)
+    np.testing.assert_allclose(single, expected[:, :, 2], rtol=1e-4, atol=1e-4)
+
+
+def test_ortho_iterator_depth_first_matches_frame_first(sicd_reader):
+    ortho_helper = NearestNeighborMethod(sicd_reader)
+    bounds = (600, 800, 700, 900)
+    results = []
+    block_counts = []
+    for depth_first in [True, False]:
+        calculator = subaperture.SubapertureCalculator(sicd_reader, frame_count=3, block_size=1)
+        iterator = subaperture.SubapertureOrthoIterator(
+            ortho_helper, calculator, bounds=bounds, depth_first=depth_first)
+        block_counts.append(len(iterator._iteration_blocks))
+        mosaic = {}
+        for data, start_indices, frame in iterator:
+            if frame not in mosaic:
+                mosaic[frame] = np.zeros(
+                    (iterator.ortho_bounds[1] - iterator.ortho_bounds[0],
+                     iterator.ortho_bounds[3] - iterator.ortho_bounds[2]), dtype=data.dtype)
+            mosaic[frame][
+                start_indices[0]:start_indices[0] + data.shape[0],
+                start_indices[1]:start_indices[1] + data.shape[1]] = data
+        results.append(mosaic)
+    # a single frame is fetched at a time when iterating frame first, so the blocks are larger
+    assert block_counts[0] > block_counts[1]
+    assert results[0].keys() == results[1].keys()
+    for key in results[0]:
+        np.testing.assert_allclose(results[0][key], results[1][key], rtol=1e-4, atol=1e-4)
+
+    calculator = subaperture.SubapertureCalculator(sicd_reader, frame_count=3, block_size=1)
+    assert calculator.get_fetch_block_size(0, 1000) > calculator.get_fetch_block_size(0, 1000, frame_count=3)
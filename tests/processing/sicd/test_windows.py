@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+import scipy.signal
+
+from sarpy.processing.sicd import windows
+
+
+@pytest.mark.parametrize("name, parameters, expected", [
+    ('UNIFORM', None, lambda m: np.ones(m)),
+    ('hamming', None, lambda m: windows.hamming(m)),
+    ('Hann', None, lambda m: windows.hanning(m)),
+    ('GENERAL_HAMMING', {'alpha': 0.68}, lambda m: windows.general_hamming(m, 0.68)),
+    ('KAISER', {'BETA': 6}, lambda m: windows.kaiser(m, 6.0)),
+    ('TAYLOR', {'NBAR': 5, 'SLL': 35}, lambda m: windows.taylor(m, nbar=5, sll=-35)),
+])
+def test_get_window_matches_direct(name, parameters, expected):
+    for size in [17, 64, 513]:
+        np.testing.assert_allclose(windows.get_window(name, size, parameters=parameters), expected(size))
+
+
+def test_get_window_is_cached():
+    windows.clear_window_caches()
+    first = windows.get_window('TAYLOR', 257, copy=False)
+    second = windows.get_window('taylor', 257, parameters={'sll': 30}, copy=False)
+    assert first is second
+    assert not first.flags.writeable
+
+    copied = windows.get_window('TAYLOR', 257)
+    copied[:] = 0
+    assert np.all(windows.get_window('TAYLOR', 257, copy=False) > 0)
+
+    with pytest.raises(ValueError, match='not supported'):
+        windows.get_window('BLACKMAN', 16)
+    with pytest.raises(ValueError, match='does not accept'):
+        windows.get_window('KAISER', 16, parameters={'ALPHA': 0.5})
+
+
+def test_batched_windows():
+    sizes = [31, 64, 31, 100]
+    batch = windows.get_windows('KAISER', sizes, parameters={'BETA': 8})
+    for size, window in zip(sizes, batch):
+        np.testing.assert_array_equal(window, windows.get_window('KAISER', size, parameters={'BETA': 8}))
+
+    prototype = windows.get_window('HAMMING', 64)
+    resampled = windows.resample_windows(prototype, sizes)
+    for size, window in zip(sizes, resampled):
+        np.testing.assert_allclose(window, scipy.signal.resample(prototype, size))
+    cubic = windows.resample_window(prototype, 100, kind='cubic')
+    np.testing.assert_allclose(cubic[[0, -1]], prototype[[0, -1]])
+
+
+def test_half_power_and_ipr_width():
+    wgt = windows.get_window('KAISER', 512, parameters={'BETA': 4})
+    direct = windows._find_half_power.__wrapped__(windows._array_key(wgt), 64)
+    assert windows.find_half_power(wgt, oversample=64) == direct
+    assert windows.find_half_power(None) is None
+
+    assert windows.get_ipr_width('UNIFORM') == pytest.approx(0.886, abs=1e-3)
+    assert windows.get_ipr_width('HAMMING') == pytest.approx(
+        windows.find_half_power(windows.get_window('HAMMING', 512)), rel=1e-2)
+
+    table = windows.get_ipr_width_table('KAISER', 'BETA', [0.0, 2.0, 4.0, 8.0])
+    assert table[0] == pytest.approx(0.886, abs=2e-3)
+    assert np.all(np.diff(table) > 0)
+    assert table[2] == pytest.approx(windows.find_half_power(wgt), rel=1e-9)
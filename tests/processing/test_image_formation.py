@@ -0,0 +1,135 @@
+import logging
+import pathlib
+import time
+
+import numpy as np
+import pytest
+
+from sarpy.geometry.geocoords import wgs_84_norm
+from sarpy.io.complex.converter import open_complex
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDWriter1
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+from sarpy.processing import image_formation
+
+logger = logging.getLogger(__name__)
+
+CPHD_XML = pathlib.Path(__file__).parents[1] / "data/syntax-only-cphd-1.1.0-monostatic-minimal.xml"
+NUM_VECTORS = 96
+NUM_SAMPLES = 80
+
+
+def _get_target_locations(srp, arp):
+    normal = wgs_84_norm(srp)
+    u_range = srp - arp
+    u_range -= u_range.dot(normal)*normal
+    u_range /= np.linalg.norm(u_range)
+    u_cross = np.cross(normal, u_range)
+    return np.array([srp, srp + 20*u_range + 15*u_cross, srp - 30*u_range - 25*u_cross])
+
+
+def _write_point_target_cphd(file_name, sgn):
+    cphd_meta = CPHDType.from_xml_file(str(CPHD_XML))
+    cphd_meta.Global.SGN = sgn
+    cphd_meta.Data.Channels[0].NumVectors = NUM_VECTORS
+    cphd_meta.Data.Channels[0].NumSamples = NUM_SAMPLES
+    cphd_meta.Channel.Parameters[0].RefVectorIndex = NUM_VECTORS//2
+
+    times = np.linspace(0, 1.87, NUM_VECTORS)
+    srp = np.array([6378137., 0, 0])
+    arp = np.array([7228728., 255412., 1450829.])
+    velocity = np.array([340., -7332., -403.])
+    pvp = np.zeros((NUM_VECTORS, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    pvp['TxTime'] = times
+    pvp['RcvTime'] = times + 0.0035
+    pvp['TxPos'] = arp + (times - times[NUM_VECTORS//2])[:, None]*velocity
+    pvp['RcvPos'] = pvp['TxPos']
+    pvp['TxVel'] = velocity
+    pvp['RcvVel'] = velocity
+    pvp['SRPPos'] = srp
+    pvp['SC0'] = cphd_meta.Global.FxBand.FxMin
+    pvp['SCSS'] = (cphd_meta.Global.FxBand.FxMax - cphd_meta.Global.FxBand.FxMin)/(NUM_SAMPLES - 1)
+    pvp['FX1'] = cphd_meta.Global.FxBand.FxMin
+    pvp['FX2'] = cphd_meta.Global.FxBand.FxMax
+    pvp['TOA1'] = cphd_meta.Global.TOASwath.TOAMin
+    pvp['TOA2'] = cphd_meta.Global.TOASwath.TOAMax
+
+    targets = _get_target_locations(srp, arp)
+    signal = image_formation.synthesize_point_targets(pvp, NUM_SAMPLES, targets, sgn=sgn)
+    with CPHDWriter1(str(file_name), cphd_meta, check_existence=False) as writer:
+        writer.write_file({'1': pvp}, {'1': signal}, {})
+    return targets
+
+
+@pytest.fixture(scope='module', params=[-1, 1])
+def point_target_cphd(request, tmp_path_factory):
+    file_name = tmp_path_factory.mktemp('image_formation') / 'point_targets.cphd'
+    targets = _write_point_target_cphd(file_name, request.param)
+    return str(file_name), targets
+
+
+@pytest.mark.parametrize("algorithm, window", [
+    ('PFA', 'UNIFORM'), ('BP', 'UNIFORM'), ('PFA', 'TAYLOR'), ('BP', 'HAMMING')])
+def test_point_targets_focus_at_projected_location(point_target_cphd, algorithm, window):
+    file_name, targets = point_target_cphd
+    reader = CPHDReader(file_name)
+    sicd_reader = image_formation.create_sicd_from_cphd(
+        reader, algorithm=algorithm, window=window, max_workers=2)
+    sicd = sicd_reader.sicd_meta
+    assert sicd.is_valid(recursive=True)
+    assert sicd.Grid.Row.Sgn == reader.cphd_meta.Global.SGN
+    assert sicd.Grid.Type == ('RGAZIM' if algorithm == 'PFA' else 'PLANE')
+
+    magnitude = np.abs(sicd_reader[:, :])
+    for target in targets:
+        row, col = np.round(sicd.project_ground_to_image(target)[0]).astype('int64')
+        window_values = magnitude[row-3:row+4, col-3:col+4]
+        peak = np.unravel_index(np.argmax(window_values), window_values.shape)
+        assert peak == (3, 3)
+        assert window_values.max() > 0.7
+    # the scene center target is exactly on a pixel
+    scp_pixel = sicd.ImageData.SCPPixel
+    assert magnitude[scp_pixel.Row, scp_pixel.Col] == pytest.approx(1.0, abs=0.02)
+
+
+def test_backprojection_tiling_and_workers(point_target_cphd):
+    file_name, _ = point_target_cphd
+    reader = CPHDReader(file_name)
+    image_grid = image_formation.get_default_image_grid(reader, num_rows=50, num_cols=70)
+    expected = image_formation.backproject(
+        reader, image_grid, vector_block_size=NUM_VECTORS, tile_size=128, max_workers=1)
+    assert expected.shape == (50, 70)
+    tiled = image_formation.backproject(
+        reader, image_grid, vector_block_size=17, tile_size=16, max_workers=3)
+    np.testing.assert_allclose(tiled, expected, rtol=0, atol=1e-5)
+
+    pfa = image_formation.polar_format(reader, image_grid, vector_block_size=NUM_VECTORS, max_workers=1)
+    blocked = image_formation.polar_format(reader, image_grid, vector_block_size=10, max_workers=3)
+    np.testing.assert_allclose(blocked, pfa, rtol=0, atol=1e-5)
+
+
+def test_write_sicd_and_throughput(point_target_cphd, tmp_path):
+    file_name, _ = point_target_cphd
+    reader = CPHDReader(file_name)
+    for algorithm in ['PFA', 'BP']:
+        output_file = str(tmp_path / '{}.sicd'.format(algorithm))
+        start = time.perf_counter()
+        assert image_formation.create_sicd_from_cphd(reader, output_file=output_file, algorithm=algorithm) is None
+        elapsed = time.perf_counter() - start
+        logger.info('{} image formation: {:.1f} signal samples per second'.format(
+            algorithm, NUM_VECTORS*NUM_SAMPLES/elapsed))
+
+        sicd_reader = open_complex(output_file)
+        in_memory = image_formation.create_sicd_from_cphd(reader, algorithm=algorithm)
+        np.testing.assert_array_equal(sicd_reader[:, :], in_memory[:, :])
+        assert sicd_reader.sicd_meta.ImageFormation.ImageFormAlgo == ('PFA' if algorithm == 'PFA' else 'OTHER')
+
+
+def test_validation(point_target_cphd):
+    file_name, _ = point_target_cphd
+    reader = CPHDReader(file_name)
+    with pytest.raises(ValueError, match='algorithm'):
+        image_formation.create_sicd_from_cphd(reader, algorithm='RMA')
+    with pytest.raises(ValueError, match='max_workers'):
+        image_formation.backproject(reader, max_workers=0)
+    with pytest.raises(ValueError, match='orthogonal'):
+        image_formation.ImageGrid([0, 0, 0], [1, 0, 0], [1, 1, 0], 1, 1, 10, 10)
@@ -36,3 +36,37 @@ def test_ortho_iterator_bounds(temp_sicd):
     bounds_geo = ortho_helper.get_orthorectification_bounds_from_pixel_object(rc_multipoint)
     assert np.allclose(bounds_open, bounds_closed)
     assert np.allclose(bounds_open, bounds_geo)
+
+
+def test_ortho_iterator_geo_transform(temp_sicd):
+    reader = sarpy.io.complex.sicd.is_a(str(temp_sicd))
+    ortho_helper = sarpy.processing.ortho_rectify.NearestNeighborMethod(reader)
+    ortho_iterator = sarpy.processing.ortho_rectify.OrthorectificationIterator(
+        ortho_helper, bounds=[0, 300, 0, 300])
+    geo_transform = ortho_iterator.get_geo_transform()
+    llh_corners = ortho_iterator.get_llh_image_corners()
+    # the center of the first pixel is the first corner point
+    assert geo_transform[0] + 0.5*(geo_transform[1] + geo_transform[2]) == pytest.approx(llh_corners[0, 1])
+    assert geo_transform[3] + 0.5*(geo_transform[4] + geo_transform[5]) == pytest.approx(llh_corners[0, 0])
+
+
+def test_fit_geo_transform_antimeridian():
+    raster_points = np.array([[0, 0], [10, 0], [0, 10], [10, 10]])
+    lon_lat = np.array([[179.995, 1.0], [-179.995, 1.0], [179.995, 0.99], [-179.995, 0.99]])
+    geo_transform, max_residual = sarpy.processing.ortho_rectify.base._fit_geo_transform(raster_points, lon_lat)
+    assert np.allclose(geo_transform, (179.995, 0.001, 0, 1.0, 0, -0.001))
+    assert max_residual < 1e-10
+
+
+def test_create_detected_image_geotiff(temp_sicd, tmp_path):
+    from PIL import Image
+    from sarpy.processing.sidd.sidd_product_creation import create_detected_image_geotiff
+
+    reader = sarpy.io.complex.sicd.is_a(str(temp_sicd))
+    ortho_helper = sarpy.processing.ortho_rectify.NearestNeighborMethod(reader)
+    out_file = create_detected_image_geotiff(
+        ortho_helper, str(tmp_path), output_file='test.tif', bounds=[0, 300, 0, 300], tile_size=128)
+    with Image.open(out_file) as image:
+        assert image.n_frames == 3
+        assert image.tag_v2[322] == 128
+        assert 34264 in image.tag_v2
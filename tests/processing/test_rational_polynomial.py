@@ -0,0 +1,110 @@
+import logging
+import pathlib
+import time
+
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial
+
+from sarpy.io.complex.sicd_elements.SICD import SICDType
+from sarpy.processing import rational_polynomial
+from sarpy.processing.ortho_rectify.projection_helper import PGProjection, PGRatPolyProjection
+
+logger = logging.getLogger(__name__)
+
+
+def _coefficient_matrix(coefs, coeff_list):
+    shape = tuple(max(entry[i] for entry in coeff_list) + 1 for i in range(len(coeff_list[0])))
+    out = np.zeros(shape)
+    for coef, entry in zip(coefs, coeff_list):
+        out[entry] = coef
+    return out
+
+
+def test_design_matrix_matches_monomials():
+    rng = np.random.default_rng(0)
+    x, y, z = rng.uniform(-1, 1, (3, 50))
+    data = rng.uniform(-1, 1, 50)
+    coeff_list = rational_polynomial.get_default_coefficient_ordering(3, 3)
+    A = rational_polynomial._get_design_matrix([x, y, z], data, coeff_list)
+    assert A.shape == (50, 2*len(coeff_list) - 1)
+    for i, entry in enumerate(coeff_list):
+        expected = x**entry[0] * y**entry[1] * z**entry[2]
+        np.testing.assert_allclose(A[:, i], expected, rtol=1e-12)
+        if i > 0:
+            np.testing.assert_allclose(A[:, i + len(coeff_list) - 1], -expected*data, rtol=1e-12)
+
+
+@pytest.mark.parametrize("variables", [1, 2, 3])
+def test_evaluation_matches_polyval(variables):
+    rng = np.random.default_rng(variables)
+    coeff_list = rational_polynomial.get_default_coefficient_ordering(variables, 3)
+    numerator = rng.uniform(-1, 1, len(coeff_list))
+    denominator = 0.1*rng.uniform(-1, 1, len(coeff_list))
+    denominator[0] = 1.0
+    offsets = rng.uniform(-10, 10, variables)
+    scales = rng.uniform(1, 10, variables)
+    rat_poly = rational_polynomial.RationalPolynomial(
+        numerator, denominator, coeff_list, offsets, scales, 2.0, 3.0)
+
+    points = rng.uniform(-10, 10, (7, 11, variables))
+    scaled = [(points[..., i] - offsets[i])/scales[i] for i in range(variables)]
+    evaluate = {1: polynomial.polyval, 2: polynomial.polyval2d, 3: polynomial.polyval3d}[variables]
+    expected = evaluate(*scaled, _coefficient_matrix(numerator, coeff_list)) / \
+        evaluate(*scaled, _coefficient_matrix(denominator, coeff_list))*3.0 + 2.0
+
+    if variables == 1:
+        np.testing.assert_allclose(rat_poly(points[..., 0]), expected, rtol=1e-10)
+    else:
+        np.testing.assert_allclose(rat_poly(points), expected, rtol=1e-10)
+        np.testing.assert_allclose(rat_poly(*[points[..., i] for i in range(variables)]), expected, rtol=1e-10)
+        with pytest.raises(ValueError, match='Final dimension'):
+            rat_poly(points[..., :1])
+    assert np.ndim(rat_poly(*points[0, 0])) == 0
+
+
+def test_fit_and_combined_evaluation():
+    rng = np.random.default_rng(1)
+    x, y = rng.uniform(1000, 3000, (2, 400))
+    first = rational_polynomial.get_rational_poly_2d(x, y, 2*x + 0.5*y + 1e-4*x*y, order=2)
+    second = rational_polynomial.get_rational_poly_2d(x, y, x - y, order=2)
+    np.testing.assert_allclose(first(x, y), 2*x + 0.5*y + 1e-4*x*y, rtol=1e-8)
+
+    combined = rational_polynomial.CombinedRationalPolynomial(first, second)
+    assert combined._shared_coefficients is not None
+    points = np.stack([x, y], axis=-1).reshape((20, 20, 2))
+    values = combined(points)
+    assert values.shape == (20, 20, 2)
+    np.testing.assert_allclose(values[..., 0], first(points), rtol=1e-12)
+    np.testing.assert_allclose(values[..., 1], second(points), rtol=1e-12)
+
+    other = rational_polynomial.get_rational_poly_2d(x + 1, y, x - y, order=2)
+    separate = rational_polynomial.CombinedRationalPolynomial(first, other)
+    assert separate._shared_coefficients is None
+    np.testing.assert_allclose(separate(points, combine=False)[1], other(points), rtol=1e-12)
+
+
+def test_rational_projection_against_pg_projection():
+    sicd_xml = pathlib.Path(__file__).parents[1] / "data/example.sicd.xml"
+    sicd = SICDType.from_xml_file(str(sicd_xml))
+    pg_projection = PGProjection(sicd)
+    rat_projection = PGRatPolyProjection(sicd)
+
+    rows, cols = np.meshgrid(
+        np.linspace(0, sicd.ImageData.NumRows - 1, 40), np.linspace(0, sicd.ImageData.NumCols - 1, 40),
+        indexing='ij')
+    pixels = np.stack([rows, cols], axis=-1)
+    ortho = pg_projection.pixel_to_ortho(pixels)
+
+    start = time.perf_counter()
+    expected = pg_projection.ortho_to_pixel(ortho)
+    pg_time = time.perf_counter() - start
+    start = time.perf_counter()
+    values = rat_projection.ortho_to_pixel(ortho)
+    rat_time = time.perf_counter() - start
+    logger.info('ortho_to_pixel for {} points: PGProjection {:.4f}s, PGRatPolyProjection {:.4f}s'.format(
+        rows.size, pg_time, rat_time))
+    np.testing.assert_allclose(values, expected, atol=1e-2)
+
+    ecf = sicd.project_image_to_ground(pixels)
+    np.testing.assert_allclose(rat_projection.ecf_to_pixel(ecf), pixels, atol=1e-2)
@@ -0,0 +1,142 @@
+import pathlib
+
+import numpy as np
+import pytest
+
+from sarpy.io.phase_history.cphd import CPHDReader, CPHDWriter1, write_compressed_cphd
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
+from sarpy.io.phase_history.cphd1_elements.Data import ChannelSizeType
+import sarpy.utils.subset_cphd
+
+CPHD_XML = pathlib.Path(__file__).parents[1] / "data/syntax-only-cphd-1.1.0-monostatic-minimal.xml"
+NUM_VECTORS = 60
+NUM_SAMPLES = 20
+
+
+@pytest.fixture(scope='module')
+def cphd_parts():
+    cphd_meta = CPHDType.from_xml_file(str(CPHD_XML))
+    cphd_meta.Data.Channels = [
+        ChannelSizeType(
+            Identifier=str(index + 1), NumVectors=NUM_VECTORS, NumSamples=NUM_SAMPLES,
+            SignalArrayByteOffset=index*NUM_VECTORS*NUM_SAMPLES*8,
+            PVPArrayByteOffset=index*NUM_VECTORS*cphd_meta.Data.NumBytesPVP)
+        for index in range(2)]
+    second = cphd_meta.Channel.Parameters[0].copy()
+    second.Identifier = '2'
+    cphd_meta.Channel.Parameters.append(second)
+    cphd_meta.Channel.Parameters[0].RefVectorIndex = 31
+    cphd_meta.Channel.Parameters[1].RefVectorIndex = 5
+    cphd_meta.Global.DomainType = 'FX'
+
+    rng = np.random.default_rng(7)
+    pvp_block = {}
+    signal_block = {}
+    for entry in cphd_meta.Data.Channels:
+        pvp = np.zeros((NUM_VECTORS, ), dtype=cphd_meta.PVP.get_vector_dtype())
+        pvp['TxTime'] = np.linspace(0, 3, NUM_VECTORS)
+        pvp['SC0'] = 9.0e9
+        pvp['SCSS'] = 1.0e6
+        pvp['FX1'] = 9.0e9
+        pvp['FX2'] = 9.0e9 + (NUM_SAMPLES - 1)*1.0e6
+        pvp['TOA1'] = -1.0e-6
+        pvp['TOA2'] = 1.0e-6
+        pvp_block[entry.Identifier] = pvp
+        signal_block[entry.Identifier] = (
+            rng.standard_normal((NUM_VECTORS, NUM_SAMPLES)) +
+            1j*rng.standard_normal((NUM_VECTORS, NUM_SAMPLES))).astype('complex64')
+    return cphd_meta, pvp_block, signal_block
+
+
+@pytest.fixture(scope='module')
+def cphd_file(cphd_parts, tmp_path_factory):
+    cphd_meta, pvp_block, signal_block = cphd_parts
+    file_name = str(tmp_path_factory.mktemp('subset_cphd') / 'example.cphd')
+    with CPHDWriter1(file_name, cphd_meta, check_existence=False) as writer:
+        writer.write_file(pvp_block, signal_block)
+    return file_name
+
+
+def test_subset_cphd_help(capsys):
+    with pytest.raises(SystemExit):
+        sarpy.utils.subset_cphd.main(['--help'])
+
+    captured = capsys.readouterr()
+    assert captured.err == ''
+    assert captured.out.startswith('usage:')
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_subset_cphd_vectors_and_samples(cphd_parts, cphd_file, tmp_path, max_workers):
+    _, pvp_block, signal_block = cphd_parts
+    out_file = str(tmp_path / 'subset.cphd')
+    meta = sarpy.utils.subset_cphd.subset_cphd(
+        cphd_file, out_file, time_window=(0.5, 2.5), vector_step=3, sample_range=(4, 14),
+        vector_batch_size=4, max_workers=max_workers)
+
+    expected = np.nonzero((pvp_block['1']['TxTime'] >= 0.5) & (pvp_block['1']['TxTime'] < 2.5))[0][::3]
+    reader = CPHDReader(out_file)
+    assert reader.cphd_meta.to_xml_string() == meta.to_xml_string()
+    for identifier in ['1', '2']:
+        np.testing.assert_array_equal(reader.read(index=identifier), signal_block[identifier][expected, 4:14])
+        pvp = reader.read_pvp_array(identifier)
+        np.testing.assert_array_equal(pvp['TxTime'], pvp_block[identifier]['TxTime'][expected])
+        np.testing.assert_allclose(pvp['SC0'], 9.0e9 + 4*1.0e6)
+        np.testing.assert_allclose(pvp['FX2'], 9.0e9 + 13*1.0e6)
+
+    params = reader.cphd_meta.Channel.Parameters
+    assert params[0].RefVectorIndex == int(np.argmin(np.abs(expected - 31)))
+    assert params[1].RefVectorIndex == 0
+    assert params[0].FxBW == pytest.approx(9*1.0e6)
+    assert params[0].FXFixed and reader.cphd_meta.Channel.FXFixedCPHD
+    assert reader.cphd_meta.Global.Timeline.TxTime1 == pvp_block['1']['TxTime'][expected[0]]
+    assert reader.cphd_meta.Global.FxBand.FxMin == pytest.approx(9.0e9 + 4*1.0e6)
+    reader.close()
+
+
+def test_subset_cphd_closes_reader(cphd_file, tmp_path, monkeypatch):
+    opened = []
+
+    def open_reader(file_name):
+        opened.append(CPHDReader(file_name))
+        return opened[-1]
+
+    monkeypatch.setattr(sarpy.utils.subset_cphd, 'CPHDReader', open_reader)
+    sarpy.utils.subset_cphd.subset_cphd(cphd_file, str(tmp_path / 'subset.cphd'), channels=['1'])
+    with pytest.raises(KeyError):
+        sarpy.utils.subset_cphd.subset_cphd(cphd_file, str(tmp_path / 'missing.cphd'), channels=['missing'])
+    assert len(opened) == 2 and all(reader.closed for reader in opened)
+
+    # a provided reader remains open
+    reader = CPHDReader(cphd_file)
+    sarpy.utils.subset_cphd.subset_cphd(reader, str(tmp_path / 'provided.cphd'), channels=[1])
+    assert not reader.closed
+    reader.close()
+
+
+def test_subset_cphd_channels_and_range(cphd_parts, cphd_file, tmp_path, caplog):
+    cphd_meta, pvp_block, signal_block = cphd_parts
+    out_file = str(tmp_path / 'channel.cphd')
+    sarpy.utils.subset_cphd.main([cphd_file, out_file, '--channels', '2', '--vector-range', '10', '40'])
+    reader = CPHDReader(out_file)
+    assert [entry.Identifier for entry in reader.cphd_meta.Data.Channels] == ['2']
+    assert reader.cphd_meta.Channel.RefChId == '2'
+    assert reader.cphd_meta.Channel.Parameters[0].RefVectorIndex == 0
+    np.testing.assert_array_equal(reader.read(index='2'), signal_block['2'][10:40])
+    reader.close()
+
+    with pytest.raises(ValueError, match='select no data'):
+        sarpy.utils.subset_cphd.subset_cphd(
+            cphd_file, str(tmp_path / 'empty.cphd'), time_window=(10, 11))
+    with pytest.raises(ValueError, match='vector_step'):
+        sarpy.utils.subset_cphd.subset_cphd(cphd_file, str(tmp_path / 'bad.cphd'), vector_step=0)
+
+    # compressed input is written uncompressed
+    compressed_file = str(tmp_path / 'compressed.cphd')
+    write_compressed_cphd(compressed_file, cphd_meta, pvp_block, signal_block, vectors_per_chunk=8)
+    sarpy.utils.subset_cphd.subset_cphd(
+        compressed_file, out_file, channels=[0], vector_range=(5, 30), check_existence=False)
+    reader = CPHDReader(out_file)
+    assert reader.cphd_meta.Data.SignalCompressionID is None
+    np.testing.assert_array_equal(reader.read(index='1'), signal_block['1'][5:30])
+    reader.close()
@@ -1,10 +1,14 @@
 import os
+import pathlib
 import xml.etree.ElementTree
 import zipfile
 
+import numpy as np
 import pytest
 
 import sarpy.io.phase_history
+from sarpy.io.phase_history.cphd import CPHDWriter1
+from sarpy.io.phase_history.cphd1_elements.CPHD import CPHDType
 import sarpy.visualization.cphd_kmz_product_creation as cphd_kmz
 
 
@@ -54,3 +58,60 @@ def test_create_kmz(cphd_file, tmp_path, include_antenna):
     file_stem = f'has_antenna_is_{include_antenna}'
     cphd_kmz.cphd_create_kmz_view(reader, tmp_path, file_stem=file_stem)
     _check_kmz(tmp_path, file_stem, expect_antenna=include_antenna)
+
+
+@pytest.fixture(scope='module')
+def synthetic_cphd_file(tmp_path_factory):
+    cphd_meta = CPHDType.from_xml_file(
+        str(pathlib.Path(__file__).parents[1] / 'data/syntax-only-cphd-1.1.0-monostatic.xml'))
+    cphd_meta.Data.SupportArrays = None
+    cphd_meta.SupportArray = None
+    cphd_meta.PVP.AddedPVP = None
+    cphd_meta.PVP.TDIonoSRP = None
+    cphd_meta.Data.NumBytesPVP = cphd_meta.PVP.get_vector_dtype().itemsize
+    cphd_meta.Data.SignalCompressionID = None
+    num_vectors = 3000
+    channel = cphd_meta.Data.Channels[0]
+    channel.NumVectors, channel.NumSamples = num_vectors, 2
+    channel.CompressedSignalSize = None
+    channel.SignalArrayByteOffset = channel.PVPArrayByteOffset = 0
+    cphd_meta.Channel.Parameters[0].RefVectorIndex = 0
+
+    # a curved aperture at 8 km altitude, with the antenna aimed at the IARP
+    iarp = cphd_meta.SceneCoordinates.IARP.ECF.get_array()
+    up = iarp/np.linalg.norm(iarp)
+    east = np.cross([0, 0, 1], up)
+    east /= np.linalg.norm(east)
+    north = np.cross(up, east)
+    times = np.linspace(-10, 10, num_vectors)[:, np.newaxis]
+    positions = iarp + 8000*up - 10000*north + 150*times*east + 60*times**2*north
+    pvp = np.zeros((num_vectors, ), dtype=cphd_meta.PVP.get_vector_dtype())
+    los = iarp - positions
+    los /= np.linalg.norm(los, axis=1, keepdims=True)
+    acx = np.cross(los, up)
+    acx /= np.linalg.norm(acx, axis=1, keepdims=True)
+    for txrcv in ('Tx', 'Rcv'):
+        pvp[f'{txrcv}Time'] = times[:, 0] + 10
+        pvp[f'{txrcv}Pos'] = positions
+        pvp[f'{txrcv}ACX'] = acx
+        pvp[f'{txrcv}ACY'] = np.cross(los, acx)
+    pvp['SRPPos'] = iarp
+    pvp['SIGNAL'] = 1
+    pvp['AmpSF'] = 1
+    pvp['TOA1'], pvp['TOA2'] = -1e-6, 1e-6
+
+    file_name = str(tmp_path_factory.mktemp('cphd_kmz') / 'synthetic.cphd')
+    with CPHDWriter1(file_name, cphd_meta, check_existence=False) as writer:
+        writer.write_file({channel.Identifier: pvp}, {channel.Identifier: np.zeros((num_vectors, 2), 'complex64')}, {})
+    return file_name
+
+
+def test_create_kmz_decimated(synthetic_cphd_file, tmp_path):
+    reader = sarpy.io.phase_history.open(synthetic_cphd_file)
+    geometry = cphd_kmz.cphd_channel_geometry(reader, 0, position_tolerance=1.0, max_vectors=100)
+    assert 24 < geometry['vector_indices'].size <= 100
+    assert geometry['vector_indices'][0] == 0 and geometry['vector_indices'][-1] == 2999
+    assert set(geometry['footprints']) == {'Tx', 'Rcv'}
+    assert cphd_kmz.cphd_channel_geometry(reader, 0, position_tolerance=1.0, max_vectors=100) is geometry
+    cphd_kmz.cphd_create_kmz_view(reader, tmp_path, file_stem='synthetic', position_tolerance=1.0, max_vectors=100)
+    _check_kmz(tmp_path, 'synthetic', expect_antenna=True)
@@ -0,0 +1,133 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from sarpy.io.complex.sicd_elements.blocks import Poly2DType
+from sarpy.visualization import kmz_utils
+
+
+def _aiming(count):
+    altitude = 10000.
+    positions = np.tile([kmz_utils.WGS84_SEMIMAJOR + altitude, 0, 0], (count, 1))
+    positions[:, 1] = np.linspace(-5000, 5000, count)
+    uacx = np.tile([0., 1., 0.], (count, 1))
+    uacy = np.tile([0., 0., -1.], (count, 1))
+    return {
+        "antpat_id": "test",
+        "raw": {
+            "positions": positions,
+            "times": np.linspace(0, 1, count),
+            "uacx": uacx,
+            "uacy": uacy,
+            "uacz": np.cross(uacx, uacy),
+            "eb_dcx": np.linspace(-0.01, 0.01, count),
+            "eb_dcy": np.zeros(count),
+        },
+    }
+
+
+def test_ray_intersect_earth_array():
+    rng = np.random.default_rng(1)
+    positions = rng.normal(size=(20, 3))
+    positions *= (kmz_utils.WGS84_SEMIMAJOR + 7e5)/np.linalg.norm(positions, axis=1, keepdims=True)
+    directions = -positions + rng.normal(scale=2e5, size=(20, 3))
+    result = kmz_utils.ray_intersect_earth_array(positions, directions)
+    for position, direction, point in zip(positions, directions, result):
+        np.testing.assert_allclose(point, kmz_utils.ray_intersect_earth(position, direction), rtol=0, atol=1e-4)
+
+    # rays which miss, or point away, are NaN
+    result = kmz_utils.ray_intersect_earth_array(positions[:2], np.stack([positions[0], np.cross(positions[1], [0, 0, 1])]))
+    assert np.all(np.isnan(result))
+
+
+def test_adaptive_track_indices():
+    times = np.linspace(0, 10, 2001)
+    line = np.stack([times, 2*times, np.zeros_like(times)], axis=-1)
+    selected = kmz_utils.adaptive_track_indices(times, [line], [0.01], min_count=24, max_count=256)
+    assert selected.size == 24
+
+    curve = np.stack([np.cos(times), np.sin(times), np.zeros_like(times)], axis=-1)*1000
+    selected = kmz_utils.adaptive_track_indices(times, [line, curve], [0.01, 1.0], min_count=24, max_count=256)
+    assert 24 < selected.size < 256
+    assert selected[0] == 0 and selected[-1] == times.size - 1
+    interpolated = np.stack([np.interp(times, times[selected], curve[selected, i]) for i in range(3)], axis=-1)
+    assert np.max(np.linalg.norm(interpolated - curve, axis=-1)) <= 1.0
+
+    assert kmz_utils.adaptive_track_indices(times, [curve], [1e-9], max_count=50).size == 50
+    np.testing.assert_array_equal(kmz_utils.adaptive_track_indices(times[:10], [curve[:10]], [1]), np.arange(10))
+    with pytest.raises(ValueError, match='tolerances'):
+        kmz_utils.adaptive_track_indices(times, [curve], [1, 2])
+
+
+def test_make_beam_footprints():
+    aiming = _aiming(11)
+    array_gain_poly = Poly2DType(Coefs=[[0, 0, -1200], [0, 0, 0], [-1200, 0, 0]])
+    element_gain_poly = Poly2DType(Coefs=[[0, 0, -100], [0, 0, 0], [-100, 0, 0]])
+    labels = {"start": 0, "middle": 5, "end": 10}
+    footprints = kmz_utils.make_beam_footprints(aiming, labels, array_gain_poly, element_gain_poly)
+    assert set(footprints.keys()) == set(labels.keys())
+    for name, index in labels.items():
+        contour = footprints[name]["contour"]
+        assert footprints[name]["time"] == aiming["raw"]["times"][index]
+        np.testing.assert_allclose(np.linalg.norm(contour, axis=-1), kmz_utils.WGS84_SEMIMAJOR, rtol=1e-7)
+        ground_range = np.linalg.norm(contour[:, 1:] - aiming["raw"]["positions"][index, 1:], axis=-1)
+        assert np.all((ground_range > 300) & (ground_range < 600))
+
+    # the matplotlib fallback finds the same contours
+    with mock.patch.object(kmz_utils, "contourpy", None):
+        fallback = kmz_utils.make_beam_footprints(aiming, labels, array_gain_poly, element_gain_poly)
+    for name in labels:
+        # the same closed ring, possibly with a different starting vertex
+        np.testing.assert_allclose(
+            np.unique(np.round(fallback[name]["contour"], 3), axis=0),
+            np.unique(np.round(footprints[name]["contour"], 3), axis=0))
+
+    # a beam pointing away from the earth has no footprint
+    aiming["raw"]["uacy"][0] *= -1
+    assert set(kmz_utils.make_beam_footprints(aiming, labels, array_gain_poly, element_gain_poly)) == {"middle", "end"}
+
+
+def test_make_beam_footprints_isolates_failures():
+    aiming = _aiming(11)
+    array_gain_poly = Poly2DType(Coefs=[[0, 0, -1200], [0, 0, 0], [-1200, 0, 0]])
+    element_gain_poly = Poly2DType(Coefs=[[0, 0, -100], [0, 0, 0], [-100, 0, 0]])
+    labels = {"start": 0, "middle": 5, "end": 10}
+
+    def failing_element_gain(dcx, dcy):
+        # the middle slowtime has zero electrical boresight offset
+        if np.any(np.isclose(np.mean(dcx, axis=(-2, -1)), 0, rtol=0, atol=1e-12)):
+            raise ValueError("bad vector")
+        return element_gain_poly(dcx, dcy)
+
+    footprints = kmz_utils.make_beam_footprints(aiming, labels, array_gain_poly, failing_element_gain)
+    assert set(footprints) == {"start", "end"}
+
+    intersect = kmz_utils.ray_intersect_earth_array
+
+    def failing_intersect(positions, directions):
+        if np.any(positions[:, 1] == -5000):
+            raise ValueError("bad vector")
+        return intersect(positions, directions)
+
+    with mock.patch.object(kmz_utils, "ray_intersect_earth_array", failing_intersect):
+        footprints = kmz_utils.make_beam_footprints(aiming, labels, array_gain_poly, element_gain_poly)
+    assert set(footprints) == {"middle", "end"}
+
+
+def test_cached_geometry(tmp_path):
+    file_name = tmp_path / 'data.bin'
+    file_name.write_bytes(b'0123')
+    compute = mock.Mock(side_effect=lambda: object())
+    kmz_utils.clear_geometry_cache()
+    first = kmz_utils.cached_geometry(str(file_name), ('a', 1), compute)
+    assert kmz_utils.cached_geometry(str(file_name), ('a', 1), compute) is first
+    assert compute.call_count == 1
+    kmz_utils.cached_geometry(str(file_name), ('a', 2), compute)
+    assert compute.call_count == 2
+
+    file_name.write_bytes(b'012345')
+    assert kmz_utils.cached_geometry(str(file_name), ('a', 1), compute) is not first
+    kmz_utils.cached_geometry(None, ('a', 1), compute)
+    assert compute.call_count == 4
+    kmz_utils.clear_geometry_cache()